@@ -0,0 +1,73 @@
+"""Benchmark IStructure.get_primitive_structure with the hashed translation filter
+against the previous all-pairs filter on supercells of ordered structures.
+
+Both paths must return the same primitive cell. Run with:
+    python dev_scripts/benchmark_primitive_structure.py
+"""
+
+from __future__ import annotations
+
+import time
+from unittest import mock
+
+import numpy as np
+
+from pymatgen.core import Lattice, Structure
+from pymatgen.util.testing import MatSciTest
+
+__author__ = "pymatgen developers"
+__date__ = "2026-10-16"
+
+
+def filter_pbc_translations_pairwise(translations, grouped_frac_coords, tol):
+    """Previous filter, comparing every translated site with every site of its group.
+    Note that it only bounded the differences from above.
+    """
+    for group in sorted(grouped_frac_coords, key=len):
+        for frac_coords in group:
+            dist = translations[:, None, :] - (group - frac_coords)[None, :, :]
+            dist -= np.round(dist)
+            translations = translations[np.any(np.all(dist < tol, axis=-1), axis=-1)]
+    return translations
+
+
+def get_structures() -> dict[str, Structure]:
+    """Supercells with 200-500 sites."""
+    cscl = Structure(Lattice.cubic(4.1), ["Cs", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+    return {
+        "LiFePO4 2x2x2": MatSciTest.get_structure("LiFePO4") * 2,
+        "LiFePO4 skewed": MatSciTest.get_structure("LiFePO4") * [[2, 1, 0], [0, 2, 0], [0, 0, 2]],
+        "Si 5x5x5": MatSciTest.get_structure("Si") * 5,
+        "Li2O 4x4x4": MatSciTest.get_structure("Li2O") * 4,
+        "CsCl 6x6x6": cscl * 6,
+    }
+
+
+def time_primitive(struct: Structure, n_repeats: int = 3) -> tuple[float, Structure]:
+    """Best wall time of get_primitive_structure and its result."""
+    best = float("inf")
+    for _ in range(n_repeats):
+        start = time.perf_counter()
+        prim = struct.get_primitive_structure()
+        best = min(best, time.perf_counter() - start)
+    return best, prim
+
+
+def main() -> None:
+    """Print a table of timings and check that both paths agree."""
+    print(f"{'structure':<16} {'sites':>5} {'prim':>5} {'pairwise (s)':>13} {'hashed (s)':>11} {'speedup':>8}")
+    for name, struct in get_structures().items():
+        with mock.patch("pymatgen.core.structure._filter_pbc_translations", filter_pbc_translations_pairwise):
+            t_pairwise, prim_pairwise = time_primitive(struct)
+        t_hashed, prim_hashed = time_primitive(struct)
+
+        if prim_hashed.lattice != prim_pairwise.lattice or prim_hashed != prim_pairwise:
+            raise ValueError(f"Primitive cells of {name} differ between the two filters")
+        print(
+            f"{name:<16} {len(struct):>5} {len(prim_hashed):>5} {t_pairwise:>13.3f} {t_hashed:>11.3f} "
+            f"{t_pairwise / t_hashed:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,8 @@
 
 """Create `core.periodic_table.json` from source files, and as such
 you should NOT modify the final JSON directly, but work on the data
-source and then run this script to generate the JSON/YAML.
+source and then run this script to generate the JSON/YAML and the
+binary `core.periodic_table.bin` that pymatgen loads at runtime.
 
 Each source file may be parsed using a common or custom parser. In cases where
 a custom parser is required, it should return a single `Property` or
@@ -48,6 +49,7 @@ import requests
 from ruamel.yaml import YAML
 
 from pymatgen.core import PKG_DIR, Element
+from pymatgen.core.periodic_table import _write_pt_binary
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
@@ -377,6 +379,7 @@ def generate_yaml_and_json(
     *,
     yaml_file: PathLike,
     json_file: PathLike,
+    binary_file: PathLike,
 ) -> None:
     """
     Generate a human-readable YAML and a production-ready JSON file from properties.
@@ -385,6 +388,7 @@ def generate_yaml_and_json(
         properties (Iterable[Property]): A sequence of Property objects to serialize.
         yaml_file (PathLike): Path to output YAML file (for development).
         json_file (PathLike): Path to output JSON file (for production).
+        binary_file (PathLike): Path to output binary table (loaded by pymatgen).
 
     Raises:
         ValueError: If duplicate property names are found in the input.
@@ -462,6 +466,11 @@ def generate_yaml_and_json(
 
     print(f"Saved JSON to: {json_file}")
 
+    # Memory-mapped copy of the JSON data, which is what pymatgen loads at runtime
+    _write_pt_binary(element_to_props, binary_file)
+
+    print(f"Saved binary table to: {binary_file}")
+
 
 def main():
     # Generate and gather Property
@@ -488,6 +497,7 @@ def main():
         properties,
         yaml_file=f"{RESOURCES_DIR}/_periodic_table.yaml",
         json_file=f"{PKG_DIR}/core/periodic_table.json.gz",
+        binary_file=f"{PKG_DIR}/core/periodic_table.bin",
     )
 
 
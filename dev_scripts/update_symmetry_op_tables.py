@@ -0,0 +1,86 @@
+"""Script to regenerate the precompiled tables of symmetry operations in the symmetry module
+from symm_ops.json and symm_data_magnetic.sqlite, which must be rerun when either changes.
+
+- symm_ops.npy: rotations and translations of the space groups in symm_ops.json
+- symm_groups_magnetic.npy: labels and numbers of the magnetic space groups, by OG3 index
+- symm_ops_magnetic.npy: rotations, translations and time reversals of the magnetic space
+  groups in the BNS setting, including lattice centerings
+
+The tables of operations are sorted by group, which is the index of the group in
+symm_ops.json or its OG3 index - 1.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+
+import numpy as np
+
+from pymatgen.core.operations import SymmOp
+from pymatgen.symmetry import groups, maggroups
+
+__author__ = "pymatgen developers"
+__date__ = "2026-10-17"
+
+MODULE_DIR = os.path.dirname(groups.__file__)
+
+SG_OPS_DTYPE = np.dtype([("group", "<i2"), ("rotation", "i1", (3, 3)), ("translation", "<f8", (3,))])
+MSG_OPS_DTYPE = np.dtype([*SG_OPS_DTYPE.descr, ("time_reversal", "i1")])
+MSG_DTYPE = np.dtype(
+    [
+        ("magtype", "i1"),
+        ("bns_number", "<i2", (2,)),
+        ("bns_label", "<U16"),
+        ("og_number", "<i2", (3,)),
+        ("og_label", "<U16"),
+    ]
+)
+
+
+def write_space_group_ops() -> None:
+    """Write the operations of the space groups in symm_ops.json."""
+    rows = []
+    for idx, spg in enumerate(groups.SpaceGroup.SYMM_OPS):
+        for xyz_str in spg["symops"]:
+            op = SymmOp.from_xyz_str(xyz_str)
+            rows.append((idx, np.round(op.rotation_matrix), op.translation_vector))
+    np.save(os.path.join(MODULE_DIR, groups.SYMM_OPS_TABLE), np.array(rows, dtype=SG_OPS_DTYPE))
+
+
+def write_magnetic_space_groups() -> None:
+    """Write the labels and numbers of the magnetic space groups."""
+    db = sqlite3.connect(maggroups.MAGSYMM_DATA)
+    rows = [
+        (magtype, (bns1, bns2), bns_label, (og1, og2, og3), og_label)
+        for magtype, bns1, bns2, bns_label, og1, og2, og3, og_label in db.execute(
+            "SELECT magtype, BNS1, BNS2, BNS_label, OG1, OG2, OG3, OG_label FROM space_groups ORDER BY OG3"
+        )
+    ]
+    db.close()
+    np.save(os.path.join(MODULE_DIR, maggroups.MAGSYMM_GROUPS), np.array(rows, dtype=MSG_DTYPE))
+
+
+def write_magnetic_space_group_ops() -> None:
+    """Write the operations of the magnetic space groups, parsed from the SQLite database."""
+    rows = []
+    for idx in range(1651):
+        data = maggroups.MagneticSpaceGroup(idx + 1)._data
+        ops = [
+            (op_data["op"].rotation_matrix, op_data["op"].translation_vector, op_data["op"].time_reversal)
+            for op_data in data["bns_operators"]
+        ]
+        # add lattice centerings, as in MagneticSpaceGroup.symmetry_ops before the tables
+        centered_ops = []
+        for vec in (latt["vector"] for latt in data["bns_lattice"]):
+            if not any(np.array_equal(vec, unit_vec) for unit_vec in np.eye(3)):
+                centered_ops += [(rot, trans + vec, time_reversal) for rot, trans, time_reversal in ops]
+        rows += [(idx, np.round(rot), trans, time_reversal) for rot, trans, time_reversal in ops + centered_ops]
+    np.save(os.path.join(MODULE_DIR, maggroups.MAGSYMM_OPS), np.array(rows, dtype=MSG_OPS_DTYPE))
+
+
+if __name__ == "__main__":
+    write_space_group_ops()
+    write_magnetic_space_groups()
+    groups._load_table.cache_clear()
+    write_magnetic_space_group_ops()
@@ -11,6 +11,15 @@ from setuptools import Extension, setup
 is_win_64 = sys.platform.startswith("win") and platform.machine().endswith("64")
 extra_link_args = ["-Wl,--allow-multiple-definition"] if is_win_64 else []
 
+# OpenMP for the multi-threaded neighbor search. Apple Clang ships without OpenMP,
+# so on macOS the prange loops compile to serial code.
+if sys.platform.startswith("win"):
+    openmp_compile_args, openmp_link_args = ["/openmp"], []
+elif sys.platform.startswith("linux"):
+    openmp_compile_args, openmp_link_args = ["-fopenmp"], ["-fopenmp"]
+else:
+    openmp_compile_args, openmp_link_args = [], []
+
 setup(
     ext_modules=[
         Extension(
@@ -26,7 +35,8 @@ setup(
         Extension(
             "pymatgen.optimization.neighbors",
             ["src/pymatgen/optimization/neighbors.pyx"],
-            extra_link_args=extra_link_args,
+            extra_compile_args=openmp_compile_args,
+            extra_link_args=extra_link_args + openmp_link_args,
         ),
     ],
     include_dirs=[np.get_include()],
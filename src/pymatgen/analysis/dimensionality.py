@@ -23,7 +23,6 @@ get_dimensionality_gorai:
 from __future__ import annotations
 
 import copy
-import itertools
 from collections import defaultdict
 
 import networkx as nx
@@ -402,26 +401,21 @@ def find_connected_atoms(struct, tolerance=0.45, ldict=None):
         ldict = JmolNN().el_radius
 
     n_atoms = len(struct.species)
-    fc = np.array(struct.frac_coords)
-    fc_copy = np.repeat(fc[:, :, None], 27, axis=2)
-    neighbors = np.array(list(itertools.product([0, 1, -1], [0, 1, -1], [0, 1, -1]))).T
-    neighbors = np.repeat(neighbors[None, :, :], 1, axis=0)
-    fc_diff = fc_copy - neighbors
     species = list(map(str, struct.species))
     # in case of charged species
     for ii, item in enumerate(species):
         if item not in ldict:
             species[ii] = str(Species.from_str(item).element)
+    radii = np.array([ldict[sp] for sp in species])
     connected_matrix = np.zeros((n_atoms, n_atoms))
+    if n_atoms == 0:
+        return connected_matrix
 
-    for ii in range(n_atoms):
-        for jj in range(ii + 1, n_atoms):
-            max_bond_length = ldict[species[ii]] + ldict[species[jj]] + tolerance
-            frac_diff = fc_diff[jj] - fc_copy[ii]
-            distance_ij = np.dot(struct.lattice.matrix.T, frac_diff)
-            if sum(np.linalg.norm(distance_ij, axis=0) < max_bond_length) > 0:
-                connected_matrix[ii, jj] = 1
-                connected_matrix[jj, ii] = 1
+    # Atoms are bonded if their nearest images are closer than the bond length,
+    # so only pairs within the longest possible bond length are candidates
+    dist_mat = struct.get_sparse_distance_matrix(2 * radii.max() + tolerance).tocoo()
+    bonded = dist_mat.data < radii[dist_mat.row] + radii[dist_mat.col] + tolerance
+    connected_matrix[dist_mat.row[bonded], dist_mat.col[bonded]] = 1
     return connected_matrix
 
 
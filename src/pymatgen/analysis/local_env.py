@@ -600,6 +600,17 @@ class NearNeighbors:
                 return idx
         raise ValueError("Site not found in structure")
 
+    @staticmethod
+    def _get_neighbors(structure: Structure, n: int, r: float) -> list:
+        """Private convenience method for get_nn_info,
+        gives the neighbors of site n within r. Uses the Verlet neighbor list
+        attached to the structure (structure.neighbor_list_cache) if it covers r.
+        """
+        neighbor_list = getattr(structure, "neighbor_list_cache", None)
+        if neighbor_list is not None and r <= neighbor_list.r:
+            return neighbor_list.get_all_neighbors(structure, r, indices=[n])[0]
+        return structure.get_neighbors(structure[n], r)
+
     def get_bonded_structure(
         self,
         structure: Structure,
@@ -1306,7 +1317,7 @@ class JmolNN(NearNeighbors):
         min_rad = min(bonds.values())
 
         siw = []
-        for nn in structure.get_neighbors(site, max_rad):
+        for nn in self._get_neighbors(structure, n, max_rad):
             dist = nn.nn_distance
             # Confirm neighbor based on bond length specific to atom pair
             if dist <= (bonds[site.specie, nn.specie]) and (nn.nn_distance > self.min_bond_distance):
@@ -1383,8 +1394,7 @@ class MinimumDistanceNN(NearNeighbors):
             siw (list[dict]): dicts with (Site, array, float) each one of which represents a
                 neighbor site, its image location, and its weight.
         """
-        site = structure[n]
-        neighs_dists = structure.get_neighbors(site, self.cutoff)
+        neighs_dists = self._get_neighbors(structure, n, self.cutoff)
         is_periodic = isinstance(structure, Structure | IStructure)
         siw = []
         if self.get_all_sites:
@@ -1794,7 +1804,7 @@ class MinimumOKeeffeNN(NearNeighbors):
                 and its weight.
         """
         site = structure[n]
-        neighs_dists = structure.get_neighbors(site, self.cutoff)
+        neighs_dists = self._get_neighbors(structure, n, self.cutoff)
         try:
             eln = site.specie.element
         except Exception:
@@ -3480,7 +3490,7 @@ class BrunnerNNReciprocal(NearNeighbors):
                 coordinated site, its image location, and its weight.
         """
         site = structure[n]
-        neighs_dists = structure.get_neighbors(site, self.cutoff)
+        neighs_dists = self._get_neighbors(structure, n, self.cutoff)
         ds = sorted(idx.nn_distance for idx in neighs_dists)
 
         ns = [1 / ds[idx] - 1 / ds[idx + 1] for idx in range(len(ds) - 1)]
@@ -3555,8 +3565,7 @@ class BrunnerNNRelative(NearNeighbors):
                 of which represents a coordinated site, its image location,
                 and its weight.
         """
-        site = structure[n]
-        neighs_dists = structure.get_neighbors(site, self.cutoff)
+        neighs_dists = self._get_neighbors(structure, n, self.cutoff)
         ds = sorted(idx.nn_distance for idx in neighs_dists)
 
         ns = [ds[idx + 1] / ds[idx] for idx in range(len(ds) - 1)]
@@ -3631,8 +3640,7 @@ class BrunnerNNReal(NearNeighbors):
                 of which represents a coordinated site, its image location,
                 and its weight.
         """
-        site = structure[n]
-        neighs_dists = structure.get_neighbors(site, self.cutoff)
+        neighs_dists = self._get_neighbors(structure, n, self.cutoff)
         ds = sorted(idx.nn_distance for idx in neighs_dists)
 
         ns = [ds[idx + 1] - ds[idx] for idx in range(len(ds) - 1)]
@@ -3732,7 +3740,7 @@ class EconNN(NearNeighbors):
                 and its weight.
         """
         site = structure[n]
-        neighbors = structure.get_neighbors(site, self.cutoff)
+        neighbors = self._get_neighbors(structure, n, self.cutoff)
 
         oxi_state = getattr(site.specie, "oxi_state", None)
         if self.cation_anion and oxi_state is not None:
@@ -4329,7 +4337,7 @@ class CutOffDictNN(NearNeighbors):
         """
         site = structure[n]
 
-        neighs_dists = structure.get_neighbors(site, self._max_dist)
+        neighs_dists = self._get_neighbors(structure, n, self._max_dist)
 
         nn_info = []
         for nn in neighs_dists:
@@ -315,11 +315,13 @@ class VoronoiConnectivity:
         """
         con = []
         max_conn = self.max_connectivity
-        for ii in range(max_conn.shape[0]):
-            for jj in range(max_conn.shape[1]):
-                if max_conn[ii][jj] != 0:
-                    dist = self.structure.get_distance(ii, jj)
-                    con.append([ii, jj, dist])
+        # Voronoi neighbors are within the cutoff, so their nearest image distances
+        # are looked up in a sparse distance matrix instead of one by one
+        dist_mat = self.structure.get_sparse_distance_matrix(self.cutoff).todok()
+        for ii, jj in np.argwhere(max_conn != 0).tolist():
+            # Pairs missing from the matrix (incl. the diagonal) fall back to get_distance
+            dist = dist_mat.get((ii, jj), 0) or self.structure.get_distance(ii, jj)
+            con.append([ii, jj, dist])
         return con
 
     def get_sitej(self, site_index, image_index):
@@ -5,7 +5,9 @@ from __future__ import annotations
 import abc
 import itertools
 import math
+from collections import defaultdict
 from functools import lru_cache
+from multiprocessing import Pool
 from typing import TYPE_CHECKING, cast
 
 import numpy as np
@@ -18,7 +20,7 @@ from pymatgen.util.coord_cython import is_coord_subset_pbc, pbc_shortest_vectors
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
-    from typing import Literal
+    from typing import Any, Literal
 
     from typing_extensions import Self
 
@@ -803,7 +805,7 @@ class StructureMatcher(MSONable):
 
         return None
 
-    def group_structures(self, s_list, anonymous=False):
+    def group_structures(self, s_list, anonymous=False, ncores: int | None = None):
         """
         Given a list of structures, use fit to group
         them by structural equality.
@@ -811,6 +813,9 @@ class StructureMatcher(MSONable):
         Args:
             s_list ([Structure]): List of structures to be grouped
             anonymous (bool): Whether to use anonymous mode.
+            ncores (int | None): Number of processes to match structures with.
+                Defaults to None, which implies serial matching. The groups are
+                the same either way.
 
         Returns:
             A list of lists of matched structures
@@ -838,30 +843,80 @@ class StructureMatcher(MSONable):
             return c_hash(s[1].composition)
 
         sorted_s_list = sorted(enumerate(s_list), key=s_hash)
-        all_groups = []
+
+        # Without supercells, structures with different numbers of sites never match, so
+        # the pre-groups are split further by number of sites. The greedy matching below
+        # then gives the same groups as matching each pre-group as a whole.
+        buckets = []
+        for hash_idx, (_, g) in enumerate(itertools.groupby(sorted_s_list, key=s_hash)):
+            inds = [idx for idx, _ in g]
+            if self._supercell:
+                buckets.append((hash_idx, inds))
+            else:
+                inds_by_num_sites = defaultdict(list)
+                for idx in inds:
+                    inds_by_num_sites[len(s_list[idx])].append(idx)
+                buckets.extend((hash_idx, sub_inds) for sub_inds in inds_by_num_sites.values())
 
         # For each pre-grouped list of structures, perform actual matching.
-        for _, g in itertools.groupby(sorted_s_list, key=s_hash):
-            unmatched = list(g)
-            while len(unmatched) > 0:
-                i, refs = unmatched.pop(0)
-                matches = [i]
-                if anonymous:
-                    inds = filter(
-                        lambda i: self.fit_anonymous(refs, unmatched[i][1], skip_structure_reduction=True),
-                        list(range(len(unmatched))),
-                    )
-                else:
-                    inds = filter(
-                        lambda i: self.fit(refs, unmatched[i][1], skip_structure_reduction=True),
-                        list(range(len(unmatched))),
-                    )
-                inds = list(inds)
-                matches.extend([unmatched[i][0] for i in inds])
-                unmatched = [unmatched[i] for i in range(len(unmatched)) if i not in inds]
-                all_groups.append([original_s_list[i] for i in matches])
-
-        return all_groups
+        if not ncores:
+            bucket_groups = [self._group_indices(s_list, inds, anonymous) for _, inds in buckets]
+        else:
+            with Pool(ncores, initializer=_init_group_worker, initargs=(self, s_list, anonymous)) as pool:
+                # Small buckets are matched in a single process each, while the structures of
+                # large buckets are fit to each reference structure over all processes
+                small = [idx for idx, (_, inds) in enumerate(buckets) if len(inds) <= 4 * ncores]
+                small_groups = pool.map_async(_group_indices_in_worker, [buckets[idx][1] for idx in small])
+                bucket_groups = [
+                    self._group_indices(s_list, inds, anonymous, pool=pool, ncores=ncores)
+                    if len(inds) > 4 * ncores
+                    else None
+                    for _, inds in buckets
+                ]
+                for idx, groups in zip(small, small_groups.get(), strict=True):
+                    bucket_groups[idx] = groups
+
+        # Order groups as if each pre-group were matched as a whole, i.e. by their first structure
+        all_groups = sorted(
+            (hash_idx, group) for (hash_idx, _), groups in zip(buckets, bucket_groups, strict=True) for group in groups
+        )
+        return [[original_s_list[idx] for idx in group] for _, group in all_groups]
+
+    def _group_indices(self, structures, inds, anonymous, pool=None, ncores=None):
+        """Group structures by taking the first unmatched structure and all structures
+        that fit it as a group, until all structures are matched.
+
+        Args:
+            structures (list[Structure]): Reduced structures.
+            inds (list[int]): Indices of the structures to group.
+            anonymous (bool): Whether to use anonymous mode.
+            pool (Pool | None): Process pool to fit structures with, initialized with
+                _init_group_worker. Defaults to None.
+            ncores (int | None): Number of processes of the pool.
+
+        Returns:
+            list[list[int]]: Groups of indices, in order of their first index.
+        """
+        groups = []
+        unmatched = list(inds)
+        while len(unmatched) > 0:
+            ref = unmatched.pop(0)
+            if pool is None or len(unmatched) < 2 * ncores:
+                is_match = self._fit_to_ref(structures, ref, unmatched, anonymous)
+            else:
+                chunksize = math.ceil(len(unmatched) / ncores)
+                chunks = [unmatched[idx : idx + chunksize] for idx in range(0, len(unmatched), chunksize)]
+                is_match = list(
+                    itertools.chain.from_iterable(pool.map(_fit_to_ref_in_worker, [(ref, chunk) for chunk in chunks]))
+                )
+            groups.append([ref, *itertools.compress(unmatched, is_match)])
+            unmatched = [idx for idx, match in zip(unmatched, is_match, strict=True) if not match]
+        return groups
+
+    def _fit_to_ref(self, structures, ref, inds, anonymous):
+        """Whether each of the reduced structures at inds fits the one at ref."""
+        fit = self.fit_anonymous if anonymous else self.fit
+        return [fit(structures[ref], structures[idx], skip_structure_reduction=True) for idx in inds]
 
     def as_dict(self):
         """MSONable dict."""
@@ -1241,3 +1296,28 @@ class StructureMatcher(MSONable):
             return None
 
         return match[4]
+
+
+# Matcher, reduced structures and anonymous flag of StructureMatcher.group_structures
+# in worker processes, set by _init_group_worker
+_GROUP_WORKER_DATA: dict[str, Any] = {}
+
+
+def _init_group_worker(matcher: StructureMatcher, structures: list[Structure], anonymous: bool) -> None:
+    """Store the data of StructureMatcher.group_structures in a worker process, so that
+    tasks only need to send indices of structures.
+    """
+    _GROUP_WORKER_DATA.update(matcher=matcher, structures=structures, anonymous=anonymous)
+
+
+def _group_indices_in_worker(inds: list[int]) -> list[list[int]]:
+    """Group the structures at inds in a worker process."""
+    data = _GROUP_WORKER_DATA
+    return data["matcher"]._group_indices(data["structures"], inds, data["anonymous"])
+
+
+def _fit_to_ref_in_worker(args: tuple[int, list[int]]) -> list[bool]:
+    """Whether each of the structures at inds fits the one at ref, in a worker process."""
+    ref, inds = args
+    data = _GROUP_WORKER_DATA
+    return data["matcher"]._fit_to_ref(data["structures"], ref, inds, data["anonymous"])
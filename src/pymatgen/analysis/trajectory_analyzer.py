@@ -0,0 +1,259 @@
+"""This module provides functions to analyze molecular dynamics trajectories, i.e. mean
+squared displacements, radial distribution functions and velocity autocorrelation.
+
+All functions work directly on the coords and lattice arrays of a Trajectory, without
+creating a Structure for each frame, and process the frames in chunks, so that they also
+work on trajectories memory-mapped from a TrajectoryStore that do not fit in memory.
+Time averages over all time origins are computed with FFTs.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pymatgen.core.trajectory import Trajectory
+
+__author__ = "pymatgen developers"
+__date__ = "2026-10-17"
+
+# Maximum number of (frame, site) coordinate triples loaded at once
+CHUNK_SIZE: int = 2**20
+
+
+def get_msd(trajectory: Trajectory, chunk_size: int = CHUNK_SIZE) -> dict[str, np.ndarray]:
+    """Mean squared displacement of each species, averaged over all time origins.
+
+    Positions are unwrapped across periodic boundaries as in Trajectory.to_displacements,
+    and the time average is computed with an FFT, i.e. in O(M log M) rather than O(M^2)
+    for M frames.
+
+    Args:
+        trajectory (Trajectory): Trajectory to analyze, with positions or displacements.
+        chunk_size (int): Maximum number of (frame, site) coordinates loaded at once.
+            Sites are processed in chunks of chunk_size // M sites.
+
+    Returns:
+        dict[str, np.ndarray]: shape (M,). MSD in Angstrom^2 of each species as a
+            function of the lag time in frames, i.e. multiply np.arange(M) by the
+            time_step of the trajectory to get the times.
+    """
+    n_frames = len(trajectory)
+    return _average_over_species(
+        trajectory,
+        (_get_msd_fft(positions) for positions in _iter_unwrapped_cart_coords(trajectory, chunk_size)),
+        n_frames,
+    )
+
+
+def get_vacf(trajectory: Trajectory, normalize: bool = False, chunk_size: int = CHUNK_SIZE) -> dict[str, np.ndarray]:
+    """Velocity autocorrelation function of each species, averaged over all time origins.
+
+    The velocities are taken from the "velocities" site property if present. Otherwise,
+    they are obtained by finite differences of the unwrapped positions, which requires
+    the time_step of the trajectory and gives M - 1 velocities for M frames.
+
+    Args:
+        trajectory (Trajectory): Trajectory to analyze.
+        normalize (bool): Whether to divide the VACF by its value at zero lag time.
+        chunk_size (int): Maximum number of (frame, site) coordinates loaded at once.
+
+    Returns:
+        dict[str, np.ndarray]: VACF of each species as a function of the lag time in
+            frames, in (velocity unit)^2, i.e. (Angstrom/fs)^2 for finite differences.
+    """
+    velocity_chunks = _iter_velocities(trajectory, chunk_size)
+    first = next(velocity_chunks)
+    vacf = _average_over_species(
+        trajectory,
+        (_get_autocorrelation(velocities) for velocities in itertools.chain([first], velocity_chunks)),
+        len(first),
+    )
+    if normalize:
+        return {key: val / val[0] for key, val in vacf.items()}
+    return vacf
+
+
+def get_rdf(
+    trajectory: Trajectory,
+    r_max: float = 10.0,
+    n_bins: int = 200,
+    skin: float = 0.3,
+) -> tuple[np.ndarray, dict[tuple[str, str], np.ndarray]]:
+    """Partial radial distribution functions of each pair of species, averaged over
+    the frames of a Structure-based trajectory.
+
+    Neighbors are found with Trajectory.get_neighbor_lists, which reuses a Verlet
+    neighbor list between frames and reads one frame at a time.
+
+    Args:
+        trajectory (Trajectory): Structure-based trajectory to analyze.
+        r_max (float): Maximum distance in Angstrom. Defaults to 10.
+        n_bins (int): Number of distance bins. Defaults to 200.
+        skin (float): Skin distance of the Verlet neighbor list. Defaults to 0.3.
+
+    Returns:
+        tuple[np.ndarray, dict[tuple[str, str], np.ndarray]]: Centers of the distance
+            bins, and the partial RDF g_ab(r) of each pair of species (a, b), with a
+            and b in the order they first appear in the trajectory.
+    """
+    if trajectory.lattice is None:
+        raise TypeError("RDFs are only available for Structure-based Trajectory!")
+
+    labels, species_idx = _get_species_indices(trajectory)
+    n_species = len(labels)
+    edges = np.linspace(0, r_max, n_bins + 1)
+
+    counts = np.zeros((n_species, n_species, n_bins))
+    volumes = np.broadcast_to(np.abs(np.linalg.det(trajectory.lattice)), len(trajectory))
+    for idx, (centers, points, _images, distances) in enumerate(trajectory.get_neighbor_lists(r_max, skin=skin)):
+        bins = np.floor(distances / (r_max / n_bins)).astype(int)
+        in_range = bins < n_bins
+        pair_bins = (species_idx[centers] * n_species + species_idx[points]) * n_bins + bins
+        frame_counts = np.bincount(pair_bins[in_range], minlength=n_species * n_species * n_bins)
+        # Weight the counts by the volume of the frame, for the number density
+        counts += frame_counts.reshape(counts.shape) * volumes[idx]
+
+    n_sites = np.bincount(species_idx, minlength=n_species)
+    shell_volumes = 4 / 3 * np.pi * np.diff(edges**3)
+    rdfs: dict[tuple[str, str], np.ndarray] = {}
+    for idx_a, idx_b in zip(*np.triu_indices(n_species), strict=True):
+        n_pairs = n_sites[idx_a] * (n_sites[idx_b] - (idx_a == idx_b))
+        rdf = counts[idx_a, idx_b] / (len(trajectory) * shell_volumes * max(n_pairs, 1))
+        rdfs[labels[idx_a], labels[idx_b]] = rdf
+    return (edges[1:] + edges[:-1]) / 2, rdfs
+
+
+def _get_species_indices(trajectory: Trajectory) -> tuple[list[str], np.ndarray]:
+    """Labels of the distinct species in the trajectory, and the index of each site's
+    species in these labels.
+    """
+    labels = list(dict.fromkeys(map(str, trajectory.species)))
+    species_idx = np.array([labels.index(str(sp)) for sp in trajectory.species])
+    return labels, species_idx
+
+
+def _average_over_species(
+    trajectory: Trajectory,
+    site_chunks: Iterator[np.ndarray],
+    n_frames: int,
+) -> dict[str, np.ndarray]:
+    """Average per-site time series, given in chunks of shape (n_frames, n_chunk_sites),
+    over the sites of each species.
+    """
+    labels, species_idx = _get_species_indices(trajectory)
+    totals = np.zeros((len(labels), n_frames))
+    start = 0
+    for values in site_chunks:
+        stop = start + values.shape[1]
+        for label_idx in np.unique(species_idx[start:stop]):
+            totals[label_idx] += values[:, species_idx[start:stop] == label_idx].sum(axis=1)
+        start = stop
+
+    n_sites = np.bincount(species_idx, minlength=len(labels))
+    return {label: totals[idx] / n_sites[idx] for idx, label in enumerate(labels)}
+
+
+def _iter_site_chunks(trajectory: Trajectory, chunk_size: int) -> Iterator[slice]:
+    """Slices of sites such that each chunk holds at most chunk_size (frame, site) pairs."""
+    n_sites = len(trajectory.species)
+    sites_per_chunk = max(1, chunk_size // len(trajectory))
+    for start in range(0, n_sites, sites_per_chunk):
+        yield slice(start, min(start + sites_per_chunk, n_sites))
+
+
+def _iter_unwrapped_cart_coords(trajectory: Trajectory, chunk_size: int) -> Iterator[np.ndarray]:
+    """Cartesian positions of all frames for chunks of sites, unwrapped across
+    periodic boundaries.
+
+    Yields:
+        np.ndarray: shape (M, n_chunk_sites, 3) positions of the sites in the chunk.
+    """
+    lattice = trajectory.lattice
+    for sites in _iter_site_chunks(trajectory, chunk_size):
+        coords = np.asarray(trajectory.coords[:, sites], dtype=float)
+        if trajectory.coords_are_displacement:
+            # Displacements from to_displacements are already corrected for PBC
+            start = trajectory.base_positions[sites] + coords[0]
+            displacements = coords[1:]
+        else:
+            start = coords[0]
+            displacements = np.diff(coords, axis=0)
+            if lattice is not None:
+                # As in to_displacements, an atom moving from 0.98 to 0.01 moved by 0.03
+                displacements -= np.round(displacements)
+
+        if lattice is not None:
+            if trajectory.constant_lattice:
+                start, displacements = start @ lattice, displacements @ lattice
+            else:
+                start = start @ lattice[0]
+                displacements = np.einsum("tsj,tji->tsi", displacements, lattice[1:])
+
+        positions = np.empty_like(coords)
+        positions[0] = start
+        np.cumsum(displacements, axis=0, out=positions[1:])
+        positions[1:] += start
+        yield positions
+
+
+def _iter_velocities(trajectory: Trajectory, chunk_size: int) -> Iterator[np.ndarray]:
+    """Velocities of all frames for chunks of sites, either from the "velocities" site
+    property or by finite differences of the positions.
+    """
+    site_props = trajectory.site_properties
+    if isinstance(site_props, dict) or site_props is None or "velocities" not in site_props[0]:
+        if trajectory.time_step is None:
+            raise ValueError("time_step is required to compute velocities from positions")
+        for positions in _iter_unwrapped_cart_coords(trajectory, chunk_size):
+            yield np.diff(positions, axis=0) / trajectory.time_step
+        return
+
+    columns = getattr(site_props, "columns", None)
+    velocities = columns["velocities"] if columns else np.array([props["velocities"] for props in site_props])
+    for sites in _iter_site_chunks(trajectory, chunk_size):
+        yield np.asarray(velocities[:, sites], dtype=float)
+
+
+def _get_autocorrelation(values: np.ndarray) -> np.ndarray:
+    """Autocorrelation sum_t x(t).x(t+m) / (M-m) of each site over all time origins, using
+    zero-padded FFTs.
+
+    Args:
+        values (np.ndarray): shape (M, n_sites, 3). Time series of vectors.
+
+    Returns:
+        np.ndarray: shape (M, n_sites).
+    """
+    n_frames = len(values)
+    fft = np.fft.rfft(values, n=2 * n_frames, axis=0)
+    corr = np.fft.irfft(fft * fft.conj(), n=2 * n_frames, axis=0)[:n_frames].sum(axis=-1)
+    return corr / (n_frames - np.arange(n_frames))[:, None]
+
+
+def _get_msd_fft(positions: np.ndarray) -> np.ndarray:
+    """Mean squared displacement of each site over all time origins.
+
+    Uses MSD(m) = S1(m) - 2 S2(m), where S2 is the position autocorrelation and
+    S1(m) = sum_{t=0}^{M-m-1} (r(t)^2 + r(t+m)^2) / (M-m) is a running sum, see
+    Calandrini et al., École thématique de la Société Française de la Neutronique 12,
+    201 (2011).
+
+    Args:
+        positions (np.ndarray): shape (M, n_sites, 3). Unwrapped positions.
+
+    Returns:
+        np.ndarray: shape (M, n_sites).
+    """
+    n_frames = len(positions)
+    sq_norms = np.sum(positions**2, axis=-1)
+    # Sums of r(t)^2 over t < M-m and over t >= m, for each lag m
+    sum_start = np.cumsum(sq_norms, axis=0)[::-1]
+    sum_end = np.cumsum(sq_norms[::-1], axis=0)[::-1]
+    s1 = (sum_start + sum_end) / (n_frames - np.arange(n_frames))[:, None]
+    return s1 - 2 * _get_autocorrelation(positions)
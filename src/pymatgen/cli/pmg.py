@@ -5,20 +5,32 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import itertools
 
 from tabulate import tabulate, tabulate_formats
 
-from pymatgen.cli.pmg_analyze import analyze
-from pymatgen.cli.pmg_config import configure_pmg
-from pymatgen.cli.pmg_plot import plot
-from pymatgen.cli.pmg_potcar import generate_potcar
-from pymatgen.cli.pmg_structure import analyze_structures
 from pymatgen.core import SETTINGS
 from pymatgen.core.structure import Structure
 from pymatgen.io.vasp import Incar, Potcar
 
 
+def _lazy_command(module_name: str, func_name: str):
+    """Get a sub-command handler that only imports pymatgen.cli.<module_name> when
+    the sub-command is run, so that e.g. "pmg diff" does not pay for matplotlib.
+
+    Args:
+        module_name (str): Name of the module in pymatgen.cli.
+        func_name (str): Name of the handler in that module.
+    """
+
+    def handler(args):
+        module = importlib.import_module(f"pymatgen.cli.{module_name}")
+        return getattr(module, func_name)(args)
+
+    return handler
+
+
 def parse_view(args):
     """Handle view commands.
 
@@ -141,7 +153,7 @@ def main():
         help="Suffix to append to a backup of .pmgrc.yaml when changing this file. "
         "Defaults to '.bak'. Set to '' to disable.",
     )
-    parser_config.set_defaults(func=configure_pmg)
+    parser_config.set_defaults(func=_lazy_command("pmg_config", "configure_pmg"))
 
     parser_analyze = subparsers.add_parser("analyze", help="VASP calculation analysis tools.")
     parser_analyze.add_argument(
@@ -207,7 +219,7 @@ def main():
         default="energy_per_atom",
         help="Sort criteria. Defaults to energy / atom.",
     )
-    parser_analyze.set_defaults(func=analyze)
+    parser_analyze.set_defaults(func=_lazy_command("pmg_analyze", "analyze"))
 
     parser_query = subparsers.add_parser("query", help="Search for structures and data from the Materials Project.")
     parser_query.add_argument(
@@ -319,7 +331,7 @@ def main():
         type=str,
         help="Save plot to file instead of displaying.",
     )
-    parser_plot.set_defaults(func=plot)
+    parser_plot.set_defaults(func=_lazy_command("pmg_plot", "plot"))
 
     parser_structure = subparsers.add_parser("structure", help="Structure conversion and analysis tools.")
 
@@ -375,7 +387,7 @@ def main():
         "Center Species-Ligand Species=max_dist, e.g. H-O=0.5.",
     )
 
-    parser_structure.set_defaults(func=analyze_structures)
+    parser_structure.set_defaults(func=_lazy_command("pmg_structure", "analyze_structures"))
 
     parser_view = subparsers.add_parser("view", help="Visualize structures")
     parser_view.add_argument("filename", metavar="filename", type=str, nargs=1, help="Filename")
@@ -428,7 +440,7 @@ def main():
         type=str,
         help="Dirname to find and generate from POTCAR.spec.",
     )
-    parser_potcar.set_defaults(func=generate_potcar)
+    parser_potcar.set_defaults(func=_lazy_command("pmg_potcar", "generate_potcar"))
 
     try:
         import argcomplete
@@ -10,30 +10,70 @@ import os
 import re
 import string
 import warnings
+import weakref
 from collections import defaultdict
-from functools import total_ordering
+from functools import cache, lru_cache, total_ordering
 from itertools import combinations_with_replacement, product
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, NamedTuple, cast
 
+import numpy as np
 from monty.dev import deprecated
 from monty.fractions import gcd, gcd_float
 from monty.json import MSONable
 from monty.serialization import loadfn
 
-from pymatgen.core.periodic_table import DummySpecies, Element, ElementType, Species, get_el_sp
+from pymatgen.core.periodic_table import (
+    DummySpecies,
+    Element,
+    ElementType,
+    Species,
+    get_el_sp,
+    get_element_property_table,
+)
 from pymatgen.core.units import Mass
 from pymatgen.util.string import Stringify, formula_double_format
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, ItemsView, Iterator, Mapping
+    from collections.abc import Generator, ItemsView, Iterable, Iterator, Mapping
     from typing import Any, ClassVar, Literal
 
+    from numpy.typing import ArrayLike, NDArray
     from typing_extensions import Self
 
     from pymatgen.util.typing import SpeciesLike
 
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Maximum number of distinct formula strings whose parsed form is kept
+FORMULA_CACHE_SIZE = 16384
+
+# Interned Compositions, keyed by their type, allow_negative and items
+_INTERNED: weakref.WeakValueDictionary[tuple, Composition] = weakref.WeakValueDictionary()
+_INTERN_COUNTS: collections.Counter[str] = collections.Counter()
+
+
+class CompositionCacheInfo(NamedTuple):
+    """Hit and miss counts of the formula parsing cache and of Composition interning."""
+
+    formula_hits: int
+    formula_misses: int
+    formula_size: int
+    interned_hits: int
+    interned_misses: int
+    interned_size: int
+
+    @property
+    def formula_hit_rate(self) -> float:
+        """Fraction of formula parses served from the cache."""
+        total = self.formula_hits + self.formula_misses
+        return self.formula_hits / total if total else 0.0
+
+    @property
+    def interned_hit_rate(self) -> float:
+        """Fraction of Composition.interned calls that returned an existing instance."""
+        total = self.interned_hits + self.interned_misses
+        return self.interned_hits / total if total else 0.0
+
 
 @total_ordering
 class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, Stringify):
@@ -304,8 +344,18 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
     __div__ = __truediv__
 
     def __hash__(self) -> int:
-        """Hash based on the chemical system."""
-        return hash(frozenset(self._data))
+        """Hash based on the chemical system. Computed once, as Compositions are immutable."""
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash: int = hash(frozenset(self._data))
+            return self._hash
+
+    def __getstate__(self) -> dict[str, Any]:
+        # String hashes are salted per process, so the cached hash must not be pickled
+        state = self.__dict__.copy()
+        state.pop("_hash", None)
+        return state
 
     def __repr__(self) -> str:
         formula = " ".join(f"{key}{':' if hasattr(key, 'oxi_state') else ''}{val:g}" for key, val in self.items())
@@ -363,6 +413,53 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         """A copy of the composition."""
         return type(self)(self, allow_negative=self.allow_negative)
 
+    @classmethod
+    def interned(cls, *args, **kwargs) -> Self:
+        """Get a shared Composition equal to Composition(*args, **kwargs).
+
+        Compositions with identical amounts and allow_negative share one instance
+        (and its precomputed hash) for as long as any reference to it is alive,
+        which saves memory when many entries have the same formula. Since
+        Compositions are immutable, the shared instance can be used anywhere
+        a new one would be.
+
+        Args:
+            *args: Any input accepted by the Composition constructor.
+            **kwargs: Any keyword argument accepted by the Composition constructor.
+
+        Returns:
+            Composition: The interned instance.
+        """
+        comp = args[0] if len(args) == 1 and not kwargs and type(args[0]) is cls else cls(*args, **kwargs)
+        key = (cls, comp.allow_negative, frozenset(comp.items()))
+        if (existing := _INTERNED.get(key)) is not None:
+            _INTERN_COUNTS["hits"] += 1
+            return existing
+        _INTERN_COUNTS["misses"] += 1
+        hash(comp)
+        _INTERNED[key] = comp
+        return comp
+
+    @staticmethod
+    def cache_info() -> CompositionCacheInfo:
+        """Hit and miss counts of the formula parsing cache and of interning."""
+        parse_info = _parse_formula.cache_info()
+        return CompositionCacheInfo(
+            formula_hits=parse_info.hits,
+            formula_misses=parse_info.misses,
+            formula_size=parse_info.currsize,
+            interned_hits=_INTERN_COUNTS["hits"],
+            interned_misses=_INTERN_COUNTS["misses"],
+            interned_size=len(_INTERNED),
+        )
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the formula parsing cache, the interned Compositions and their counters."""
+        _parse_formula.cache_clear()
+        _INTERNED.clear()
+        _INTERN_COUNTS.clear()
+
     @property
     def formula(self) -> str:
         """A formula string, with elements sorted by electronegativity,
@@ -610,44 +707,9 @@ class Composition(collections.abc.Hashable, collections.abc.Mapping, MSONable, S
         Notes:
             In the case of Metallofullerene formula (e.g. Y3N@C80),
             the @ mark will be dropped and passed to parser.
+            Parsed formulas are kept in a bounded LRU cache, see Composition.cache_info.
         """
-        # Raise error if formula contains special characters or only spaces and/or numbers
-        if strict and re.match(r"[\s\d.*/]*$", formula):
-            raise ValueError(f"Invalid {formula=}")
-
-        # For Metallofullerene like "Y3N@C80"
-        formula = formula.replace("@", "")
-        # Square brackets are used in formulas to denote coordination complexes (gh-3583)
-        formula = formula.replace("[", "(")
-        formula = formula.replace("]", ")")
-        # next 2 lines covered by test_curly_bracket_deeply_nested_formulas
-        formula = formula.replace("{", "(")
-        formula = formula.replace("}", ")")
-
-        def get_sym_dict(form: str, factor: float) -> dict[str, float]:
-            sym_dict: dict[str, float] = defaultdict(float)
-            for match in re.finditer(r"([A-Z][a-z]*)\s*([-*\.e\d]*)", form):
-                el = match[1]
-                amt = 1.0
-                if match[2].strip() != "":
-                    amt = float(match[2])
-                sym_dict[el] += amt * factor
-                form = form.replace(match.group(), "", 1)
-            if form.strip():
-                raise ValueError(f"{form} is an invalid formula!")
-            return sym_dict
-
-        match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
-        while match:
-            factor = 1.0
-            if match[2] != "":
-                factor = float(match[2])
-            unit_sym_dict = get_sym_dict(match[1], factor)
-            expanded_sym = "".join(f"{el}{amt}" for el, amt in unit_sym_dict.items())
-            expanded_formula = formula.replace(match.group(), expanded_sym, 1)
-            formula = expanded_formula
-            match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
-        return get_sym_dict(formula, 1)
+        return dict(_parse_formula(formula, strict))
 
     @property
     def anonymized_formula(self) -> str:
@@ -1393,6 +1455,50 @@ def reduce_formula(
     return "".join([*reduced_form, *poly_anions]), factor
 
 
+@lru_cache(maxsize=FORMULA_CACHE_SIZE)
+def _parse_formula(formula: str, strict: bool) -> tuple[tuple[str, float], ...]:
+    """Parse a formula string into (symbol, amount) pairs. Cached since the
+    same formulas are parsed over and over when processing entries.
+    """
+    # Raise error if formula contains special characters or only spaces and/or numbers
+    if strict and re.match(r"[\s\d.*/]*$", formula):
+        raise ValueError(f"Invalid {formula=}")
+
+    # For Metallofullerene like "Y3N@C80"
+    formula = formula.replace("@", "")
+    # Square brackets are used in formulas to denote coordination complexes (gh-3583)
+    formula = formula.replace("[", "(")
+    formula = formula.replace("]", ")")
+    # next 2 lines covered by test_curly_bracket_deeply_nested_formulas
+    formula = formula.replace("{", "(")
+    formula = formula.replace("}", ")")
+
+    def get_sym_dict(form: str, factor: float) -> dict[str, float]:
+        sym_dict: dict[str, float] = defaultdict(float)
+        for match in re.finditer(r"([A-Z][a-z]*)\s*([-*\.e\d]*)", form):
+            el = match[1]
+            amt = 1.0
+            if match[2].strip() != "":
+                amt = float(match[2])
+            sym_dict[el] += amt * factor
+            form = form.replace(match.group(), "", 1)
+        if form.strip():
+            raise ValueError(f"{form} is an invalid formula!")
+        return sym_dict
+
+    match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
+    while match:
+        factor = 1.0
+        if match[2] != "":
+            factor = float(match[2])
+        unit_sym_dict = get_sym_dict(match[1], factor)
+        expanded_sym = "".join(f"{el}{amt}" for el, amt in unit_sym_dict.items())
+        expanded_formula = formula.replace(match.group(), expanded_sym, 1)
+        formula = expanded_formula
+        match = re.search(r"\(([^\(\)]+)\)\s*([\.e\d]*)", formula)
+    return tuple(get_sym_dict(formula, 1).items())
+
+
 class CompositionError(Exception):
     """Composition exceptions."""
 
@@ -1456,3 +1562,266 @@ class ChemicalPotential(dict, MSONable):
         if strict and (missing := set(composition) - set(self)):
             raise ValueError(f"Potentials not specified for {missing}")
         return sum(self.get(key, 0) * val for key, val in composition.items())
+
+
+@cache
+def _get_element_table() -> tuple[tuple[str, ...], NDArray[np.float64], NDArray[np.float64]]:
+    """Symbols, atomic masses and Pauling electronegativities of all elements,
+    indexed by Z - 1. Electronegativities are NaN where no value is known.
+    """
+    masses = get_element_property_table("atomic_mass")[1:]
+    symbols = tuple(Element.from_Z(z).symbol for z in range(1, len(masses) + 1))
+    return symbols, masses, get_element_property_table("X")[1:]
+
+
+@cache
+def _get_symbol_columns() -> dict[str, int]:
+    """Map of element symbol to its CompositionMatrix column."""
+    return {sym: idx for idx, sym in enumerate(_get_element_table()[0])}
+
+
+class CompositionMatrix:
+    """An array-backed collection of element compositions, e.g. all the
+    formulas of a large dataset. Rows are compositions and columns are
+    elements ordered by atomic number, i.e. column Z - 1 holds the amount of
+    the element with atomic number Z.
+
+    Properties that Composition computes one object at a time, such as
+    reduced compositions, weights, atomic fractions or chemical systems, are
+    computed here for all rows at once with numpy. Oxidation states are not
+    stored: Species are counted as their elements, as in
+    Composition.element_composition.
+
+    Examples:
+        >>> comps = CompositionMatrix.from_formulas(["Fe2O3", "Li4Fe4P4O16"])
+        >>> comps.get_atomic_fraction("O")
+        array([0.6       , 0.57142857])
+        >>> comps.reduced_composition.to_formulas()
+        ['Fe2 O3', 'Li1 Fe1 P1 O4']
+        >>> comps.chemical_systems
+        ['Fe-O', 'Fe-Li-O-P']
+    """
+
+    def __init__(self, amounts: ArrayLike) -> None:
+        """
+        Args:
+            amounts (ArrayLike): (n_compositions, n_elements) amounts, where
+                column Z - 1 holds the amount of the element with atomic number Z.
+                The array is copied.
+        """
+        amounts = np.array(amounts, dtype=float)
+        n_elements = len(_get_element_table()[0])
+        if amounts.ndim != 2 or amounts.shape[1] != n_elements:
+            raise ValueError(f"amounts must have shape (n_compositions, {n_elements}), got {amounts.shape}")
+        amounts[np.abs(amounts) < Composition.amount_tolerance] = 0
+        amounts.flags.writeable = False
+        self._amounts = amounts
+
+    def __len__(self) -> int:
+        return len(self._amounts)
+
+    def __iter__(self) -> Iterator[Composition]:
+        return iter(self.to_compositions())
+
+    def __getitem__(self, idx: int | slice | ArrayLike) -> Composition | CompositionMatrix:
+        """An integer index gives a Composition, anything else that numpy
+        accepts as a row index gives a new CompositionMatrix.
+        """
+        if isinstance(idx, int | np.integer):
+            return self._to_composition(self._amounts[idx])
+        return type(self)(self._amounts[idx])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompositionMatrix):
+            return NotImplemented
+        return self._amounts.shape == other._amounts.shape and np.allclose(
+            self._amounts, other._amounts, rtol=0, atol=Composition.amount_tolerance
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} compositions, {len(self.elements)} elements)"
+
+    @property
+    def amounts(self) -> NDArray[np.float64]:
+        """Read-only (n_compositions, n_elements) array of amounts."""
+        return self._amounts
+
+    @property
+    def elements(self) -> list[Element]:
+        """Elements present in at least one composition, sorted by Z."""
+        return [Element.from_Z(idx + 1) for idx in np.flatnonzero(np.any(self._amounts != 0, axis=0))]
+
+    @classmethod
+    def from_compositions(cls, compositions: Iterable[Composition | Mapping | str]) -> Self:
+        """Create a CompositionMatrix from Compositions, or anything the
+        Composition constructor accepts.
+
+        Args:
+            compositions (Iterable[Composition | Mapping | str]): Compositions.
+
+        Raises:
+            CompositionError: If a composition contains a DummySpecies.
+        """
+        rows: list[int] = []
+        cols: list[int] = []
+        vals: list[float] = []
+        n_rows = 0
+        for row, comp in enumerate(compositions):
+            n_rows += 1
+            if not isinstance(comp, Composition):
+                comp = Composition(comp)
+            for sp, amt in comp.items():
+                if isinstance(sp, DummySpecies):
+                    raise CompositionError(f"{sp} has no column in a CompositionMatrix")
+                rows.append(row)
+                cols.append(sp.Z - 1)
+                vals.append(amt)
+        return cls._from_coo(rows, cols, vals, n_rows)
+
+    @classmethod
+    def from_formulas(cls, formulas: Iterable[str]) -> Self:
+        """Create a CompositionMatrix from formula strings, e.g. "Li3Fe2(PO4)3".
+        Formulas are parsed as in Composition but no Composition objects are made.
+
+        Args:
+            formulas (Iterable[str]): Formula strings.
+
+        Raises:
+            ValueError: If a formula is invalid or contains negative amounts.
+        """
+        columns = _get_symbol_columns()
+        rows: list[int] = []
+        cols: list[int] = []
+        vals: list[float] = []
+        n_rows = 0
+        for row, formula in enumerate(formulas):
+            n_rows += 1
+            for sym, amt in Composition._parse_formula(formula).items():
+                if sym not in columns:
+                    raise ValueError(f"{sym} in {formula=} is not an element")
+                if amt < -Composition.amount_tolerance:
+                    raise ValueError("Amounts in Composition cannot be negative!")
+                rows.append(row)
+                cols.append(columns[sym])
+                vals.append(amt)
+        return cls._from_coo(rows, cols, vals, n_rows)
+
+    @classmethod
+    def _from_coo(cls, rows: list[int], cols: list[int], vals: list[float], n_rows: int) -> Self:
+        """Build from (row, column, amount) triplets, summing repeated entries."""
+        amounts = np.zeros((n_rows, len(_get_element_table()[0])))
+        np.add.at(amounts, (np.array(rows, dtype=int), np.array(cols, dtype=int)), vals)
+        return cls(amounts)
+
+    @staticmethod
+    def _to_composition(row: NDArray[np.float64]) -> Composition:
+        symbols = _get_element_table()[0]
+        return Composition({symbols[idx]: float(row[idx]) for idx in np.flatnonzero(row)}, allow_negative=True)
+
+    def to_compositions(self) -> list[Composition]:
+        """The rows as a list of Compositions."""
+        return [self._to_composition(row) for row in self._amounts]
+
+    def to_formulas(self, reduced: bool = False) -> list[str]:
+        """The rows as formula strings.
+
+        Args:
+            reduced (bool): Whether to give Composition.reduced_formula instead
+                of Composition.formula. Defaults to False.
+        """
+        if reduced:
+            return [comp.reduced_formula for comp in self.to_compositions()]
+        return [comp.formula for comp in self.to_compositions()]
+
+    @property
+    def num_atoms(self) -> NDArray[np.float64]:
+        """Total number of atoms of each composition."""
+        return np.abs(self._amounts).sum(axis=1)
+
+    def get_atomic_fraction(self, el: SpeciesLike) -> NDArray[np.float64]:
+        """Calculate the atomic fraction of an element in every composition.
+
+        Args:
+            el (SpeciesLike): Element or Species (counted as its element).
+
+        Returns:
+            NDArray: Atomic fraction of el for each composition.
+        """
+        sp = get_el_sp(el)
+        if isinstance(sp, DummySpecies):
+            raise CompositionError(f"{sp} has no column in a CompositionMatrix")
+        return np.abs(self._amounts[:, sp.Z - 1]) / self.num_atoms
+
+    @property
+    def fractional_composition(self) -> Self:
+        """The compositions normalized so the amounts of each row sum to 1."""
+        return type(self)(self._amounts / self.num_atoms[:, None])
+
+    def get_reduced_composition_and_factor(self) -> tuple[Self, NDArray[np.float64]]:
+        """Calculate the reduced compositions and factors, consistent with
+        Composition.get_reduced_composition_and_factor for each row.
+
+        Returns:
+            tuple[CompositionMatrix, NDArray]: Reduced compositions and
+                multiplicative factors.
+        """
+        amounts = self._amounts
+        int_amounts = np.round(amounts)
+        all_int = np.all(np.abs(amounts - int_amounts) < Composition.amount_tolerance, axis=1)
+        factors = np.gcd.reduce(int_amounts.astype(np.int64), axis=1).astype(float)
+        factors[~all_int | (factors == 0)] = 1
+
+        # Do not "completely reduce" certain formulas, e.g. Li2O2 stays Li2O2
+        reduced = amounts / factors[:, None]
+        candidates = np.flatnonzero(all_int & (np.count_nonzero(amounts, axis=1) <= 2))
+        if len(candidates) > 0:
+            special = type(self).from_formulas(Composition.special_formulas)._amounts
+            matches = np.all(reduced[candidates, None, :] == special[None], axis=-1).any(axis=1)
+            factors[candidates[matches]] /= 2
+
+        return type(self)(amounts / factors[:, None]), factors
+
+    @property
+    def reduced_composition(self) -> Self:
+        """The reduced compositions, i.e. amounts normalized by greatest common denominator."""
+        return self.get_reduced_composition_and_factor()[0]
+
+    @property
+    def weight(self) -> NDArray[np.float64]:
+        """Total molecular weight of each composition in amu."""
+        return self._amounts @ _get_element_table()[1]
+
+    @property
+    def average_electroneg(self) -> NDArray[np.float64]:
+        """Average electronegativity of each composition. NaN for compositions
+        with an element that has no Pauling electronegativity, as in Composition.
+        """
+        electronegs = _get_element_table()[2]
+        known = ~np.isnan(electronegs)
+        abs_amounts = np.abs(self._amounts)
+        avg = abs_amounts[:, known] @ electronegs[known] / self.num_atoms
+        avg[np.any(abs_amounts[:, ~known] > 0, axis=1)] = np.nan
+        return avg
+
+    @property
+    def chemical_systems(self) -> list[str]:
+        """The chemical system of each composition, e.g. "O-Si" for SiO2, as in
+        Composition.chemical_system.
+        """
+        unique_masks, inverse = np.unique(self._amounts != 0, axis=0, return_inverse=True)
+        symbols = _get_element_table()[0]
+        unique_systems = ["-".join(sorted(symbols[idx] for idx in np.flatnonzero(mask))) for mask in unique_masks]
+        return [unique_systems[idx] for idx in inverse.ravel()]
+
+    def group_by_chemical_system(self) -> dict[str, NDArray[np.intp]]:
+        """Row indices of the compositions in each chemical system.
+
+        Returns:
+            dict[str, NDArray]: Chemical system to sorted row indices.
+        """
+        groups: dict[str, list[int]] = defaultdict(list)
+        for idx, chemsys in enumerate(self.chemical_systems):
+            groups[chemsys].append(idx)
+        return {chemsys: np.array(indices, dtype=np.intp) for chemsys, indices in groups.items()}
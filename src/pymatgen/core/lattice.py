@@ -10,7 +10,7 @@ import operator
 import warnings
 from collections import defaultdict
 from fractions import Fraction
-from functools import cached_property, reduce
+from functools import cached_property, lru_cache, reduce
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -34,6 +34,9 @@ __copyright__ = "Copyright 2011, The Materials Project"
 __maintainer__ = "Shyue Ping Ong"
 __email__ = "shyuep@gmail.com"
 
+# Maximum number of lattices whose Niggli/LLL reduction is cached per tolerance
+REDUCTION_CACHE_SIZE = 1024
+
 
 class Lattice(MSONable):
     """Essentially a matrix with conversion matrices. In general,
@@ -543,16 +546,12 @@ class Lattice(MSONable):
     @property
     def lll_matrix(self) -> NDArray[np.float64]:
         """The matrix for LLL reduction."""
-        if 0.75 not in self._lll_matrix_mappings:
-            self._lll_matrix_mappings[0.75] = self._calculate_lll()
-        return self._lll_matrix_mappings[0.75][0]
+        return self._get_lll_matrix_mapping()[0]
 
     @property
     def lll_mapping(self) -> NDArray[np.float64]:
         """The mapping between the LLL reduced lattice and the original lattice."""
-        if 0.75 not in self._lll_matrix_mappings:
-            self._lll_matrix_mappings[0.75] = self._calculate_lll()
-        return self._lll_matrix_mappings[0.75][1]
+        return self._get_lll_matrix_mapping()[1]
 
     @property
     def lll_inverse(self) -> NDArray[np.float64]:
@@ -1044,9 +1043,16 @@ class Lattice(MSONable):
         Returns:
             Lattice: LLL reduced
         """
+        return type(self)(self._get_lll_matrix_mapping(delta)[0])
+
+    def _get_lll_matrix_mapping(self, delta: float = 0.75) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """LLL reduced lattice matrix and mapping, looked up in the reduction
+        cache shared by all lattices with the same matrix.
+        """
         if delta not in self._lll_matrix_mappings:
-            self._lll_matrix_mappings[delta] = self._calculate_lll()
-        return type(self)(self._lll_matrix_mappings[delta][0])
+            matrix, mapping = _get_lll_matrix_mapping(_get_reduction_key(self._matrix), delta)
+            self._lll_matrix_mappings[delta] = (matrix.copy(), mapping.copy())
+        return self._lll_matrix_mappings[delta]
 
     def _calculate_lll(self, delta: float = 0.75) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
         """Perform a Lenstra-Lenstra-Lovasz lattice basis reduction to obtain a
@@ -1149,10 +1155,24 @@ class Lattice(MSONable):
         Acta Crystallographica Section A Foundations of Crystallography, 2003,
         60(1), 1-6. doi:10.1107/S010876730302186X.
 
+        Repeated reductions of the same lattice are served from a bounded cache
+        keyed on the lattice matrix and tol.
+
         Args:
             tol (float): The numerical tolerance. The default of 1e-5 should
                 result in stable behavior for most cases.
 
+        Returns:
+            Lattice: Niggli-reduced lattice.
+        """
+        return type(self)(_get_niggli_matrix(_get_reduction_key(self._matrix), tol))
+
+    def _calculate_niggli(self, tol: float = 1e-5) -> Self:
+        """Run the Niggli reduction algorithm, see get_niggli_reduced_lattice.
+
+        Args:
+            tol (float): The numerical tolerance.
+
         Returns:
             Lattice: Niggli-reduced lattice.
         """
@@ -1765,6 +1785,29 @@ class Lattice(MSONable):
         return analyzer.get_symmetry_operations()
 
 
+def _get_reduction_key(matrix: NDArray[np.float64]) -> bytes:
+    """Hashable key of a lattice matrix for the reduction cache."""
+    # The exact matrix is used as key, as the reduction is sensitive to small changes
+    return np.ascontiguousarray(matrix, dtype=np.float64).tobytes()
+
+
+@lru_cache(maxsize=REDUCTION_CACHE_SIZE)
+def _get_niggli_matrix(key: bytes, tol: float) -> NDArray[np.float64]:
+    """Niggli-reduced matrix of the lattice matrix with the given key."""
+    matrix = Lattice(np.frombuffer(key))._calculate_niggli(tol).matrix
+    matrix.setflags(write=False)
+    return matrix
+
+
+@lru_cache(maxsize=REDUCTION_CACHE_SIZE)
+def _get_lll_matrix_mapping(key: bytes, delta: float) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """LLL-reduced matrix and mapping of the lattice matrix with the given key."""
+    matrix, mapping = Lattice(np.frombuffer(key))._calculate_lll(delta)
+    matrix.setflags(write=False)
+    mapping.setflags(write=False)
+    return matrix, mapping
+
+
 def get_integer_index(
     miller_index: tuple[int, ...],
     round_dp: int = 4,
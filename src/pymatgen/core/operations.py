@@ -142,6 +142,26 @@ class SymmOp(MSONable):
         affine_points = np.concatenate([points, np.ones(points.shape[:-1] + (1,))], axis=-1)
         return np.inner(affine_points, self.affine_matrix)[..., :-1]
 
+    @staticmethod
+    def operate_stack(symm_ops: Sequence[SymmOp] | ArrayLike, points: ArrayLike) -> NDArray[np.float64]:
+        """Apply each of a stack of operations on each of a list of points,
+        in a single vectorized call.
+
+        Args:
+            symm_ops: K SymmOps, or their (K, 4, 4) affine matrices.
+            points: List of coordinates, of shape (..., 3).
+
+        Returns:
+            Numpy array of shape (K, ..., 3), where entry k holds the points
+                after operation k, i.e. symm_ops[k].operate_multi(points).
+        """
+        if not isinstance(symm_ops, np.ndarray):
+            symm_ops = [op.affine_matrix if isinstance(op, SymmOp) else op for op in symm_ops]
+        affine_matrices = np.asarray(symm_ops, dtype=float).reshape(-1, 4, 4)
+        points = np.asarray(points, dtype=float)
+        translations = affine_matrices[:, :3, 3].reshape(-1, *[1] * (points.ndim - 1), 3)
+        return np.einsum("kij,...j->k...i", affine_matrices[:, :3, :3], points) + translations
+
     def apply_rotation_only(self, vector: NDArray) -> NDArray:
         """Vectors should only be operated by the rotation matrix and not the
         translation vector.
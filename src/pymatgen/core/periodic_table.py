@@ -9,10 +9,12 @@ from __future__ import annotations
 
 import ast
 import functools
-import gzip
+import mmap
 import re
+import struct
 import warnings
 from collections import Counter
+from collections.abc import Hashable, Mapping
 from enum import Enum, EnumMeta, unique
 from itertools import combinations, product
 from pathlib import Path
@@ -27,21 +29,139 @@ from pymatgen.io.core import ParseError
 from pymatgen.util.string import Stringify, formula_double_format
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator, Sequence
     from typing import Any, Literal
 
+    from numpy.typing import NDArray
     from typing_extensions import Self
 
     from pymatgen.util.typing import SpeciesLike
 
-# Load element data (periodic table) from JSON file
-# NOTE: you should not update the JSON file manually,
-# see `dev_scripts/generate_periodic_table_yaml_json.py`
-with gzip.open(Path(__file__).absolute().parent / "periodic_table.json.gz", mode="rb") as ptable_json:
-    _RAW_PT_DATA: dict = orjson.loads(ptable_json.read())
+# Binary periodic table, see _PeriodicTableData for its layout
+_PT_BINARY_MAGIC: bytes = b"PMGPTBL1"
+_PT_BINARY_HEADER = struct.Struct("<8sQ")
+
+
+class _ElementData(Mapping):
+    """Read-only {property: value} view of one element in a _PeriodicTableData.
+
+    Values are looked up in each of the given symbols in turn, which is how
+    named isotopes (e.g. D) fall back to the data of their element (H).
+    """
+
+    def __init__(self, table: _PeriodicTableData, symbols: tuple[str, ...]) -> None:
+        self._table = table
+        self._symbols = symbols
+
+    def __getitem__(self, prop: str) -> Any:
+        column = self._table.column(prop)
+        for sym in self._symbols:
+            if sym in column:
+                return column[sym]
+        raise KeyError(prop)
+
+    def __contains__(self, prop: object) -> bool:
+        if prop not in self._table.properties:
+            return False
+        column = self._table.column(prop)  # type: ignore[arg-type]
+        return any(sym in column for sym in self._symbols)
+
+    def __iter__(self) -> Iterator[str]:
+        return (prop for prop in self._table.properties if prop in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def copy(self) -> dict[str, Any]:
+        """A dict of all properties, decoding every column."""
+        return dict(self.items())
+
+
+class _PeriodicTableData(Mapping):
+    """Memory-mapped periodic table, decoded one property at a time.
+
+    The file holds a header followed by one orjson-encoded {symbol: value}
+    block per property:
+        magic (8 bytes) | header size (uint64, little-endian) | header | blocks
+    where the header is orjson-encoded {"symbols": [...], "_unit": {...},
+    "columns": {property: [offset, size]}} with offsets relative to the first
+    block. Since the file is mapped read-only, processes share its pages and
+    only pay for the properties they use.
+    """
+
+    def __init__(self, filename: str | Path) -> None:
+        with open(filename, mode="rb") as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_size = _PT_BINARY_HEADER.unpack_from(self._buffer)
+        if magic != _PT_BINARY_MAGIC:
+            raise ValueError(f"{filename} is not a binary periodic table")
+        start = _PT_BINARY_HEADER.size
+        header = orjson.loads(memoryview(self._buffer)[start : start + header_size])
+        self._data_start = start + header_size
+        self._spans: dict[str, tuple[int, int]] = {prop: tuple(span) for prop, span in header["columns"].items()}
+        self._columns: dict[str, dict[str, Any]] = {}
+        self.symbols: tuple[str, ...] = tuple(header["symbols"])
+        self.properties: tuple[str, ...] = tuple(self._spans)
+        self.units: dict[str, str] = header["_unit"]
+
+    def column(self, prop: str) -> dict[str, Any]:
+        """The {symbol: value} data of a property, decoded on first access.
+
+        Raises:
+            KeyError: If no element has the property.
+        """
+        if (column := self._columns.get(prop)) is None:
+            offset, size = self._spans[prop]
+            start = self._data_start + offset
+            column = self._columns[prop] = orjson.loads(memoryview(self._buffer)[start : start + size])
+        return column
+
+    def element_data(self, *symbols: str) -> _ElementData:
+        """Data of an element, falling back to the data of further symbols if given."""
+        return _ElementData(self, symbols)
+
+    def __getitem__(self, symbol: str) -> _ElementData:
+        if symbol not in self.symbols:
+            raise KeyError(symbol)
+        return self.element_data(symbol)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.symbols)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
 
-_PT_UNIT: dict[str, str] = _RAW_PT_DATA.pop("_unit")
-_PT_DATA: dict[str, Any] = _RAW_PT_DATA
+def _write_pt_binary(pt_data: dict[str, dict[str, Any]], filename: str | Path) -> None:
+    """Write periodic table data in the {symbol: {property: value}} format of
+    periodic_table.json.gz, including its "_unit" key, as a binary table
+    readable by _PeriodicTableData.
+    """
+    pt_data = dict(pt_data)
+    units = pt_data.pop("_unit")
+    props = list(dict.fromkeys(prop for data in pt_data.values() for prop in data))
+
+    blocks: list[bytes] = []
+    spans: dict[str, list[int]] = {}
+    offset = 0
+    for prop in props:
+        block = orjson.dumps({sym: data[prop] for sym, data in pt_data.items() if prop in data})
+        spans[prop] = [offset, len(block)]
+        blocks.append(block)
+        offset += len(block)
+
+    header = orjson.dumps({"symbols": list(pt_data), "_unit": units, "columns": spans})
+    with open(filename, mode="wb") as file:
+        file.write(_PT_BINARY_HEADER.pack(_PT_BINARY_MAGIC, len(header)))
+        file.write(header)
+        file.writelines(blocks)
+
+
+# Load element data (periodic table) from the binary file
+# NOTE: you should not update the data files manually,
+# see `dev_scripts/generate_periodic_table_yaml_json.py`
+_PT_DATA: _PeriodicTableData = _PeriodicTableData(Path(__file__).absolute().parent / "periodic_table.bin")
+_PT_UNIT: dict[str, str] = _PT_DATA.units
 
 _PT_ROW_SIZES: tuple[int, ...] = (2, 8, 8, 18, 18, 32, 32)
 
@@ -152,7 +272,7 @@ class ElementBase(Enum):
             # For specified/named isotopes, treat the same as named element
             # (the most common isotope). Then we pad the data block with the
             # entries for the named element.
-            data = {**_PT_DATA[self.symbol], **data}
+            data = _PT_DATA.element_data(symbol, self.symbol)
 
         at_r: float | None = data.get("Atomic radius")
         self._atomic_radius = None if at_r is None else Length(at_r, _PT_UNIT["Atomic radius"])
@@ -790,7 +910,7 @@ class ElementBase(Enum):
     @property
     def is_quadrupolar(self) -> bool:
         """Check if this element can be quadrupolar."""
-        return len(self.data.get("NMR Quadrupole Moment", {})) > 0
+        return len(self._data.get("NMR Quadrupole Moment", {})) > 0
 
     @property
     def nmr_quadrupole_moment(self) -> dict[str, FloatWithUnit]:
@@ -799,7 +919,7 @@ class ElementBase(Enum):
         """
         return {
             k: FloatWithUnit(v, _PT_UNIT["NMR Quadrupole Moment"])
-            for k, v in self.data.get("NMR Quadrupole Moment", {}).items()
+            for k, v in self._data.get("NMR Quadrupole Moment", {}).items()
         }
 
     @property
@@ -1657,6 +1777,107 @@ def get_el_sp(obj: int | SpeciesLike) -> Element | Species | DummySpecies:
         raise ValueError(f"Can't parse Element or Species from {obj!r}") from exc
 
 
+# Largest atomic number in the periodic table
+_MAX_Z: int = max(el.Z for el in Element)
+
+
+@functools.cache
+def get_element_property_table(prop: str) -> NDArray[np.float64]:
+    """Dense lookup table of a numeric Element property, indexed by atomic
+    number, for vectorized featurization. E.g. get_element_property_table("X")[26]
+    is Element("Fe").X. Index 0 is kept for DummySpecies and is always NaN.
+
+    Args:
+        prop (str): Name of an Element attribute with numeric (or bool) values,
+            e.g. "X", "atomic_mass", "atomic_radius", "row" or "group".
+
+    Raises:
+        ValueError: If Element has no property prop.
+        TypeError: If prop is not a numeric Element property.
+
+    Returns:
+        NDArray: Read-only array of length 119 with the property in its base
+            units (e.g. amu, Angstrom) and NaN where no value is known.
+    """
+    table = np.full(_MAX_Z + 1, np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for el in Element:
+            try:
+                val = getattr(el, prop)
+            except AttributeError as exc:
+                raise ValueError(f"Element has no property {prop!r}") from exc
+            except (KeyError, ValueError):
+                continue
+            if val is None:
+                continue
+            if not isinstance(val, int | float):
+                raise TypeError(f"{prop!r} is not a numeric Element property, got {type(val).__name__}")
+            table[el.Z] = val
+    table.flags.writeable = False
+    return table
+
+
+def get_occupancy_matrix(species: Sequence[Mapping[SpeciesLike, float]]) -> NDArray[np.float64]:
+    """Occupancies by atomic number of a sequence of sites, e.g.
+    Structure.species_and_occu. Species are counted as their element and
+    DummySpecies in column 0.
+
+    Args:
+        species (Sequence[Mapping[SpeciesLike, float]]): {species: occupancy}
+            for each site, e.g. Compositions.
+
+    Returns:
+        NDArray: (n_sites, 119) occupancies.
+    """
+    occupancies = np.zeros((len(species), _MAX_Z + 1))
+    rows: dict[Any, NDArray[np.float64]] = {}
+    for idx, comp in enumerate(species):
+        # Sites usually share a few species, so each distinct one is looked up once
+        hashable = isinstance(comp, Hashable)
+        if (row := rows.get(comp) if hashable else None) is None:
+            row = np.zeros(_MAX_Z + 1)
+            for sp, occu in comp.items():
+                sp = get_el_sp(sp)
+                row[0 if isinstance(sp, DummySpecies) else sp.Z] += occu
+            if hashable:
+                rows[comp] = row
+        occupancies[idx] = row
+    return occupancies
+
+
+def get_element_properties(
+    species: Sequence[Mapping[SpeciesLike, float]] | NDArray[np.float64],
+    props: str | Sequence[str],
+) -> dict[str, NDArray[np.float64]]:
+    """Numeric Element properties of many sites at once. Disordered sites get
+    the occupancy-weighted average of their species, normalized by the total
+    occupancy of the site.
+
+    Args:
+        species (Sequence[Mapping[SpeciesLike, float]] | NDArray): {species: occupancy}
+            for each site, e.g. Structure.species_and_occu, or an occupancy
+            matrix from get_occupancy_matrix.
+        props (str | Sequence[str]): Names of numeric Element properties,
+            see get_element_property_table.
+
+    Returns:
+        dict[str, NDArray]: Property name to array with a value per site.
+            NaN for sites with a species that has no value for the property.
+    """
+    occupancies = species if isinstance(species, np.ndarray) else get_occupancy_matrix(species)
+    total_occu = occupancies.sum(axis=1)
+    properties: dict[str, NDArray[np.float64]] = {}
+    for prop in [props] if isinstance(props, str) else props:
+        table = get_element_property_table(prop)
+        known = ~np.isnan(table)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = occupancies[:, known] @ table[known] / total_occu
+        values[np.any(occupancies[:, ~known] != 0, axis=1)] = np.nan
+        properties[prop] = values
+    return properties
+
+
 @unique
 class ElementType(Enum):
     """Enum for element types."""
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import collections
+import contextlib
 import json
+import operator
 import warnings
 from typing import TYPE_CHECKING, cast
 
@@ -17,6 +19,7 @@ from pymatgen.util.coord import pbc_diff
 from pymatgen.util.misc import is_np_dict_equal
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
     from typing import Any, Literal
 
     from numpy.typing import ArrayLike, NDArray
@@ -653,3 +656,505 @@ class PeriodicSite(Site, MSONable):
         label = dct.get("label")
         lattice = lattice or Lattice.from_dict(dct["lattice"])
         return cls(species, dct["abc"], lattice, properties=props, label=label)
+
+
+class ColumnarSites(collections.abc.MutableSequence):
+    """Array-backed sequence of PeriodicSites sharing a common lattice.
+
+    Species are stored as indices into a table of unique Compositions, fractional
+    coordinates as a contiguous (N, 3) array and site properties as one column
+    (list or NumPy array) per property. PeriodicSite objects are only built when
+    a caller indexes or iterates, and are then cached so that in-place changes
+    to a returned site are honored: bulk accessors such as frac_coords first
+    sync the state of all handed-out sites back into the columns.
+
+    Copies are copy-on-write: they share the species, coordinate, property and
+    label buffers with the original until either side is about to change them
+    or hand out a site, at which point that side takes a private copy.
+
+    This is the storage backend of IStructure/Structure created with
+    columnar=True and is not meant to be instantiated directly by most users.
+    """
+
+    def __init__(
+        self,
+        lattice: Lattice,
+        species_table: list[Composition],
+        species_indices: ArrayLike,
+        frac_coords: ArrayLike,
+        site_properties: dict[str, Any] | None = None,
+        labels: list[str | None] | None = None,
+    ) -> None:
+        """
+        Args:
+            lattice (Lattice): Lattice shared by all sites.
+            species_table (list[Composition]): Unique species and occupancies.
+            species_indices (ArrayLike): Index into species_table for each site.
+            frac_coords (ArrayLike): (N, 3) fractional coordinates.
+            site_properties (dict): Property name to per-site column, either a
+                list or a NumPy array of length N. Defaults to None.
+            labels (list[str | None]): Per-site labels. Defaults to None.
+        """
+        self._lattice = lattice
+        self.species_table = species_table
+        self.species_indices: NDArray[np.intp] = np.asarray(species_indices, dtype=np.intp)
+        self._frac_coords: NDArray[np.float64] = np.asarray(frac_coords, dtype=np.float64).reshape(-1, 3)
+        self.site_properties: dict[str, Any] = site_properties or {}
+        self.labels: list[str | None] | None = labels
+        # Materialized PeriodicSites, keyed by site index
+        self._cache: dict[int, PeriodicSite] = {}
+        # Whether the buffers may be shared with a copy, see copy(). Sites are never
+        # materialized while shared, so the cache is always empty then.
+        self._shared = False
+
+    @classmethod
+    def from_species_and_coords(
+        cls,
+        lattice: Lattice,
+        species: Sequence[CompositionLike],
+        coords: ArrayLike,
+        to_unit_cell: bool = False,
+        coords_are_cartesian: bool = False,
+        site_properties: dict | None = None,
+        labels: Sequence[str | None] | None = None,
+    ) -> Self:
+        """Build the columns from the same inputs as the Structure constructor.
+        Repeated species inputs are only converted to a Composition once.
+        """
+        frac_coords = np.array(coords, dtype=np.float64).reshape(-1, 3)
+        if coords_are_cartesian:
+            frac_coords = lattice.get_fractional_coords(frac_coords)
+        if to_unit_cell:
+            pbc = np.array(lattice.pbc)
+            frac_coords[:, pbc] = np.mod(frac_coords[:, pbc], 1)
+
+        species_table: list[Composition] = []
+        lookup: dict[Any, int] = {}
+        species_indices = np.empty(len(species), dtype=np.intp)
+        for idx, specie in enumerate(species):
+            key: Any = (type(specie), tuple(specie.items()) if isinstance(specie, Composition | dict) else specie)
+            try:
+                sp_idx = lookup.get(key)
+            except TypeError:  # unhashable input
+                key = id(specie)
+                sp_idx = lookup.get(key)
+            if sp_idx is None:
+                sp_idx = lookup[key] = len(species_table)
+                species_table.append(_get_composition(specie))
+            species_indices[idx] = sp_idx
+
+        props = {
+            key: np.array(val) if isinstance(val, np.ndarray) else list(val)
+            for key, val in (site_properties or {}).items()
+            if val is not None
+        }
+        return cls(
+            lattice,
+            species_table,
+            species_indices,
+            frac_coords,
+            site_properties=props,
+            labels=list(labels) if labels else None,
+        )
+
+    @classmethod
+    def from_sites(cls, sites: Sequence[PeriodicSite], lattice: Lattice) -> Self:
+        """Build the columns from existing PeriodicSites. The sites are kept as
+        the materialized sites so that references held by the caller stay live.
+        """
+        columns = cls(lattice, [], np.zeros(len(sites), dtype=np.intp), np.zeros((len(sites), 3)))
+        for idx, site in enumerate(sites):
+            columns[idx] = site
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.species_indices)
+
+    def __getitem__(self, idx: int | slice) -> PeriodicSite | list[PeriodicSite]:  # type: ignore[override]
+        if isinstance(idx, slice):
+            return [self._get_site(ii) for ii in range(*idx.indices(len(self)))]
+        return self._get_site(idx)
+
+    def __iter__(self) -> Iterator[PeriodicSite]:
+        for idx in range(len(self)):
+            yield self._get_site(idx)
+
+    def __setitem__(self, idx: int | slice, site: PeriodicSite | Iterable[PeriodicSite]) -> None:  # type: ignore[override]
+        if isinstance(idx, slice):
+            sites = self.to_list()
+            sites[idx] = site  # type: ignore[assignment]
+            self._reset(sites)
+            return
+
+        idx = self._normalize_index(idx)
+        self._detach()
+        self._cache[idx] = cast("PeriodicSite", site)
+        self._write_row(idx, self._cache[idx])
+
+    def __delitem__(self, idx: int | slice) -> None:
+        if isinstance(idx, slice):
+            keep = np.ones(len(self), dtype=bool)
+            keep[idx] = False
+            self.take(np.flatnonzero(keep), in_place=True)
+            return
+        idx = self._normalize_index(idx)
+        self.take(np.delete(np.arange(len(self)), idx), in_place=True)
+
+    def insert(self, idx: int, site: PeriodicSite) -> None:  # type: ignore[override]
+        """Insert a site before index idx."""
+        n_sites = len(self)
+        idx = min(max(idx + n_sites if idx < 0 else idx, 0), n_sites)
+        self.sync()
+        self._detach()
+        self._cache = {(ii + 1 if ii >= idx else ii): cached for ii, cached in self._cache.items()}
+        self.species_indices = np.insert(self.species_indices, idx, 0)
+        self._frac_coords = np.insert(self._frac_coords, idx, 0, axis=0)
+        for key, col in self.site_properties.items():
+            col = list(col)
+            col.insert(idx, None)
+            self.site_properties[key] = col
+        if self.labels is not None:
+            self.labels.insert(idx, None)
+        self[idx] = site
+
+    def sort(self, key: Callable | None = None, reverse: bool = False) -> None:
+        """Sort the sites in place with the same semantics as list.sort."""
+        sites = self.to_list()
+        order = sorted(
+            range(len(sites)),
+            key=(lambda idx: sites[idx]) if key is None else (lambda idx: key(sites[idx])),
+            reverse=reverse,
+        )
+        self.take(order, in_place=True)
+
+    @property
+    def lattice(self) -> Lattice:
+        """Lattice shared by all sites."""
+        return self._lattice
+
+    @lattice.setter
+    def lattice(self, lattice: Lattice) -> None:
+        self._lattice = lattice
+        for site in self._cache.values():
+            site.lattice = lattice
+
+    @property
+    def frac_coords(self) -> NDArray[np.float64]:
+        """(N, 3) array of fractional coordinates. This is the internal buffer,
+        copy it before modifying.
+        """
+        self.sync()
+        return self._frac_coords
+
+    @frac_coords.setter
+    def frac_coords(self, frac_coords: ArrayLike) -> None:
+        self.sync()
+        self._frac_coords = np.array(frac_coords, dtype=np.float64).reshape(-1, 3)
+        for idx, site in self._cache.items():
+            site.frac_coords = self._frac_coords[idx]
+
+    @property
+    def species(self) -> list[Composition]:
+        """Species and occupancies on each site."""
+        self.sync()
+        table = self.species_table
+        return [table[idx] for idx in self.species_indices.tolist()]
+
+    def get_species_counts(self) -> list[tuple[Composition, int]]:
+        """Species table entries that occur on at least one site, with the
+        number of sites they occur on.
+        """
+        self.sync()
+        counts = np.bincount(self.species_indices, minlength=len(self.species_table))
+        return [(comp, count) for comp, count in zip(self.species_table, counts.tolist(), strict=True) if count]
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether any PeriodicSite has been built from the columns."""
+        return bool(self._cache)
+
+    def get_labels(self) -> list[str]:
+        """Site labels, falling back to the species string like PeriodicSite.label."""
+        self.sync()
+        species_strings = [_get_species_string(comp) for comp in self.species_table]
+        labels = self.labels or [None] * len(self)
+        return [
+            species_strings[sp_idx] if label is None else label
+            for label, sp_idx in zip(labels, self.species_indices.tolist(), strict=True)
+        ]
+
+    def get_site_properties(self) -> dict[str, list]:
+        """Site properties as a dict of lists."""
+        self.sync()
+        return {key: list(col) for key, col in self.site_properties.items()}
+
+    def sync(self) -> None:
+        """Write the state of materialized sites that changed back into the columns."""
+        missing_keys: set[str] = set()
+        for idx in self._get_changed_rows():
+            missing_keys |= self._write_row(idx, self._cache[idx])
+
+        # Drop properties which were deleted from all sites
+        if missing_keys and len(self._cache) == len(self):
+            for key in missing_keys:
+                if not any(key in site.properties for site in self._cache.values()):
+                    del self.site_properties[key]
+
+    def add_site_property(self, property_name: str, values: Sequence | NDArray) -> None:
+        """Set a property column and the property of all materialized sites."""
+        self.sync()
+        self._detach()
+        col = np.array(values) if isinstance(values, np.ndarray) else list(values)
+        self.site_properties[property_name] = col
+        for idx, site in self._cache.items():
+            dict.__setitem__(site.properties, property_name, col[idx])
+
+    def remove_site_property(self, property_name: str) -> None:
+        """Remove a property column and the property of all materialized sites."""
+        self.sync()
+        self._detach()
+        del self.site_properties[property_name]
+        for site in self._cache.values():
+            dict.pop(site.properties, property_name, None)
+
+    def to_list(self) -> list[PeriodicSite]:
+        """Materialize all sites."""
+        return list(self)
+
+    def take(self, indices: ArrayLike, in_place: bool = False) -> Self:
+        """Select sites by index with NumPy fancy indexing of all columns.
+
+        Args:
+            indices (ArrayLike): Site indices. May contain repeats when not in_place.
+            in_place (bool): Whether to reorder/filter self instead of returning new
+                columns. Materialized sites are only carried over in place.
+
+        Returns:
+            ColumnarSites: self if in_place, else new columns.
+        """
+        self.sync()
+        indices = np.asarray(indices, dtype=np.intp).reshape(-1)
+        idx_list = indices.tolist()
+        columns = self if in_place else type(self)(self._lattice, self.species_table, [], [])
+        columns.species_table = list(self.species_table)
+        columns.species_indices = self.species_indices[indices]
+        columns._frac_coords = self._frac_coords[indices]
+        columns.site_properties = {
+            key: col[indices] if isinstance(col, np.ndarray) else [col[idx] for idx in idx_list]
+            for key, col in self.site_properties.items()
+        }
+        columns.labels = None if self.labels is None else [self.labels[idx] for idx in idx_list]
+        columns._cache = (
+            {new: self._cache[old] for new, old in enumerate(idx_list) if old in self._cache} if in_place else {}
+        )
+        columns._shared = False
+        return columns
+
+    def copy(self) -> Self:
+        """Copy of the columns without any materialized sites.
+
+        Unless sites of self have been materialized (and may thus still be changed
+        through them), the copy shares the buffers of self copy-on-write, so that
+        copying is O(1) in the number of sites.
+        """
+        if self._cache:
+            return self.take(np.arange(len(self)))
+        columns = type(self)(
+            self._lattice,
+            self.species_table,
+            self.species_indices,
+            self._frac_coords,
+            site_properties=dict(self.site_properties),
+            labels=self.labels,
+        )
+        self._shared = columns._shared = True
+        return columns
+
+    def _normalize_index(self, idx: int) -> int:
+        idx = operator.index(idx)
+        n_sites = len(self)
+        if not -n_sites <= idx < n_sites:
+            raise IndexError("site index out of range")
+        return idx + n_sites if idx < 0 else idx
+
+    def _get_changed_rows(self) -> list[int]:
+        """Indices of the materialized sites whose state differs from their row.
+        Coordinates may have been changed in place, so they are compared all at once,
+        while species and labels are immutable and compared by identity.
+        """
+        if not self._cache:
+            return []
+        rows = list(self._cache)
+        sites = list(self._cache.values())
+        frac_coords = np.array([site._frac_coords for site in sites], dtype=np.float64).reshape(-1, 3)
+        coords_changed = np.any(frac_coords != self._frac_coords[rows], axis=1).tolist()
+        table = self.species_table
+        labels = self.labels
+        return [
+            idx
+            for idx, site, sp_idx, changed in zip(
+                rows, sites, self.species_indices[rows].tolist(), coords_changed, strict=True
+            )
+            if changed
+            or site._species is not table[sp_idx]
+            or site._label is not (None if labels is None else labels[idx])
+            or type(site.properties) is not _SiteProperties
+            or site.properties.modified
+        ]
+
+    def _get_site(self, idx: int) -> PeriodicSite:
+        idx = self._normalize_index(idx)
+        if (site := self._cache.get(idx)) is None:
+            # The site may be changed in place and synced back later
+            self._detach()
+            site = self._cache[idx] = PeriodicSite(
+                self.species_table[self.species_indices[idx]],
+                self._frac_coords[idx].copy(),
+                self._lattice,
+                label=None if self.labels is None else self.labels[idx],
+                skip_checks=True,
+            )
+            # Set directly, as an empty dict would be replaced in PeriodicSite.__init__
+            site.properties = _SiteProperties({key: col[idx] for key, col in self.site_properties.items()})
+        return site
+
+    def _write_row(self, idx: int, site: PeriodicSite) -> set[str]:
+        """Copy the state of a PeriodicSite into row idx of the columns.
+
+        Returns:
+            set[str]: Property columns that the site does not have.
+        """
+        self._detach()
+        species = site.species
+        sp_idx = int(self.species_indices[idx])
+        if sp_idx >= len(self.species_table) or self.species_table[sp_idx] is not species:
+            for sp_idx, comp in enumerate(self.species_table):  # noqa: B007
+                if comp is species:
+                    break
+            else:
+                sp_idx = len(self.species_table)
+                self.species_table.append(species)
+            self.species_indices[idx] = sp_idx
+        self._frac_coords[idx] = site.frac_coords
+
+        for key in site.properties.keys() - self.site_properties.keys():
+            self.site_properties[key] = [None] * len(self)
+        for key, col in self.site_properties.items():
+            val = site.properties.get(key)
+            if isinstance(col, np.ndarray):
+                with contextlib.suppress(TypeError, ValueError):
+                    if val is not None and np.shape(val) == col.shape[1:] and np.array_equal(col[idx], val):
+                        continue
+                col = self.site_properties[key] = list(col)
+            col[idx] = val
+
+        if site._label is not None and self.labels is None:
+            self.labels = [None] * len(self)
+        if self.labels is not None:
+            self.labels[idx] = site._label
+
+        if type(site.properties) is _SiteProperties:
+            site.properties.modified = False
+        return self.site_properties.keys() - site.properties.keys()
+
+    def _detach(self) -> None:
+        """Take a private copy of buffers that may be shared with a copy."""
+        if not self._shared:
+            return
+        self.species_table = list(self.species_table)
+        self.species_indices = self.species_indices.copy()
+        self._frac_coords = self._frac_coords.copy()
+        self.site_properties = {
+            key: col.copy() if isinstance(col, np.ndarray) else list(col) for key, col in self.site_properties.items()
+        }
+        self.labels = None if self.labels is None else list(self.labels)
+        self._shared = False
+
+    def _reset(self, sites: list[PeriodicSite]) -> None:
+        """Replace all columns with those built from a list of sites."""
+        columns = type(self).from_sites(sites, self._lattice)
+        self.__dict__.update(columns.__dict__)
+
+
+class _SiteProperties(dict):
+    """Properties of a site materialized from ColumnarSites, which record whether
+    they were changed since the site was last written into the columns.
+    """
+
+    modified = False
+
+    def __setitem__(self, key: str, val: Any) -> None:
+        self.modified = True
+        super().__setitem__(key, val)
+
+    def __delitem__(self, key: str) -> None:
+        self.modified = True
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> Self:  # type: ignore[misc,override]
+        self.modified = True
+        return super().__ior__(other)
+
+    def clear(self) -> None:
+        self.modified = True
+        super().clear()
+
+    def pop(self, *args: Any) -> Any:
+        self.modified = True
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[str, Any]:
+        self.modified = True
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self.modified = True
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self.modified = True
+        super().update(*args, **kwargs)
+
+
+class ColumnarSitesView(collections.abc.Sequence):
+    """Read-only view of ColumnarSites, returned as the sites of an immutable IStructure."""
+
+    def __init__(self, columns: ColumnarSites) -> None:
+        """
+        Args:
+            columns (ColumnarSites): Columns to view.
+        """
+        self._columns = columns
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __getitem__(self, idx: int | slice) -> PeriodicSite | tuple[PeriodicSite, ...]:  # type: ignore[override]
+        if isinstance(idx, slice):
+            return tuple(self._columns[idx])
+        return self._columns[idx]
+
+    def __iter__(self) -> Iterator[PeriodicSite]:
+        return iter(self._columns)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._columns)!r})"
+
+
+def _get_composition(species: SpeciesLike | CompositionLike) -> Composition:
+    """Convert a species-like input to a Composition, as done in Site.__init__."""
+    if not isinstance(species, Composition):
+        try:
+            species = Composition({get_el_sp(species): 1})  # type: ignore[arg-type]
+        except TypeError:
+            species = Composition(species)
+    if species.num_atoms > 1 + Composition.amount_tolerance:
+        raise ValueError("Species occupancies sum to more than 1!")
+    return species
+
+
+def _get_species_string(species: Composition) -> str:
+    """String representation of a site's species, as in Site.species_string."""
+    if species.num_atoms == len(species) == 1:
+        return str(next(iter(species)))
+    return ", ".join(f"{sp}:{species[sp]:.3}" for sp in sorted(species))
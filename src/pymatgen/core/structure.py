@@ -29,20 +29,15 @@ from monty.io import zopen
 from monty.json import MSONable
 from numpy.linalg import norm
 from ruamel.yaml import YAML
-from scipy.cluster.hierarchy import fcluster, linkage
-from scipy.linalg import expm, polar
-from scipy.spatial.distance import squareform
-from tabulate import tabulate
 
-from pymatgen.core.bonds import CovalentBond, get_bond_length
+from pymatgen.core.bonds import CovalentBond, bond_lengths, get_bond_length
 from pymatgen.core.composition import Composition
 from pymatgen.core.lattice import Lattice, get_points_in_spheres
 from pymatgen.core.operations import SymmOp
-from pymatgen.core.periodic_table import DummySpecies, Element, Species, get_el_sp
-from pymatgen.core.sites import PeriodicSite, Site
+from pymatgen.core.periodic_table import DummySpecies, Element, Species, get_el_sp, get_element_properties
+from pymatgen.core.sites import ColumnarSites, ColumnarSitesView, PeriodicSite, Site
 from pymatgen.core.units import Length, Mass
 from pymatgen.electronic_structure.core import Magmom
-from pymatgen.symmetry.maggroups import MagneticSpaceGroup
 from pymatgen.util.coord import all_distances, get_angle, lattice_points_in_supercell
 from pymatgen.util.due import Doi, due
 
@@ -59,8 +54,11 @@ if TYPE_CHECKING:
     from ase.optimize.optimize import Optimizer
     from matgl.ext.ase import TrajectoryObserver
     from numpy.typing import ArrayLike, NDArray
+    from scipy.sparse import csr_matrix
+    from scipy.spatial import cKDTree
     from typing_extensions import Self
 
+    from pymatgen.symmetry.maggroups import MagneticSpaceGroup
     from pymatgen.util.typing import CompositionLike, PathLike, SpeciesLike
 
 FileFormats: TypeAlias = Literal[
@@ -244,11 +242,17 @@ class SiteCollection(collections.abc.Sequence, ABC):
     @property
     def sites(self) -> list[PeriodicSite] | tuple[PeriodicSite, ...]:
         """The sites in the Structure."""
+        if isinstance(self._sites, ColumnarSites) and not isinstance(self, collections.abc.MutableSequence):
+            # Immutable collections must not be changed through their sites sequence
+            return ColumnarSitesView(self._sites)  # type: ignore[return-value]
         return self._sites
 
     @sites.setter
     def sites(self, sites: Sequence[PeriodicSite]) -> None:
         """Set the sites in the Structure."""
+        if isinstance(self._sites, ColumnarSites):
+            self._sites = ColumnarSites.from_sites(list(sites), self._sites.lattice)
+            return
         # If self is mutable Structure or Molecule, set _sites as list
         is_mutable = isinstance(self._sites, collections.abc.MutableSequence)
         self._sites: list[PeriodicSite] | tuple[PeriodicSite, ...] = list(sites) if is_mutable else tuple(sites)
@@ -281,6 +285,26 @@ class SiteCollection(collections.abc.Sequence, ABC):
         """
         return all_distances(self.cart_coords, self.cart_coords)
 
+    def get_sparse_distance_matrix(self, r: float, numerical_tol: float = 1e-8) -> csr_matrix:
+        """Sparse counterpart of distance_matrix holding only the distances up to r.
+        It is built with a cell list, so that time and memory scale with the number
+        of pairs within r instead of N^2. For periodic structures, this is
+        overwritten to hold the nearest image distances.
+
+        Args:
+            r (float): Cutoff radius.
+            numerical_tol (float): Numerical tolerance for distances. Sites which are
+                r + numerical_tol away are deemed to be within r.
+
+        Returns:
+            csr_matrix: (N, N) sparse matrix of distances. Pairs further apart than r
+                and the diagonal are not stored, coincident sites are stored as
+                explicit zeros.
+        """
+        cart_coords = self.cart_coords.reshape(-1, 3)
+        center_indices, points_indices, distances = _get_cart_neighbor_list(cart_coords, cart_coords, r, numerical_tol)
+        return _get_sparse_distance_matrix(len(self), center_indices, points_indices, distances)
+
     @property
     def species(self) -> list[Element | Species]:
         """Only works for ordered structures.
@@ -293,13 +317,36 @@ class SiteCollection(collections.abc.Sequence, ABC):
         """
         if not self.is_ordered:
             raise AttributeError("species property only supports ordered structures!")
+        if isinstance(self._sites, ColumnarSites):
+            return [next(iter(comp)) for comp in self._sites.species]
         return [site.specie for site in self]
 
     @property
     def species_and_occu(self) -> list[Composition]:
         """List of species and occupancies at each site of the structure."""
+        if isinstance(self._sites, ColumnarSites):
+            return self._sites.species
         return [site.species for site in self]
 
+    def get_element_properties(self, props: str | Sequence[str]) -> dict[str, NDArray]:
+        """Numeric Element properties of all sites, e.g. for featurization.
+        Disordered sites get the occupancy-weighted average of their species,
+        see periodic_table.get_element_properties.
+
+        Args:
+            props (str | Sequence[str]): Names of numeric Element properties,
+                e.g. "X", "atomic_mass", "atomic_radius", "row" or "group".
+
+        Returns:
+            dict[str, NDArray]: Property name to array with a value per site.
+        """
+        if isinstance(self._sites, ColumnarSites):
+            self._sites.sync()
+            # Only the unique species need to be looked up
+            table_props = get_element_properties(self._sites.species_table, props)
+            return {prop: values[self._sites.species_indices] for prop, values in table_props.items()}
+        return get_element_properties(self.species_and_occu, props)
+
     @property
     def n_elems(self) -> int:
         """Number of types of atoms."""
@@ -315,8 +362,12 @@ class SiteCollection(collections.abc.Sequence, ABC):
     def types_of_species(self) -> tuple[Element | Species | DummySpecies, ...]:
         """Tuple of types of species."""
         types: list[Element | Species | DummySpecies] = []
-        for site in self:
-            for sp, amt in site.species.items():
+        if isinstance(self._sites, ColumnarSites):
+            site_species = [comp for comp, _count in self._sites.get_species_counts()]
+        else:
+            site_species = [site.species for site in self]
+        for comp in site_species:
+            for sp, amt in comp.items():
                 if amt != 0:
                     types.append(sp)
 
@@ -352,6 +403,8 @@ class SiteCollection(collections.abc.Sequence, ABC):
     def atomic_numbers(self) -> tuple[int, ...]:
         """Tuple of atomic numbers."""
         try:
+            if isinstance(self._sites, ColumnarSites):
+                return tuple(specie.Z for specie in self.species)  # type: ignore[union-attr]
             return tuple(site.specie.Z for site in self)
         except AttributeError:
             raise AttributeError("atomic_numbers available only for ordered Structures")
@@ -361,6 +414,8 @@ class SiteCollection(collections.abc.Sequence, ABC):
         """The site properties as a dict of sequences.
         E.g. {"magmom": (5, -5), "charge": (-4, 4)}.
         """
+        if isinstance(self._sites, ColumnarSites):
+            return self._sites.get_site_properties()
         prop_keys: set[str] = set()
         for site in self:
             prop_keys.update(site.properties)
@@ -370,6 +425,8 @@ class SiteCollection(collections.abc.Sequence, ABC):
     @property
     def labels(self) -> list[str | None]:
         """Site labels as a list."""
+        if isinstance(self._sites, ColumnarSites):
+            return self._sites.get_labels()  # type: ignore[return-value]
         return [site.label for site in self]
 
     def relabel_sites(self, ignore_uniq: bool = False) -> Self:
@@ -406,6 +463,8 @@ class SiteCollection(collections.abc.Sequence, ABC):
     @property
     def cart_coords(self) -> NDArray[np.float64]:
         """An np.array of the Cartesian coordinates of sites in the structure."""
+        if isinstance(self._sites, ColumnarSites):
+            return self._sites.lattice.get_cartesian_coords(self._sites.frac_coords)
         return np.array([site.coords for site in self])
 
     @property
@@ -432,6 +491,11 @@ class SiteCollection(collections.abc.Sequence, ABC):
     def composition(self) -> Composition:
         """The structure's corresponding Composition object."""
         elem_map: dict[SpeciesLike, float] = defaultdict(float)
+        if isinstance(self._sites, ColumnarSites):
+            for comp, count in self._sites.get_species_counts():
+                for species, occu in comp.items():
+                    elem_map[species] += occu * count
+            return Composition(elem_map)
         for site in self:
             for species, occu in site.species.items():
                 elem_map[species] += occu
@@ -455,6 +519,11 @@ class SiteCollection(collections.abc.Sequence, ABC):
         Elements are found, a charge of 0 is assumed.
         """
         charge = 0.0
+        if isinstance(self._sites, ColumnarSites):
+            for comp, count in self._sites.get_species_counts():
+                for specie, amt in comp.items():
+                    charge += (getattr(specie, "oxi_state", 0) or 0) * amt * count
+            return charge
         for site in self:
             for specie, amt in site.species.items():
                 charge += (getattr(specie, "oxi_state", 0) or 0) * amt
@@ -466,6 +535,8 @@ class SiteCollection(collections.abc.Sequence, ABC):
         """Check if structure is ordered, meaning no partial occupancies in any
         of the sites.
         """
+        if isinstance(self._sites, ColumnarSites):
+            return all(comp.num_atoms == len(comp) == 1 for comp, _count in self._sites.get_species_counts())
         return all(site.is_ordered for site in self)
 
     def get_angle(self, i: int, j: int, k: int) -> float:
@@ -516,8 +587,7 @@ class SiteCollection(collections.abc.Sequence, ABC):
         """
         if len(self) == 1:
             return True
-        all_dists = self.distance_matrix[np.triu_indices(len(self), 1)]
-        return bool(np.min(all_dists) > tol)
+        return self.get_sparse_distance_matrix(tol).nnz == 0
 
     @abstractmethod
     def to(self, filename: str = "", fmt: FileFormats = "") -> str | None:
@@ -564,6 +634,9 @@ class SiteCollection(collections.abc.Sequence, ABC):
         """
         if len(values) != len(self):
             raise ValueError(f"{len(values)=} must equal sites in structure={len(self)}")
+        if isinstance(self._sites, ColumnarSites):
+            self._sites.add_site_property(property_name, values)
+            return self
         for site, val in zip(self, values, strict=True):
             site.properties[property_name] = val
 
@@ -578,6 +651,9 @@ class SiteCollection(collections.abc.Sequence, ABC):
         Returns:
             SiteCollection: self with property removed.
         """
+        if isinstance(self._sites, ColumnarSites):
+            self._sites.remove_site_property(property_name)
+            return self
         for site in self:
             del site.properties[property_name]
 
@@ -1013,6 +1089,10 @@ class IStructure(SiteCollection, MSONable):
     structure is equivalent to going through the sites in sequence.
     """
 
+    # Verlet neighbor list used by get_neighbor_list and get_all_neighbors
+    # for radii it covers, see VerletNeighborList
+    neighbor_list_cache: VerletNeighborList | None = None
+
     def __init__(
         self,
         lattice: ArrayLike | Lattice,
@@ -1025,6 +1105,7 @@ class IStructure(SiteCollection, MSONable):
         site_properties: dict | None = None,
         labels: Sequence[str | None] | None = None,
         properties: dict | None = None,
+        columnar: bool = False,
     ) -> None:
         """Create a periodic structure.
 
@@ -1066,11 +1147,32 @@ class IStructure(SiteCollection, MSONable):
             properties (dict): Properties associated with the whole structure.
                 Will be serialized when writing the structure to JSON or YAML but is
                 lost when converting to other formats.
+            columnar (bool): Whether to store the sites as contiguous arrays of
+                species indices, fractional coordinates and site properties
+                (see ColumnarSites) instead of a sequence of PeriodicSites.
+                Sites are then only built on indexing or iteration, and bulk
+                operations work on the arrays directly. Defaults to False.
         """
         if len(species) != len(coords):
             raise StructureError(f"{len(species)=} != {len(coords)=}")
 
         self._lattice = lattice if isinstance(lattice, Lattice) else Lattice(lattice)
+        self._charge = charge
+        self._properties = properties or {}
+
+        if columnar:
+            self._sites: tuple[PeriodicSite, ...] | ColumnarSites = ColumnarSites.from_species_and_coords(
+                self._lattice,
+                species,
+                coords,
+                to_unit_cell=to_unit_cell,
+                coords_are_cartesian=coords_are_cartesian,
+                site_properties=site_properties,
+                labels=labels,
+            )
+            if validate_proximity and not self.is_valid():
+                raise StructureError(f"sites are less than {self.DISTANCE_TOLERANCE} Angstrom apart!")
+            return
 
         sites = []
         for idx, specie in enumerate(species):
@@ -1090,11 +1192,9 @@ class IStructure(SiteCollection, MSONable):
                 label=label,
             )
             sites.append(site)
-        self._sites: tuple[PeriodicSite, ...] = tuple(sites)
+        self._sites = tuple(sites)
         if validate_proximity and not self.is_valid():
             raise StructureError(f"sites are less than {self.DISTANCE_TOLERANCE} Angstrom apart!")
-        self._charge = charge
-        self._properties = properties or {}
 
     def __eq__(self, other: object) -> bool:
         """Define equality by comparing all three attributes: lattice, sites, properties."""
@@ -1146,6 +1246,29 @@ class IStructure(SiteCollection, MSONable):
             you prefer a subclass to return its own type, you need to override
             this method in the subclass.
         """
+        return self._get_supercell(scaling_matrix, columnar=self.is_columnar)
+
+    def _get_supercell(
+        self,
+        scaling_matrix: int | Sequence[int] | Sequence[Sequence[int]],
+        columnar: bool,
+    ) -> Structure:
+        """Make a supercell with all sites folded into the unit cell, see __mul__.
+
+        The lattice point translations are broadcast against the Cartesian
+        coordinates of all sites at once and the species, site properties and
+        labels are tiled as columns, so no PeriodicSite is built unless a site-based
+        (non-columnar) structure is asked for. Sites are ordered site-major, i.e. all
+        images of the first site come first.
+
+        Args:
+            scaling_matrix: A scaling matrix for transforming the lattice vectors.
+            columnar (bool): Whether to return a structure storing its sites as
+                arrays (see ColumnarSites).
+
+        Returns:
+            Structure: The supercell.
+        """
         scale_matrix = np.array(scaling_matrix, int)
         if scale_matrix.shape != (3, 3):
             scale_matrix = scale_matrix * np.eye(3)  # (ruff-preview) noqa: PLR6104
@@ -1153,24 +1276,37 @@ class IStructure(SiteCollection, MSONable):
 
         frac_lattice = lattice_points_in_supercell(scale_matrix)
         cart_lattice = new_lattice.get_cartesian_coords(frac_lattice)
+        new_charge = self._charge * np.linalg.det(scale_matrix) if self._charge else None
 
-        new_sites = []
-        for site in self:
-            for vec in cart_lattice:
-                periodic_site = PeriodicSite(
-                    site.species,
-                    site.coords + vec,
-                    new_lattice,
-                    properties=site.properties,
-                    coords_are_cartesian=True,
-                    to_unit_cell=False,
-                    skip_checks=True,
-                    label=site.label,
-                )
-                new_sites.append(periodic_site)
+        if isinstance(self._sites, ColumnarSites):
+            columns = self._sites
+        else:
+            # Missing site properties are set to None and labels made explicit, as in from_sites
+            columns = ColumnarSites.from_species_and_coords(
+                self._lattice,
+                [site.species for site in self],
+                self.frac_coords,
+                site_properties=self.site_properties,
+                labels=self.labels,
+            )
 
-        new_charge = self._charge * np.linalg.det(scale_matrix) if self._charge else None
-        return Structure.from_sites(new_sites, charge=new_charge, to_unit_cell=True)
+        cart_coords = (self.cart_coords[:, None, :] + cart_lattice[None, :, :]).reshape(-1, 3)
+        columns = columns.take(np.repeat(np.arange(len(self)), len(cart_lattice)))
+        columns.lattice = new_lattice
+        frac_coords = new_lattice.get_fractional_coords(cart_coords)
+        del cart_coords
+        pbc = np.array(new_lattice.pbc)
+        frac_coords[:, pbc] = np.mod(frac_coords[:, pbc], 1)
+        columns.frac_coords = frac_coords
+
+        supercell = Structure._from_columns(columns, charge=new_charge)
+        if not columnar:
+            supercell._sites = list(columns)
+            for site in supercell._sites:
+                # Sites of site-based structures hold plain dicts, not the tracked
+                # properties of materialized ColumnarSites
+                site.properties = dict(site.properties)
+        return supercell
 
     def __rmul__(self, scaling_matrix):
         """Similar to __mul__ to preserve commutativeness."""
@@ -1184,6 +1320,8 @@ class IStructure(SiteCollection, MSONable):
         return "\n".join(outs)
 
     def __str__(self) -> str:
+        from tabulate import tabulate
+
         def to_str(x) -> str:
             return f"{x:>10.6f}"
 
@@ -1223,6 +1361,7 @@ class IStructure(SiteCollection, MSONable):
         validate_proximity: bool = False,
         to_unit_cell: bool = False,
         properties: dict | None = None,
+        columnar: bool = False,
     ) -> Self:
         """Convenience constructor to make a IStructure from a list of sites.
 
@@ -1237,6 +1376,9 @@ class IStructure(SiteCollection, MSONable):
             properties (dict): Properties associated with the whole structure.
                 Will be serialized when writing the structure to JSON or YAML but is
                 lost when converting to other formats.
+            columnar (bool): Whether to store the sites as arrays (see ColumnarSites).
+                Copies of such a structure share its arrays copy-on-write.
+                Defaults to False.
 
         Raises:
             ValueError: If sites is empty or sites do not have the same lattice.
@@ -1271,8 +1413,24 @@ class IStructure(SiteCollection, MSONable):
             to_unit_cell=to_unit_cell,
             labels=labels,
             properties=properties,
+            columnar=columnar,
         )
 
+    @classmethod
+    def _from_columns(
+        cls,
+        columns: ColumnarSites,
+        charge: float | None = None,
+        properties: dict | None = None,
+    ) -> Self:
+        """Wrap existing ColumnarSites in a structure without copying them."""
+        struct = cls.__new__(cls)
+        struct._lattice = columns.lattice
+        struct._sites = columns
+        struct._charge = charge
+        struct._properties = properties or {}
+        return struct
+
     @classmethod
     def from_spacegroup(
         cls,
@@ -1442,6 +1600,8 @@ class IStructure(SiteCollection, MSONable):
 
         magmoms = [Magmom(m) for m in site_properties["magmom"]]
 
+        from pymatgen.symmetry.maggroups import MagneticSpaceGroup
+
         if not isinstance(msg, MagneticSpaceGroup):
             msg = MagneticSpaceGroup(msg)
 
@@ -1530,6 +1690,26 @@ class IStructure(SiteCollection, MSONable):
         """
         return self.lattice.get_all_distances(self.frac_coords, self.frac_coords)
 
+    def get_sparse_distance_matrix(self, r: float, numerical_tol: float = 1e-8) -> csr_matrix:
+        """Sparse counterpart of distance_matrix holding only the nearest image
+        distances up to r. It is built from get_neighbor_list, so that time and
+        memory scale with the number of pairs within r instead of N^2.
+
+        Args:
+            r (float): Cutoff radius.
+            numerical_tol (float): Numerical tolerance for distances. Sites which are
+                r + numerical_tol away are deemed to be within r.
+
+        Returns:
+            csr_matrix: (N, N) sparse matrix of the nearest image distances. Pairs
+                further apart than r and the diagonal are not stored, coincident
+                sites are stored as explicit zeros.
+        """
+        center_indices, points_indices, _, distances = self.get_neighbor_list(
+            r, numerical_tol=numerical_tol, exclude_self=False
+        )
+        return _get_sparse_distance_matrix(len(self), center_indices, points_indices, distances)
+
     @property
     def lattice(self) -> Lattice:
         """Lattice of the structure."""
@@ -1610,8 +1790,15 @@ class IStructure(SiteCollection, MSONable):
     @property
     def frac_coords(self):
         """Fractional coordinates as a Nx3 numpy array."""
+        if isinstance(self._sites, ColumnarSites):
+            return self._sites.frac_coords.copy()
         return np.array([site.frac_coords for site in self])
 
+    @property
+    def is_columnar(self) -> bool:
+        """Whether the sites are stored as arrays (see ColumnarSites)."""
+        return isinstance(self._sites, ColumnarSites)
+
     @property
     def volume(self) -> float:
         """The volume of the structure in Angstrom^3."""
@@ -1784,6 +1971,7 @@ class IStructure(SiteCollection, MSONable):
         sites: Sequence[PeriodicSite] | None = None,
         numerical_tol: float = 1e-8,
         exclude_self: bool = True,
+        n_threads: int = 1,
     ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """Get neighbor lists using numpy array representations without constructing
         Neighbor objects. If the cython extension is installed, this method will
@@ -1808,10 +1996,21 @@ class IStructure(SiteCollection, MSONable):
                 ok in most instances.
             exclude_self (bool): whether to exclude atom neighboring with itself within
                 numerical tolerance distance, default to True
+            n_threads (int): Number of threads for the neighbor search of the cython
+                extension. The result does not depend on it. Values < 1 use all
+                available threads. Defaults to 1.
 
         Returns:
             tuple: (center_indices, points_indices, offset_vectors, distances)
         """
+        neighbor_list = self.neighbor_list_cache
+        if (
+            sites is None
+            and neighbor_list is not None
+            and r <= neighbor_list.r
+            and numerical_tol == neighbor_list.numerical_tol
+        ):
+            return neighbor_list.get_neighbor_list(self.frac_coords, self.lattice, r=r, exclude_self=exclude_self)
         try:
             from pymatgen.optimization.neighbors import find_points_in_spheres
         except ImportError:
@@ -1820,10 +2019,11 @@ class IStructure(SiteCollection, MSONable):
             return self._get_neighbor_list_py(r, list(sites), exclude_self=exclude_self)
 
         else:
-            if sites is None:
-                sites = self.sites
-            site_coords = np.ascontiguousarray([site.coords for site in sites], dtype=float)
             cart_coords = np.ascontiguousarray(self.cart_coords, dtype=float)
+            if sites is None:
+                site_coords = cart_coords
+            else:
+                site_coords = np.ascontiguousarray([site.coords for site in sites], dtype=float)
             lattice_matrix = np.ascontiguousarray(self.lattice.matrix, dtype=float)
             pbc = np.ascontiguousarray(self.pbc, dtype=np.int64)
             center_indices, points_indices, images, distances = find_points_in_spheres(
@@ -1833,6 +2033,7 @@ class IStructure(SiteCollection, MSONable):
                 pbc=pbc,
                 lattice=lattice_matrix,
                 tol=numerical_tol,
+                n_threads=n_threads,
             )
             cond = np.array([True] * len(center_indices))
             if exclude_self:
@@ -2023,6 +2224,7 @@ class IStructure(SiteCollection, MSONable):
         include_image: bool = False,
         sites: Sequence[PeriodicSite] | None = None,
         numerical_tol: float = 1e-8,
+        n_threads: int = 1,
     ) -> list[list[PeriodicNeighbor]]:
         """Get neighbors for each atom in the unit cell, out to a distance r.
         Use this method if you are planning on looping over all sites in the
@@ -2055,16 +2257,35 @@ class IStructure(SiteCollection, MSONable):
                 with the site. Sites which are r + numerical_tol away is deemed
                 to be within r from the site. The default of 1e-8 should be
                 ok in most instances.
+            n_threads (int): Number of threads for the neighbor search, see
+                get_neighbor_list. Defaults to 1.
 
         Returns:
             [[pymatgen.core.structure.PeriodicNeighbor], ...]: a list of
                 list of neighbors for each site in structure.
         """
         if sites is None:
+            neighbor_list = self.neighbor_list_cache
+            if neighbor_list is not None and r <= neighbor_list.r and numerical_tol == neighbor_list.numerical_tol:
+                return neighbor_list.get_all_neighbors(self, r)
             sites = self.sites
         center_indices, points_indices, images, distances = self.get_neighbor_list(
-            r=r, sites=sites, numerical_tol=numerical_tol
+            r=r, sites=sites, numerical_tol=numerical_tol, n_threads=n_threads
         )
+        return self._get_neighbors_from_list(sites, center_indices, points_indices, images, distances, numerical_tol)
+
+    def _get_neighbors_from_list(
+        self,
+        sites: Sequence[PeriodicSite],
+        center_indices: np.ndarray,
+        points_indices: np.ndarray,
+        images: np.ndarray,
+        distances: np.ndarray,
+        numerical_tol: float,
+    ) -> list[list[PeriodicNeighbor]]:
+        """Convert a neighbor list with indices into sites into PeriodicNeighbors,
+        excluding each site itself.
+        """
         if len(points_indices) < 1:
             return [[]] * len(sites)
         f_coords = self.frac_coords[points_indices] + images
@@ -2371,6 +2592,14 @@ class IStructure(SiteCollection, MSONable):
         props = self.properties
         if properties:
             props.update(properties)
+        if isinstance(self._sites, ColumnarSites) and not sanitize:
+            columns = self._sites.copy()
+            for key, val in (site_properties or {}).items():
+                if val is None:
+                    columns.site_properties.pop(key, None)
+                else:
+                    columns.site_properties[key] = np.array(val) if isinstance(val, np.ndarray) else list(val)
+            return type(self)._from_columns(columns, charge=self._charge, properties=props)
         if not sanitize:
             return type(self)(
                 self._lattice,
@@ -2500,6 +2729,8 @@ class IStructure(SiteCollection, MSONable):
         if interpolate_lattices:
             # Interpolate lattice matrices using polar decomposition
             # u is a unitary rotation, p is stretch
+            from scipy.linalg import polar
+
             _u, p = polar(np.dot(end_structure.lattice.matrix.T, np.linalg.inv(self.lattice.matrix.T)))
             lvec = end_amplitude * (p - np.identity(3))
             lstart = self.lattice.matrix.T
@@ -2608,23 +2839,11 @@ class IStructure(SiteCollection, MSONable):
         super_ftol = np.divide(tolerance, self.lattice.abc)
         super_ftol_2 = super_ftol * 2
 
-        def pbc_coord_intersection(fc1, fc2, tol):
-            """Get the fractional coords in fc1 that have coordinates
-            within tolerance to some coordinate in fc2.
-            """
-            dist = fc1[:, None, :] - fc2[None, :, :]
-            dist -= np.round(dist)
-            return fc1[np.any(np.all(dist < tol, axis=-1), axis=-1)]
-
         # Here we reduce the number of min_vecs by enforcing that every
         # vector in min_vecs approximately maps each site onto a similar site.
         # The subsequent processing is O(fu^3 * min_vecs) = O(n^4) if we do no
-        # reduction.
-        # This reduction is O(n^3) so usually is an improvement. Using double
-        # the tolerance because both vectors are approximate
-        for group in sorted(grouped_frac_coords, key=len):
-            for frac_coords in group:
-                min_vecs = pbc_coord_intersection(min_vecs, group - frac_coords, super_ftol_2)
+        # reduction. Using double the tolerance because both vectors are approximate
+        min_vecs = _filter_pbc_translations(min_vecs, grouped_frac_coords, super_ftol_2)
 
         def get_hnf(form_units):
             """Get all possible distinct supercell matrices given a
@@ -3407,9 +3626,27 @@ class IStructure(SiteCollection, MSONable):
             except ImportError:
                 raise ImportError("moyopy is not installed. Run pip install moyopy.")
 
-            # Convert structure to MoyoDataset format
-            moyo_cell = moyopy.interface.MoyoAdapter.from_structure(self)
-            dataset = moyopy.MoyoDataset(cell=moyo_cell, symprec=symprec, **kwargs)
+            from pymatgen.symmetry.cache import get_symmetry_cache
+
+            cache = get_symmetry_cache()
+            dataset = None
+            if cache is not None:
+                key = cache.get_key(
+                    self.lattice.matrix,
+                    self.frac_coords,
+                    self.atomic_numbers,
+                    symprec=symprec,
+                    backend=f"moyopy {getattr(moyopy, '__version__', '')}",
+                    **kwargs,
+                )
+                dataset = cache.get(key)
+
+            if dataset is None:
+                # Convert structure to MoyoDataset format
+                moyo_cell = moyopy.interface.MoyoAdapter.from_structure(self)
+                dataset = moyopy.MoyoDataset(cell=moyo_cell, symprec=symprec, **kwargs)
+                if cache is not None:
+                    cache.set(key, dataset)
 
         else:
             from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
@@ -3446,6 +3683,9 @@ class IMolecule(SiteCollection, MSONable):
     equivalent to going through the sites in sequence.
     """
 
+    # KD-tree of the Cartesian coordinates it was built from, for sphere queries
+    _spatial_index: tuple[NDArray[np.float64], cKDTree] | None = None
+
     def __init__(
         self,
         species: Sequence[CompositionLike],
@@ -3694,10 +3934,23 @@ class IMolecule(SiteCollection, MSONable):
         Returns:
             List of bonds
         """
+        # Every pair of species present needs bond data, as in CovalentBond.is_bonded
+        counts = collections.Counter(next(iter(site.species)).symbol for site in self._sites)
+        max_length = 0.0
+        for syms in itertools.combinations_with_replacement(sorted(counts), 2):
+            if syms[0] == syms[1] and counts[syms[0]] < 2:
+                continue
+            if syms not in bond_lengths:
+                raise ValueError(f"No bond data for elements {syms[0]} - {syms[1]}")
+            max_length = max(max_length, *bond_lengths[syms].values())
+
+        # Only pairs within the longest bond length are candidates
+        dist_mat = self.get_sparse_distance_matrix((1 + tol) * max_length)
         bonds = []
-        for site1, site2 in itertools.combinations(self._sites, 2):
-            if CovalentBond.is_bonded(site1, site2, tol):
-                bonds.append(CovalentBond(site1, site2))
+        for idx in range(len(self)):
+            for jdx in dist_mat.indices[dist_mat.indptr[idx] : dist_mat.indptr[idx + 1]]:
+                if jdx > idx and CovalentBond.is_bonded(self._sites[idx], self._sites[jdx], tol):
+                    bonds.append(CovalentBond(self._sites[idx], self._sites[jdx]))
         return bonds
 
     def get_zmatrix(self) -> str:
@@ -3793,7 +4046,8 @@ class IMolecule(SiteCollection, MSONable):
         return self[i].distance(self[j])
 
     def get_sites_in_sphere(self, pt: ArrayLike, r: float) -> list[Neighbor]:
-        """Find all sites within a sphere from a point.
+        """Find all sites within a sphere from a point. The sites are looked up in
+        a KD-tree, which is cached until the coordinates of the sites change.
 
         Args:
             pt (3x1 array): Cartesian coordinates of center of sphere
@@ -3802,10 +4056,15 @@ class IMolecule(SiteCollection, MSONable):
         Returns:
             Neighbor
         """
+        cart_coords, tree = self._get_spatial_index()
+        pt = np.asarray(pt, dtype=float)
+        # Pad the radius so that sites at exactly r are not lost to rounding in the tree
+        indices = np.array(tree.query_ball_point(pt, r + 1e-8, return_sorted=True), dtype=np.int64)
+        dists = np.linalg.norm(cart_coords[indices] - pt, axis=-1)
         neighbors = []
-        for idx, site in enumerate(self._sites):
-            dist = site.distance_from_point(pt)
+        for idx, dist in zip(indices.tolist(), dists.tolist(), strict=True):
             if dist <= r:
+                site = self._sites[idx]
                 neighbors.append(
                     Neighbor(
                         site.species,
@@ -3818,6 +4077,96 @@ class IMolecule(SiteCollection, MSONable):
                 )
         return neighbors
 
+    def _get_spatial_index(self) -> tuple[NDArray[np.float64], cKDTree]:
+        """Cartesian coordinates of the sites and a KD-tree built from them. The tree
+        is rebuilt whenever the coordinates differ from those it was built from, so
+        that it stays valid if sites are changed in place.
+        """
+        from scipy.spatial import cKDTree
+
+        cart_coords = self.cart_coords.reshape(-1, 3)
+        if self._spatial_index is None or not np.array_equal(self._spatial_index[0], cart_coords):
+            self._spatial_index = (cart_coords, cKDTree(cart_coords))
+        return self._spatial_index
+
+    def get_neighbor_list(
+        self,
+        r: float,
+        sites: Sequence[Site] | None = None,
+        numerical_tol: float = 1e-8,
+        exclude_self: bool = True,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get neighbor lists using numpy array representations without constructing
+        Neighbor objects, with the same return values as Structure.get_neighbor_list.
+        Neighbors are found with a cell list, so that time and memory scale with the
+        number of neighbors instead of N^2.
+        Atom `center_indices[i]` has neighbor atom `points_indices[i]` at distance
+        `distances[i]`. As molecules are not periodic, `offset_vectors` are all zero.
+
+        Args:
+            r (float): Radius of sphere
+            sites (list of Sites or None): sites for getting all neighbors,
+                default is None, which means neighbors will be obtained for all
+                sites.
+            numerical_tol (float): This is a numerical tolerance for distances.
+                Sites which are < numerical_tol are determined to be coincident
+                with the site. Sites which are r + numerical_tol away is deemed
+                to be within r from the site. The default of 1e-8 should be
+                ok in most instances.
+            exclude_self (bool): whether to exclude atom neighboring with itself within
+                numerical tolerance distance, default to True
+
+        Returns:
+            tuple: (center_indices, points_indices, offset_vectors, distances)
+        """
+        cart_coords = self.cart_coords.reshape(-1, 3)
+        site_coords = cart_coords if sites is None else np.array([site.coords for site in sites]).reshape(-1, 3)
+        center_indices, points_indices, distances = _get_cart_neighbor_list(cart_coords, site_coords, r, numerical_tol)
+        if exclude_self:
+            cond = ~((center_indices == points_indices) & (distances <= numerical_tol))
+            center_indices, points_indices, distances = center_indices[cond], points_indices[cond], distances[cond]
+        return center_indices, points_indices, np.zeros((len(center_indices), 3)), distances
+
+    def get_all_neighbors(
+        self,
+        r: float,
+        sites: Sequence[Site] | None = None,
+        numerical_tol: float = 1e-8,
+    ) -> list[list[Neighbor]]:
+        """Get neighbors for each site out to a distance r, as in
+        Structure.get_all_neighbors. All neighbors are found in one pass with a
+        cell list, which is much faster than calling get_neighbors for each site.
+
+        Args:
+            r (float): Radius of sphere.
+            sites (list of Sites or None): sites for getting all neighbors,
+                default is None, which means neighbors will be obtained for all
+                sites.
+            numerical_tol (float): This is a numerical tolerance for distances.
+                Sites which are < numerical_tol are determined to be coincident
+                with the site. Sites which are r + numerical_tol away is deemed
+                to be within r from the site. The default of 1e-8 should be
+                ok in most instances.
+
+        Returns:
+            list[list[Neighbor]]: Neighbors of each site, sorted by site index.
+        """
+        if sites is None:
+            sites = self._sites
+        center_indices, points_indices, _, distances = self.get_neighbor_list(
+            r, sites=sites, numerical_tol=numerical_tol
+        )
+        order = np.lexsort((points_indices, center_indices))
+        neighbors: list[list[Neighbor]] = [[] for _ in sites]
+        for center_idx, idx, dist in zip(
+            center_indices[order].tolist(), points_indices[order].tolist(), distances[order].tolist(), strict=True
+        ):
+            site = self._sites[idx]
+            neighbors[center_idx].append(
+                Neighbor(site.species, site.coords, site.properties, dist, idx, label=site.label)
+            )
+        return neighbors
+
     def get_neighbors(self, site: Site, r: float) -> list[Neighbor]:
         """Get all neighbors to a site within a sphere of radius r. Excludes the
         site itself.
@@ -4151,6 +4500,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
         site_properties: dict | None = None,
         labels: Sequence[str | None] | None = None,
         properties: dict | None = None,
+        columnar: bool = False,
     ) -> None:
         """Create a periodic structure.
 
@@ -4191,6 +4541,8 @@ class Structure(IStructure, collections.abc.MutableSequence):
             properties (dict): Properties associated with the whole structure.
                 Will be serialized when writing the structure to JSON or YAML but is
                 lost when converting to other formats.
+            columnar (bool): Whether to store the sites as contiguous arrays
+                instead of a list of PeriodicSites. See IStructure. Defaults to False.
         """
         super().__init__(
             lattice,
@@ -4203,9 +4555,11 @@ class Structure(IStructure, collections.abc.MutableSequence):
             site_properties=site_properties,
             labels=labels,
             properties=properties,
+            columnar=columnar,
         )
 
-        self._sites: list[PeriodicSite] = list(self._sites)  # type: ignore[assignment]
+        if not columnar:
+            self._sites: list[PeriodicSite] = list(self._sites)  # type: ignore[assignment]
 
     def __setitem__(
         self,
@@ -4289,6 +4643,9 @@ class Structure(IStructure, collections.abc.MutableSequence):
         if not isinstance(lattice, Lattice):
             lattice = Lattice(lattice)
         self._lattice = lattice
+        if isinstance(self._sites, ColumnarSites):
+            self._sites.lattice = lattice
+            return
         for site in self:
             site.lattice = lattice
 
@@ -4566,6 +4923,22 @@ class Structure(IStructure, collections.abc.MutableSequence):
         Returns:
             Structure: post-operation structure
         """
+        if isinstance(self._sites, ColumnarSites):
+            columns = self._sites
+            old_lattice = self._lattice
+            if fractional:
+                self._lattice = Lattice(np.dot(symm_op.rotation_matrix, old_lattice.matrix))
+                cart_coords = old_lattice.get_cartesian_coords(symm_op.operate_multi(columns.frac_coords))
+            else:
+                self._lattice = Lattice([symm_op.apply_rotation_only(row) for row in old_lattice.matrix])
+                cart_coords = symm_op.operate_multi(old_lattice.get_cartesian_coords(columns.frac_coords))
+            # Sites handed out before the operation are detached, as they
+            # would be if the sites were rebuilt one by one
+            self._sites = columns.copy()
+            self._sites.lattice = self._lattice
+            self._sites.frac_coords = self._lattice.get_fractional_coords(cart_coords)
+            return self
+
         if fractional:
             new_latt = np.dot(symm_op.rotation_matrix, self._lattice.matrix)
             self._lattice = Lattice(new_latt)
@@ -4666,6 +5039,13 @@ class Structure(IStructure, collections.abc.MutableSequence):
         if not isinstance(indices, collections.abc.Iterable):
             indices = [indices]
 
+        if isinstance(self._sites, ColumnarSites):
+            indices = np.arange(len(self))[list(indices)]
+            if len(np.unique(indices)) == len(indices):
+                vectors = np.broadcast_to(np.asarray(vector, dtype=np.float64), (len(indices), 3))
+                self._translate_columns(indices, vectors, frac_coords, to_unit_cell)
+                return self
+
         for idx in indices:
             site = self[idx]
             if frac_coords:
@@ -4678,6 +5058,29 @@ class Structure(IStructure, collections.abc.MutableSequence):
 
         return self
 
+    def _translate_columns(
+        self,
+        indices: NDArray[np.intp],
+        vectors: NDArray[np.float64],
+        frac_coords: bool,
+        to_unit_cell: bool,
+    ) -> None:
+        """Vectorized translate_sites for array-backed structures, with one
+        translation vector per (unique) site index.
+        """
+        columns = cast("ColumnarSites", self._sites)
+        all_frac_coords = columns.frac_coords.copy()
+        if frac_coords:
+            new_frac_coords = all_frac_coords[indices] + vectors
+        else:
+            cart_coords = self._lattice.get_cartesian_coords(all_frac_coords[indices])
+            new_frac_coords = self._lattice.get_fractional_coords(cart_coords + vectors)
+        if to_unit_cell:
+            pbc = np.array(self._lattice.pbc)
+            new_frac_coords[:, pbc] = np.mod(new_frac_coords[:, pbc], 1)
+        all_frac_coords[indices] = new_frac_coords
+        columns.frac_coords = all_frac_coords
+
     def rotate_sites(
         self,
         indices: list[int] | None = None,
@@ -4713,6 +5116,8 @@ class Structure(IStructure, collections.abc.MutableSequence):
 
         theta %= 2 * np.pi
 
+        from scipy.linalg import expm
+
         rm = expm(np.cross(np.eye(3), axis / norm(axis)) * theta)
         for idx in indices:
             site = self[idx]
@@ -4754,6 +5159,12 @@ class Structure(IStructure, collections.abc.MutableSequence):
             dist = distance if min_distance is None else rng.uniform(min_distance, distance)
             return vector / vnorm * dist if vnorm != 0 else get_rand_vec()
 
+        if isinstance(self._sites, ColumnarSites):
+            # Draw the vectors in the same order as the site-by-site loop below
+            vectors = np.array([get_rand_vec() for _ in range(len(self))]).reshape(-1, 3)
+            self._translate_columns(np.arange(len(self)), vectors, frac_coords=False, to_unit_cell=True)
+            return self
+
         for idx in range(len(self._sites)):
             self.translate_sites([idx], get_rand_vec(), frac_coords=False)
 
@@ -4764,6 +5175,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
         scaling_matrix: ArrayLike,
         to_unit_cell: bool = True,
         in_place: bool = True,
+        columnar: bool | None = None,
     ) -> Structure:
         """Create a supercell.
 
@@ -4785,18 +5197,20 @@ class Structure(IStructure, collections.abc.MutableSequence):
                 if they have fractional coords > 1. Defaults to True.
             in_place (bool): Whether to perform the operation in-place or to return
                 a new Structure object. Defaults to True.
+            columnar (bool | None): Whether the supercell stores its sites as arrays
+                (see ColumnarSites), which avoids building a PeriodicSite per site
+                for very large supercells. Defaults to None, keeping the storage
+                mode of the structure.
 
         Returns:
             Structure: self if in_place is True else self.copy() after making supercell
         """
         # TODO (janosh) maybe default in_place to False after a depreciation period
         struct: Structure = self if in_place else self.copy()
-        supercell: Structure = struct * scaling_matrix
-        if to_unit_cell:
-            for site in supercell:
-                site.to_unit_cell(in_place=True)
-        struct.sites = supercell.sites
-        struct.lattice = supercell.lattice
+        # Sites are always folded into the unit cell when building the supercell
+        supercell = struct._get_supercell(scaling_matrix, columnar=struct.is_columnar if columnar is None else columnar)
+        struct._sites = supercell._sites
+        struct._lattice = supercell.lattice
 
         return struct
 
@@ -4848,6 +5262,9 @@ class Structure(IStructure, collections.abc.MutableSequence):
         if dist_mat.shape == (1, 1):
             return self
 
+        from scipy.cluster.hierarchy import fcluster, linkage
+        from scipy.spatial.distance import squareform
+
         clusters = fcluster(linkage(squareform((dist_mat + dist_mat.T) / 2)), tol, "distance")
 
         sites: list[PeriodicSite] = []
@@ -5363,6 +5780,8 @@ class Molecule(IMolecule, collections.abc.MutableSequence):
 
         theta %= 2 * np.pi
 
+        from scipy.linalg import expm
+
         rm = expm(np.cross(np.eye(3), axis / norm(axis)) * theta)
 
         for idx in indices:
@@ -5571,6 +5990,489 @@ class Molecule(IMolecule, collections.abc.MutableSequence):
         return self._calculate(calculator, verbose=verbose)
 
 
+def get_neighbor_lists(
+    structures: Sequence[IStructure | Structure],
+    r: float,
+    numerical_tol: float = 1e-8,
+    exclude_self: bool = True,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Get the neighbor lists of many structures in one call. This is the batched
+    equivalent of IStructure.get_neighbor_list. With the cython extension, all
+    structures are processed in a single loop that does not hold the GIL.
+
+    The neighbor pairs of all structures are concatenated and indptr marks where
+    the pairs of each structure start, i.e. the pairs of structures[i] are at
+    slice(indptr[i], indptr[i + 1]) of the other returned arrays, in the same
+    order as returned by structures[i].get_neighbor_list(r). Site indices are
+    local to each structure.
+
+    Args:
+        structures (Sequence[IStructure | Structure]): Structures to get neighbors for.
+        r (float): Radius of sphere.
+        numerical_tol (float): This is a numerical tolerance for distances.
+            Sites which are < numerical_tol are determined to be coincident
+            with the site. Sites which are r + numerical_tol away is deemed
+            to be within r from the site. The default of 1e-8 should be
+            ok in most instances.
+        exclude_self (bool): whether to exclude atom neighboring with itself within
+            numerical tolerance distance, default to True
+
+    Returns:
+        tuple: (center_indices, points_indices, offset_vectors, distances, indptr)
+    """
+    try:
+        from pymatgen.optimization.neighbors import find_points_in_spheres_batch
+    except ImportError:
+        neighbor_lists = [
+            struct.get_neighbor_list(r, numerical_tol=numerical_tol, exclude_self=exclude_self) for struct in structures
+        ]
+        indptr = np.cumsum([0, *(len(nl[0]) for nl in neighbor_lists)])
+        if not neighbor_lists:
+            return (
+                np.array([], dtype=int),
+                np.array([], dtype=int),
+                np.empty((0, 3)),
+                np.array([], dtype=float),
+                indptr,
+            )
+        center_indices, points_indices, images, distances = (
+            np.concatenate([nl[idx] for nl in neighbor_lists]) for idx in range(4)
+        )
+        return center_indices, points_indices, images.reshape(-1, 3), distances, indptr
+
+    cart_coords = [struct.cart_coords for struct in structures]
+    all_coords = np.ascontiguousarray(np.concatenate([np.empty((0, 3)), *cart_coords]), dtype=float)
+    all_indptr = np.cumsum([0, *map(len, cart_coords)]).astype(np.int64)
+    pbc = np.ascontiguousarray([struct.pbc for struct in structures], dtype=np.int64).reshape(-1, 3)
+    lattices = np.ascontiguousarray([struct.lattice.matrix for struct in structures], dtype=float).reshape(-1, 3, 3)
+    center_indices, points_indices, images, distances, indptr = find_points_in_spheres_batch(
+        all_coords,
+        all_indptr,
+        all_coords,
+        all_indptr,
+        r=r,
+        pbc=pbc,
+        lattices=lattices,
+        tol=numerical_tol,
+    )
+    if exclude_self:
+        cond = ~((center_indices == points_indices) & (distances <= numerical_tol))
+        indptr = np.concatenate([[0], np.cumsum(cond)])[indptr]
+        return center_indices[cond], points_indices[cond], images[cond], distances[cond], indptr
+    return center_indices, points_indices, images, distances, indptr
+
+
+class VerletNeighborList:
+    """Neighbor list with a Verlet skin for structures whose atoms move little
+    between calls, e.g. the frames of an MD run or the steps of a relaxation.
+
+    Candidate pairs are searched out to r + skin and reused as long as no atom
+    has moved more than skin / 2 from its reference position, since no pair can
+    have come closer than r without being a candidate. Queries then only
+    recompute the distances of the candidate pairs. If only a few atoms moved
+    further, just their pairs are searched again. A change of the lattice or of
+    the number of sites, or many moved atoms, trigger a full rebuild.
+
+    The neighbors found are the same as those of IStructure.get_neighbor_list,
+    but the order of the neighbors of each center may differ. The list is not
+    bound to a single structure and can be fed successive structures (or frac
+    coords), or be attached to a structure via IStructure.neighbor_list_cache,
+    in which case get_neighbor_list, get_all_neighbors and the NearNeighbors
+    classes of pymatgen.analysis.local_env use it for radii up to r.
+    """
+
+    def __init__(
+        self,
+        r: float,
+        skin: float = 0.3,
+        numerical_tol: float = 1e-8,
+        n_threads: int = 1,
+        max_partial_fraction: float = 0.1,
+    ) -> None:
+        """
+        Args:
+            r (float): Largest radius that the neighbor list is used for.
+            skin (float): Skin distance added to r for the candidate pairs. Larger
+                values mean more candidates but fewer rebuilds. Defaults to 0.3.
+            numerical_tol (float): Numerical tolerance for distances, see
+                IStructure.get_neighbor_list.
+            n_threads (int): Number of threads for the neighbor searches of
+                the cython extension. Defaults to 1.
+            max_partial_fraction (float): Largest fraction of moved atoms for which
+                only the pairs of the moved atoms are searched again. Above it, the
+                whole list is rebuilt. Defaults to 0.1.
+        """
+        if skin < 0:
+            raise ValueError(f"skin must be non-negative, got {skin}")
+        self.r = r
+        self.skin = skin
+        self.numerical_tol = numerical_tol
+        self.n_threads = n_threads
+        self.max_partial_fraction = max_partial_fraction
+        # Counters of how each call to update was served
+        self.n_full_builds = self.n_partial_builds = self.n_reuses = 0
+
+        self._lattice: Lattice | None = None
+        self._ref_frac_coords = np.empty((0, 3))
+        self._shifts = np.empty((0, 3))
+        self._center_indices = np.array([], dtype=int)
+        self._points_indices = np.array([], dtype=int)
+        self._images = np.empty((0, 3))
+        self._indptr = np.zeros(1, dtype=int)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(r={self.r}, skin={self.skin})"
+
+    def update(self, frac_coords: ArrayLike, lattice: Lattice) -> bool:
+        """Check the candidate pairs against new positions and rebuild them if needed.
+
+        Args:
+            frac_coords (ArrayLike): (N, 3) fractional coordinates of the sites.
+            lattice (Lattice): Lattice of the structure.
+
+        Returns:
+            bool: Whether the candidate pairs were (partially) rebuilt.
+        """
+        frac_coords = np.asarray(frac_coords, dtype=float).reshape(-1, 3)
+        if (
+            self._lattice is None
+            or len(frac_coords) != len(self._ref_frac_coords)
+            or lattice.pbc != self._lattice.pbc
+            or not np.array_equal(lattice.matrix, self._lattice.matrix)
+        ):
+            self._build(frac_coords, lattice)
+            return True
+
+        # Periodic images that atoms were wrapped to since the reference positions
+        # were set, so that each atom is compared to its nearest reference image
+        diff = frac_coords - self._ref_frac_coords
+        shifts = np.zeros_like(diff)
+        pbc = np.array(lattice.pbc)
+        shifts[:, pbc] = np.round(diff[:, pbc])
+        displacements = lattice.get_cartesian_coords(diff - shifts)
+        moved = np.einsum("ij,ij->i", displacements, displacements) > (self.skin / 2) ** 2
+        self._shifts = shifts
+        n_moved = np.count_nonzero(moved)
+        if n_moved == 0:
+            self.n_reuses += 1
+            return False
+        if n_moved > self.max_partial_fraction * len(frac_coords):
+            self._build(frac_coords, lattice)
+        else:
+            self._rebuild_moved(frac_coords - shifts, lattice, moved)
+        return True
+
+    def get_neighbor_list(
+        self,
+        frac_coords: ArrayLike,
+        lattice: Lattice,
+        r: float | None = None,
+        exclude_self: bool = True,
+        indices: Sequence[int] | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get the neighbor list for new positions, updating the candidate pairs
+        if needed. The return values are as for IStructure.get_neighbor_list.
+
+        Args:
+            frac_coords (ArrayLike): (N, 3) fractional coordinates of the sites.
+            lattice (Lattice): Lattice of the structure.
+            r (float | None): Radius of sphere, at most the r of the neighbor list.
+                Defaults to the r of the neighbor list.
+            exclude_self (bool): Whether to exclude atom neighboring with itself
+                within numerical tolerance distance. Defaults to True.
+            indices (Sequence[int] | None): Indices of the center sites. Defaults to
+                None, meaning all sites.
+
+        Returns:
+            tuple: (center_indices, points_indices, offset_vectors, distances)
+        """
+        r = self.r if r is None else r
+        if r > self.r:
+            raise ValueError(f"r={r} exceeds the radius of the neighbor list ({self.r})")
+        frac_coords = np.asarray(frac_coords, dtype=float).reshape(-1, 3)
+        self.update(frac_coords, lattice)
+
+        if indices is None:
+            center_indices, points_indices, images = self._center_indices, self._points_indices, self._images
+        else:
+            pairs = np.concatenate(
+                [np.empty(0, dtype=int)]
+                + [np.arange(self._indptr[idx], self._indptr[idx + 1]) for idx in np.asarray(indices, dtype=int)]
+            )
+            center_indices, points_indices, images = (
+                self._center_indices[pairs],
+                self._points_indices[pairs],
+                self._images[pairs],
+            )
+
+        # Translate the images from the reference positions to the current ones
+        images = images - self._shifts[points_indices] + self._shifts[center_indices]
+        vectors = lattice.get_cartesian_coords(frac_coords[points_indices] + images - frac_coords[center_indices])
+        distances = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+        # Same selection as find_points_in_spheres, which searches radii below
+        # 1 A with a radius of 1 A and discards the pairs further apart than r
+        cond = distances * distances < r * r + self.numerical_tol if r >= 1 else distances <= r
+        if exclude_self:
+            cond &= ~((center_indices == points_indices) & (distances <= self.numerical_tol))
+        return center_indices[cond], points_indices[cond], images[cond], distances[cond]
+
+    def get_all_neighbors(
+        self,
+        structure: IStructure | Structure,
+        r: float | None = None,
+        indices: Sequence[int] | None = None,
+    ) -> list[list[PeriodicNeighbor]]:
+        """Get the neighbors of the sites of a structure, see IStructure.get_all_neighbors.
+
+        Args:
+            structure (IStructure | Structure): Structure to get neighbors for.
+            r (float | None): Radius of sphere, at most the r of the neighbor list.
+                Defaults to the r of the neighbor list.
+            indices (Sequence[int] | None): Indices of the center sites. Defaults to
+                None, meaning all sites.
+
+        Returns:
+            list[list[PeriodicNeighbor]]: Neighbors of each center site.
+        """
+        center_indices, points_indices, images, distances = self.get_neighbor_list(
+            structure.frac_coords, structure.lattice, r=r, exclude_self=False, indices=indices
+        )
+        if indices is None:
+            return structure._get_neighbors_from_list(
+                structure.sites, center_indices, points_indices, images, distances, self.numerical_tol
+            )
+        positions = np.zeros(len(structure), dtype=int)
+        positions[np.asarray(indices, dtype=int)] = np.arange(len(indices))
+        return structure._get_neighbors_from_list(
+            [structure[idx] for idx in indices],
+            positions[center_indices],
+            points_indices,
+            images,
+            distances,
+            self.numerical_tol,
+        )
+
+    def _build(self, frac_coords: np.ndarray, lattice: Lattice) -> None:
+        """Search all candidate pairs out to r + skin."""
+        self._lattice = lattice.copy()
+        self._ref_frac_coords = frac_coords.copy()
+        self._shifts = np.zeros_like(frac_coords)
+        cart_coords = lattice.get_cartesian_coords(frac_coords)
+        center_indices, points_indices, images, _ = self._find_pairs(
+            cart_coords, cart_coords, self.r + self.skin, lattice
+        )
+        self._set_pairs(center_indices, points_indices, images)
+        self.n_full_builds += 1
+
+    def _rebuild_moved(self, frac_coords: np.ndarray, lattice: Lattice, moved: np.ndarray) -> None:
+        """Search the pairs of the moved atoms again. frac_coords are the current
+        positions translated to the periodic images of the reference positions.
+
+        An unmoved atom may move by up to skin from its current position before it
+        has to be rebuilt, and a moved atom by up to skin / 2 from its new reference
+        position, so the pairs of moved atoms are searched out to r + 1.5 * skin.
+        """
+        moved_indices = np.flatnonzero(moved)
+        self._ref_frac_coords[moved_indices] = frac_coords[moved_indices]
+        cart_coords = lattice.get_cartesian_coords(frac_coords)
+        local_indices, points_indices, images, _ = self._find_pairs(
+            cart_coords, cart_coords[moved_indices], self.r + 1.5 * self.skin, lattice
+        )
+        center_indices = moved_indices[local_indices]
+        # Pairs between a moved and an unmoved atom also appear with the unmoved
+        # atom as center
+        reverse = ~moved[points_indices]
+        keep = ~(moved[self._center_indices] | moved[self._points_indices])
+        self._set_pairs(
+            np.concatenate([self._center_indices[keep], center_indices, points_indices[reverse]]),
+            np.concatenate([self._points_indices[keep], points_indices, center_indices[reverse]]),
+            np.concatenate([self._images[keep], images, -images[reverse]]),
+        )
+        self.n_partial_builds += 1
+
+    def _set_pairs(self, center_indices: np.ndarray, points_indices: np.ndarray, images: np.ndarray) -> None:
+        """Store the candidate pairs grouped by center."""
+        order = np.argsort(center_indices, kind="stable")
+        self._center_indices = center_indices[order]
+        self._points_indices = points_indices[order]
+        self._images = images[order]
+        self._indptr = np.concatenate(
+            [[0], np.cumsum(np.bincount(self._center_indices, minlength=len(self._ref_frac_coords)))]
+        )
+
+    def _find_pairs(
+        self,
+        all_coords: np.ndarray,
+        center_coords: np.ndarray,
+        r: float,
+        lattice: Lattice,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Find all pairs of points within r, with the images relative to all_coords."""
+        if len(all_coords) == 0 or len(center_coords) == 0:
+            return np.array([], dtype=int), np.array([], dtype=int), np.empty((0, 3)), np.array([], dtype=float)
+        try:
+            from pymatgen.optimization.neighbors import find_points_in_spheres
+        except ImportError:
+            frac_coords = lattice.get_fractional_coords(all_coords)
+            pairs = [
+                (idx, index, np.round(lattice.get_fractional_coords(coord) - frac_coords[index]), dist)
+                for idx, neighbors in enumerate(
+                    get_points_in_spheres(
+                        all_coords, center_coords, r, pbc=lattice.pbc, numerical_tol=self.numerical_tol, lattice=lattice
+                    )
+                )
+                for coord, dist, index, _ in neighbors
+            ]
+            if not pairs:
+                return np.array([], dtype=int), np.array([], dtype=int), np.empty((0, 3)), np.array([], dtype=float)
+            center_indices, points_indices, images, distances = zip(*pairs, strict=True)
+            return np.array(center_indices), np.array(points_indices), np.array(images), np.array(distances)
+
+        return find_points_in_spheres(
+            np.ascontiguousarray(all_coords, dtype=float),
+            np.ascontiguousarray(center_coords, dtype=float),
+            r=r,
+            pbc=np.ascontiguousarray(lattice.pbc, dtype=np.int64),
+            lattice=np.ascontiguousarray(lattice.matrix, dtype=float),
+            tol=self.numerical_tol,
+            n_threads=self.n_threads,
+        )
+
+
+def _filter_pbc_translations(
+    translations: NDArray[np.float64],
+    grouped_frac_coords: Sequence[NDArray[np.float64]],
+    tol: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Keep the translations that map every site of each group onto a site of
+    the same group, up to a per-axis fractional tolerance and periodic images.
+
+    Sites of each group are hashed into a grid of cells that are at least 2 * tol
+    wide, so a translated site can only match sites in its own cell and the 7
+    cells next to the corner it is closest to. All translations are checked
+    against a group at once with sorted key lookups, which takes
+    O(n_translations * n_sites) instead of O(n_translations * n_sites^2) for
+    comparing all pairs.
+
+    Args:
+        translations (NDArray): (K, 3) candidate fractional translations.
+        grouped_frac_coords (Sequence[NDArray]): (N_i, 3) fractional coordinates
+            of each group of equivalent sites.
+        tol (NDArray): Fractional tolerance along each axis.
+
+    Returns:
+        NDArray: The translations that map all groups onto themselves.
+    """
+    n_cells = np.maximum(np.floor(1 / (2 * tol)), 1).astype(np.int64)
+    offsets = np.array(list(itertools.product((0, 1), repeat=3)))
+
+    def get_keys(cells):
+        cells %= n_cells
+        return (cells[..., 0] * n_cells[1] + cells[..., 1]) * n_cells[2] + cells[..., 2]
+
+    # Smaller groups first, as they are cheaper and rule out translations as well
+    for frac_coords in sorted(grouped_frac_coords, key=len):
+        if len(translations) == 0:
+            break
+        frac_coords = np.mod(frac_coords, 1)
+        keys = get_keys(np.floor(frac_coords * n_cells).astype(np.int64))
+        order = np.argsort(keys, kind="stable")
+        keys, frac_coords = keys[order], frac_coords[order]
+        max_occupancy = np.unique(keys, return_counts=True)[1].max()
+
+        # All translated sites, with shape (N_i, K, 3)
+        queries = np.mod(frac_coords[:, None, :] + translations[None, :, :], 1)
+        scaled_queries = queries * n_cells
+        query_cells = np.floor(scaled_queries).astype(np.int64)
+        # Direction of the closest neighboring cell along each axis
+        directions = np.where(scaled_queries - query_cells < 0.5, -1, 1)
+        matched = np.zeros(queries.shape[:2], dtype=bool)
+        for offset in offsets:
+            nbr_keys = get_keys(query_cells + offset * directions)
+            starts = np.searchsorted(keys, nbr_keys, side="left")
+            ends = np.searchsorted(keys, nbr_keys, side="right")
+            # Cells rarely hold more than one site of a group
+            for slot in range(max_occupancy):
+                indices = starts + slot
+                in_cell = indices < ends
+                dist = queries - frac_coords[np.minimum(indices, len(keys) - 1)]
+                dist -= np.round(dist)
+                matched |= in_cell & np.all(np.abs(dist) < tol, axis=-1)
+        translations = translations[np.all(matched, axis=0)]
+    return translations
+
+
+def _get_cart_neighbor_list(
+    all_coords: NDArray[np.float64],
+    center_coords: NDArray[np.float64],
+    r: float,
+    numerical_tol: float = 1e-8,
+) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64]]:
+    """Find all points within r of each center without periodic boundaries, using
+    the cell list of find_points_in_spheres.
+
+    Args:
+        all_coords (NDArray): (N, 3) Cartesian coordinates of the points.
+        center_coords (NDArray): (M, 3) Cartesian coordinates of the centers.
+        r (float): Cutoff radius.
+        numerical_tol (float): Points which are r + numerical_tol away are deemed
+            to be within r.
+
+    Returns:
+        tuple: (center_indices, points_indices, distances)
+    """
+    all_coords = np.ascontiguousarray(all_coords, dtype=float).reshape(-1, 3)
+    center_coords = np.ascontiguousarray(center_coords, dtype=float).reshape(-1, 3)
+    try:
+        from pymatgen.optimization.neighbors import find_points_in_spheres
+    except ImportError:
+        pairs = [
+            (idx, index, dist)
+            for idx, neighbors in enumerate(
+                get_points_in_spheres(all_coords, center_coords, r=r, pbc=False, numerical_tol=numerical_tol)
+            )
+            for _, dist, index, _ in neighbors
+        ]
+        center_indices, points_indices, distances = np.array(pairs, dtype=float).reshape(-1, 3).T
+        return center_indices.astype(np.int64), points_indices.astype(np.int64), distances
+
+    # Without periodic boundaries, the lattice only has to be invertible
+    center_indices, points_indices, _, distances = find_points_in_spheres(
+        all_coords,
+        center_coords,
+        r=r,
+        pbc=np.zeros(3, dtype=np.int64),
+        lattice=np.eye(3),
+        tol=numerical_tol,
+    )
+    return center_indices, points_indices, distances
+
+
+def _get_sparse_distance_matrix(
+    n_sites: int,
+    center_indices: np.ndarray,
+    points_indices: np.ndarray,
+    distances: np.ndarray,
+) -> csr_matrix:
+    """Reduce a neighbor list to a CSR matrix of the shortest distance between
+    each pair of distinct sites, i.e. the nearest image distance.
+    """
+    from scipy.sparse import csr_matrix
+
+    cond = center_indices != points_indices
+    center_indices, points_indices, distances = center_indices[cond], points_indices[cond], distances[cond]
+    keys = center_indices * n_sites + points_indices
+    order = np.lexsort((distances, keys))
+    keys = keys[order]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    order = order[first]
+    return csr_matrix(
+        (distances[order], (center_indices[order], points_indices[order])),
+        shape=(n_sites, n_sites),
+    )
+
+
 class StructureError(Exception):
     """Exception class for Structure.
     Raised when the structure has problems, e.g. atoms that are too close.
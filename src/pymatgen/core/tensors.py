@@ -6,6 +6,7 @@ which provides basic methods for creating and manipulating rank 2 tensors.
 from __future__ import annotations
 
 import collections
+import functools
 import itertools
 import os
 import string
@@ -328,8 +329,8 @@ class Tensor(np.ndarray, MSONable):
                 used to generate the symmetry operations
         """
         sga = SpacegroupAnalyzer(structure, symprec)
-        symm_ops = sga.get_symmetry_operations(cartesian=True)
-        return sum(self.transform(symm_op) for symm_op in symm_ops) / len(symm_ops)
+        rotations = np.array([symm_op.rotation_matrix for symm_op in sga.get_symmetry_operations(cartesian=True)])
+        return type(self)(_transform_stack(np.asarray(self)[None], rotations).mean(axis=0)[0])
 
     def is_fit_to_structure(self, structure: Structure, tol: float = 1e-2) -> bool:
         """Test whether a tensor is invariant with respect to the
@@ -346,10 +347,8 @@ class Tensor(np.ndarray, MSONable):
     @property
     def voigt(self) -> NDArray[np.float64]:
         """The tensor in Voigt notation."""
-        v_matrix = np.zeros(self._vscale.shape, dtype=self.dtype)
-        this_voigt_map = self.get_voigt_dict(self.rank)
-        for ind, v in this_voigt_map.items():
-            v_matrix[v] = self[ind]
+        _, tensor_idx = _get_voigt_indices(self.rank)
+        v_matrix = np.asarray(self).reshape(-1)[tensor_idx].reshape(self._vscale.shape)
         if not self.is_voigt_symmetric():
             warnings.warn("Tensor is not symmetric, information may be lost in Voigt conversion.", stacklevel=2)
         return v_matrix * self._vscale
@@ -359,16 +358,7 @@ class Tensor(np.ndarray, MSONable):
         by grouping indices into pairs and constructing a sequence of
         possible permutations to be used in a tensor transpose.
         """
-        transpose_pieces = [[[0 for _ in range(self.rank % 2)]]]
-        transpose_pieces += [[list(range(j, j + 2))] for j in range(self.rank % 2, self.rank, 2)]
-        for n in range(self.rank % 2, len(transpose_pieces)):
-            if len(transpose_pieces[n][0]) == 2:
-                transpose_pieces[n] += [transpose_pieces[n][0][::-1]]
-        for trans_seq in itertools.product(*transpose_pieces):
-            transpose_seq = list(itertools.chain(*trans_seq))
-            if (self - self.transpose(transpose_seq) > tol).any():
-                return False
-        return True
+        return not any((self - self.transpose(seq) > tol).any() for seq in _get_voigt_transposes(self.rank))
 
     @staticmethod
     def get_voigt_dict(rank: int) -> dict[tuple[int, ...], tuple[int, ...]]:
@@ -402,10 +392,8 @@ class Tensor(np.ndarray, MSONable):
         if voigt_input.shape != t._vscale.shape:
             raise ValueError("Invalid shape for Voigt matrix")
         voigt_input = voigt_input / t._vscale  # (ruff-preview) noqa: PLR6104
-        this_voigt_map = t.get_voigt_dict(rank)
-        for ind, v in this_voigt_map.items():
-            t[ind] = voigt_input[v]
-        return cls(t)
+        voigt_idx, _ = _get_voigt_indices(rank)
+        return cls(voigt_input.reshape(-1)[voigt_idx].reshape(t.shape).astype(t.dtype))
 
     @staticmethod
     def get_ieee_rotation(
@@ -714,6 +702,10 @@ class Tensor(np.ndarray, MSONable):
 class TensorCollection(collections.abc.Sequence, MSONable):
     """A sequence of tensors that can be used for fitting data
     or for having a tensor expansion.
+
+    If all tensors have the same rank, they are stored as views into a single
+    (M, 3, ..., 3) array, see TensorCollection.stack, and the list-based methods
+    operate on all tensors at once.
     """
 
     def __init__(self, tensor_list: Sequence, base_class=Tensor) -> None:
@@ -722,7 +714,12 @@ class TensorCollection(collections.abc.Sequence, MSONable):
             tensor_list: List of tensors.
             base_class: Class to be used.
         """
-        self.tensors = [tensor if isinstance(tensor, base_class) else base_class(tensor) for tensor in tensor_list]
+        tensors = [tensor if isinstance(tensor, base_class) else base_class(tensor) for tensor in tensor_list]
+        self._stack = None
+        if tensors and len({tensor.rank for tensor in tensors}) == 1:
+            self._stack = np.stack([np.asarray(tensor) for tensor in tensors])
+            tensors = [_view_like(tensor, row) for tensor, row in zip(tensors, self._stack, strict=True)]
+        self.tensors = tensors
 
     def __len__(self) -> int:
         return len(self.tensors)
@@ -733,6 +730,19 @@ class TensorCollection(collections.abc.Sequence, MSONable):
     def __iter__(self):
         return iter(self.tensors)
 
+    @property
+    def stack(self) -> NDArray | None:
+        """All tensors as a single (M, 3, ..., 3) array, which the tensors of the
+        collection are views into, or None if the tensors have different ranks.
+        """
+        return self._stack
+
+    def _from_stack(self, stack: NDArray) -> Self:
+        """TensorCollection of the same type from a (M, 3, ..., 3) array, with each
+        tensor of the same type as the corresponding tensor in this collection.
+        """
+        return type(self)([type(tensor)(new) for tensor, new in zip(self, stack, strict=True)])
+
     def zeroed(self, tol: float = 1e-3) -> Self:
         """
         Args:
@@ -741,7 +751,9 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection where small values are set to 0.
         """
-        return type(self)([tensor.zeroed(tol) for tensor in self])
+        if self._stack is None:
+            return type(self)([tensor.zeroed(tol) for tensor in self])
+        return self._from_stack(np.where(np.abs(self._stack) < tol, 0, self._stack))
 
     def transform(self, symm_op: SymmOp) -> Self:
         """Transforms TensorCollection with a symmetry operation.
@@ -752,7 +764,9 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.transform(symm_op) for tensor in self])
+        if self._stack is None:
+            return type(self)([tensor.transform(symm_op) for tensor in self])
+        return self._from_stack(_transform_stack(self._stack, symm_op.rotation_matrix[None])[0])
 
     def rotate(self, matrix, tol: float = 1e-3) -> Self:
         """Rotates TensorCollection.
@@ -764,12 +778,25 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.rotate(matrix, tol) for tensor in self])
+        if self._stack is None:
+            return type(self)([tensor.rotate(matrix, tol) for tensor in self])
+        matrix = SquareTensor(matrix)
+        if not matrix.is_rotation(tol):
+            raise ValueError("Rotation matrix is not valid.")
+        return self._from_stack(_transform_stack(self._stack, np.asarray(matrix)[None])[0])
 
     @property
     def symmetrized(self) -> Self:
         """TensorCollection where all tensors are symmetrized."""
-        return type(self)([tensor.symmetrized for tensor in self])
+        if self._stack is None:
+            return type(self)([tensor.symmetrized for tensor in self])
+        return self._from_stack(self._get_symmetrized_stack())
+
+    def _get_symmetrized_stack(self) -> NDArray:
+        """Average of the stack over all permutations of the tensor indices."""
+        rank = self._stack.ndim - 1
+        perms = list(itertools.permutations(range(1, rank + 1)))
+        return sum(np.transpose(self._stack, (0, *perm)) for perm in perms) / len(perms)
 
     def is_symmetric(self, tol: float = 1e-5) -> bool:
         """
@@ -779,7 +806,9 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             Whether all tensors are symmetric.
         """
-        return all(tensor.is_symmetric(tol) for tensor in self)
+        if self._stack is None:
+            return all(tensor.is_symmetric(tol) for tensor in self)
+        return np.allclose(self._stack, self._get_symmetrized_stack(), atol=tol, rtol=0)
 
     def fit_to_structure(
         self,
@@ -795,7 +824,15 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.fit_to_structure(structure, symprec) for tensor in self])
+        if self._stack is None:
+            return type(self)([tensor.fit_to_structure(structure, symprec) for tensor in self])
+        return self._from_stack(self._get_fit_stack(structure, symprec))
+
+    def _get_fit_stack(self, structure: Structure, symprec: float = 0.1) -> NDArray:
+        """Average of the stack over the symmetry operations of a structure."""
+        sga = SpacegroupAnalyzer(structure, symprec)
+        rotations = np.array([symm_op.rotation_matrix for symm_op in sga.get_symmetry_operations(cartesian=True)])
+        return _transform_stack(self._stack, rotations).mean(axis=0)
 
     def is_fit_to_structure(
         self,
@@ -810,12 +847,20 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             Whether all tensors are fitted to Structure.
         """
-        return all(tensor.is_fit_to_structure(structure, tol) for tensor in self)
+        if self._stack is None:
+            return all(tensor.is_fit_to_structure(structure, tol) for tensor in self)
+        return np.allclose(self._stack, self._get_fit_stack(structure), atol=tol, rtol=0)
 
     @property
     def voigt(self) -> list[NDArray[np.float64]]:
         """TensorCollection where all tensors are in Voigt form."""
-        return [tensor.voigt for tensor in self]
+        if self._stack is None:
+            return [tensor.voigt for tensor in self]
+        if not self.is_voigt_symmetric():
+            warnings.warn("Tensor is not symmetric, information may be lost in Voigt conversion.", stacklevel=2)
+        _, tensor_idx = _get_voigt_indices(self._stack.ndim - 1)
+        vscales = np.array([tensor._vscale for tensor in self])
+        return list(self._stack.reshape(len(self), -1)[:, tensor_idx].reshape(vscales.shape) * vscales)
 
     @property
     def ranks(self) -> list:
@@ -830,7 +875,12 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             Whether all tensors are voigt symmetric.
         """
-        return all(tensor.is_voigt_symmetric(tol) for tensor in self)
+        if self._stack is None:
+            return all(tensor.is_voigt_symmetric(tol) for tensor in self)
+        return not any(
+            (self._stack - self._stack.transpose(0, *[idx + 1 for idx in seq]) > tol).any()
+            for seq in _get_voigt_transposes(self._stack.ndim - 1)
+        )
 
     @classmethod
     def from_voigt(
@@ -847,7 +897,17 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return cls([base_class.from_voigt(v) for v in voigt_input_list])
+        if len({np.shape(v) for v in voigt_input_list}) != 1:
+            return cls([base_class.from_voigt(v) for v in voigt_input_list])
+
+        voigt_stack = np.array(voigt_input_list, dtype=float)
+        rank = sum(voigt_stack.shape[1:]) // 3
+        vscale = base_class(np.zeros([3] * rank))._vscale
+        if voigt_stack.shape[1:] != vscale.shape:
+            raise ValueError("Invalid shape for Voigt matrix")
+        voigt_idx, _ = _get_voigt_indices(rank)
+        stack = (voigt_stack / vscale).reshape(len(voigt_stack), -1)[:, voigt_idx]
+        return cls([base_class(tensor) for tensor in stack.reshape(len(stack), *[3] * rank)])
 
     def convert_to_ieee(
         self,
@@ -877,7 +937,9 @@ class TensorCollection(collections.abc.Sequence, MSONable):
         Returns:
             TensorCollection.
         """
-        return type(self)([tensor.round(*args, **kwargs) for tensor in self])
+        if self._stack is None:
+            return type(self)([tensor.round(*args, **kwargs) for tensor in self])
+        return self._from_stack(np.round(self._stack, *args, **kwargs))
 
     @property
     def voigt_symmetrized(self) -> Self:
@@ -1025,6 +1087,78 @@ def get_uvec(vec: NDArray[np.float64]) -> NDArray[np.float64]:
     return vec if norm < 1e-8 else vec / norm
 
 
+def _view_like(tensor: Tensor, array: NDArray) -> Tensor:
+    """View of an array as the type of a tensor, with the attributes of that tensor."""
+    view = array.view(type(tensor))
+    view.__dict__.update(tensor.__dict__)
+    return view
+
+
+def _transform_stack(stack: NDArray, rotations: NDArray) -> NDArray:
+    """Apply each of K rotation matrices to each of M tensors of the same rank,
+    as SymmOp.transform_tensor does for one tensor.
+
+    The rotations are applied to one tensor index at a time, which scales as
+    3^(N+1) rather than 3^(2N) per tensor for rank N, and gives each entry
+    independently of the number of tensors.
+
+    Args:
+        stack (np.ndarray): shape (M, 3, ..., 3). Tensors to transform.
+        rotations (np.ndarray): shape (K, 3, 3). Rotation matrices.
+
+    Returns:
+        np.ndarray: shape (K, M, 3, ..., 3).
+    """
+    rank = stack.ndim - 1
+    indices = string.ascii_lowercase[:rank]
+    result = np.broadcast_to(stack, (len(rotations), *stack.shape))
+    for axis in range(rank):
+        old_indices = f"{indices[:axis]}z{indices[axis + 1 :]}"
+        result = np.einsum(f"K{indices[axis]}z,KM{old_indices}->KM{indices}", rotations, result)
+    return result
+
+
+@functools.cache
+def _get_voigt_indices(rank: int) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Flat index arrays for vectorized conversions between standard and Voigt
+    notation, following the mapping of Tensor.get_voigt_dict.
+
+    Args:
+        rank (int): Tensor rank.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: For each of the 3^rank tensor entries, the
+            flat index of its Voigt entry, and for each Voigt entry, the flat index
+            of the tensor entry it is taken from.
+    """
+    reverse_voigt_map = np.array([[0, 5, 4], [5, 1, 3], [4, 3, 2]])
+    # Rows of tensor indices in the order of itertools.product, as in get_voigt_dict
+    indices = np.indices([3] * rank).reshape(rank, -1)
+    voigt_indices = [*indices[: rank % 2]]
+    voigt_indices += [reverse_voigt_map[indices[pos], indices[pos + 1]] for pos in range(rank % 2, rank, 2)]
+    voigt_shape = [3] * (rank % 2) + [6] * (rank // 2)
+    voigt_idx = np.ravel_multi_index(voigt_indices, voigt_shape)
+
+    # get_voigt_dict maps several tensor entries to each Voigt entry, and Tensor.voigt
+    # takes the value of the last one
+    _, last = np.unique(voigt_idx[::-1], return_index=True)
+    tensor_idx = len(voigt_idx) - 1 - last
+    voigt_idx.flags.writeable = tensor_idx.flags.writeable = False
+    return voigt_idx, tensor_idx
+
+
+def _get_voigt_transposes(rank: int) -> list[list[int]]:
+    """Index permutations under which a tensor of a given rank must be invariant
+    for a lossless Voigt conversion, i.e. all swaps of the indices within pairs.
+    """
+    transpose_pieces = [[[0 for _ in range(rank % 2)]]]
+    transpose_pieces += [[list(range(j, j + 2))] for j in range(rank % 2, rank, 2)]
+    for n in range(rank % 2, len(transpose_pieces)):
+        if len(transpose_pieces[n][0]) == 2:
+            transpose_pieces[n] += [transpose_pieces[n][0][::-1]]
+    return [list(itertools.chain(*trans_seq)) for trans_seq in itertools.product(*transpose_pieces)]
+
+
 def symmetry_reduce(
     tensors,
     structure: Structure,
@@ -1050,17 +1184,26 @@ def symmetry_reduce(
     """
     sga = SpacegroupAnalyzer(structure, **kwargs)
     symm_ops = sga.get_symmetry_operations(cartesian=True)
-    unique_mapping = TensorMapping([tensors[0]], [[]], tol=tol)
-    for tensor in tensors[1:]:
-        is_unique = True
-        for unique_tensor, symm_op in itertools.product(unique_mapping, symm_ops):
-            if np.allclose(unique_tensor.transform(symm_op), tensor, atol=tol):
-                unique_mapping[unique_tensor].append(symm_op)
-                is_unique = False
-                break
-        if is_unique:
-            unique_mapping[tensor] = []
-    return unique_mapping
+    rotations = np.array([symm_op.rotation_matrix for symm_op in symm_ops])
+    stack = np.array(tensors, dtype=float)
+    # Images of all tensors under all symmetry operations, of shape (M, K, 3, ..., 3)
+    images = np.swapaxes(_transform_stack(stack, rotations), 0, 1)
+    # Same tolerances as np.allclose(image, tensor, atol=tol)
+    tols = tol + 1e-5 * np.abs(stack)
+
+    unique_indices = [0]
+    symm_op_lists: list[list[SymmOp]] = [[]]
+    for idx in range(1, len(stack)):
+        matches = np.abs(images[unique_indices] - stack[idx]) <= tols[idx]
+        matches = matches.reshape(*matches.shape[:2], -1).all(axis=-1)
+        if matches.any():
+            # First match over the unique tensors, then over the symmetry operations
+            unique_idx, op_idx = divmod(int(np.argmax(matches)), len(symm_ops))
+            symm_op_lists[unique_idx].append(symm_ops[op_idx])
+        else:
+            unique_indices.append(idx)
+            symm_op_lists.append([])
+    return TensorMapping([tensors[idx] for idx in unique_indices], symm_op_lists, tol=tol)
 
 
 class TensorMapping(collections.abc.MutableMapping):
@@ -5,17 +5,31 @@ either relaxation or molecular dynamics.
 from __future__ import annotations
 
 import itertools
+import json
+import os
 import warnings
+from collections.abc import Sequence
 from fnmatch import fnmatch
+from numbers import Number
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import TYPE_CHECKING, TypeAlias, cast
 
 import numpy as np
 from monty.io import zopen
-from monty.json import MSONable
-
-from pymatgen.core.structure import Composition, DummySpecies, Element, Lattice, Molecule, Species, Structure
+from monty.json import MontyDecoder, MontyEncoder, MSONable
+from monty.serialization import dumpfn, loadfn
+
+from pymatgen.core.structure import (
+    Composition,
+    DummySpecies,
+    Element,
+    Lattice,
+    Molecule,
+    Species,
+    Structure,
+    VerletNeighborList,
+)
 from pymatgen.io.ase import NO_ASE_ERR, AseAtomsAdaptor
 
 if NO_ASE_ERR is None:
@@ -25,7 +39,7 @@ else:
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Iterable, Iterator
     from typing import Any
 
     from typing_extensions import Self
@@ -182,10 +196,34 @@ class Trajectory(MSONable):
         self.time_step = time_step
 
         self._check_site_props(site_properties)
+        if isinstance(site_properties, list):
+            # Store per-frame site properties as columns where possible, and otherwise
+            # copy the list, so that extend can append to it in place
+            site_properties = SitePropertyColumns.from_frames(site_properties) or list(site_properties)
         self.site_properties = site_properties
 
         self._check_frame_props(frame_properties)
-        self.frame_properties = frame_properties
+        self.frame_properties = list(frame_properties) if isinstance(frame_properties, list) else frame_properties
+
+    @property
+    def coords(self) -> np.ndarray:
+        """Positions or displacements of the sites in all frames, shape (M, N, 3)."""
+        return self._coords.array
+
+    @coords.setter
+    def coords(self, coords: np.ndarray) -> None:
+        self._coords = _FrameBuffer(coords)
+
+    @property
+    def lattice(self) -> np.ndarray | None:
+        """Lattice of all frames, shape (3, 3), or of each frame, shape (M, 3, 3). None
+        for Molecule-based trajectories.
+        """
+        return self._lattice.array if isinstance(self._lattice, _FrameBuffer) else self._lattice
+
+    @lattice.setter
+    def lattice(self, lattice: np.ndarray | None) -> None:
+        self._lattice = _FrameBuffer(lattice) if lattice is not None and lattice.ndim == 3 else lattice
 
     def __iter__(self) -> Iterator[Structure | Molecule]:
         """Iterator of the trajectory, yielding a pymatgen Structure or Molecule for each frame."""
@@ -194,7 +232,7 @@ class Trajectory(MSONable):
 
     def __len__(self) -> int:
         """Number of frames in the trajectory."""
-        return len(self.coords)
+        return len(self._coords)
 
     def __getitem__(self, frames: ValidIndex) -> Molecule | Structure:
         """Get a subset of the trajectory.
@@ -318,6 +356,42 @@ class Trajectory(MSONable):
 
         return mol
 
+    def get_neighbor_lists(
+        self,
+        r: float,
+        skin: float = 0.3,
+        numerical_tol: float = 1e-8,
+        exclude_self: bool = True,
+    ) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """Iterate over the neighbor lists of all frames of a Structure-based trajectory.
+
+        A VerletNeighborList is carried from frame to frame, so the neighbor search
+        is only repeated when atoms have moved by more than skin / 2. No Structure
+        is created for the frames.
+
+        Args:
+            r (float): Radius of sphere.
+            skin (float): Skin distance of the VerletNeighborList. Defaults to 0.3.
+            numerical_tol (float): Numerical tolerance for distances, see
+                Structure.get_neighbor_list.
+            exclude_self (bool): Whether to exclude atom neighboring with itself
+                within numerical tolerance distance. Defaults to True.
+
+        Yields:
+            tuple: (center_indices, points_indices, offset_vectors, distances) of
+                each frame, with the same neighbors as self[idx].get_neighbor_list(r).
+        """
+        if self.lattice is None:
+            raise TypeError("Neighbor lists are only available for Structure-based Trajectory!")
+
+        self.to_positions()
+        neighbor_list = VerletNeighborList(r, skin=skin, numerical_tol=numerical_tol)
+        lattice = Lattice(self.lattice) if self.constant_lattice else None
+        for idx in range(len(self)):
+            frame_lattice = lattice or Lattice(self.lattice[idx])
+            # Frames are wrapped into the unit cell as in __getitem__
+            yield neighbor_list.get_neighbor_list(np.mod(self.coords[idx], 1), frame_lattice, exclude_self=exclude_self)
+
     def to_positions(self) -> None:
         """Convert displacements between consecutive frames into positions.
 
@@ -394,31 +468,128 @@ class Trajectory(MSONable):
         self.to_positions()
         trajectory.to_positions()
 
-        self.site_properties = self._combine_site_props(
-            self.site_properties,
+        self._append_frames(
+            trajectory.coords,
+            trajectory.lattice,
             trajectory.site_properties,
-            len(self),
-            len(trajectory),
+            trajectory.frame_properties,
         )
 
-        self.frame_properties = self._combine_frame_props(
-            self.frame_properties,
-            trajectory.frame_properties,
-            len(self),
-            len(trajectory),
+    def append_frame(
+        self,
+        coords: np.ndarray,
+        lattice: Lattice | np.ndarray | None = None,
+        site_properties: dict | None = None,
+        frame_properties: dict | None = None,
+    ) -> None:
+        """Append a single frame to the trajectory.
+
+        The coords, lattices and site properties are kept in buffers whose capacity is
+        doubled when full, so building a trajectory of M frames one frame at a time
+        takes O(M) time, as does extending it with many short trajectories.
+
+        Args:
+            coords: shape (N, 3). Fractional coords for Structure-based trajectories,
+                Cartesian coords for Molecule-based ones.
+            lattice: shape (3, 3). Lattice of the frame, required for Structure-based
+                trajectories. If the trajectory has a constant lattice and this differs
+                from it, the trajectory gets a lattice per frame.
+            site_properties (dict | None): Site properties of the frame.
+            frame_properties (dict | None): Properties of the frame, e.g. its energy.
+        """
+        if (lattice is None) != (self.lattice is None):
+            raise ValueError("lattice must be given if and only if the trajectory is Structure-based.")
+        if isinstance(lattice, Lattice):
+            lattice = lattice.matrix
+        if lattice is not None:
+            lattice = np.asarray(lattice)
+            if self.lattice.ndim == 3 or not np.allclose(lattice, self.lattice):  # type:ignore[union-attr]
+                lattice = lattice[None]
+
+        self.to_positions()
+        self._append_frames(
+            np.asarray(coords)[None],
+            lattice,
+            site_properties,
+            None if frame_properties is None else [frame_properties],
         )
 
-        if self.lattice is not None and trajectory.lattice is not None:
-            self.lattice, self.constant_lattice = self._combine_lattice(
-                self.lattice,
-                trajectory.lattice,
-                len(self),
-                len(trajectory),
+    def _append_frames(
+        self,
+        coords: np.ndarray,
+        lattice: np.ndarray | None,
+        site_properties: SitePropsType | SitePropertyColumns | None,
+        frame_properties: Sequence[dict | None] | None,
+    ) -> None:
+        """Append frames to the buffers of the trajectory.
+
+        Args:
+            coords: shape (K, N, 3). Positions of the new frames.
+            lattice: shape (3, 3) or (K, 3, 3). Lattice of the new frames.
+            site_properties: Site properties of the new frames, as in __init__.
+            frame_properties: Frame properties of the new frames, or None.
+        """
+        n_frames = len(coords)
+        if coords.shape[1:] != self.coords.shape[1:]:
+            raise ValueError(f"coords of new frames must have shape (K, {len(self.species)}, 3), got {coords.shape}")
+
+        # Note, the site and frame properties need to be extended first, since len(self)
+        # is used there
+        self._extend_site_props(site_properties, n_frames)
+        self._extend_frame_props(frame_properties, n_frames)
+
+        if self.lattice is not None and lattice is not None and not self.lattice.ndim == lattice.ndim == 2:
+            if self.lattice.ndim == 2:
+                self.lattice = np.tile(self.lattice, (len(self), 1, 1))
+            self._lattice.extend(lattice if lattice.ndim == 3 else np.tile(lattice, (n_frames, 1, 1)))
+            self.constant_lattice = False
+
+        self._coords.extend(coords)
+
+    def _extend_site_props(
+        self,
+        site_props: SitePropsType | SitePropertyColumns | None,
+        n_frames: int,
+    ) -> None:
+        """Append the site properties of n_frames new frames, in place where possible.
+
+        Either the current or the new site properties can be None, a dict that applies
+        to all frames, or per-frame site properties.
+        """
+        if self.site_properties is site_props is None:
+            return
+        if isinstance(self.site_properties, dict) and self.site_properties == site_props:
+            return
+
+        if isinstance(site_props, dict):
+            new_frames: Sequence = [site_props] * n_frames
+        elif site_props is None:
+            new_frames = [None] * n_frames
+        else:
+            new_frames = site_props
+
+        if isinstance(self.site_properties, SitePropertyColumns):
+            new_columns = SitePropertyColumns.from_frames(new_frames)
+            if new_columns is not None and self.site_properties.is_compatible(new_columns):
+                self.site_properties.extend(new_columns)
+                return
+
+        if not isinstance(self.site_properties, list):
+            self.site_properties = (
+                [self.site_properties] * len(self)
+                if isinstance(self.site_properties, dict | None)
+                else list(self.site_properties)
             )
+        self.site_properties.extend(new_frames)
 
-        # Note, this should be after the other self._combine... method calls, since
-        # len(self) is used there.
-        self.coords = np.concatenate((self.coords, trajectory.coords))
+    def _extend_frame_props(self, frame_props: Sequence[dict | None] | None, n_frames: int) -> None:
+        """Append the frame properties of n_frames new frames in place."""
+        if self.frame_properties is frame_props is None:
+            return
+        if not isinstance(self.frame_properties, list):
+            # Copy frame properties that are None or e.g. read from a TrajectoryStore
+            self.frame_properties = [None] * len(self) if self.frame_properties is None else list(self.frame_properties)
+        self.frame_properties.extend([None] * n_frames if frame_props is None else frame_props)
 
     def write_Xdatcar(
         self,
@@ -489,8 +660,12 @@ class Trajectory(MSONable):
             "charge": self.charge,
             "spin_multiplicity": self.spin_multiplicity,
             "lattice": lat,
-            "site_properties": self.site_properties,
-            "frame_properties": self.frame_properties,
+            "site_properties": (
+                list(self.site_properties)
+                if isinstance(self.site_properties, SitePropertyColumns)
+                else self.site_properties
+            ),
+            "frame_properties": None if self.frame_properties is None else list(self.frame_properties),
             "constant_lattice": self.constant_lattice,
             "time_step": self.time_step,
             "coords_are_displacement": self.coords_are_displacement,
@@ -557,25 +732,37 @@ class Trajectory(MSONable):
         )
 
     @classmethod
-    def from_file(cls, filename: str | Path, constant_lattice: bool = True, **kwargs) -> Self:
+    def from_file(
+        cls,
+        filename: str | Path,
+        constant_lattice: bool = True,
+        store: PathLike | None = None,
+        **kwargs,
+    ) -> Self:
         """Create trajectory from XDATCAR, vasprun.xml file, or ASE trajectory (.traj) file.
 
         Args:
             filename (str | Path): Path to the file to read from.
             constant_lattice (bool): Whether the lattice changes during the simulation,
                 such as in an NPT MD simulation. Defaults to True.
-            **kwargs: Additional kwargs passed to Trajectory constructor.
+            store (PathLike | None): If given, the frames are written to a new
+                TrajectoryStore in this directory and the returned trajectory is
+                memory-mapped from it. XDATCAR files are streamed frame by frame, so
+                the trajectory never needs to fit in memory. Defaults to None.
+            **kwargs: Additional kwargs passed to Trajectory constructor, or to
+                TrajectoryStore.from_structures if store is given.
 
         Returns:
             Trajectory: containing the structures or molecules in the file.
         """
         filename = str(Path(filename).expanduser().resolve())
-        structures = []
+        structures: Iterable[Structure] = []
 
         if fnmatch(filename, "*XDATCAR*"):
             from pymatgen.io.vasp.outputs import Xdatcar
 
-            structures = Xdatcar(filename).structures
+            # Stream the frames into the store rather than parsing them all first
+            structures = Xdatcar(filename).structures if store is None else Xdatcar.iter_structures(filename)
 
         elif fnmatch(filename, "vasprun*.xml*"):
             from pymatgen.io.vasp.outputs import Vasprun
@@ -583,102 +770,32 @@ class Trajectory(MSONable):
             structures = Vasprun(filename).structures
 
         elif fnmatch(filename, "*.traj"):
-            if NO_ASE_ERR is None:
-                return cls.from_ase(  # type:ignore[return-value]
-                    filename,
-                    constant_lattice=constant_lattice,
-                    store_frame_properties=True,
-                    additional_fields=None,
-                )
-            raise ImportError("ASE is required to read .traj files. pip install ase")
+            if NO_ASE_ERR is not None:
+                raise ImportError("ASE is required to read .traj files. pip install ase")
+            traj = cls.from_ase(
+                filename,
+                constant_lattice=constant_lattice,
+                store_frame_properties=True,
+                additional_fields=None,
+            )
+            if store is None:
+                return traj  # type:ignore[return-value]
+            return TrajectoryStore.from_trajectory(store, traj).to_trajectory()  # type:ignore[return-value]
 
         elif fnmatch(filename, "*.json*"):
-            from monty.serialization import loadfn
-
-            return loadfn(filename, **kwargs)
+            if store is None:
+                return loadfn(filename, **kwargs)
+            return TrajectoryStore.from_trajectory(store, loadfn(filename)).to_trajectory()  # type:ignore[return-value]
 
         else:
             supported_file_types = ("XDATCAR", "vasprun.xml", "*.traj", ".json")
             raise ValueError(f"Expect file to be one of {supported_file_types}; got {filename}.")
 
-        return cls.from_structures(structures, constant_lattice=constant_lattice, **kwargs)
-
-    @staticmethod
-    def _combine_lattice(
-        lat1: np.ndarray,
-        lat2: np.ndarray,
-        len1: int,
-        len2: int,
-    ) -> tuple[np.ndarray, bool]:
-        """Helper function to combine trajectory lattice."""
-        if lat1.ndim == lat2.ndim == 2:
-            constant_lat = True
-            lat = lat1
-        else:
-            constant_lat = False
-            if lat1.ndim == 2:
-                lat1 = np.tile(lat1, (len1, 1, 1))
-            if lat2.ndim == 2:
-                lat2 = np.tile(lat2, (len2, 1, 1))
-            lat = np.concatenate((lat1, lat2))
-
-        return lat, constant_lat
-
-    @staticmethod
-    def _combine_site_props(
-        prop1: SitePropsType | None,
-        prop2: SitePropsType | None,
-        len1: int,
-        len2: int,
-    ) -> SitePropsType | None:
-        """Combine site properties.
-
-        Either one of prop1 or prop2 can be None, dict, or a list of dict. All
-        possibilities of combining them are considered.
-        """
-        # Special cases
-        if prop1 is prop2 is None:
-            return None
-
-        if isinstance(prop1, dict) and prop1 == prop2:
-            return prop1
-
-        # General case
-        if prop1 is not None and not isinstance(prop1, list | dict):
-            raise ValueError(f"prop1 should be None, list or dict, got {type(prop1).__name__}.")
-        if prop2 is not None and not isinstance(prop2, list | dict):
-            raise ValueError(f"prop2 should be None, list or dict, got {type(prop2).__name__}.")
-
-        p1_candidates: dict[str, Any] = {
-            "NoneType": [None] * len1,
-            "dict": [prop1] * len1,
-            "list": prop1,
-        }
-        p2_candidates: dict[str, Any] = {
-            "NoneType": [None] * len2,
-            "dict": [prop2] * len2,
-            "list": prop2,
-        }
-        p1_selected: list = p1_candidates[type(prop1).__name__]
-        p2_selected: list = p2_candidates[type(prop2).__name__]
-
-        return p1_selected + p2_selected
-
-    @staticmethod
-    def _combine_frame_props(
-        prop1: list[dict] | None,
-        prop2: list[dict] | None,
-        len1: int,
-        len2: int,
-    ) -> list | None:
-        """Combine frame properties."""
-        if prop1 is prop2 is None:
-            return None
-        if prop1 is None:
-            return [None] * len1 + list(cast("list[dict]", prop2))
-        if prop2 is None:
-            return list(prop1) + [None] * len2
-        return list(prop1) + list(prop2)
+        if store is not None:
+            return TrajectoryStore.from_structures(  # type:ignore[return-value]
+                store, structures, constant_lattice=constant_lattice, **kwargs
+            ).to_trajectory()
+        return cls.from_structures(structures, constant_lattice=constant_lattice, **kwargs)  # type:ignore[arg-type]
 
     def _check_site_props(self, site_props: SitePropsType | None) -> None:
         """Check data shape of site properties.
@@ -699,6 +816,9 @@ class Trajectory(MSONable):
             raise ValueError(
                 f"Size of the site properties {len(site_props)} does not equal the number of frames {len(self)}"
             )
+        if isinstance(site_props, SitePropertyColumns):
+            # Check the first frame of each column rather than the dicts of all frames
+            site_props = [site_props.constant, {key: col[0] for key, col in site_props.columns.items()}]
 
         n_sites = len(self.coords[0])
         for dct in site_props:
@@ -725,6 +845,8 @@ class Trajectory(MSONable):
             return None
         if isinstance(self.site_properties, dict):
             return self.site_properties
+        if isinstance(self.site_properties, SitePropertyColumns):
+            return self.site_properties[frames]
         if isinstance(self.site_properties, list):
             if isinstance(frames, int):
                 return self.site_properties[frames]
@@ -877,3 +999,558 @@ class Trajectory(MSONable):
             temp_file.close()
 
         return ase_traj
+
+
+class _FrameBuffer:
+    """Array that grows along its first (frame) axis in amortized O(1) time per frame,
+    by doubling its capacity whenever it is full.
+    """
+
+    def __init__(self, arr: np.ndarray) -> None:
+        """
+        Args:
+            arr (np.ndarray): Initial frames. Not copied until frames are appended.
+        """
+        self._data = arr
+        self._len = len(arr)
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def array(self) -> np.ndarray:
+        """View of the frames in the buffer."""
+        return self._data[: self._len]
+
+    def extend(self, arr: np.ndarray) -> None:
+        """Append frames, reallocating the buffer if it is full."""
+        arr = np.asarray(arr)
+        new_len = self._len + len(arr)
+        dtype = np.result_type(self._data, arr)
+        if new_len > len(self._data) or dtype != self._data.dtype:
+            data = np.empty((max(new_len, 2 * len(self._data)), *self._data.shape[1:]), dtype=dtype)
+            data[: self._len] = self._data[: self._len]
+            self._data = data
+        self._data[self._len : new_len] = arr
+        self._len = new_len
+
+
+class SitePropertyColumns(Sequence):
+    """Per-frame site properties of a trajectory stored as one array per property.
+
+    Behaves like the list of M dicts accepted by Trajectory(site_properties=...), but
+    holds each property as a single (M, N, ...) array, which may be memory-mapped.
+    Indexing with an int gives the dict of a frame, and indexing with a slice or a
+    list of ints gives a new SitePropertyColumns without copying a list of dicts.
+    Appending frames with extend takes amortized O(1) time per frame.
+    """
+
+    def __init__(self, columns: dict[str, np.ndarray], constant: dict | None = None) -> None:
+        """
+        Args:
+            columns (dict[str, np.ndarray]): Arrays of shape (M, N, ...) for each
+                per-frame site property. All arrays must have the same M.
+            constant (dict | None): Site properties that are the same for all frames.
+        """
+        lengths = {len(col) for col in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"All site property columns must have the same number of frames, got {lengths}")
+        self._columns = {key: _FrameBuffer(col) for key, col in columns.items()}
+        self.constant = constant or {}
+        self._len = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_frames(cls, site_props: Sequence[dict]) -> Self | None:
+        """Convert a list of per-frame site property dicts to columns.
+
+        Args:
+            site_props (Sequence[dict]): Site properties of each frame.
+
+        Returns:
+            SitePropertyColumns, or None if the frames do not all have the same
+                properties or the values are not numeric, boolean or string arrays.
+        """
+        if isinstance(site_props, cls):
+            return site_props
+        if not site_props or any(not isinstance(props, dict) for props in site_props):
+            return None
+        keys = set(site_props[0])
+        if not keys or any(set(props) != keys for props in site_props):
+            return None
+        # Sequences of other objects, e.g. Magmom, would not survive the round trip to arrays
+        if any(
+            len(val) == 0 or not isinstance(val[0], Number | np.generic | str | list | tuple | np.ndarray)
+            for val in site_props[0].values()
+        ):
+            return None
+
+        try:
+            columns = {key: np.array([props[key] for props in site_props]) for key in keys}
+        except ValueError:  # ragged values
+            return None
+        if any(col.dtype.kind not in "biufcU" for col in columns.values()):
+            return None
+        return cls(columns)
+
+    @property
+    def columns(self) -> dict[str, np.ndarray]:
+        """Arrays of shape (M, N, ...) of each per-frame site property."""
+        return {key: col.array for key, col in self._columns.items()}
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, frames: ValidIndex) -> Any:  # type:ignore[override]
+        if isinstance(frames, int | np.integer):
+            return self.constant | {key: col.array[frames].tolist() for key, col in self._columns.items()}
+        return type(self)({key: col[frames] for key, col in self.columns.items()}, self.constant)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or len(self) != len(other):
+            return NotImplemented
+        return all(frame == other_frame for frame, other_frame in zip(self, other, strict=True))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.constant) + list(self._columns)}, frames={len(self)})"
+
+    def is_compatible(self, other: SitePropertyColumns) -> bool:
+        """Whether other has the same properties, so that it can be appended with extend."""
+        if self.constant != other.constant or self._columns.keys() != other._columns.keys():
+            return False
+        return all(col.array.shape[1:] == other._columns[key].array.shape[1:] for key, col in self._columns.items())
+
+    def extend(self, other: SitePropertyColumns) -> None:
+        """Append the frames of compatible site property columns in place.
+
+        Args:
+            other (SitePropertyColumns): Site properties of the frames to append.
+        """
+        if not self.is_compatible(other):
+            raise ValueError(f"Cannot extend {self} with incompatible site properties {other}")
+        for key, col in self._columns.items():
+            col.extend(other._columns[key].array)
+        self._len += len(other)
+
+
+class _FramePropertiesFile(Sequence):
+    """Read-only sequence of frame properties stored as JSON lines in a TrajectoryStore."""
+
+    def __init__(self, data: np.ndarray, ends: np.ndarray) -> None:
+        """
+        Args:
+            data (np.ndarray): uint8 memory map of the JSON lines file.
+            ends (np.ndarray): End offset of each line in data.
+        """
+        self.data = data
+        self.ends = ends
+
+    def __len__(self) -> int:
+        return len(self.ends)
+
+    def __getitem__(self, frames: ValidIndex) -> Any:  # type:ignore[override]
+        if isinstance(frames, int | np.integer):
+            idx = range(len(self))[frames]
+            start = int(self.ends[idx - 1]) if idx > 0 else 0
+            return json.loads(self.data[start : int(self.ends[idx])].tobytes(), cls=MontyDecoder)
+        if isinstance(frames, slice):
+            frames = range(len(self))[frames]  # type:ignore[assignment]
+        return [self[idx] for idx in frames]  # type:ignore[union-attr]
+
+
+class TrajectoryStore:
+    """Append-only on-disk storage of trajectory frames, for trajectories that do not
+    fit in memory, e.g. long AIMD runs.
+
+    A store is a directory holding the per-frame data as raw binary files, which are
+    memory-mapped on reading, and the metadata as JSON:
+
+        trajectory.json             species, lattice, charge, time step, number of frames...
+        coords.bin                  (M, N, 3) float64 coordinates, fractional for
+                                    structures and Cartesian for molecules.
+        lattice.bin                 (M, 3, 3) float64 lattices, if constant_lattice=False.
+        site_property_<i>.bin       (M, N, ...) arrays of the per-frame site properties.
+        frame_properties.jsonl      Frame properties, one JSON line per frame, and the
+        frame_properties.idx        int64 end offsets of the lines.
+
+    Appended frames are buffered and written in chunks of chunk_size frames, without
+    rewriting existing data. to_trajectory gives a Trajectory whose coords, lattices
+    and properties are memory-mapped, so frames are only read from disk when accessed.
+    """
+
+    META_FILE = "trajectory.json"
+
+    def __init__(self, path: PathLike, chunk_size: int = 1024) -> None:
+        """Open an existing store for reading and appending. Use TrajectoryStore.create or
+        one of the from_* methods to write a new store.
+
+        Args:
+            path (PathLike): Directory of the store.
+            chunk_size (int): Number of appended frames buffered in memory before they
+                are written to disk. Defaults to 1024.
+        """
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self._meta: dict[str, Any] = loadfn(self.path / self.META_FILE)
+        self._pending: list[tuple[np.ndarray, np.ndarray | None, dict, dict | None]] = []
+        self._discard_unflushed_data()
+
+    @classmethod
+    def create(
+        cls,
+        path: PathLike,
+        species: list[str | Element | Species | DummySpecies | Composition],
+        lattice: Lattice | np.ndarray | None = None,
+        *,
+        constant_lattice: bool = True,
+        charge: float | None = None,
+        spin_multiplicity: float | None = None,
+        time_step: float | None = None,
+        site_properties: dict | None = None,
+        chunk_size: int = 1024,
+    ) -> Self:
+        """Create a new, empty store.
+
+        Args:
+            path (PathLike): Directory of the store. Created if it does not exist, and
+                must not already contain a store.
+            species: shape (N,). Species on each site, see Trajectory.
+            lattice: shape (3, 3). Lattice of all frames if constant_lattice is True.
+                Otherwise a lattice must be passed with each frame, and this is only
+                used to mark the store as Structure-based. None for molecules.
+            constant_lattice (bool): Whether the lattice is the same for all frames.
+            charge: Charge of the system. Required for Molecule-based trajectories.
+            spin_multiplicity: Spin multiplicity of the system, for molecules.
+            time_step: Time step of the simulation in femto-seconds.
+            site_properties (dict | None): Site properties that are the same for all
+                frames. Per-frame site properties are passed to append.
+            chunk_size (int): Number of appended frames buffered before writing.
+
+        Returns:
+            TrajectoryStore: Empty store, ready for appending.
+        """
+        path = Path(path)
+        if (path / cls.META_FILE).exists():
+            raise FileExistsError(f"{path} already contains a trajectory store")
+        if lattice is None and charge is None:
+            raise ValueError("charge must be provided for a Molecule-based Trajectory!")
+        path.mkdir(parents=True, exist_ok=True)
+
+        if isinstance(lattice, Lattice):
+            lattice = lattice.matrix
+        meta = {
+            "species": list(species),
+            "n_sites": len(species),
+            "n_frames": 0,
+            "is_periodic": lattice is not None,
+            "lattice": None if lattice is None or not constant_lattice else np.asarray(lattice, dtype=float),
+            "constant_lattice": None if lattice is None else constant_lattice,
+            "charge": charge,
+            "spin_multiplicity": spin_multiplicity,
+            "time_step": time_step,
+            "site_properties": site_properties or None,
+            "site_property_columns": None,
+            "has_frame_properties": False,
+        }
+        dumpfn(meta, path / cls.META_FILE)
+        return cls(path, chunk_size=chunk_size)
+
+    @classmethod
+    def from_structures(
+        cls,
+        path: PathLike,
+        structures: Iterable[Structure | Molecule],
+        constant_lattice: bool = True,
+        time_step: float | None = None,
+        chunk_size: int = 1024,
+    ) -> Self:
+        """Write structures or molecules to a new store, one at a time, so that
+        structures can be a generator, e.g. Xdatcar.iter_structures.
+
+        Note: Assumes no atoms removed during simulation.
+
+        Args:
+            path (PathLike): Directory of the store.
+            structures (Iterable[Structure | Molecule]): Frames of the trajectory.
+            constant_lattice (bool): Whether the lattice changes during the simulation.
+                If True, the lattice of the first structure is used for all frames.
+            time_step (float | None): Time step of the simulation in femto-seconds.
+            chunk_size (int): Number of frames buffered before writing.
+
+        Returns:
+            TrajectoryStore: with all structures written to disk.
+        """
+        structures = iter(structures)
+        first = next(structures, None)
+        if first is None:
+            raise ValueError("Cannot create a trajectory store without any structures")
+
+        kwargs: dict[str, Any] = {"time_step": time_step, "chunk_size": chunk_size}
+        if isinstance(first, Structure):
+            kwargs |= {"lattice": first.lattice.matrix, "constant_lattice": constant_lattice}
+        else:
+            kwargs |= {"charge": int(first.charge), "spin_multiplicity": int(first.spin_multiplicity)}
+        store = cls.create(path, first.species, **kwargs)  # type:ignore[arg-type]
+        for struct in itertools.chain([first], structures):
+            store.append_structure(struct)
+        store.flush()
+        return store
+
+    @classmethod
+    def from_trajectory(cls, path: PathLike, trajectory: Trajectory, chunk_size: int = 1024) -> Self:
+        """Write an in-memory Trajectory to a new store.
+
+        Args:
+            path (PathLike): Directory of the store.
+            trajectory (Trajectory): Trajectory to write.
+            chunk_size (int): Number of frames buffered before writing.
+
+        Returns:
+            TrajectoryStore: with all frames of the trajectory written to disk.
+        """
+        lattice, site_props = trajectory.lattice, trajectory.site_properties
+        store = cls.create(
+            path,
+            trajectory.species,
+            lattice[0] if lattice is not None and lattice.ndim == 3 else lattice,
+            constant_lattice=bool(trajectory.constant_lattice),
+            charge=trajectory.charge,
+            spin_multiplicity=trajectory.spin_multiplicity,
+            time_step=trajectory.time_step,
+            site_properties=site_props if isinstance(site_props, dict) else None,
+            chunk_size=chunk_size,
+        )
+        store.extend(trajectory)
+        store.flush()
+        return store
+
+    def __len__(self) -> int:
+        """Number of frames in the store, including frames not yet written to disk."""
+        return self._meta["n_frames"] + len(self._pending)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.flush()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.path)!r}, frames={len(self)}, sites={self._meta['n_sites']})"
+
+    def append(
+        self,
+        coords: np.ndarray,
+        lattice: Lattice | np.ndarray | None = None,
+        site_properties: dict | None = None,
+        frame_properties: dict | None = None,
+    ) -> None:
+        """Append a frame to the store.
+
+        Args:
+            coords: shape (N, 3). Fractional coords for structures, Cartesian for molecules.
+            lattice: shape (3, 3). Lattice of the frame. Required if the lattice is not
+                constant, and ignored otherwise.
+            site_properties (dict | None): Per-frame site properties, each a sequence
+                of length N. All frames must have the same numeric site properties.
+            frame_properties (dict | None): Properties of the frame, e.g. its energy.
+        """
+        coords = np.array(coords, dtype=float)
+        if coords.shape != (self._meta["n_sites"], 3):
+            raise ValueError(f"coords must have shape ({self._meta['n_sites']}, 3), got {coords.shape}")
+
+        if self._meta["constant_lattice"] is False:
+            if lattice is None:
+                raise ValueError("lattice must be provided for each frame if constant_lattice=False")
+            lattice = np.array(lattice.matrix if isinstance(lattice, Lattice) else lattice, dtype=float)
+        else:
+            lattice = None
+
+        site_props = self._check_site_props(site_properties or {})
+        self._pending.append((coords, lattice, site_props, frame_properties))
+        if len(self._pending) >= self.chunk_size:
+            self.flush()
+
+    def append_structure(self, structure: Structure | Molecule, frame_properties: dict | None = None) -> None:
+        """Append a Structure or Molecule as a frame.
+
+        Args:
+            structure (Structure | Molecule): Frame to append, with the same species
+                as the store.
+            frame_properties (dict | None): Properties of the frame. Defaults to the
+                properties of the structure, if any.
+        """
+        if isinstance(structure, Structure):
+            coords, lattice = structure.frac_coords, structure.lattice.matrix
+        else:
+            coords, lattice = structure.cart_coords, None
+        site_props = {key: val for key, val in structure.site_properties.items() if key not in self._constant_props}
+        self.append(coords, lattice, site_props, frame_properties or structure.properties or None)
+
+    def extend(self, trajectory: Trajectory) -> None:
+        """Append all frames of a Trajectory to the store.
+
+        Args:
+            trajectory (Trajectory): Trajectory with the same species as the store.
+        """
+        if list(trajectory.species) != list(self._meta["species"]):
+            raise ValueError("Cannot extend trajectory store. Species in the trajectories are incompatible.")
+        trajectory.to_positions()
+        for idx in range(len(trajectory)):
+            lattice = None
+            if trajectory.lattice is not None:
+                lattice = trajectory.lattice if trajectory.constant_lattice else trajectory.lattice[idx]
+            site_props = trajectory._get_site_props(idx)
+            self.append(
+                trajectory.coords[idx],
+                lattice,
+                None if isinstance(trajectory.site_properties, dict) else site_props,  # type:ignore[arg-type]
+                None if trajectory.frame_properties is None else trajectory.frame_properties[idx],
+            )
+
+    def flush(self) -> None:
+        """Write buffered frames to disk."""
+        if not self._pending:
+            return
+        coords, lattices, site_props, frame_props = zip(*self._pending, strict=True)
+
+        self._write("coords.bin", np.stack(coords))
+        if self._meta["constant_lattice"] is False:
+            self._write("lattice.bin", np.stack(lattices))
+        for idx, (key, dtype, _shape) in enumerate(self._meta["site_property_columns"] or []):
+            self._write(f"site_property_{idx}.bin", np.stack([props[key] for props in site_props]).astype(dtype))
+
+        lines = [json.dumps(props, cls=MontyEncoder).encode() + b"\n" for props in frame_props]
+        with open(self.path / "frame_properties.jsonl", mode="ab") as file:
+            offset = file.tell()
+            file.write(b"".join(lines))
+        self._write("frame_properties.idx", offset + np.cumsum([len(line) for line in lines], dtype=np.int64))
+
+        self._meta["n_frames"] += len(self._pending)
+        self._meta["has_frame_properties"] |= any(props is not None for props in frame_props)
+        self._pending = []
+        # Update the metadata last, so that an interrupted flush leaves a valid store
+        dumpfn(self._meta, self.path / self.META_FILE)
+
+    @property
+    def coords(self) -> np.ndarray:
+        """Read-only memory map of the coords of all frames, shape (M, N, 3)."""
+        self.flush()
+        return self._memmap("coords.bin", np.float64, (self._meta["n_sites"], 3))
+
+    @property
+    def lattice(self) -> np.ndarray | None:
+        """Lattice of shape (3, 3) if constant, else a read-only memory map of shape
+        (M, 3, 3). None for Molecule-based trajectories.
+        """
+        if self._meta["constant_lattice"] is False:
+            self.flush()
+            return self._memmap("lattice.bin", np.float64, (3, 3))
+        return self._meta["lattice"]
+
+    @property
+    def site_properties(self) -> SitePropertyColumns | dict | None:
+        """Site properties of all frames, memory-mapped if they change between frames."""
+        self.flush()
+        if not self._meta["site_property_columns"]:
+            return self._meta["site_properties"]
+        columns = {
+            key: self._memmap(f"site_property_{idx}.bin", np.dtype(dtype), tuple(shape))
+            for idx, (key, dtype, shape) in enumerate(self._meta["site_property_columns"])
+        }
+        return SitePropertyColumns(columns, self._meta["site_properties"])
+
+    @property
+    def frame_properties(self) -> Sequence[dict] | None:
+        """Frame properties of all frames, decoded from disk when accessed."""
+        self.flush()
+        if not self._meta["has_frame_properties"]:
+            return None
+        return _FramePropertiesFile(
+            self._memmap("frame_properties.jsonl", np.uint8, ()),
+            self._memmap("frame_properties.idx", np.int64, ()),
+        )
+
+    def to_trajectory(self) -> Trajectory:
+        """Get a Trajectory of the frames in the store, with memory-mapped arrays.
+
+        Frames appended to the store afterwards are not part of the returned Trajectory.
+        Operations that change the coords of the Trajectory, like to_displacements or
+        extend, load them into memory.
+        """
+        if len(self) == 0:
+            raise ValueError(f"Trajectory store {self.path} has no frames")
+        return Trajectory(
+            species=self._meta["species"],
+            coords=self.coords,
+            charge=self._meta["charge"],
+            spin_multiplicity=self._meta["spin_multiplicity"],
+            lattice=self.lattice,
+            site_properties=self.site_properties,
+            frame_properties=self.frame_properties,  # type:ignore[arg-type]
+            constant_lattice=self._meta["constant_lattice"],
+            time_step=self._meta["time_step"],
+        )
+
+    @property
+    def _constant_props(self) -> dict:
+        return self._meta["site_properties"] or {}
+
+    def _check_site_props(self, site_props: dict) -> dict[str, np.ndarray]:
+        """Convert per-frame site properties to arrays, and check that they match the
+        columns of the store, which are set by the first frame.
+        """
+        arrays = {key: np.asarray(val) for key, val in site_props.items()}
+        for key, arr in arrays.items():
+            if arr.dtype.kind not in "biuf" or len(arr) != self._meta["n_sites"]:
+                raise ValueError(
+                    f"Site property {key} must be a numeric sequence of length {self._meta['n_sites']}, got {arr!r}"
+                )
+
+        if self._meta["site_property_columns"] is None:
+            self._meta["site_property_columns"] = [
+                (key, arr.dtype.str, list(arr.shape)) for key, arr in sorted(arrays.items())
+            ]
+        elif {key for key, *_ in self._meta["site_property_columns"]} != set(arrays):
+            raise ValueError(
+                f"Per-frame site properties {sorted(arrays)} do not match those of the trajectory store "
+                f"{[key for key, *_ in self._meta['site_property_columns']]}"
+            )
+        return arrays
+
+    def _write(self, filename: str, arr: np.ndarray) -> None:
+        with open(self.path / filename, mode="ab") as file:
+            file.write(np.ascontiguousarray(arr).tobytes())
+
+    def _memmap(self, filename: str, dtype: np.dtype | type, frame_shape: tuple[int, ...]) -> np.ndarray:
+        """Read-only memory map of the n_frames frames in filename. For a frame_shape of
+        (), the whole file is mapped.
+        """
+        path = self.path / filename
+        if frame_shape == ():
+            shape: tuple[int, ...] = (path.stat().st_size // np.dtype(dtype).itemsize if path.exists() else 0,)
+        else:
+            shape = (self._meta["n_frames"], *frame_shape)
+        if 0 in shape:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=shape)
+
+    def _discard_unflushed_data(self) -> None:
+        """Truncate data files to the number of frames in the metadata, discarding frames
+        of an interrupted flush.
+        """
+        n_frames = self._meta["n_frames"]
+        sizes = {
+            "coords.bin": n_frames * self._meta["n_sites"] * 3 * 8,
+            "lattice.bin": n_frames * 9 * 8,
+            "frame_properties.idx": n_frames * 8,
+            # The index file may still hold the line ends of the interrupted flush
+            "frame_properties.jsonl": (
+                int(self._memmap("frame_properties.idx", np.int64, ())[n_frames - 1]) if n_frames else 0
+            ),
+        }
+        for idx, (_key, dtype, shape) in enumerate(self._meta["site_property_columns"] or []):
+            sizes[f"site_property_{idx}.bin"] = n_frames * np.dtype(dtype).itemsize * int(np.prod(shape))
+
+        for filename, size in sizes.items():
+            path = self.path / filename
+            if path.exists() and path.stat().st_size > size:
+                os.truncate(path, size)
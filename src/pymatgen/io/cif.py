@@ -23,11 +23,10 @@ from monty.serialization import loadfn
 from pymatgen.core import Composition, DummySpecies, Element, Lattice, PeriodicSite, Species, Structure, get_el_sp
 from pymatgen.core.operations import MagSymmOp, SymmOp
 from pymatgen.electronic_structure.core import Magmom
-from pymatgen.symmetry.analyzer import SpacegroupAnalyzer, SpacegroupOperations
 from pymatgen.symmetry.groups import SYMM_DATA, SpaceGroup
 from pymatgen.symmetry.maggroups import MagneticSpaceGroup
 from pymatgen.symmetry.structure import SymmetrizedStructure
-from pymatgen.util.coord import find_in_coord_list_pbc, in_coord_list_pbc
+from pymatgen.util.coord import find_in_coord_list_pbc, find_unique_coords_pbc
 
 if TYPE_CHECKING:
     from typing import Any
@@ -607,46 +606,39 @@ class CifParser:
         """Generate unique coordinates using coordinates and symmetry
         positions, and their corresponding magnetic moments if supplied.
         """
-        coords_out: list[NDArray] = []
-        labels_out: list[str] = []
         labels = labels or {}
+        if magmoms and len(magmoms) != len(coords):
+            raise ValueError("Length of magmoms and coords don't match.")
+
+        # Apply all operations to all coords at once, ordered by coord and then by
+        # operation, and keep the first of each set of equivalent points
+        symm_ops = self.symmetry_operations
+        all_coords = np.swapaxes(SymmOp.operate_stack(symm_ops, np.reshape(coords, (-1, 3))), 0, 1).reshape(-1, 3)
+        all_coords -= np.floor(all_coords)
+        unique_indices = find_unique_coords_pbc(all_coords, atol=self._site_tolerance)
+        coords_out: list[NDArray] = list(all_coords[unique_indices])
+        coord_indices, op_indices = np.divmod(unique_indices, len(symm_ops))
+        labels_out: list[str] = [labels.get(coords[idx], "no_label") for idx in coord_indices]
 
         if magmoms:
-            if len(magmoms) != len(coords):
-                raise ValueError("Length of magmoms and coords don't match.")
-
             magmoms_out: list[Magmom] = []
-            for tmp_coord, tmp_magmom in zip(coords, magmoms, strict=True):
-                for op in self.symmetry_operations:
-                    coord = op.operate(tmp_coord)
-                    coord = np.array([i - math.floor(i) for i in coord])
-                    if isinstance(op, MagSymmOp):
-                        # Up to this point, magmoms have been defined relative
-                        # to crystal axis. Now convert to Cartesian and into
-                        # a Magmom object.
-                        if lattice is None:
-                            raise ValueError("Lattice cannot be None.")
-                        magmom = Magmom.from_moment_relative_to_crystal_axes(
-                            op.operate_magmom(tmp_magmom), lattice=lattice
-                        )
-                    else:
-                        magmom = Magmom(tmp_magmom)
-
-                    if not in_coord_list_pbc(coords_out, coord, atol=self._site_tolerance):
-                        coords_out.append(coord)
-                        magmoms_out.append(magmom)
-                        labels_out.append(labels.get(tmp_coord, "no_label"))
+            for coord_idx, op_idx in zip(coord_indices, op_indices, strict=True):
+                op = symm_ops[op_idx]
+                if isinstance(op, MagSymmOp):
+                    # Up to this point, magmoms have been defined relative
+                    # to crystal axis. Now convert to Cartesian and into
+                    # a Magmom object.
+                    if lattice is None:
+                        raise ValueError("Lattice cannot be None.")
+                    magmom = Magmom.from_moment_relative_to_crystal_axes(
+                        op.operate_magmom(magmoms[coord_idx]), lattice=lattice
+                    )
+                else:
+                    magmom = Magmom(magmoms[coord_idx])
+                magmoms_out.append(magmom)
 
             return coords_out, magmoms_out, labels_out
 
-        for tmp_coord in coords:
-            for op in self.symmetry_operations:
-                coord = op.operate(tmp_coord)
-                coord = np.array([i - math.floor(i) for i in coord])
-                if not in_coord_list_pbc(coords_out, coord, atol=self._site_tolerance):
-                    coords_out.append(coord)
-                    labels_out.append(labels.get(tmp_coord, "no_label"))
-
         dummy_magmoms = [Magmom(0)] * len(coords_out)
         return coords_out, dummy_magmoms, labels_out
 
@@ -1225,6 +1217,8 @@ class CifParser:
                 # space groups names are likewise not parsed (again, not all CIFs will contain this information)
                 # What is stored are the lists of symmetry operations used to generate the structure
                 # TODO: ensure space group labels are stored if present
+                from pymatgen.symmetry.analyzer import SpacegroupOperations
+
                 sg = SpacegroupOperations("Not Parsed", -1, self.symmetry_operations)
                 struct = SymmetrizedStructure(struct, sg, equivalent_indices, wyckoffs)
 
@@ -1570,6 +1564,8 @@ class CifWriter:
         blocks: dict[str, Any] = {}
         spacegroup: tuple[str, int] = ("P 1", 1)
         if symprec is not None:
+            from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+
             spg_analyzer = SpacegroupAnalyzer(struct, symprec, angle_tolerance=angle_tolerance)
             spacegroup = (
                 spg_analyzer.get_space_group_symbol(),
@@ -3,24 +3,73 @@ This package implements modules for input and output to and from VASP. It
 imports the key classes form both vasp_input and vasp_output to allow most
 classes to be simply called as pymatgen.io.vasp.Incar for example, to retain
 backwards compatibility.
+
+The classes are imported from their module on first access (PEP 562), so that
+e.g. writing a POSCAR does not pay for importing the output parsers.
 """
 
 from __future__ import annotations
 
-from .inputs import Incar, Kpoints, Poscar, Potcar, PotcarSingle, VaspInput
-from .outputs import (
-    BSVasprun,
-    Chgcar,
-    Dynmat,
-    Elfcar,
-    Locpot,
-    Oszicar,
-    Outcar,
-    Procar,
-    Vaspout,
-    Vasprun,
-    VolumetricData,
-    Wavecar,
-    Waveder,
-    Xdatcar,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .inputs import Incar, Kpoints, Poscar, Potcar, PotcarSingle, VaspInput
+    from .outputs import (
+        BSVasprun,
+        Chgcar,
+        Dynmat,
+        Elfcar,
+        Locpot,
+        Oszicar,
+        Outcar,
+        Procar,
+        Vaspout,
+        Vasprun,
+        VolumetricData,
+        Wavecar,
+        Waveder,
+        Xdatcar,
+    )
+
+_LAZY_IMPORTS: dict[str, str] = {
+    **dict.fromkeys(("Incar", "Kpoints", "Poscar", "Potcar", "PotcarSingle", "VaspInput"), "inputs"),
+    **dict.fromkeys(
+        (
+            "BSVasprun",
+            "Chgcar",
+            "Dynmat",
+            "Elfcar",
+            "Locpot",
+            "Oszicar",
+            "Outcar",
+            "Procar",
+            "Vaspout",
+            "Vasprun",
+            "VolumetricData",
+            "Wavecar",
+            "Waveder",
+            "Xdatcar",
+        ),
+        "outputs",
+    ),
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        obj = getattr(importlib.import_module(f"{__name__}.{_LAZY_IMPORTS[name]}"), name)
+        globals()[name] = obj
+        return obj
+    # Submodules that used to be imported with the package
+    if name in {"inputs", "outputs"}:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
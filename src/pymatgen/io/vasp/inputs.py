@@ -6,6 +6,7 @@ All major VASP input files.
 from __future__ import annotations
 
 import codecs
+import functools
 import hashlib
 import itertools
 import math
@@ -1909,12 +1910,42 @@ class OrbitalDescription(NamedTuple):
     Rcut2: float | None
 
 
-# Hashes computed from the full POTCAR file contents by pymatgen (not 1st-party VASP hashes)
-PYMATGEN_POTCAR_HASHES: dict = loadfn(f"{MODULE_DIR}/vasp_potcar_pymatgen_hashes.json")
-# Written to some newer POTCARs by VASP
-VASP_POTCAR_HASHES: dict = loadfn(f"{MODULE_DIR}/vasp_potcar_file_hashes.json")
 POTCAR_STATS_PATH: str = os.path.join(MODULE_DIR, "potcar-summary-stats.json.bz2")
 
+# POTCAR data tables, loaded on first access as reading them takes most of
+# the import time of this module. Available as module attributes (PEP 562).
+_LAZY_DATA_PATHS: dict[str, str] = {
+    # Hashes computed from the full POTCAR file contents by pymatgen (not 1st-party VASP hashes)
+    "PYMATGEN_POTCAR_HASHES": f"{MODULE_DIR}/vasp_potcar_pymatgen_hashes.json",
+    # Written to some newer POTCARs by VASP
+    "VASP_POTCAR_HASHES": f"{MODULE_DIR}/vasp_potcar_file_hashes.json",
+    "POTCAR_SUMMARY_STATS": POTCAR_STATS_PATH,
+}
+
+
+@functools.cache
+def _get_lazy_data(name: str) -> dict:
+    """Load one of the data tables in _LAZY_DATA_PATHS."""
+    return loadfn(_LAZY_DATA_PATHS[name])
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_DATA_PATHS:
+        return _get_lazy_data(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazyClassData:
+    """Class attribute holding one of the data tables in _LAZY_DATA_PATHS,
+    loaded on first access. Can be overridden by assigning to the class attribute.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: object, objtype: type | None = None) -> dict:
+        return _get_lazy_data(self.name)
+
 
 class PmgVaspPspDirError(ValueError):
     """Error thrown when PMG_VASP_PSP_DIR is not configured, but POTCAR is requested."""
@@ -2010,7 +2041,7 @@ class PotcarSingle:
     }
 
     # Used for POTCAR validation
-    _potcar_summary_stats = loadfn(POTCAR_STATS_PATH)
+    _potcar_summary_stats: ClassVar[dict] = _LazyClassData("POTCAR_SUMMARY_STATS")  # type: ignore[assignment]
 
     def __init__(self, data: str, symbol: str | None = None) -> None:
         """
@@ -2577,7 +2608,7 @@ class PotcarSingle:
             # If no sha256 hash is found in the POTCAR file, compare the whole
             # file with known potcar file hashes.
             md5_file_hash = self.md5_computed_file_hash
-            hash_is_valid = md5_file_hash in VASP_POTCAR_HASHES
+            hash_is_valid = md5_file_hash in _get_lazy_data("VASP_POTCAR_HASHES")
 
         return has_sha256, hash_is_valid
 
@@ -2781,10 +2812,10 @@ class PotcarSingle:
         }
 
         if mode == "data":
-            hash_db = PYMATGEN_POTCAR_HASHES
+            hash_db = _get_lazy_data("PYMATGEN_POTCAR_HASHES")
             potcar_hash = self.md5_header_hash
         elif mode == "file":
-            hash_db = VASP_POTCAR_HASHES
+            hash_db = _get_lazy_data("VASP_POTCAR_HASHES")
             potcar_hash = self.md5_computed_file_hash
         else:
             raise ValueError(f"Bad {mode=}. Choose 'data' or 'file'.")
@@ -4619,9 +4619,29 @@ class Xdatcar:
             ionicstep_end (int): Ending index of ionic step.
             comment (str): Optional comment attached to this set of structures.
         """
+        self.structures = list(self.iter_structures(filename, ionicstep_start, ionicstep_end))
+        self.comment = comment or self.structures[0].formula
+
+    @staticmethod
+    def iter_structures(
+        filename: PathLike,
+        ionicstep_start: int = 1,
+        ionicstep_end: int | None = None,
+    ) -> Iterator[Structure]:
+        """Iterate over the structures in an XDATCAR file, parsing one ionic step at a
+        time. Unlike Xdatcar(filename).structures, this never holds all structures in
+        memory, e.g. to write them to a TrajectoryStore.
+
+        Args:
+            filename (PathLike): The XDATCAR file.
+            ionicstep_start (int): Starting index of ionic step.
+            ionicstep_end (int): Ending index of ionic step.
+
+        Yields:
+            Structure: of each ionic step.
+        """
         preamble = None
         coords_str: list = []
-        structures: list = []
         preamble_done: bool = False
         parse_poscar: bool = False
         num_sites: int | None = None
@@ -4669,7 +4689,7 @@ class Xdatcar:
                     if (ionicstep_end is None and ionicstep_cnt >= ionicstep_start) or (
                         ionicstep_end is not None and ionicstep_start <= ionicstep_cnt < ionicstep_end
                     ):
-                        structures.append(poscar.structure)
+                        yield poscar.structure
                     elif (ionicstep_end is not None) and ionicstep_cnt >= ionicstep_end:
                         break
 
@@ -4682,9 +4702,6 @@ class Xdatcar:
             if preamble is None:
                 raise ValueError("preamble is None")
 
-        self.structures = structures
-        self.comment = comment or self.structures[0].formula
-
     def __str__(self) -> str:
         return self.get_str()
 
@@ -10,33 +10,45 @@
 # Setting cdivision=True gives a small speed improvement, but the code is currently
 # written based on Python division so using cdivision may result in missing neighbors
 # in some off cases. See https://github.com/materialsproject/pymatgen/issues/2226
+# The GIL-free kernels below therefore use cdivision only where the divisor is a
+# nonzero constant or has been checked, and py_mod reproduces Python's float modulo.
+
+import os
 
 import numpy as np
 
+cimport cython
 cimport numpy as np
-from libc.math cimport ceil, floor, pi, sqrt
+from libc.math cimport INFINITY, ceil, floor, fmod, pi, sqrt
 from libc.stdlib cimport free, malloc, realloc
-from libc.string cimport memset
+from libc.string cimport memcpy
 
+from cython.parallel cimport prange
 
-cdef void *safe_malloc(size_t size) except? NULL:
-    """Raise MemoryError if malloc fails."""
-    if size == 0:
-        return NULL
-    cdef void *ptr = malloc(size)
-    if ptr == NULL:
-        raise MemoryError(f"Memory allocation of {size} bytes failed!")
-    return ptr
 
+cdef struct NeighborList:
+    # Growable output buffers of a neighbor search
+    np.int64_t *index_1
+    np.int64_t *index_2
+    double *offsets
+    double *distances
+    np.int64_t count
+    np.int64_t capacity
 
-cdef void *safe_realloc(void *ptr_orig, size_t size) except? NULL:
-    """Raise MemoryError if realloc fails."""
-    if size == 0:
-        return NULL
-    cdef void *ptr = realloc(ptr_orig, size)
-    if ptr == NULL:
-        raise MemoryError(f"Realloc memory of {size} bytes failed!")
-    return ptr
+
+cdef struct CellList:
+    # Periodic images of all_coords that fall within the search box around the
+    # center points, binned in a linked list of cubes of edge length ledge
+    np.int64_t n_images
+    double *image_coords  # (n_images, 3) Cartesian coordinates
+    double *image_offsets  # (n_images, 3) lattice translations of each image
+    np.int64_t *image_indices  # (n_images,) index of each image in all_coords
+    double *offset_correction  # (n_total, 3) translation wrapping all_coords into the cell
+    np.int64_t *head  # (n_cubes,) first image in each cube, -1 if empty
+    np.int64_t *next_image  # (n_images,) next image in the same cube, -1 at the end
+    np.int64_t ncube[3]
+    double valid_min[3]
+    double ledge
 
 
 def find_points_in_spheres(
@@ -46,7 +58,8 @@ def find_points_in_spheres(
         const np.int64_t[::1] pbc,
         const double[:, ::1] lattice,
         const double tol=1e-8,
-        const double min_r=1.0
+        const double min_r=1.0,
+        int n_threads=1
     ):
     """For each point in `center_coords`, get all the neighboring points in `all_coords`
     that are within the cutoff radius `r`. All the coordinates should be Cartesian.
@@ -63,6 +76,10 @@ def find_points_in_spheres(
             directly. If the cutoff is less than this value, the algorithm
             will calculate neighbor list using min_r as cutoff and discard
             those that have larger distances.
+        n_threads: (int) number of threads that the center points are split across.
+            The output is identical to the serial search with n_threads=1.
+            Values < 1 use all available threads. Multi-threading requires the
+            extension to be built with OpenMP, otherwise the search is serial.
 
     Returns:
         index1 (n, ): Indexes of center_coords.
@@ -70,110 +87,310 @@ def find_points_in_spheres(
         offset_vectors (n, 3): The periodic image offsets for all_coords.
         distances (n, ).
     """
-    if r < min_r:
-        findex1, findex2, foffset_vectors, fdistances = find_points_in_spheres(
-            all_coords=all_coords, center_coords=center_coords,
-            r=min_r + tol, pbc=pbc, lattice=lattice, tol=tol, min_r=min_r)
-        mask = fdistances <= r
-        return findex1[mask], findex2[mask], foffset_vectors[mask], fdistances[
-            mask]
+    cdef:
+        NeighborList neighbors
+        int status = 0
+        np.int64_t n_total = all_coords.shape[0]
+        np.int64_t n_center = center_coords.shape[0]
+
+    n_threads = resolve_n_threads(n_threads)
+    init_neighbor_list(&neighbors)
+    if n_total > 0 and n_center > 0:
+        with nogil:
+            status = find_neighbors(
+                &all_coords[0, 0], n_total, &center_coords[0, 0], n_center,
+                r, &pbc[0], &lattice[0, 0], tol, min_r, n_threads, &neighbors
+            )
+    try:
+        if status != 0:
+            raise MemoryError("Memory allocation for the neighbor list failed!")
+        return neighbor_list_to_arrays(&neighbors)
+    finally:
+        free_neighbor_list(&neighbors)
+
 
+def find_points_in_spheres_batch(
+        const double[:, ::1] all_coords,
+        const np.int64_t[::1] all_indptr,
+        const double[:, ::1] center_coords,
+        const np.int64_t[::1] center_indptr,
+        const double r,
+        const np.int64_t[:, ::1] pbc,
+        const double[:, :, ::1] lattices,
+        const double tol=1e-8,
+        const double min_r=1.0,
+        int n_threads=1
+    ):
+    """Batched version of find_points_in_spheres for M independent systems,
+    e.g. many structures, in a single call. The loop over systems runs without
+    the GIL and all neighbor pairs are written to one set of output arrays.
+
+    The points of all systems are concatenated, with CSR-style index pointers
+    marking where each system starts: the points of system i are
+    all_coords[all_indptr[i]:all_indptr[i + 1]].
+
+    Args:
+        all_coords: (np.ndarray[double, dim=2]) concatenated Cartesian coordinates
+            of all available points of all systems.
+        all_indptr: (np.ndarray[np.int64_t, dim=1]) (M + 1,) index pointers into all_coords.
+        center_coords: (np.ndarray[double, dim=2]) concatenated Cartesian coordinates
+            of all centering points.
+        center_indptr: (np.ndarray[np.int64_t, dim=1]) (M + 1,) index pointers into
+            center_coords.
+        r: (float) cutoff radius
+        pbc: (np.ndarray[np.int64_t, dim=2]) (M, 3) periodic boundaries of each system
+        lattices: (np.ndarray[double, dim=3]) (M, 3, 3) lattice matrices
+        tol: (float) numerical tolerance
+        min_r: (float) minimal cutoff to calculate the neighbor list directly,
+            see find_points_in_spheres.
+        n_threads: (int) number of threads that the center points of each
+            system are split across, see find_points_in_spheres.
+
+    Returns:
+        index1 (n, ): Indexes of center points, local to their system.
+        index2 (n, ): Indexes of neighboring points, local to their system.
+        offset_vectors (n, 3): The periodic image offsets of the neighboring points.
+        distances (n, ).
+        indptr (M + 1, ): The pairs of system i are in the slice indptr[i]:indptr[i + 1].
+    """
     cdef:
-        int i, j, k
-        unsigned int i_dim  # index of dimension
-        unsigned int i_pt  # index of point in all_coords (n_total)
-        double[3] max_rep  # maximum repetitions in each direction
+        NeighborList neighbors
+        int status = 0
+        np.int64_t i_sys
+        np.int64_t n_sys = lattices.shape[0]
+        np.int64_t n_total, n_center
+        np.ndarray[np.int64_t, ndim=1] indptr = np.zeros(n_sys + 1, dtype=np.int64)
+        np.int64_t[::1] indptr_view = indptr
+
+    if all_indptr.shape[0] != n_sys + 1 or center_indptr.shape[0] != n_sys + 1 or pbc.shape[0] != n_sys:
+        raise ValueError("all_indptr, center_indptr, pbc and lattices must describe the same number of systems")
+    if all_indptr[n_sys] > all_coords.shape[0] or center_indptr[n_sys] > center_coords.shape[0]:
+        raise ValueError("Index pointers exceed the number of coordinates")
+    n_threads = resolve_n_threads(n_threads)
+
+    init_neighbor_list(&neighbors)
+    with nogil:
+        for i_sys in range(n_sys):
+            n_total = all_indptr[i_sys + 1] - all_indptr[i_sys]
+            n_center = center_indptr[i_sys + 1] - center_indptr[i_sys]
+            if n_total > 0 and n_center > 0:
+                status = find_neighbors(
+                    &all_coords[all_indptr[i_sys], 0], n_total,
+                    &center_coords[center_indptr[i_sys], 0], n_center,
+                    r, &pbc[i_sys, 0], &lattices[i_sys, 0, 0], tol, min_r, n_threads, &neighbors
+                )
+                if status != 0:
+                    break
+            indptr_view[i_sys + 1] = neighbors.count
+    try:
+        if status != 0:
+            raise MemoryError("Memory allocation for the neighbor list failed!")
+        return (*neighbor_list_to_arrays(&neighbors), indptr)
+    finally:
+        free_neighbor_list(&neighbors)
+
+
+cdef int resolve_n_threads(int n_threads):
+    """Number of threads to use, n_threads < 1 means all available threads."""
+    if n_threads < 1:
+        return os.cpu_count() or 1
+    return n_threads
+
+
+cdef tuple neighbor_list_to_arrays(NeighborList *neighbors):
+    """Copy the neighbor list buffers into NumPy arrays."""
+    cdef np.int64_t count = neighbors.count
+    py_index_1 = np.empty(count, dtype=np.int64)
+    py_index_2 = np.empty(count, dtype=np.int64)
+    py_offsets = np.empty((count, 3), dtype=float)
+    py_distances = np.empty(count, dtype=float)
+    if count > 0:
+        memcpy(np.PyArray_DATA(py_index_1), neighbors.index_1, count * sizeof(np.int64_t))
+        memcpy(np.PyArray_DATA(py_index_2), neighbors.index_2, count * sizeof(np.int64_t))
+        memcpy(np.PyArray_DATA(py_offsets), neighbors.offsets, 3 * count * sizeof(double))
+        memcpy(np.PyArray_DATA(py_distances), neighbors.distances, count * sizeof(double))
+    return py_index_1, py_index_2, py_offsets, py_distances
 
-        # Valid boundary, that is the minimum in center_coords - (r + tol)
-        double[3] valid_min
-        double[3] valid_max
 
-        double ledge
+cdef void init_neighbor_list(NeighborList *neighbors) noexcept nogil:
+    neighbors.index_1 = NULL
+    neighbors.index_2 = NULL
+    neighbors.offsets = NULL
+    neighbors.distances = NULL
+    neighbors.count = 0
+    neighbors.capacity = 0
 
-        unsigned int n_center = center_coords.shape[0]
-        unsigned int n_total = all_coords.shape[0]
-        np.int64_t nlattice = 1
 
-        np.int64_t[3] max_bounds = [1, 1, 1]
-        np.int64_t[3] min_bounds = [0, 0, 0]
-        double [:, ::1] frac_coords =  <double[:n_center, :3]> safe_malloc(
-            n_center * 3 * sizeof(double)
-        )
-        double[:, ::1] all_frac_coords = <double[:n_total, :3]> safe_malloc(
-            n_total * 3 * sizeof(double)
-        )
-        double[:, ::1] coords_in_cell = <double[:n_total, :3]> safe_malloc(
-            n_total * 3 * sizeof(double)
-        )
-        double[:, ::1] offset_correction = <double[:n_total, :3]> safe_malloc(
-            n_total * 3 * sizeof(double)
-        )
-        double[3][3] inv_lattice_arr
-        double[:, ::1] inv_lattice = inv_lattice_arr
-        double[3][3] reciprocal_lattice_arr = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
-        double[:, ::1] reciprocal_lattice = reciprocal_lattice_arr
-
-        unsigned int count = 0
-        unsigned int n_atoms = n_total
-        double *offsets_p_temp = <double*> safe_malloc(n_atoms * 3 * sizeof(double))
-        double *expanded_coords_p_temp = <double*> safe_malloc(
-            n_atoms * 3 * sizeof(double)
-        )
-        np.int64_t *indices_p_temp = <np.int64_t*> safe_malloc(n_atoms * sizeof(np.int64_t))
-        double coord_temp[3]
-        np.int64_t ncube[3]
+cdef void free_neighbor_list(NeighborList *neighbors) noexcept nogil:
+    free(neighbors.index_1)
+    free(neighbors.index_2)
+    free(neighbors.offsets)
+    free(neighbors.distances)
+    init_neighbor_list(neighbors)
+
+
+cdef int reserve_neighbor_list(NeighborList *neighbors, np.int64_t capacity) noexcept nogil:
+    """Grow the buffers to hold at least capacity pairs, doubling the size
+    as needed. Return -1 if a reallocation fails, leaving the buffers valid.
+    """
+    cdef:
+        np.int64_t new_capacity = neighbors.capacity if neighbors.capacity > 0 else 10000
+        void *ptr
 
-        np.int64_t[:, ::1] center_indices3 = <np.int64_t[:n_center, :3]> safe_malloc(
-            n_center*3*sizeof(np.int64_t)
+    if capacity <= neighbors.capacity:
+        return 0
+    while new_capacity < capacity:
+        new_capacity += new_capacity
+
+    ptr = realloc(neighbors.index_1, new_capacity * sizeof(np.int64_t))
+    if ptr == NULL:
+        return -1
+    neighbors.index_1 = <np.int64_t*> ptr
+    ptr = realloc(neighbors.index_2, new_capacity * sizeof(np.int64_t))
+    if ptr == NULL:
+        return -1
+    neighbors.index_2 = <np.int64_t*> ptr
+    ptr = realloc(neighbors.offsets, 3 * new_capacity * sizeof(double))
+    if ptr == NULL:
+        return -1
+    neighbors.offsets = <double*> ptr
+    ptr = realloc(neighbors.distances, new_capacity * sizeof(double))
+    if ptr == NULL:
+        return -1
+    neighbors.distances = <double*> ptr
+    neighbors.capacity = new_capacity
+    return 0
+
+
+cdef int find_neighbors(
+        const double *all_coords,
+        np.int64_t n_total,
+        const double *center_coords,
+        np.int64_t n_center,
+        double r,
+        const np.int64_t *pbc,
+        const double *lattice,
+        double tol,
+        double min_r,
+        int n_threads,
+        NeighborList *neighbors
+    ) noexcept nogil:
+    """Append the neighbors of all center points to the neighbor list.
+    Return -1 if a memory allocation failed.
+    """
+    cdef:
+        CellList cells
+        int status
+        # If the cutoff is less than min_r, search with min_r and discard the
+        # pairs that are further apart than r
+        double r_search = r if r >= min_r else min_r + tol
+        double r_keep = INFINITY if r >= min_r else r
+
+    status = build_cell_list(all_coords, n_total, center_coords, n_center, r_search, pbc, lattice, tol, &cells)
+    if status == 0:
+        status = query_cell_list(
+            &cells, center_coords, 0, n_center, r_search * r_search + tol, r_keep, neighbors, n_threads
         )
-        np.int64_t[::1] center_indices1 = <np.int64_t[:n_center]> safe_malloc(n_center*sizeof(np.int64_t))
-
-        unsigned int malloc_chunk = 10000  # size of memory chunks to re-allocate dynamically
-        unsigned int failed_malloc = 0  # flag for failed reallocation within loops
-        np.int64_t *index_1 = <np.int64_t*> safe_malloc(malloc_chunk*sizeof(np.int64_t))
-        np.int64_t *index_2 = <np.int64_t*> safe_malloc(malloc_chunk*sizeof(np.int64_t))
-        double *offset_final = <double*> safe_malloc(3*malloc_chunk*sizeof(double))
-        double *distances = <double*> safe_malloc(malloc_chunk*sizeof(double))
-        np.int64_t cube_index_temp
-        np.int64_t link_index
-        double d_temp2
-        double r2 = r * r
-
-    if r < 0.1:
-        ledge = 0.1
-    else:
-        ledge = r
-
-    get_max_and_min(center_coords, valid_max, valid_min)
+    free_cell_list(&cells)
+    return status
+
+
+cdef void free_cell_list(CellList *cells) noexcept nogil:
+    free(cells.image_coords)
+    free(cells.image_offsets)
+    free(cells.image_indices)
+    free(cells.offset_correction)
+    free(cells.head)
+    free(cells.next_image)
+    cells.image_coords = NULL
+    cells.image_offsets = NULL
+    cells.image_indices = NULL
+    cells.offset_correction = NULL
+    cells.head = NULL
+    cells.next_image = NULL
+
+
+cdef int build_cell_list(
+        const double *all_coords,
+        np.int64_t n_total,
+        const double *center_coords,
+        np.int64_t n_center,
+        double r,
+        const np.int64_t *pbc,
+        const double *lattice,
+        double tol,
+        CellList *cells
+    ) noexcept nogil:
+    """Find the periodic images of all_coords within (min_center_coords - r - tol,
+    max_center_coords + r + tol) and bin them into a linked cell list.
+    Return -1 if a memory allocation failed. The cell list must be freed with
+    free_cell_list in any case.
+    """
+    cdef:
+        np.int64_t i, j, k, i_pt, i_dim, n_cubes, cube_index
+        np.int64_t capacity = n_total
+        double[3] max_rep  # maximum repetitions in each direction
+        double[3] valid_max
+        double[3] max_coords
+        double[9] inv_lattice
+        double[9] reciprocal_lattice
+        double[3] coord_temp
+        np.int64_t[3] max_bounds
+        np.int64_t[3] min_bounds
+        double *all_frac_coords = NULL
+        double *coords_in_cell = NULL
+        double *center_frac_coords = NULL
+        void *ptr
+
+    cells.n_images = 0
+    cells.image_coords = <double*> malloc(capacity * 3 * sizeof(double))
+    cells.image_offsets = <double*> malloc(capacity * 3 * sizeof(double))
+    cells.image_indices = <np.int64_t*> malloc(capacity * sizeof(np.int64_t))
+    cells.offset_correction = <double*> malloc(n_total * 3 * sizeof(double))
+    cells.head = NULL
+    cells.next_image = NULL
+    all_frac_coords = <double*> malloc(n_total * 3 * sizeof(double))
+    coords_in_cell = <double*> malloc(n_total * 3 * sizeof(double))
+    center_frac_coords = <double*> malloc(n_center * 3 * sizeof(double))
+    if (
+            cells.image_coords == NULL or cells.image_offsets == NULL or cells.image_indices == NULL or
+            cells.offset_correction == NULL or all_frac_coords == NULL or coords_in_cell == NULL or
+            center_frac_coords == NULL
+    ):
+        free(all_frac_coords)
+        free(coords_in_cell)
+        free(center_frac_coords)
+        return -1
+
+    cells.ledge = 0.1 if r < 0.1 else r
+
+    get_max_and_min(center_coords, n_center, max_coords, cells.valid_min)
     for i_dim in range(3):
-        valid_max[i_dim] = valid_max[i_dim] + r + tol
-        valid_min[i_dim] = valid_min[i_dim] - r - tol
+        valid_max[i_dim] = max_coords[i_dim] + r + tol
+        cells.valid_min[i_dim] = cells.valid_min[i_dim] - r - tol
 
     # Process PBC
-    get_frac_coords(lattice, inv_lattice, all_coords, offset_correction)
+    matrix_inv(lattice, inv_lattice)
+    matmul(all_coords, n_total, inv_lattice, cells.offset_correction)
     for i_pt in range(n_total):
         for i_dim in range(3):
             if pbc[i_dim]:
                 # Only wrap atoms when this dimension is PBC
-                all_frac_coords[i_pt, i_dim] = offset_correction[i_pt, i_dim] % 1
-                offset_correction[i_pt, i_dim] = offset_correction[i_pt, i_dim] - all_frac_coords[i_pt, i_dim]
+                all_frac_coords[3 * i_pt + i_dim] = py_mod(cells.offset_correction[3 * i_pt + i_dim], 1)
+                cells.offset_correction[3 * i_pt + i_dim] -= all_frac_coords[3 * i_pt + i_dim]
             else:
-                all_frac_coords[i_pt, i_dim] = offset_correction[i_pt, i_dim]
-                offset_correction[i_pt, i_dim] = 0
+                all_frac_coords[3 * i_pt + i_dim] = cells.offset_correction[3 * i_pt + i_dim]
+                cells.offset_correction[3 * i_pt + i_dim] = 0
 
-    # Compute the reciprocal lattice in place
     get_reciprocal_lattice(lattice, reciprocal_lattice)
-
     get_max_rep(reciprocal_lattice, max_rep, r)
 
-    # Get fractional coordinates of center points in place
-    get_frac_coords(lattice, inv_lattice, center_coords, frac_coords)
-
-    get_bounds(frac_coords, max_rep, &pbc[0], max_bounds, min_bounds)
-
-    for i_dim in range(3):
-        nlattice *= (max_bounds[i_dim] - min_bounds[i_dim])
-    matmul(all_frac_coords, lattice, coords_in_cell)
+    # Get fractional coordinates of center points
+    matmul(center_coords, n_center, inv_lattice, center_frac_coords)
+    get_bounds(center_frac_coords, n_center, max_rep, pbc, max_bounds, min_bounds)
+    matmul(all_frac_coords, n_total, lattice, coords_in_cell)
+    free(all_frac_coords)
+    free(center_frac_coords)
 
     # Get translated images, coordinates and indices
     for i in range(min_bounds[0], max_bounds[0]):
@@ -181,354 +398,219 @@ def find_points_in_spheres(
             for k in range(min_bounds[2], max_bounds[2]):
                 for i_pt in range(n_total):
                     for i_dim in range(3):
-                        coord_temp[i_dim] = <double>i * lattice[0, i_dim] + \
-                                        <double>j * lattice[1, i_dim] + \
-                                        <double>k * lattice[2, i_dim] + \
-                                        coords_in_cell[i_pt, i_dim]
+                        coord_temp[i_dim] = <double>i * lattice[i_dim] + \
+                                        <double>j * lattice[3 + i_dim] + \
+                                        <double>k * lattice[6 + i_dim] + \
+                                        coords_in_cell[3 * i_pt + i_dim]
                     if (
-                            (coord_temp[0] > valid_min[0]) &
+                            (coord_temp[0] > cells.valid_min[0]) &
                             (coord_temp[0] < valid_max[0]) &
-                            (coord_temp[1] > valid_min[1]) &
+                            (coord_temp[1] > cells.valid_min[1]) &
                             (coord_temp[1] < valid_max[1]) &
-                            (coord_temp[2] > valid_min[2]) &
+                            (coord_temp[2] > cells.valid_min[2]) &
                             (coord_temp[2] < valid_max[2])
                     ):
-                        offsets_p_temp[3*count] = i
-                        offsets_p_temp[3*count+1] = j
-                        offsets_p_temp[3*count+2] = k
-                        indices_p_temp[count] = i_pt
-                        expanded_coords_p_temp[3*count] = coord_temp[0]
-                        expanded_coords_p_temp[3*count+1] = coord_temp[1]
-                        expanded_coords_p_temp[3*count+2] = coord_temp[2]
-                        count += 1
-                        if count >= n_atoms:  # exceeding current memory
-                            n_atoms += n_atoms
-                            offsets_p_temp = <double*> realloc(
-                                offsets_p_temp, n_atoms * 3 * sizeof(double)
-                            )
-                            expanded_coords_p_temp = <double*> realloc(
-                                expanded_coords_p_temp, n_atoms * 3 * sizeof(double)
-                            )
-                            indices_p_temp = <np.int64_t*> realloc(
-                                indices_p_temp, n_atoms * sizeof(np.int64_t)
-                            )
-                        if (
-                                offset_final is NULL or
-                                expanded_coords_p_temp is NULL or
-                                indices_p_temp is NULL
-                        ):
-                            failed_malloc = 1
-                            break
-                else:
-                    continue
-                break
-            else:
-                continue
-            break
-        else:
-            continue
-        break
-
-    if failed_malloc:
-        raise MemoryError("A realloc of memory of failed!")
-    else:
-        failed_malloc = 0
-
-    # If no valid neighbors were found return empty
-    if count == 0:
-        free(&frac_coords[0, 0])
-        free(&all_frac_coords[0, 0])
-        free(&coords_in_cell[0, 0])
-        free(&offset_correction[0, 0])
-        free(&center_indices1[0])
-        free(&center_indices3[0, 0])
-
-        free(offsets_p_temp)
-        free(expanded_coords_p_temp)
-        free(indices_p_temp)
-
-        free(index_1)
-        free(index_2)
-        free(offset_final)
-        free(distances)
-
-        return (np.array([], dtype=np.int64), np.array([], dtype=np.int64),
-            np.array([[], [], []], dtype=float).T, np.array([], dtype=float))
-
-    n_atoms = count
-    cdef:
-        # Delete those beyond (min_center_coords - r - tol, max_center_coords + r + tol)
-        double *offsets_p = <double*> safe_realloc(
-            offsets_p_temp, count * 3 * sizeof(double)
-        )
-        double *expanded_coords_p = <double*> safe_realloc(
-            expanded_coords_p_temp, count * 3 * sizeof(double)
-        )
-        np.int64_t *indices_p = <np.int64_t*> safe_realloc(
-            indices_p_temp, count * sizeof(np.int64_t)
-        )
-
-        double[:, ::1] offsets = <double[:count, :3]> offsets_p
-        double[:, ::1] expanded_coords = <double[:count, :3]> expanded_coords_p
-        np.int64_t[::1] indices = <np.int64_t[:count]> indices_p
-
-        # Construct linked cell list
-        np.int64_t[:, ::1] all_indices3 = <np.int64_t[:n_atoms, :3]> safe_malloc(
-            n_atoms * 3 * sizeof(np.int64_t)
-        )
-        np.int64_t[::1] all_indices1 = <np.int64_t[:n_atoms]> safe_malloc(
-            n_atoms * sizeof(np.int64_t)
-        )
-
+                        if cells.n_images >= capacity:  # exceeding current memory
+                            capacity += capacity
+                            ptr = realloc(cells.image_coords, capacity * 3 * sizeof(double))
+                            if ptr == NULL:
+                                free(coords_in_cell)
+                                return -1
+                            cells.image_coords = <double*> ptr
+                            ptr = realloc(cells.image_offsets, capacity * 3 * sizeof(double))
+                            if ptr == NULL:
+                                free(coords_in_cell)
+                                return -1
+                            cells.image_offsets = <double*> ptr
+                            ptr = realloc(cells.image_indices, capacity * sizeof(np.int64_t))
+                            if ptr == NULL:
+                                free(coords_in_cell)
+                                return -1
+                            cells.image_indices = <np.int64_t*> ptr
+                        cells.image_offsets[3 * cells.n_images] = i
+                        cells.image_offsets[3 * cells.n_images + 1] = j
+                        cells.image_offsets[3 * cells.n_images + 2] = k
+                        cells.image_indices[cells.n_images] = i_pt
+                        cells.image_coords[3 * cells.n_images] = coord_temp[0]
+                        cells.image_coords[3 * cells.n_images + 1] = coord_temp[1]
+                        cells.image_coords[3 * cells.n_images + 2] = coord_temp[2]
+                        cells.n_images += 1
+    free(coords_in_cell)
+
+    # Construct linked cell list
     for i_dim in range(3):
-        ncube[i_dim] = <np.int64_t>(ceil((valid_max[i_dim] - valid_min[i_dim]) / ledge))
+        cells.ncube[i_dim] = <np.int64_t>(ceil((valid_max[i_dim] - cells.valid_min[i_dim]) / cells.ledge))
+    n_cubes = cells.ncube[0] * cells.ncube[1] * cells.ncube[2]
+    cells.head = <np.int64_t*> malloc(n_cubes * sizeof(np.int64_t))
+    cells.next_image = <np.int64_t*> malloc((cells.n_images if cells.n_images > 0 else 1) * sizeof(np.int64_t))
+    if cells.head == NULL or cells.next_image == NULL:
+        return -1
+    for i in range(n_cubes):
+        cells.head[i] = -1
+    for i_pt in range(cells.n_images):
+        cube_index = get_cube_index(cells, &cells.image_coords[3 * i_pt])
+        cells.next_image[i_pt] = cells.head[cube_index]
+        cells.head[cube_index] = i_pt
+    return 0
 
-    compute_cube_index(expanded_coords, valid_min, ledge, all_indices3)
-    three_to_one(all_indices3, ncube[1], ncube[2], all_indices1)
 
+cdef int query_cell_list(
+        const CellList *cells,
+        const double *center_coords,
+        np.int64_t start,
+        np.int64_t end,
+        double r2,
+        double r_keep,
+        NeighborList *neighbors,
+        int n_threads
+    ) noexcept nogil:
+    """Append the neighbors of center points start to end - 1 with squared
+    distance < r2 (and distance <= r_keep) to the neighbor list.
+    Return -1 if a memory allocation failed.
+
+    With n_threads > 1 the center points are split across threads in two
+    passes: the neighbors of each center are first counted, the output is
+    then grown once to the total count, and each center finally writes its
+    pairs at the offset given by the prefix sum of the counts. The result is
+    identical to the serial path.
+    """
     cdef:
-        np.int64_t nb_cubes = ncube[0] * ncube[1] * ncube[2]
-        np.int64_t *head = <np.int64_t*> safe_malloc(nb_cubes*sizeof(np.int64_t))
-        np.int64_t *atom_indices = <np.int64_t*> safe_malloc(n_atoms*sizeof(np.int64_t))
-        np.int64_t[:, ::1] neighbor_map = <np.int64_t[:nb_cubes, :27]> safe_malloc(
-            nb_cubes * 27 * sizeof(np.int64_t)
-        )
-
-    memset(<void*>head, -1, nb_cubes*sizeof(np.int64_t))
-    memset(<void*>atom_indices, -1, n_atoms*sizeof(np.int64_t))
-
-    get_cube_neighbors(ncube, neighbor_map)
-    for i_pt in range(n_atoms):
-        atom_indices[i_pt] = head[all_indices1[i_pt]]
-        head[all_indices1[i_pt]] = i_pt
+        np.int64_t i, n_found
+        np.int64_t n_center = end - start
+        np.int64_t *positions
+
+    if n_threads <= 1 or n_center < 2:
+        for i in range(start, end):
+            n_found = query_center(cells, center_coords, i, r2, r_keep, neighbors, neighbors.count)
+            if n_found < 0:
+                return -1
+            neighbors.count += n_found
+        return 0
+
+    positions = <np.int64_t*> malloc((n_center + 1) * sizeof(np.int64_t))
+    if positions == NULL:
+        return -1
+    for i in prange(start, end, num_threads=n_threads, schedule="guided"):
+        positions[i - start + 1] = query_center(cells, center_coords, i, r2, r_keep, NULL, 0)
+    positions[0] = neighbors.count
+    for i in range(n_center):
+        positions[i + 1] += positions[i]
+    if reserve_neighbor_list(neighbors, positions[n_center]) != 0:
+        free(positions)
+        return -1
+    # The capacity is now sufficient, so no thread reallocates the buffers
+    for i in prange(start, end, num_threads=n_threads, schedule="guided"):
+        query_center(cells, center_coords, i, r2, r_keep, neighbors, positions[i - start])
+    neighbors.count = positions[n_center]
+    free(positions)
+    return 0
 
-    # Get center atoms' cube indices
-    compute_cube_index(center_coords, valid_min, ledge, center_indices3)
-    three_to_one(center_indices3, ncube[1], ncube[2], center_indices1)
 
-    count = 0
-    for i in range(n_center):
-        for j in range(27):
-            if neighbor_map[center_indices1[i], j] == -1:
-                continue
-            cube_index_temp = neighbor_map[center_indices1[i], j]
-            link_index = head[cube_index_temp]
-            while link_index != -1:
-                d_temp2 = distance2(expanded_coords, center_coords, link_index, i, 3)
-                if d_temp2 < r2 + tol:
-                    index_1[count] = i
-                    index_2[count] = indices[link_index]
-                    offset_final[3*count] = offsets[link_index, 0] - offset_correction[indices[link_index], 0]
-                    offset_final[3*count + 1] = offsets[link_index, 1] - offset_correction[indices[link_index], 1]
-                    offset_final[3*count + 2] = offsets[link_index, 2] - offset_correction[indices[link_index], 2]
-                    distances[count] = sqrt(d_temp2)
-
-                    count += 1
-                    # Increasing the memory size by allocating incrementally
-                    # malloc_chunk more memory locations, I found it 3x faster to do so
-                    # compared to using vectors in cpp
-                    if count >= malloc_chunk:
-                        malloc_chunk += malloc_chunk  # double the size
-                        index_1 = <np.int64_t*> realloc(index_1, malloc_chunk * sizeof(np.int64_t))
-                        index_2 = <np.int64_t*> realloc(index_2, malloc_chunk*sizeof(np.int64_t))
-                        offset_final = <double*> realloc(
-                            offset_final, 3*malloc_chunk*sizeof(double)
-                        )
-                        distances = <double*> realloc(
-                            distances, malloc_chunk*sizeof(double)
-                        )
-                        if (
-                                index_1 is NULL or index_2 is NULL or
-                                offset_final is NULL or distances is NULL
-                        ):
-                            failed_malloc = 1
-                            break
-                link_index = atom_indices[link_index]
-            else:
-                continue
-            break
-        else:
+cdef np.int64_t query_center(
+        const CellList *cells,
+        const double *center_coords,
+        np.int64_t i,
+        double r2,
+        double r_keep,
+        NeighborList *neighbors,
+        np.int64_t position
+    ) noexcept nogil:
+    """Write the neighbors of center point i to the neighbor list starting at
+    position, growing the buffers if needed, and return their number.
+    If neighbors is NULL, the neighbors are only counted.
+    Return -1 if a reallocation failed.
+    """
+    cdef:
+        np.int64_t i_pt, link_index
+        np.int64_t count = position
+        np.int64_t[3] center_cube
+        np.int64_t[3] cube3
+        double d_temp2, distance
+        int di, dj, dk
+
+    get_cube_index3(cells, &center_coords[3 * i], center_cube)
+    # Loop over the neighboring cubes in the same order as the offset vectors
+    for di in range(-1, 2):
+        cube3[0] = center_cube[0] + di
+        if cube3[0] < 0 or cube3[0] >= cells.ncube[0]:
             continue
-        break
-
-    if failed_malloc:
-        raise MemoryError("A realloc of memory of failed!")
-    else:
-        failed_malloc = 0
-
-    if count == 0:
-        py_index_1 = np.array([], dtype=np.int64)
-        py_index_2 = np.array([], dtype=np.int64)
-        py_offsets = np.array([[], [], []], dtype=float).T
-        py_distances = np.array([], dtype=float)
-    else:
-        # Resize to the actual size
-        index_1 = <np.int64_t*>safe_realloc(index_1, count * sizeof(np.int64_t))
-        index_2 = <np.int64_t*>safe_realloc(index_2, count*sizeof(np.int64_t))
-        offset_final = <double*>safe_realloc(offset_final, 3*count*sizeof(double))
-        distances = <double*>safe_realloc(distances, count*sizeof(double))
-
-        # Convert to python objects
-        py_index_1 = np.array(<np.int64_t[:count]>index_1)
-        py_index_2 = np.array(<np.int64_t[:count]>index_2)
-        py_offsets = np.array(<double[:count, :3]>offset_final)
-        py_distances = np.array(<double[:count]>distances)
-
-    # Free allocated memory
-    free(index_1)
-    free(index_2)
-    free(offset_final)
-    free(distances)
-    free(offsets_p)
-    free(expanded_coords_p)
-    free(indices_p)
-    free(head)
-    free(atom_indices)
-
-    free(&offset_correction[0, 0])
-    free(&frac_coords[0, 0])
-    free(&all_frac_coords[0, 0])
-    free(&coords_in_cell[0, 0])
-    free(&center_indices1[0])
-    free(&center_indices3[0, 0])
-    free(&neighbor_map[0, 0])
-
-    free(&all_indices3[0, 0])
-    free(&all_indices1[0])
+        for dj in range(-1, 2):
+            cube3[1] = center_cube[1] + dj
+            if cube3[1] < 0 or cube3[1] >= cells.ncube[1]:
+                continue
+            for dk in range(-1, 2):
+                cube3[2] = center_cube[2] + dk
+                if cube3[2] < 0 or cube3[2] >= cells.ncube[2]:
+                    continue
+                link_index = cells.head[
+                    cube3[0] * cells.ncube[1] * cells.ncube[2] + cube3[1] * cells.ncube[2] + cube3[2]
+                ]
+                while link_index != -1:
+                    d_temp2 = distance2(&cells.image_coords[3 * link_index], &center_coords[3 * i])
+                    if d_temp2 < r2:
+                        distance = sqrt(d_temp2)
+                        if distance <= r_keep:
+                            if neighbors != NULL:
+                                if count >= neighbors.capacity:
+                                    if reserve_neighbor_list(neighbors, count + 1) != 0:
+                                        return -1
+                                i_pt = cells.image_indices[link_index]
+                                neighbors.index_1[count] = i
+                                neighbors.index_2[count] = i_pt
+                                neighbors.offsets[3 * count] = \
+                                    cells.image_offsets[3 * link_index] - cells.offset_correction[3 * i_pt]
+                                neighbors.offsets[3 * count + 1] = \
+                                    cells.image_offsets[3 * link_index + 1] - cells.offset_correction[3 * i_pt + 1]
+                                neighbors.offsets[3 * count + 2] = \
+                                    cells.image_offsets[3 * link_index + 2] - cells.offset_correction[3 * i_pt + 2]
+                                neighbors.distances[count] = distance
+                            count += 1
+                    link_index = cells.next_image[link_index]
+    return count - position
+
+
+@cython.cdivision(True)
+cdef inline double py_mod(double a, double b) noexcept nogil:
+    """Float modulo with the sign convention of Python, for b != 0."""
+    cdef double res = fmod(a, b)
+    res += ((res != 0) & ((res < 0) ^ (b < 0))) * b
+    return res
+
+
+@cython.cdivision(True)
+cdef inline void get_cube_index3(const CellList *cells, const double *coords, np.int64_t *index3) noexcept nogil:
+    """Cube indices of a point along each dimension, ledge is always >= 0.1."""
+    cdef int i_dim
+    for i_dim in range(3):
+        index3[i_dim] = <np.int64_t>(floor((coords[i_dim] - cells.valid_min[i_dim] + 1e-8) / cells.ledge))
 
-    return py_index_1, py_index_2, py_offsets, py_distances
 
+cdef inline np.int64_t get_cube_index(const CellList *cells, const double *coords) noexcept nogil:
+    """3D cube index of a point converted to 1D."""
+    cdef np.int64_t[3] index3
+    get_cube_index3(cells, coords, index3)
+    return index3[0] * cells.ncube[1] * cells.ncube[2] + index3[1] * cells.ncube[2] + index3[2]
 
-cdef void get_cube_neighbors(
-        np.int64_t[3] ncube,
-        np.int64_t[:, ::1] neighbor_map
-    ):
-    """
-    Get {cube_index: cube_neighbor_indices} map.
-    """
-    cdef:
-        int i, j, k
-        unsigned int count = 0
-        np.int64_t ncubes = ncube[0] * ncube[1] * ncube[2]
-        np.int64_t[::1] counts = <np.int64_t[:ncubes]> safe_malloc(ncubes * sizeof(np.int64_t))
-        np.int64_t[:, ::1] cube_indices_3d = <np.int64_t[:ncubes, :3]> safe_malloc(
-            ncubes*3*sizeof(np.int64_t)
-        )
-        np.int64_t[::1] cube_indices_1d = <np.int64_t[:ncubes]> safe_malloc(ncubes*sizeof(np.int64_t))
-
-        # Creating the memviews of c-arrays once substantially improves speed
-        # but for some reason it makes the runtime scaling with the number of
-        # atoms worse
-        np.int64_t[1][3] index3_arr
-        np.int64_t[:, ::1] index3 = index3_arr
-        np.int64_t[1] index1_arr
-        np.int64_t[::1] index1 = index1_arr
-
-        int n = 1
-        np.int64_t ntotal = (2 * n + 1) * (2 * n + 1) * (2 * n + 1)
-        np.int64_t[:, ::1] ovectors
-        np.int64_t *ovectors_p = <np.int64_t *> safe_malloc(ntotal * 3 * sizeof(np.int64_t))
-        unsigned int n_ovectors = compute_offset_vectors(ovectors_p, n)
-
-    # Resize to the actual size
-    ovectors_p = <np.int64_t *> safe_realloc(ovectors_p, n_ovectors * 3 * sizeof(np.int64_t))
-    ovectors = <np.int64_t[:n_ovectors, :3]>ovectors_p
-
-    memset(<void*>&neighbor_map[0, 0], -1, neighbor_map.shape[0] * 27 * sizeof(np.int64_t))
-
-    for i in range(ncubes):
-        counts[i] = 0
-
-    for i in range(ncube[0]):
-        for j in range(ncube[1]):
-            for k in range(ncube[2]):
-                cube_indices_3d[count, 0] = i
-                cube_indices_3d[count, 1] = j
-                cube_indices_3d[count, 2] = k
-                count += 1
-
-    three_to_one(cube_indices_3d, ncube[1], ncube[2], cube_indices_1d)
-
-    for i in range(ncubes):
-        for j in range(27):
-            index3[0, 0] = ovectors[j, 0] + cube_indices_3d[i, 0]
-            index3[0, 1] = ovectors[j, 1] + cube_indices_3d[i, 1]
-            index3[0, 2] = ovectors[j, 2] + cube_indices_3d[i, 2]
-            if (
-                    (index3[0, 0] < ncube[0]) &
-                    (index3[0, 0] >= 0) &
-                    (index3[0, 1] < ncube[1]) &
-                    (index3[0, 1] >= 0) &
-                    (index3[0, 2] < ncube[2]) &
-                    (index3[0, 2] >= 0)
-            ):
-                three_to_one(index3, ncube[1], ncube[2], index1)
-                neighbor_map[i, counts[i]] = index1[0]
-                counts[i] += 1
-
-    free(&cube_indices_3d[0, 0])
-    free(&cube_indices_1d[0])
-    free(&counts[0])
-    free(ovectors_p)
-
-
-cdef int compute_offset_vectors(
-        np.int64_t* ovectors,
-        np.int64_t n
-    ) nogil:
-    cdef:
-        int i, j, k, ind
-        int count = 0
-        double center[8][3] # center vertices coords
-        double offset[8][3]  # offsetted vertices
-
-    for i in range(2):
-        for j in range(2):
-            for k in range(2):
-                ind = i * 4 + j * 2 + k
-                center[ind][0] = i - 0.5
-                center[ind][1] = j - 0.5
-                center[ind][2] = k - 0.5
-
-    for i in range(-n, n + 1):
-        for j in range(-n, n + 1):
-            for k in range(-n, n + 1):
-                offset_cube(center, i, j, k, offset)
-                if distance_vertices(center, offset, n):
-                    ovectors[3*count] = i
-                    ovectors[3*count + 1] = j
-                    ovectors[3*count + 2] = k
-                    count += 1
-
-    return count
-
-
-cdef double distance2(
-        const double[:, ::1] m1,
-        const double[:, ::1] m2,
-        np.int64_t index1,
-        np.int64_t index2,
-        np.int64_t size
-    ) nogil:
-    """Faster way to compute the distance squared by not using slice
-    but providing indices in each matrix.
-    """
+
+cdef inline double distance2(const double *coords1, const double *coords2) noexcept nogil:
+    """Squared distance between two 3D points."""
     cdef:
         int i
         double s = 0
 
-    for i in range(size):
-        s += (m1[index1, i] - m2[index2, i]) * (m1[index1, i] - m2[index2, i])
+    for i in range(3):
+        s += (coords1[i] - coords2[i]) * (coords1[i] - coords2[i])
     return s
 
 
 cdef void get_bounds(
-        const double[:, ::1] frac_coords,
+        const double *frac_coords,
+        np.int64_t n_points,
         const double[3] max_rep,
-        const np.int64_t[3] pbc,
+        const np.int64_t *pbc,
         np.int64_t[3] max_bounds,
         np.int64_t[3] min_bounds
-    ) nogil:
+    ) noexcept nogil:
     """
     Given the fractional coordinates and the number of repeation needed in each
     direction (max_rep), compute the translational bounds in each dimension.
@@ -538,7 +620,7 @@ cdef void get_bounds(
         double[3] max_fcoords
         double[3] min_fcoords
 
-    get_max_and_min(frac_coords, max_fcoords, min_fcoords)
+    get_max_and_min(frac_coords, n_points, max_fcoords, min_fcoords)
 
     for i_dim in range(3):
         min_bounds[i_dim] = 0
@@ -549,42 +631,32 @@ cdef void get_bounds(
             min_bounds[i_dim] = <np.int64_t>(floor(min_fcoords[i_dim] - max_rep[i_dim] - 1e-8))
             max_bounds[i_dim] = <np.int64_t>(ceil(max_fcoords[i_dim] + max_rep[i_dim] + 1e-8))
 
-cdef void get_frac_coords(
-        const double[:, ::1] lattice,
-        double[:, ::1] inv_lattice,
-        const double[:, ::1] cart_coords,
-        double[:, ::1] frac_coords
-    ) nogil:
-    """
-    Compute the fractional coordinates.
-    """
-    matrix_inv(lattice, inv_lattice)
-    matmul(cart_coords, inv_lattice, frac_coords)
 
 cdef void matmul(
-        const double[:, ::1] m1,
-        const double[:, ::1] m2,
-        double [:, ::1] out
-    ) nogil:
+        const double *m1,
+        np.int64_t n_rows,
+        const double *m2,
+        double *out
+    ) noexcept nogil:
     """
-    Matrix multiplication.
+    Matrix multiplication of a (n_rows, 3) matrix with a 3x3 matrix.
     """
-    cdef:
-        int i, j, k
-        int m = m1.shape[0], n = m1.shape[1], l = m2.shape[1]
+    cdef np.int64_t i, j, k
+
+    for i in range(n_rows):
+        for j in range(3):
+            out[3 * i + j] = 0
+            for k in range(3):
+                out[3 * i + j] += m1[3 * i + k] * m2[3 * k + j]
 
-    for i in range(m):
-        for j in range(l):
-            out[i, j] = 0
-            for k in range(n):
-                out[i, j] += m1[i, k] * m2[k, j]
 
+@cython.cdivision(True)
 cdef void matrix_inv(
-        const double[:, ::1] matrix,
-        double[:, ::1] inv
-    ) nogil:
+        const double *matrix,
+        double *inv
+    ) noexcept nogil:
     """
-    Matrix inversion.
+    3x3 matrix inversion.
     """
     cdef:
         int i, j
@@ -592,91 +664,101 @@ cdef void matrix_inv(
 
     for i in range(3):
         for j in range(3):
-            inv[i, j] = (matrix[(j+1)%3, (i+1)%3] * matrix[(j+2)%3, (i+2)%3] -
-                matrix[(j+2)%3, (i+1)%3] * matrix[(j+1)%3, (i+2)%3]) / det
+            inv[3 * i + j] = (
+                matrix[3 * ((j + 1) % 3) + (i + 1) % 3] * matrix[3 * ((j + 2) % 3) + (i + 2) % 3] -
+                matrix[3 * ((j + 2) % 3) + (i + 1) % 3] * matrix[3 * ((j + 1) % 3) + (i + 2) % 3]
+            ) / det
+
 
 cdef double matrix_det(
-        const double[:, ::1] matrix
-    ) nogil:
+        const double *matrix
+    ) noexcept nogil:
     """
-    Matrix determinant.
+    3x3 matrix determinant.
     """
     return (
-        matrix[0, 0] * (matrix[1, 1] * matrix[2, 2] - matrix[1, 2] * matrix[2, 1]) +
-        matrix[0, 1] * (matrix[1, 2] * matrix[2, 0] - matrix[1, 0] * matrix[2, 2]) +
-        matrix[0, 2] * (matrix[1, 0] * matrix[2, 1] - matrix[1, 1] * matrix[2, 0])
+        matrix[0] * (matrix[4] * matrix[8] - matrix[5] * matrix[7]) +
+        matrix[1] * (matrix[5] * matrix[6] - matrix[3] * matrix[8]) +
+        matrix[2] * (matrix[3] * matrix[7] - matrix[4] * matrix[6])
     )
 
+
+@cython.cdivision(True)
 cdef void get_max_rep(
-        const double[:, ::1] reciprocal_lattice,
+        const double *reciprocal_lattice,
         double[3] max_rep,
         double r
-    ) nogil:
+    ) noexcept nogil:
     """
     Get maximum repetition in each directions.
     """
     cdef:
-        unsigned int i_dim
+        int i_dim
         double recp_len
 
-    for i_dim in range(3):  # TODO: is it ever not 3x3 for our cases?
-        recp_len = norm(reciprocal_lattice[i_dim, :])
+    for i_dim in range(3):
+        recp_len = norm(&reciprocal_lattice[3 * i_dim])
         max_rep[i_dim] = ceil((r + 0.15) * recp_len / (2 * pi))
 
+
 cdef void get_reciprocal_lattice(
-        const double[:, ::1] lattice,
-        double[:, ::1] reciprocal_lattice
-    ) nogil:
+        const double *lattice,
+        double *reciprocal_lattice
+    ) noexcept nogil:
     """
     Compute the reciprocal lattice.
     """
-    cdef unsigned int i
+    cdef int i
     for i in range(3):
         recip_component(
-            lattice[i, :], lattice[(i+1)%3, :],
-            lattice[(i+2)%3, :],
-            reciprocal_lattice[i, :]
+            &lattice[3 * i], &lattice[3 * ((i + 1) % 3)],
+            &lattice[3 * ((i + 2) % 3)],
+            &reciprocal_lattice[3 * i]
         )
 
+
+@cython.cdivision(True)
 cdef void recip_component(
-        const double[::1] a1,
-        const double[::1] a2,
-        const double[::1] a3,
-        double[::1] out
-    ) nogil:
+        const double *a1,
+        const double *a2,
+        const double *a3,
+        double *out
+    ) noexcept nogil:
     """
     Compute the reciprocal lattice vector.
     """
     cdef:
-        unsigned int i
+        int i
         double prod
         double ai_cross_aj[3]
 
-    cross(&a2[0], &a3[0], ai_cross_aj)  # need to pass address of memviews
-    prod = inner(&a1[0], ai_cross_aj)
+    cross(a2, a3, ai_cross_aj)
+    prod = inner(a1, ai_cross_aj)
     for i in range(3):
         out[i] = 2 * pi * ai_cross_aj[i] / prod
 
+
 cdef double inner(
-    const double[3] x,
-    const double[3] y
-    ) nogil:
+        const double *x,
+        const double *y
+    ) noexcept nogil:
     """
     Compute inner product of 3d vectors.
     """
     cdef:
         double sum = 0
-        unsigned int i
+        int i
 
     for i in range(3):
         sum += x[i] * y[i]
     return sum
 
+
 cdef void cross(
-        const double[3] x,
-        const double[3] y,
-        double[3] out
-    ) nogil:
+        const double *x,
+        const double *y,
+        double *out
+    ) noexcept nogil:
     """
     Cross product of vector x and y, output in out.
     """
@@ -684,110 +766,42 @@ cdef void cross(
     out[1] = x[2] * y[0] - x[0] * y[2]
     out[2] = x[0] * y[1] - x[1] * y[0]
 
+
 cdef double norm(
-        const double[::1] vec
-    ) nogil:
+        const double *vec
+    ) noexcept nogil:
     """
-    Vector norm.
+    3d vector norm.
     """
     cdef:
-        unsigned int i
-        unsigned int n = vec.shape[0]
+        int i
         double sum = 0
 
-    for i in range(n):
+    for i in range(3):
         sum += vec[i] * vec[i]
     return sqrt(sum)
 
+
 cdef void get_max_and_min(
-        const double[:, ::1] coords,
+        const double *coords,
+        np.int64_t n_points,
         double[3] max_coords,
         double[3] min_coords
-    ) nogil:
+    ) noexcept nogil:
     """
     Compute the lower (min_coords) and upper (max_coords) boundaries along each dimension.
     """
     cdef:
-        unsigned int i_dim, i_pt
-        unsigned int n_points = coords.shape[0]
-        unsigned int n_dims = coords.shape[1]
-
-    for i_dim in range(n_dims):
-        max_coords[i_dim] = coords[0, i_dim]
-        min_coords[i_dim] = coords[0, i_dim]
-
-    for i_dim in range(n_points):
-        for i_pt in range(n_dims):
-            if coords[i_dim, i_pt] >= max_coords[i_pt]:
-                max_coords[i_pt] = coords[i_dim, i_pt]
-            if coords[i_dim, i_pt] <= min_coords[i_pt]:
-                min_coords[i_pt] = coords[i_dim, i_pt]
-
-cdef void compute_cube_index(
-        const double[:, ::1] coords,
-        const double[3] global_min,
-        double radius,
-        np.int64_t[:, ::1] return_indices
-    ) nogil:
-    """
-    Computes the cube indices for a set of coordinates based on radius.
-    """
-    cdef unsigned int i_pt, i_dim
-
-    for i_pt in range(coords.shape[0]):
-        for i_dim in range(coords.shape[1]):
-            return_indices[i_pt, i_dim] = <np.int64_t>(
-                floor((coords[i_pt, i_dim] - global_min[i_dim] + 1e-8) / radius)
-            )
-
-cdef void three_to_one(
-        const np.int64_t[:, ::1] label3d,
-        np.int64_t ny,
-        np.int64_t nz,
-        np.int64_t[::1] label1d
-    ) nogil:
-    """
-    3D vector representation to 1D.
-    """
-    cdef:
-        unsigned int i
-        unsigned int n = label3d.shape[0]
-
-    for i in range(n):
-        label1d[i] = label3d[i, 0] * ny * nz + label3d[i, 1] * nz + label3d[i, 2]
+        np.int64_t i_pt
+        int i_dim
 
-cdef bint distance_vertices(
-        const double[8][3] center,
-        const double[8][3] off,
-        double r
-    ) nogil:
-    cdef:
-        unsigned int i, j
-        double d2
-        double r2 = r * r
-
-    for i in range(8):
-        for j in range(8):
-            d2 = (center[i][0] - off[j][0]) * (center[i][0] - off[j][0]) + \
-                 (center[i][1] - off[j][1]) * (center[i][1] - off[j][1]) + \
-                 (center[i][2] - off[j][2]) * (center[i][2] - off[j][2])
-            if d2 <= r2:
-                return 1
-    return 0
+    for i_dim in range(3):
+        max_coords[i_dim] = coords[i_dim]
+        min_coords[i_dim] = coords[i_dim]
 
-cdef void offset_cube(
-        const double[8][3] center,
-        np.int64_t n,
-        np.int64_t m,
-        np.int64_t l,
-        const double[8][3] (&offsetted)
-    ) nogil:
-    cdef unsigned int i, j, k
-
-    for i in range(2):
-        for j in range(2):
-            for k in range(2):
-                ind = i * 4 + j * 2 + k
-                offsetted[ind][0] = center[ind][0] + n
-                offsetted[ind][1] = center[ind][1] + m
-                offsetted[ind][2] = center[ind][2] + l
+    for i_pt in range(n_points):
+        for i_dim in range(3):
+            if coords[3 * i_pt + i_dim] >= max_coords[i_dim]:
+                max_coords[i_dim] = coords[3 * i_pt + i_dim]
+            if coords[3 * i_pt + i_dim] <= min_coords[i_dim]:
+                min_coords[i_dim] = coords[3 * i_pt + i_dim]
@@ -29,6 +29,7 @@ import spglib
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.operations import SymmOp
 from pymatgen.core.structure import Molecule, PeriodicSite, Structure
+from pymatgen.symmetry.cache import get_symmetry_cache
 from pymatgen.symmetry.structure import SymmetrizedStructure
 from pymatgen.util.coord import find_in_coord_list, pbc_diff
 from pymatgen.util.due import Doi, due
@@ -73,14 +74,77 @@ class SymmetryUndeterminedError(ValueError):
 @lru_cache(maxsize=32)
 def _get_symmetry_dataset(cell, symprec, angle_tolerance):
     """Simple wrapper to cache results of spglib.get_symmetry_dataset since this call is
-    expensive.
+    expensive. Reads through the persistent cache from get_symmetry_cache, if enabled.
     """
+    cache = get_symmetry_cache()
+    if cache is not None:
+        key = cache.get_key(
+            *cell,
+            symprec=float(symprec),
+            angle_tolerance=float(angle_tolerance),
+            backend=f"spglib {spglib.__version__}",
+        )
+        if (dataset := cache.get(key)) is not None:
+            return dataset
+
     dataset = spglib.get_symmetry_dataset(cell, symprec=symprec, angle_tolerance=angle_tolerance)
     if dataset is None:
         raise SymmetryUndeterminedError(spglib.get_error_message())
+    if cache is not None:
+        cache.set(key, dataset)
     return dataset
 
 
+def _get_cell(structure: Structure | IStructure) -> tuple[tuple[Any, ...], list[Element | Species], list[int]]:
+    """The spglib cell of a structure, i.e. its lattice, fractional coordinates,
+    species numbers and magnetic moments if any, as hashable tuples.
+
+    Args:
+        structure (Structure | IStructure): Structure to analyze.
+
+    Returns:
+        tuple: The cell, the unique species, and the species number of each site,
+            which is the 1-based index of its species in the unique species.
+    """
+    unique_species: list[Element | Species] = []
+    zs = []
+    for species, group in itertools.groupby(structure, key=lambda s: s.species):
+        if species in unique_species:
+            ind = unique_species.index(species)
+            zs.extend([ind + 1] * len(tuple(group)))
+        else:
+            unique_species.append(species)
+            zs.extend([len(unique_species)] * len(tuple(group)))
+
+    has_explicit_magmoms = "magmom" in structure.site_properties or any(
+        getattr(specie, "spin", None) is not None for specie in structure.types_of_species
+    )
+
+    magmoms = []
+    for site in structure:
+        if hasattr(site, "magmom"):
+            magmoms.append(site.magmom)
+        elif site.is_ordered and getattr(site.specie, "spin", None) is not None:
+            magmoms.append(site.specie.spin)
+        elif has_explicit_magmoms:  # if any site has a magmom, all sites must have magmoms
+            magmoms.append(0)
+
+    if len(magmoms) > 0:
+        cell: tuple[Any, ...] = (
+            tuple(map(tuple, structure.lattice.matrix.tolist())),
+            tuple(map(tuple, structure.frac_coords.tolist())),
+            tuple(zs),
+            tuple(map(tuple, magmoms) if isinstance(magmoms[0], Sequence) else magmoms),
+        )
+    else:  # if no magmoms given do not add to cell
+        cell = (
+            tuple(map(tuple, structure.lattice.matrix.tolist())),
+            tuple(map(tuple, structure.frac_coords.tolist())),
+            tuple(zs),
+        )
+    return cell, unique_species, zs
+
+
 class SpacegroupAnalyzer:
     """Takes a pymatgen Structure object and a symprec.
 
@@ -109,45 +173,7 @@ class SpacegroupAnalyzer:
         self._angle_tol = angle_tolerance
         self._structure = structure
         self._site_props = structure.site_properties
-        unique_species: list[Element | Species] = []
-        zs = []
-        for species, group in itertools.groupby(structure, key=lambda s: s.species):
-            if species in unique_species:
-                ind = unique_species.index(species)
-                zs.extend([ind + 1] * len(tuple(group)))
-            else:
-                unique_species.append(species)
-                zs.extend([len(unique_species)] * len(tuple(group)))
-
-        has_explicit_magmoms = "magmom" in structure.site_properties or any(
-            getattr(specie, "spin", None) is not None for specie in structure.types_of_species
-        )
-
-        magmoms = []
-        for site in structure:
-            if hasattr(site, "magmom"):
-                magmoms.append(site.magmom)
-            elif site.is_ordered and getattr(site.specie, "spin", None) is not None:
-                magmoms.append(site.specie.spin)
-            elif has_explicit_magmoms:  # if any site has a magmom, all sites must have magmoms
-                magmoms.append(0)
-
-        self._unique_species = unique_species
-        self._numbers = zs
-
-        if len(magmoms) > 0:
-            self._cell: tuple[Any, ...] = (
-                tuple(map(tuple, structure.lattice.matrix.tolist())),
-                tuple(map(tuple, structure.frac_coords.tolist())),
-                tuple(zs),
-                tuple(map(tuple, magmoms) if isinstance(magmoms[0], Sequence) else magmoms),
-            )
-        else:  # if no magmoms given do not add to cell
-            self._cell = (
-                tuple(map(tuple, structure.lattice.matrix.tolist())),
-                tuple(map(tuple, structure.frac_coords.tolist())),
-                tuple(zs),
-            )
+        self._cell, self._unique_species, self._numbers = _get_cell(structure)
 
         self._space_group_data = _get_symmetry_dataset(self._cell, symprec, angle_tolerance)
 
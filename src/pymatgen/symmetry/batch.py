@@ -0,0 +1,174 @@
+"""Symmetry analysis of many structures, e.g. for screening large datasets.
+
+get_symmetry_results streams compact symmetry results for an iterable of structures,
+optionally over a process pool. Each result holds the space group, Wyckoff positions,
+equivalent atoms and transformation to the standard setting, without keeping
+SpacegroupAnalyzer objects or full symmetry datasets around.
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import partial
+from multiprocessing import Pool
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer, SymmetryUndeterminedError, _get_cell, _get_symmetry_dataset
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Literal
+
+    from numpy.typing import NDArray
+
+    from pymatgen.core import IStructure, Structure
+
+__author__ = "pymatgen developers"
+__date__ = "2026-10-17"
+
+
+class SymmetryResult(NamedTuple):
+    """Compact result of the symmetry analysis of a structure."""
+
+    number: int
+    international: str
+    hall_number: int
+    wyckoffs: list[str]
+    equivalent_atoms: NDArray[np.int64]
+    transformation_matrix: NDArray[np.float64]
+    origin_shift: NDArray[np.float64]
+    standard_structure: Structure | None = None
+
+
+def get_symmetry_results(
+    structures: Iterable[Structure | IStructure],
+    symprec: float = 0.01,
+    angle_tolerance: float = 5,
+    backend: Literal["spglib", "moyopy"] = "spglib",
+    standard_structure: Literal["primitive", "conventional"] | None = None,
+    ncores: int | None = None,
+    chunksize: int = 64,
+) -> Iterator[SymmetryResult | None]:
+    """Analyze the symmetry of many structures, and yield the results in the order
+    of the structures.
+
+    Args:
+        structures (Iterable[Structure | IStructure]): Structures to analyze. They are
+            read lazily, so this can be a generator over a large dataset.
+        symprec (float): Tolerance for symmetry finding. Defaults to 0.01.
+        angle_tolerance (float): Angle tolerance for symmetry finding. Defaults to 5
+            degrees.
+        backend ("spglib" | "moyopy"): Symmetry analysis backend. Defaults to "spglib".
+        standard_structure ("primitive" | "conventional" | None): Whether to include
+            the primitive or conventional standard structure from SpacegroupAnalyzer
+            in the results. Only available with the spglib backend. Defaults to None.
+        ncores (int | None): Number of processes to use. Defaults to None, which
+            implies serial processing.
+        chunksize (int): Number of structures sent to a process at once. Defaults
+            to 64.
+
+    Yields:
+        SymmetryResult | None: Result for each structure, or None if its symmetry
+            cannot be determined. The transformation matrix and origin shift
+            transform the input cell to the standard setting of the backend.
+    """
+    if backend not in ("spglib", "moyopy"):
+        raise ValueError(f"Invalid {backend=}, must be one of moyopy or spglib.")
+    if standard_structure is not None and backend != "spglib":
+        raise ValueError("Standard structures are only available with the spglib backend.")
+
+    analyze = partial(
+        _get_symmetry_result,
+        symprec=symprec,
+        angle_tolerance=angle_tolerance,
+        backend=backend,
+        standard_structure=standard_structure,
+    )
+    if not ncores:
+        yield from map(analyze, structures)
+        return
+
+    # Structures are only submitted while fewer than max_in_flight of them wait for
+    # their result to be yielded, so that the pool is kept busy without the structures
+    # and results of a large dataset all being in memory
+    max_in_flight = 4 * ncores * chunksize
+    in_flight = threading.Semaphore(max_in_flight)
+    closed = threading.Event()
+
+    def submit() -> Iterator[Structure | IStructure]:
+        for structure in structures:
+            in_flight.acquire()
+            if closed.is_set():
+                return
+            yield structure
+
+    with Pool(ncores) as pool:
+        try:
+            for result in pool.imap(analyze, submit(), chunksize):
+                in_flight.release()
+                yield result
+        finally:
+            # Unblock the submission if the results are not consumed to the end
+            closed.set()
+            in_flight.release()
+
+
+def _get_symmetry_result(
+    structure: Structure | IStructure,
+    symprec: float,
+    angle_tolerance: float,
+    backend: Literal["spglib", "moyopy"],
+    standard_structure: Literal["primitive", "conventional"] | None,
+) -> SymmetryResult | None:
+    """Symmetry result of a single structure. Must be at module level, so that it can
+    be pickled for multiprocessing.
+    """
+    if backend == "moyopy":
+        from pymatgen.symmetry.groups import SpaceGroup
+
+        try:
+            dataset = structure.get_symmetry_dataset(
+                backend="moyopy",
+                return_raw_dataset=True,
+                symprec=symprec,
+                angle_tolerance=np.radians(angle_tolerance),
+            )
+        except ValueError:
+            # moyopy raises ValueError if the symmetry search fails
+            return None
+        return SymmetryResult(
+            number=dataset.number,
+            international=SpaceGroup.from_int_number(dataset.number).symbol,
+            hall_number=dataset.hall_number,
+            wyckoffs=list(dataset.wyckoffs),
+            equivalent_atoms=np.array(dataset.orbits),
+            transformation_matrix=np.array(dataset.std_linear),
+            origin_shift=np.array(dataset.std_origin_shift),
+        )
+
+    try:
+        dataset = _get_symmetry_dataset(_get_cell(structure)[0], symprec, angle_tolerance)
+    except SymmetryUndeterminedError:
+        return None
+
+    std_structure = None
+    if standard_structure is not None:
+        # Reuses the dataset from the lru_cache of _get_symmetry_dataset
+        sga = SpacegroupAnalyzer(structure, symprec=symprec, angle_tolerance=angle_tolerance)
+        if standard_structure == "primitive":
+            std_structure = sga.get_primitive_standard_structure()
+        else:
+            std_structure = sga.get_conventional_standard_structure()
+
+    return SymmetryResult(
+        number=dataset.number,
+        international=dataset.international,
+        hall_number=dataset.hall_number,
+        wyckoffs=list(dataset.wyckoffs),
+        equivalent_atoms=dataset.equivalent_atoms,
+        transformation_matrix=dataset.transformation_matrix,
+        origin_shift=dataset.origin_shift,
+        standard_structure=std_structure,
+    )
@@ -0,0 +1,216 @@
+"""A persistent cache of symmetry datasets, shared between processes.
+
+Symmetry analysis of the same structures is often repeated by different processes,
+e.g. the stages of a pipeline or reruns of a screening. If enabled, SpacegroupAnalyzer
+and Structure.get_symmetry_dataset read the spglib and moyopy datasets through a
+SymmetryDatasetCache, which stores them in an SQLite database.
+
+The cache is disabled by default. To enable it for all processes, set
+PMG_SYMMETRY_CACHE_DIR (and optionally PMG_SYMMETRY_CACHE_SIZE, the maximum number
+of datasets) in .pmgrc.yaml or as environment variables. To enable it in a single
+process, call set_symmetry_cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pymatgen.core import SETTINGS
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from numpy.typing import ArrayLike
+
+    from pymatgen.util.typing import PathLike
+
+__author__ = "pymatgen developers"
+__date__ = "2026-10-17"
+
+DB_FILENAME = "symmetry_datasets.sqlite"
+
+# Minimum age in ns of the last use of a dataset before a cache hit records a new one.
+# Most hits are then read-only and do not wait for the write lock of the database.
+LAST_USED_REFRESH_NS = 600 * 10**9
+
+
+class SymmetryDatasetCache:
+    """Symmetry datasets stored in an SQLite database, keyed by a hash of the cell
+    and of the parameters of the symmetry search.
+
+    The database can be shared by concurrent processes. When it holds more than
+    max_size datasets, the least recently used ones are removed.
+    """
+
+    def __init__(self, directory: PathLike, max_size: int = 100_000) -> None:
+        """
+        Args:
+            directory (PathLike): Directory of the database, which is created if it
+                does not exist.
+            max_size (int): Maximum number of datasets. Defaults to 100,000.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, DB_FILENAME)
+        self.max_size = max_size
+        self._local = threading.local()
+        self._n_inserts = 0
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS datasets (key TEXT PRIMARY KEY, dataset BLOB NOT NULL, last_used INTEGER)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS last_used_index ON datasets (last_used)")
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM datasets").fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({os.path.dirname(self.path)!r}, max_size={self.max_size})"
+
+    @staticmethod
+    def get_key(
+        lattice: ArrayLike,
+        positions: ArrayLike,
+        numbers: ArrayLike,
+        magmoms: ArrayLike | None = None,
+        **params,
+    ) -> str:
+        """Hash of a cell and of the parameters of a symmetry search.
+
+        Args:
+            lattice (ArrayLike): 3x3 lattice matrix.
+            positions (ArrayLike): Fractional coordinates of the sites.
+            numbers (ArrayLike): Integer species of the sites.
+            magmoms (ArrayLike | None): Collinear or non-collinear magnetic moments
+                of the sites, if any.
+            **params: Parameters that affect the dataset, e.g. symprec,
+                angle_tolerance and the backend and its version. Values that are
+                not JSON-serializable are represented by their repr.
+
+        Returns:
+            str: Hex digest of the key.
+        """
+        digest = hashlib.sha256()
+        arrays = [(lattice, np.float64), (positions, np.float64), (numbers, np.int64)]
+        if magmoms is not None:
+            arrays.append((magmoms, np.float64))
+        for array, dtype in arrays:
+            array = np.ascontiguousarray(array, dtype=dtype)
+            digest.update(repr(array.shape).encode())
+            digest.update(array.tobytes())
+        digest.update(json.dumps(params, sort_keys=True, default=repr).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Get a dataset and mark it as recently used, unless it was already used
+        in the last LAST_USED_REFRESH_NS.
+
+        Args:
+            key (str): Key from SymmetryDatasetCache.get_key.
+
+        Returns:
+            The dataset, or None if it is not in the cache.
+        """
+        db = self._connect()
+        row = db.execute("SELECT dataset, last_used FROM datasets WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time_ns()
+        if now - row[1] >= LAST_USED_REFRESH_NS:
+            with db:
+                db.execute("UPDATE datasets SET last_used = ? WHERE key = ?", (now, key))
+        return pickle.loads(row[0])  # noqa: S301
+
+    def set(self, key: str, dataset: Any) -> None:
+        """Add a dataset to the cache, unless it cannot be pickled.
+
+        Args:
+            key (str): Key from SymmetryDatasetCache.get_key.
+            dataset: Symmetry dataset.
+        """
+        try:
+            blob = pickle.dumps(dataset, protocol=pickle.HIGHEST_PROTOCOL)
+        except (TypeError, AttributeError, pickle.PicklingError):
+            return
+        db = self._connect()
+        with db:
+            db.execute("INSERT OR REPLACE INTO datasets VALUES (?, ?, ?)", (key, blob, time.time_ns()))
+        # Evicting takes O(max_size), so only do it every max_size // 100 inserts
+        self._n_inserts += 1
+        if self._n_inserts % max(1, self.max_size // 100) == 0:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used datasets beyond max_size."""
+        db = self._connect()
+        with db:
+            db.execute(
+                "DELETE FROM datasets WHERE key IN "
+                "(SELECT key FROM datasets ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_size,),
+            )
+
+    def clear(self) -> None:
+        """Remove all datasets."""
+        db = self._connect()
+        with db:
+            db.execute("DELETE FROM datasets")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Connection of the current thread, which is reopened in forked processes."""
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            db = sqlite3.connect(self.path, timeout=60)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db, self._local.pid = db, pid
+        return self._local.db
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Connections cannot be pickled, e.g. when sent to worker processes
+        return {"path": self.path, "max_size": self.max_size}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.path, self.max_size = state["path"], state["max_size"]
+        self._local = threading.local()
+        self._n_inserts = 0
+
+
+# Cache of this process, under the key "cache" once it is loaded or set
+_SYMMETRY_CACHE: dict[str, SymmetryDatasetCache | None] = {}
+
+
+def get_symmetry_cache() -> SymmetryDatasetCache | None:
+    """Get the persistent symmetry dataset cache of this process.
+
+    Returns:
+        SymmetryDatasetCache | None: The cache set with set_symmetry_cache, else the
+            cache in PMG_SYMMETRY_CACHE_DIR if that setting exists, else None.
+    """
+    if "cache" not in _SYMMETRY_CACHE:
+        directory = SETTINGS.get("PMG_SYMMETRY_CACHE_DIR")
+        max_size = int(SETTINGS.get("PMG_SYMMETRY_CACHE_SIZE", 100_000))
+        _SYMMETRY_CACHE["cache"] = SymmetryDatasetCache(directory, max_size) if directory else None
+    return _SYMMETRY_CACHE["cache"]
+
+
+def set_symmetry_cache(cache: SymmetryDatasetCache | PathLike | None, max_size: int = 100_000) -> None:
+    """Set the persistent symmetry dataset cache of this process, overriding
+    PMG_SYMMETRY_CACHE_DIR.
+
+    Args:
+        cache (SymmetryDatasetCache | PathLike | None): Cache, or directory of the
+            cache. None disables the persistent cache.
+        max_size (int): Maximum number of datasets if a directory is given.
+            Defaults to 100,000.
+    """
+    if cache is not None and not isinstance(cache, SymmetryDatasetCache):
+        cache = SymmetryDatasetCache(cache, max_size)
+    _SYMMETRY_CACHE["cache"] = cache
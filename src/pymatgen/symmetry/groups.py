@@ -11,6 +11,7 @@ import warnings
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from fractions import Fraction
+from functools import cache
 from itertools import product
 from typing import TYPE_CHECKING, overload
 
@@ -18,6 +19,7 @@ import numpy as np
 from monty.design_patterns import cached_class
 from monty.serialization import loadfn
 
+from pymatgen.util.coord import find_unique_coords_pbc
 from pymatgen.util.string import Stringify
 
 if TYPE_CHECKING:
@@ -43,6 +45,9 @@ if TYPE_CHECKING:
 
 
 SYMM_DATA = loadfn(os.path.join(os.path.dirname(__file__), "symm_data.json"))
+# Precompiled table of the symmetry operations of the space groups in symm_ops.json,
+# see dev_scripts/update_symmetry_op_tables.py
+SYMM_OPS_TABLE = "symm_ops.npy"
 
 PG_ABBREV_MAP = {
     "2/m2/m2/m": "mmm",
@@ -63,6 +68,22 @@ PG_SETTINGS_MAP = {  # only one setting per crystal class in SYMM_DATA database
 }
 
 
+@cache
+def _load_table(filename: str) -> np.ndarray:
+    """Load a precompiled table of symmetry groups or operations from the symmetry
+    module directory. The tables are memory-mapped, so only the parts that are
+    used are read from disk.
+
+    Args:
+        filename (str): Name of the .npy file.
+
+    Returns:
+        np.ndarray: Read-only structured array. Tables of operations have a
+            "group" field, by which they are sorted.
+    """
+    return np.load(os.path.join(os.path.dirname(__file__), filename), mmap_mode="r")
+
+
 class SymmetryGroup(Sequence, Stringify, ABC):
     """Abstract class representing a symmetry group."""
 
@@ -317,6 +338,12 @@ class SpaceGroup(SymmetryGroup):
     full_sg_mapping: ClassVar[dict[str, str]] = {
         v["full_symbol"]: k for k, v in SYMM_DATA["space_group_encoding"].items()
     }
+    # Index of the first entry of SYMM_OPS matching each symbol
+    symm_ops_indices: ClassVar[dict[str, int]] = {
+        symbol: idx
+        for idx, spg in reversed(list(enumerate(SYMM_OPS)))
+        for symbol in (spg["hermann_mauguin"], spg["universal_h_m"], spg["hermann_mauguin_u"])
+    }
 
     def __init__(self, int_symbol: str, hexagonal: bool = True) -> None:
         """Initialize a Space Group from its full or abbreviated international
@@ -340,8 +367,6 @@ class SpaceGroup(SymmetryGroup):
                 (please note that the setting is not contained in the symbol
                 attribute anymore).
         """
-        from pymatgen.core.operations import SymmOp
-
         if int_symbol.endswith("H"):
             self.hexagonal = True
             if not int_symbol.endswith(":H"):
@@ -359,34 +384,29 @@ class SpaceGroup(SymmetryGroup):
         elif int_symbol in SpaceGroup.full_sg_mapping:
             int_symbol = SpaceGroup.full_sg_mapping[int_symbol]
 
-        self._symmetry_ops: set[SymmOp] | None
-
-        for spg in SpaceGroup.SYMM_OPS:
-            if int_symbol in [
-                spg["hermann_mauguin"],
-                spg["universal_h_m"],
-                spg["hermann_mauguin_u"],
-            ]:
-                ops = [SymmOp.from_xyz_str(s) for s in spg["symops"]]
-                self.symbol = spg["hermann_mauguin_u"]
-                if int_symbol in SpaceGroup.sg_encoding:
-                    self.full_symbol = SpaceGroup.sg_encoding[int_symbol]["full_symbol"]
-                    self.point_group = SpaceGroup.sg_encoding[int_symbol]["point_group"]
-                elif self.symbol in SpaceGroup.sg_encoding:
-                    self.full_symbol = SpaceGroup.sg_encoding[self.symbol]["full_symbol"]
-                    self.point_group = SpaceGroup.sg_encoding[self.symbol]["point_group"]
-                else:
-                    self.full_symbol = spg["hermann_mauguin_u"]
-                    warnings.warn(
-                        f"Full symbol not available, falling back to short Hermann Mauguin symbol "
-                        f"{self.symbol} instead",
-                        stacklevel=2,
-                    )
-                    self.point_group = spg["point_group"]
-                self.int_number = spg["number"]
-                self.order = len(ops)
-                self._symmetry_ops = {*ops}
-                break
+        self._symmetry_ops: set[SymmOp] | None = None
+        self._affine_matrices: NDArray[np.float64] | None = None
+        # Index in SYMM_OPS, whose operations are sliced from the precompiled table
+        self._symm_ops_index = SpaceGroup.symm_ops_indices.get(int_symbol)
+
+        if self._symm_ops_index is not None:
+            spg = SpaceGroup.SYMM_OPS[self._symm_ops_index]
+            self.symbol = spg["hermann_mauguin_u"]
+            if int_symbol in SpaceGroup.sg_encoding:
+                self.full_symbol = SpaceGroup.sg_encoding[int_symbol]["full_symbol"]
+                self.point_group = SpaceGroup.sg_encoding[int_symbol]["point_group"]
+            elif self.symbol in SpaceGroup.sg_encoding:
+                self.full_symbol = SpaceGroup.sg_encoding[self.symbol]["full_symbol"]
+                self.point_group = SpaceGroup.sg_encoding[self.symbol]["point_group"]
+            else:
+                self.full_symbol = spg["hermann_mauguin_u"]
+                warnings.warn(
+                    f"Full symbol not available, falling back to short Hermann Mauguin symbol {self.symbol} instead",
+                    stacklevel=2,
+                )
+                self.point_group = spg["point_group"]
+            self.int_number = spg["number"]
+            self.order = len(spg["symops"])
         else:
             if int_symbol not in SpaceGroup.sg_encoding:
                 raise ValueError(f"Bad international symbol {int_symbol!r}")
@@ -414,8 +434,6 @@ class SpaceGroup(SymmetryGroup):
             self.int_number = data["int_number"]
             self.order = data["order"]
 
-            self._symmetry_ops = None
-
     def _generate_full_symmetry_ops(self) -> np.ndarray:
         symm_ops = np.array(self.generators)
         for op in symm_ops:
@@ -482,9 +500,26 @@ class SpaceGroup(SymmetryGroup):
         from pymatgen.core.operations import SymmOp
 
         if self._symmetry_ops is None:
-            self._symmetry_ops = {SymmOp(m) for m in self._generate_full_symmetry_ops()}
+            if self._symm_ops_index is not None:
+                ops = _load_table(SYMM_OPS_TABLE)
+                start, stop = np.searchsorted(ops["group"], [self._symm_ops_index, self._symm_ops_index + 1])
+                affine_matrices = np.zeros((stop - start, 4, 4))
+                affine_matrices[:, :3, :3] = ops["rotation"][start:stop]
+                affine_matrices[:, :3, 3] = ops["translation"][start:stop]
+                affine_matrices[:, 3, 3] = 1
+            else:
+                affine_matrices = self._generate_full_symmetry_ops()
+            self._symmetry_ops = {SymmOp(m) for m in affine_matrices}
         return self._symmetry_ops
 
+    def _get_affine_matrices(self) -> NDArray[np.float64]:
+        """Affine matrices of the symmetry operations, stacked in the iteration
+        order of symmetry_ops, for operating on points with all of them at once.
+        """
+        if self._affine_matrices is None:
+            self._affine_matrices = np.array([op.affine_matrix for op in self.symmetry_ops])
+        return self._affine_matrices
+
     def get_orbit(self, p: ArrayLike, tol: float = 1e-5) -> list[np.ndarray]:
         """Get the orbit for a point.
 
@@ -497,6 +532,12 @@ class SpaceGroup(SymmetryGroup):
         Returns:
             list[array]: Orbit for point.
         """
+        if tol:
+            from pymatgen.core.operations import SymmOp
+
+            points = np.mod(np.round(SymmOp.operate_stack(self._get_affine_matrices(), p), decimals=10), 1)
+            return list(points[find_unique_coords_pbc(points, atol=tol, pbc=(False, False, False))])
+
         orbit: list[np.ndarray] = []
         for o in self.symmetry_ops:
             pp = o.operate(p)
@@ -519,8 +560,15 @@ class SpaceGroup(SymmetryGroup):
         """
         from pymatgen.core.operations import SymmOp
 
-        orbit: list[np.ndarray] = [np.array(p, dtype=float)]
         identity = SymmOp.from_rotation_and_translation(np.eye(3), np.zeros(3))
+        if tol:
+            symm_ops = list(self.symmetry_ops)
+            points = np.mod(np.round(SymmOp.operate_stack(self._get_affine_matrices(), p), decimals=10), 1)
+            points = np.concatenate([np.array(p, dtype=float)[None], points])
+            unique_indices = find_unique_coords_pbc(points, atol=tol, pbc=(False, False, False))
+            return list(points[unique_indices]), [identity, *(symm_ops[idx - 1] for idx in unique_indices[1:])]
+
+        orbit: list[np.ndarray] = [np.array(p, dtype=float)]
         generators: list[SymmOp] = [identity]
         for o in self.symmetry_ops:
             pp = o.operate(p)
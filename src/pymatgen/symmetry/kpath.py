@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import abc
+import copy
 import itertools
 import math
+from collections import OrderedDict
 from math import cos, pi, sin
 from typing import TYPE_CHECKING
 from warnings import warn
@@ -37,6 +39,12 @@ __email__ = "jmunro@lbl.gov"
 __status__ = "Development"
 __date__ = "March 2020"
 
+# Maximum number of Latimer-Munro k-paths kept, see KPathLatimerMunro.cache_clear
+KPATH_CACHE_SIZE = 1024
+
+# Latimer-Munro k-paths, keyed by reciprocal lattice, reciprocal point group and atol
+_KPATH_CACHE: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+
 
 class KPathBase(abc.ABC):
     """This is the base class for classes used to generate high-symmetry
@@ -92,33 +100,33 @@ class KPathBase(abc.ABC):
         """The symmetry line path in reciprocal space."""
         return self._kpath
 
-    def get_kpoints(self, line_density=20, coords_are_cartesian=True):
-        """Get kpoints along the path in Cartesian coordinates together with the critical-point labels."""
-        list_k_points = []
+    def get_kpoints(self, line_density=20, coords_are_cartesian=True, as_array=False):
+        """Get kpoints along the path in Cartesian coordinates together with the critical-point labels.
+
+        Args:
+            line_density (int): Number of kpoints per unit of distance along the path.
+            coords_are_cartesian (bool): Whether to return the kpoints in Cartesian
+                or fractional coordinates.
+            as_array (bool): Whether to return the kpoints as a single (N, 3) array
+                instead of a list of arrays, e.g. for long paths. Defaults to False.
+        """
+        segments = []
         sym_point_labels = []
         for k_path in self.kpath["path"]:
             for path_step in range(1, len(k_path)):
-                start = np.array(self.kpath["kpoints"][k_path[path_step - 1]])
-                end = np.array(self.kpath["kpoints"][k_path[path_step]])
-                distance = np.linalg.norm(
-                    self._rec_lattice.get_cartesian_coords(start) - self._rec_lattice.get_cartesian_coords(end)
-                )
+                start = self._rec_lattice.get_cartesian_coords(np.array(self.kpath["kpoints"][k_path[path_step - 1]]))
+                end = self._rec_lattice.get_cartesian_coords(np.array(self.kpath["kpoints"][k_path[path_step]]))
+                distance = np.linalg.norm(start - end)
                 nb = math.ceil(distance * line_density)
                 if nb == 0:
                     continue
                 sym_point_labels.extend([k_path[path_step - 1]] + [""] * (nb - 1) + [k_path[path_step]])
-                list_k_points += [
-                    self._rec_lattice.get_cartesian_coords(start)
-                    + float(i)
-                    / float(nb)
-                    * (self._rec_lattice.get_cartesian_coords(end) - self._rec_lattice.get_cartesian_coords(start))
-                    for i in range(nb + 1)
-                ]
-        if coords_are_cartesian:
-            return list_k_points, sym_point_labels
+                segments.append(start + (np.arange(nb + 1) / nb)[:, None] * (end - start))
 
-        frac_k_points = [self._rec_lattice.get_fractional_coords(k) for k in list_k_points]
-        return frac_k_points, sym_point_labels
+        k_points = np.concatenate(segments) if segments else np.empty((0, 3))
+        if not coords_are_cartesian:
+            k_points = self._rec_lattice.get_fractional_coords(k_points)
+        return (k_points if as_array else list(k_points)), sym_point_labels
 
 
 @cite_conventional_cell_algo
@@ -1174,6 +1182,29 @@ class KPathLatimerMunro(KPathBase):
 
         self._rpg = recip_point_group
 
+        # Steps 2 to 10 only depend on the reciprocal lattice and point group, which are
+        # shared by e.g. substituted or differently ordered magnetic structures
+        cache_key = (
+            tuple(np.round(self._rec_lattice.matrix, decimals=10).ravel() + 0.0),
+            tuple(np.ravel(recip_point_group) + 0.0),
+            atol,
+        )
+        if cache_key in _KPATH_CACHE:
+            _KPATH_CACHE.move_to_end(cache_key)
+        else:
+            _KPATH_CACHE[cache_key] = self._get_kpath_from_point_group(recip_point_group, W, atol)
+            if len(_KPATH_CACHE) > KPATH_CACHE_SIZE:
+                _KPATH_CACHE.popitem(last=False)
+        return copy.deepcopy(_KPATH_CACHE[cache_key])
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the cache of k-paths, which are reused for structures with the same
+        reciprocal lattice and reciprocal point group.
+        """
+        _KPATH_CACHE.clear()
+
+    def _get_kpath_from_point_group(self, recip_point_group, W, atol):
         # 2: Get all vertices, edge- and face- center points of BZ ("key points")
 
         key_points, bz_as_key_point_inds, face_center_inds = self._get_key_points()
@@ -1240,23 +1271,18 @@ class KPathLatimerMunro(KPathBase):
         points_in_path_inds_unique = list(set(points_in_path_inds))
 
         orbit_cosines = []
+        label_points = np.array([self.label_points(point_index) for point_index in range(26)], dtype=float)
+        label_point_norms = np.array([np.linalg.norm(label_point) for label_point in label_points])
 
         for orbit in key_points_inds_orbits[:-1]:
-            current_orbit_cosines = []
-
-            for orbit_index in orbit:
-                key_point = key_points[orbit_index]
-
-                # Calculate cosine values for all 26 neighbor points
-                for point_index in range(26):
-                    label_point = self.label_points(point_index)
-
-                    # Calculate cosine of angle between key_point and label_point
-                    cosine_value = np.dot(key_point, label_point)
-                    cosine_value /= np.linalg.norm(key_point) * np.linalg.norm(label_point)
-                    cosine_value = np.round(cosine_value, decimals=3)
+            orbit_points = np.array([key_points[orbit_index] for orbit_index in orbit])
+            orbit_point_norms = np.array([np.linalg.norm(key_point) for key_point in orbit_points])
 
-                    current_orbit_cosines.append((point_index, cosine_value))
+            # Calculate cosines of the angles between the key points and all 26 neighbor points
+            cosine_values = orbit_points @ label_points.T
+            cosine_values /= orbit_point_norms[:, None] * label_point_norms
+            cosine_values = np.round(cosine_values, decimals=3)
+            current_orbit_cosines = list(zip(itertools.cycle(range(26)), cosine_values.ravel(), strict=False))
 
             # Sort cosine values in descending order, break ties using point index
             sorted_cosines = sorted(current_orbit_cosines, key=lambda x: (-x[1], x[0]))
@@ -1422,37 +1448,35 @@ class KPathLatimerMunro(KPathBase):
         bz = [bz[i] for i in range(len(bz)) if i not in pop]
 
         # use vertex points to calculate edge- and face- centers
+        # key points are also stacked in an array, to compare new points to all of them at once
+        key_points_arr = np.empty((3 * sum(len(facet) for facet in bz), 3))
+
+        def add_key_point(point):
+            key_points_arr[len(key_points)] = point
+            key_points.append(point)
+            return len(key_points) - 1
+
         for idx, facet in enumerate(bz):
             bz_as_key_point_inds.append([])
             for j, vert in enumerate(facet):
                 edge_center = (vert + facet[j + 1]) / 2 if j != len(facet) - 1 else (vert + facet[0]) / 2.0
-                duplicatevert = duplicateedge = False
-                for k, point in enumerate(key_points):
-                    if np.allclose(vert, point, atol=self._atol):
-                        bz_as_key_point_inds[idx].append(k)
-                        duplicatevert = True
-                        break
-                for k, point in enumerate(key_points):
-                    if np.allclose(edge_center, point, atol=self._atol):
-                        bz_as_key_point_inds[idx].append(k)
-                        duplicateedge = True
-                        break
-                if not duplicatevert:
-                    key_points.append(vert)
-                    bz_as_key_point_inds[idx].append(len(key_points) - 1)
-                if not duplicateedge:
-                    key_points.append(edge_center)
-                    bz_as_key_point_inds[idx].append(len(key_points) - 1)
+                vert_inds = self._find_close_points(vert, key_points_arr[: len(key_points)], atol=self._atol)
+                edge_inds = self._find_close_points(edge_center, key_points_arr[: len(key_points)], atol=self._atol)
+                if len(vert_inds) > 0:
+                    bz_as_key_point_inds[idx].append(int(vert_inds[0]))
+                if len(edge_inds) > 0:
+                    bz_as_key_point_inds[idx].append(int(edge_inds[0]))
+                if len(vert_inds) == 0:
+                    bz_as_key_point_inds[idx].append(add_key_point(vert))
+                if len(edge_inds) == 0:
+                    bz_as_key_point_inds[idx].append(add_key_point(edge_center))
             if len(facet) == 4:  # parallelogram facet
                 face_center = (facet[0] + facet[1] + facet[2] + facet[3]) / 4.0
-                key_points.append(face_center)
-                face_center_inds.append(len(key_points) - 1)
-                bz_as_key_point_inds[idx].append(len(key_points) - 1)
             else:  # hexagonal facet
                 face_center = (facet[0] + facet[1] + facet[2] + facet[3] + facet[4] + facet[5]) / 6.0
-                key_points.append(face_center)
-                face_center_inds.append(len(key_points) - 1)
-                bz_as_key_point_inds[idx].append(len(key_points) - 1)
+            face_center_ind = add_key_point(face_center)
+            face_center_inds.append(face_center_ind)
+            bz_as_key_point_inds[idx].append(face_center_ind)
 
         # add gamma point
         key_points.append(np.array([0, 0, 0]))
@@ -1469,6 +1493,7 @@ class KPathLatimerMunro(KPathBase):
         # gamma not equivalent to any in BZ and is last point added to
         # key_points
         key_points_inds_orbits = []
+        rpg = np.array(self._rpg)
 
         i = 0
         while len(key_points_copy) > 0:
@@ -1478,17 +1503,18 @@ class KPathLatimerMunro(KPathBase):
             key_points_inds_orbits[i].append(k0ind)
             key_points_copy.pop(k0ind)
 
-            for op in self._rpg:
-                to_pop = []
-                k1 = np.dot(op, k0)
-                for ind_key, key_point in key_points_copy.items():
-                    diff = k1 - key_point
-                    if self._all_ints(diff, atol=self._atol):
-                        key_points_inds_orbits[i].append(ind_key)
-                        to_pop.append(ind_key)
-
-                for key in to_pop:
-                    key_points_copy.pop(key)
+            if len(key_points_copy) > 0:
+                # images of k0 under all operations, compared to all remaining points
+                remaining_inds = list(key_points_copy)
+                diffs = (rpg @ k0)[:, None, :] - np.array(list(key_points_copy.values()))[None, :, :]
+                is_equiv = self._all_ints(diffs, atol=self._atol)
+                # points join the orbit in the order of the first operation mapping k0 onto them
+                first_ops = np.where(is_equiv.any(axis=0), is_equiv.argmax(axis=0), len(rpg))
+                for j in np.argsort(first_ops, kind="stable"):
+                    if first_ops[j] == len(rpg):
+                        break
+                    key_points_inds_orbits[i].append(remaining_inds[j])
+                    key_points_copy.pop(remaining_inds[j])
             i += 1
 
         key_points_inds_orbits.append([len(key_points) - 1])
@@ -1537,6 +1563,12 @@ class KPathLatimerMunro(KPathBase):
     def _get_key_line_orbits(self, key_points, key_lines, key_points_inds_orbits):
         key_lines_copy = dict(zip(range(len(key_lines)), key_lines, strict=True))
         key_lines_inds_orbits = []
+        rpg = np.array(self._rpg)
+
+        # key point orbits partition the key points, so points are equivalent if their orbits are equal
+        point_orbit_inds = np.empty(len(key_points), dtype=int)
+        for orbit_ind, orbit in enumerate(key_points_inds_orbits):
+            point_orbit_inds[orbit] = orbit_ind
 
         i = 0
         while len(key_lines_copy) > 0:
@@ -1549,49 +1581,20 @@ class KPathLatimerMunro(KPathBase):
             p00 = key_points[l0[0]]
             p01 = key_points[l0[1]]
             pmid0 = p00 + math.e / pi * (p01 - p00)
+            # images of the end and middle points of l0 under all operations
+            p00pr, p01pr, pmid0pr = rpg @ p00, rpg @ p01, rpg @ pmid0
+            orbit00, orbit01 = point_orbit_inds[l0[0]], point_orbit_inds[l0[1]]
             for ind_key, l1 in key_lines_copy.items():
                 p10 = key_points[l1[0]]
                 p11 = key_points[l1[1]]
-                equivptspar = equivptsperp = equivline = False
+                equivline = False
 
-                if (
-                    np.array([l0[0] in orbit and l1[0] in orbit for orbit in key_points_inds_orbits]).any()
-                    and np.array([l0[1] in orbit and l1[1] in orbit for orbit in key_points_inds_orbits]).any()
-                ):
-                    equivptspar = True
-                elif (
-                    np.array([l0[1] in orbit and l1[0] in orbit for orbit in key_points_inds_orbits]).any()
-                    and np.array([l0[0] in orbit and l1[1] in orbit for orbit in key_points_inds_orbits]).any()
-                ):
-                    equivptsperp = True
-
-                if equivptspar:
-                    pmid1 = p10 + math.e / pi * (p11 - p10)
-                    for op in self._rpg:
-                        if not equivline:
-                            p00pr = np.dot(op, p00)
-                            diff0 = p10 - p00pr
-                            if self._all_ints(diff0, atol=self._atol):
-                                pmid0pr = np.dot(op, pmid0) + diff0
-                                p01pr = np.dot(op, p01) + diff0
-                                if np.allclose(p11, p01pr, atol=self._atol) and np.allclose(
-                                    pmid1, pmid0pr, atol=self._atol
-                                ):
-                                    equivline = True
-
-                elif equivptsperp:
-                    pmid1 = p11 + math.e / pi * (p10 - p11)
-                    for op in self._rpg:
-                        if not equivline:
-                            p00pr = np.dot(op, p00)
-                            diff0 = p11 - p00pr
-                            if self._all_ints(diff0, atol=self._atol):
-                                pmid0pr = np.dot(op, pmid0) + diff0
-                                p01pr = np.dot(op, p01) + diff0
-                                if np.allclose(p10, p01pr, atol=self._atol) and np.allclose(
-                                    pmid1, pmid0pr, atol=self._atol
-                                ):
-                                    equivline = True
+                if orbit00 == point_orbit_inds[l1[0]] and orbit01 == point_orbit_inds[l1[1]]:
+                    # equivalent points parallel
+                    equivline = self._ops_map_line(p00pr, p01pr, pmid0pr, p10, p11, atol=self._atol)
+                elif orbit01 == point_orbit_inds[l1[0]] and orbit00 == point_orbit_inds[l1[1]]:
+                    # equivalent points perpendicular
+                    equivline = self._ops_map_line(p00pr, p01pr, pmid0pr, p11, p10, atol=self._atol)
 
                 if equivline:
                     key_lines_inds_orbits[i].append(l1)
@@ -1607,34 +1610,23 @@ class KPathLatimerMunro(KPathBase):
         little_groups_points = []  # elements are lists of indices of recip_point_group. the
         # list little_groups_points[i] is the little group for the
         # orbit key_points_inds_orbits[i]
-        for idx, orbit in enumerate(key_points_inds_orbits):
+        rpg = np.array(self._rpg)
+        for orbit in key_points_inds_orbits:
             k0 = key_points[orbit[0]]
-            little_groups_points.append([])
-            for j, op in enumerate(self._rpg):
-                gamma_to = np.dot(op, -1 * k0) + k0
-                check_gamma = True
-                if not self._all_ints(gamma_to, atol=self._atol):
-                    check_gamma = False
-                if check_gamma:
-                    little_groups_points[idx].append(j)
+            gamma_to = rpg @ (-1 * k0) + k0
+            little_groups_points.append(np.flatnonzero(self._all_ints(gamma_to, atol=self._atol)).tolist())
 
         # elements are lists of indices of recip_point_group. the list
         # little_groups_lines[i] is
         little_groups_lines = []
         # the little group for the orbit key_points_inds_lines[i]
 
-        for idx, orbit in enumerate(key_lines_inds_orbits):
+        for orbit in key_lines_inds_orbits:
             l0 = orbit[0]
             v = key_points[l0[1]] - key_points[l0[0]]
             k0 = key_points[l0[0]] + np.e / pi * v
-            little_groups_lines.append([])
-            for j, op in enumerate(self._rpg):
-                gamma_to = np.dot(op, -1 * k0) + k0
-                check_gamma = True
-                if not self._all_ints(gamma_to, atol=self._atol):
-                    check_gamma = False
-                if check_gamma:
-                    little_groups_lines[idx].append(j)
+            gamma_to = rpg @ (-1 * k0) + k0
+            little_groups_lines.append(np.flatnonzero(self._all_ints(gamma_to, atol=self._atol)).tolist())
 
         return little_groups_points, little_groups_lines
 
@@ -1805,8 +1797,34 @@ class KPathLatimerMunro(KPathBase):
 
     @staticmethod
     def _all_ints(arr, atol):
-        rounded_arr = np.around(arr, decimals=0)
-        return np.allclose(rounded_arr, arr, atol=atol)
+        """Whether arr only has integer entries within atol, along its last axis."""
+        arr = np.asarray(arr)
+        # same criterion as np.allclose(np.around(arr), arr, atol=atol)
+        return np.all(np.abs(np.around(arr, decimals=0) - arr) <= atol + 1e-5 * np.abs(arr), axis=-1)
+
+    @staticmethod
+    def _find_close_points(point, points, atol):
+        """Indices of the points which are np.allclose to point."""
+        return np.flatnonzero(np.all(np.abs(point - points) <= atol + 1e-5 * np.abs(points), axis=1))
+
+    @classmethod
+    def _ops_map_line(cls, p0pr, p1pr, pmid_pr, q0, q1, atol):
+        """Whether any operation maps the line from p0 to p1 onto the line from q0 to q1,
+        up to a lattice translation, given the images p0pr, p1pr and pmid_pr of its end
+        points and of the point e/pi of the way along it under all operations.
+        """
+        qmid = q0 + math.e / pi * (q1 - q0)
+        diff0 = q0 - p0pr
+        p1pr = p1pr + diff0
+        pmid_pr = pmid_pr + diff0
+        # same criteria as np.allclose(q1, p1pr, atol=atol) and np.allclose(qmid, pmid_pr, atol=atol)
+        return bool(
+            np.any(
+                cls._all_ints(diff0, atol=atol)
+                & np.all(np.abs(q1 - p1pr) <= atol + 1e-5 * np.abs(p1pr), axis=1)
+                & np.all(np.abs(qmid - pmid_pr) <= atol + 1e-5 * np.abs(pmid_pr), axis=1)
+            )
+        )
 
     def _get_IRBZ(self, recip_point_group, W, key_points, face_center_inds, atol):
         rpgdict = self._get_reciprocal_point_group_dict(recip_point_group, atol)
@@ -7,6 +7,7 @@ import sqlite3
 import textwrap
 from array import array
 from fractions import Fraction
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -14,13 +15,15 @@ from monty.design_patterns import cached_class
 
 from pymatgen.core.operations import MagSymmOp
 from pymatgen.electronic_structure.core import Magmom
-from pymatgen.symmetry.groups import SymmetryGroup, in_array_list
+from pymatgen.symmetry.groups import SymmetryGroup, _load_table, in_array_list
 from pymatgen.symmetry.settings import JonesFaithfulTransformation
+from pymatgen.util.coord import find_unique_coords_pbc
 from pymatgen.util.string import transformation_to_string
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from numpy.typing import NDArray
     from typing_extensions import Self
 
     from pymatgen.core.lattice import Lattice
@@ -28,6 +31,11 @@ if TYPE_CHECKING:
 __author__ = "Matthew Horton, Shyue Ping Ong"
 
 MAGSYMM_DATA = os.path.join(os.path.dirname(__file__), "symm_data_magnetic.sqlite")
+# Precompiled tables of the labels and numbers of the groups, by OG3 index, and of
+# their symmetry operations including lattice centerings, see
+# dev_scripts/update_symmetry_op_tables.py
+MAGSYMM_GROUPS = "symm_groups_magnetic.npy"
+MAGSYMM_OPS = "symm_ops_magnetic.npy"
 
 
 @cached_class
@@ -100,7 +108,37 @@ class MagneticSpaceGroup(SymmetryGroup):
                 means no transformation, i.e. BNS setting is the same as
                 OG setting.
         """
-        self._data = {}
+        groups = _load_table(MAGSYMM_GROUPS)
+        if isinstance(label, str):
+            label = "".join(label.split())  # remove any white space
+            indices = np.flatnonzero(groups["bns_label"] == label)
+        elif isinstance(label, list):
+            indices = np.flatnonzero(np.all(groups["bns_number"] == label, axis=1))
+        elif isinstance(label, int) and 1 <= label <= len(groups):
+            # OG3 index is a 'master' index, going from 1 to 1651
+            indices = [label - 1]
+        else:
+            indices = []
+        if len(indices) == 0:
+            raise ValueError(f"Unknown magnetic space group {label!r}")
+        self._index = int(indices[0])
+
+        # Jones Faithful transformation, the identity unless given (from_origin_shift
+        # avoids parsing "a,b,c;0,0,0" with sympy for every group)
+        self.jf = JonesFaithfulTransformation.from_origin_shift("0,0,0")
+        if isinstance(setting_transformation, str):
+            if setting_transformation != "a,b,c;0,0,0":
+                self.jf = JonesFaithfulTransformation.from_transformation_str(setting_transformation)
+        elif isinstance(setting_transformation, JonesFaithfulTransformation) and setting_transformation != self.jf:
+            self.jf = setting_transformation
+
+    @cached_property
+    def _data(self) -> dict:
+        """All data of the space group from the ISO-MAG database, including the
+        OG setting and Wyckoff positions. Parsed on first use, since the symmetry
+        operations are read from the precompiled tables.
+        """
+        data: dict = {}
 
         # Datafile is stored as sqlite3 database since (a) it can be easily
         # queried for various different indexes (BNS/OG number/labels) and (b)
@@ -112,36 +150,18 @@ class MagneticSpaceGroup(SymmetryGroup):
         # retrieve raw data
         db = sqlite3.connect(MAGSYMM_DATA)
         c = db.cursor()
-        if isinstance(label, str):
-            label = "".join(label.split())  # remove any white space
-            c.execute("SELECT * FROM space_groups WHERE BNS_label=?;", (label,))
-        elif isinstance(label, list):
-            c.execute(
-                "SELECT * FROM space_groups WHERE BNS1=? AND BNS2=?;",
-                (label[0], label[1]),
-            )
-        elif isinstance(label, int):
-            # OG3 index is a 'master' index, going from 1 to 1651
-            c.execute("SELECT * FROM space_groups WHERE OG3=?;", (label,))
+        c.execute("SELECT * FROM space_groups WHERE OG3=?;", (self._index + 1,))
         raw_data = list(c.fetchone())
 
-        # Jones Faithful transformation
-        self.jf = JonesFaithfulTransformation.from_transformation_str("a,b,c;0,0,0")
-        if isinstance(setting_transformation, str):
-            if setting_transformation != "a,b,c;0,0,0":
-                self.jf = JonesFaithfulTransformation.from_transformation_str(setting_transformation)
-        elif isinstance(setting_transformation, JonesFaithfulTransformation) and setting_transformation != self.jf:
-            self.jf = setting_transformation
-
-        self._data["magtype"] = raw_data[0]  # int from 1 to 4
-        self._data["bns_number"] = [raw_data[1], raw_data[2]]
-        self._data["bns_label"] = raw_data[3]
-        self._data["og_number"] = [raw_data[4], raw_data[5], raw_data[6]]
-        self._data["og_label"] = raw_data[7]  # can differ from BNS_label
+        data["magtype"] = raw_data[0]  # int from 1 to 4
+        data["bns_number"] = [raw_data[1], raw_data[2]]
+        data["bns_label"] = raw_data[3]
+        data["og_number"] = [raw_data[4], raw_data[5], raw_data[6]]
+        data["og_label"] = raw_data[7]  # can differ from BNS_label
 
         def _get_point_operator(idx):
             """Retrieve information on point operator (rotation matrix and Seitz label)."""
-            is_hex = self._data["bns_number"][0] >= 143 and self._data["bns_number"][0] <= 194
+            is_hex = data["bns_number"][0] >= 143 and data["bns_number"][0] <= 194
             c.execute(
                 "SELECT symbol, matrix FROM point_operators WHERE idx=? AND hex=?;",
                 (idx - 1, is_hex),
@@ -274,16 +294,18 @@ class MagneticSpaceGroup(SymmetryGroup):
                 # array() behavior changed, need to explicitly convert buffer to str in earlier Python
                 raw_data[idx] = array("b", str(raw_data[idx]))
 
-        self._data["og_bns_transform"] = _parse_transformation(raw_data[8])
-        self._data["bns_operators"] = _parse_operators(raw_data[9])
-        self._data["bns_lattice"] = _parse_lattice(raw_data[10])
-        self._data["bns_wyckoff"] = _parse_wyckoff(raw_data[11])
-        self._data["og_operators"] = _parse_operators(raw_data[12])
-        self._data["og_lattice"] = _parse_lattice(raw_data[13])
-        self._data["og_wyckoff"] = _parse_wyckoff(raw_data[14])
+        data["og_bns_transform"] = _parse_transformation(raw_data[8])
+        data["bns_operators"] = _parse_operators(raw_data[9])
+        data["bns_lattice"] = _parse_lattice(raw_data[10])
+        data["bns_wyckoff"] = _parse_wyckoff(raw_data[11])
+        data["og_operators"] = _parse_operators(raw_data[12])
+        data["og_lattice"] = _parse_lattice(raw_data[13])
+        data["og_wyckoff"] = _parse_wyckoff(raw_data[14])
 
         db.close()
 
+        return data
+
     @classmethod
     def from_og(cls, label: Sequence[int] | str) -> Self:
         """Initialize from Opechowski and Guccione (OG) label or number.
@@ -291,29 +313,25 @@ class MagneticSpaceGroup(SymmetryGroup):
         Args:
             label: OG number supplied as list of 3 ints or OG label as str
         """
-        db = sqlite3.connect(MAGSYMM_DATA)
-        c = db.cursor()
+        groups = _load_table(MAGSYMM_GROUPS)
         if isinstance(label, str):
-            c.execute("SELECT BNS_label FROM space_groups WHERE OG_label=?", (label,))
-        elif isinstance(label, list):
-            c.execute(
-                "SELECT BNS_label FROM space_groups WHERE OG1=? and OG2=? and OG3=?",
-                (label[0], label[1], label[2]),
-            )
-        bns_label = c.fetchone()[0]
-        db.close()
+            indices = np.flatnonzero(groups["og_label"] == label)
+        else:
+            indices = np.flatnonzero(np.all(groups["og_number"] == label, axis=1))
+        if len(indices) == 0:
+            raise ValueError(f"Unknown magnetic space group {label!r}")
 
-        return cls(bns_label)
+        return cls(str(groups["bns_label"][indices[0]]))
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             return NotImplemented
-        return self._data == other._data
+        return self._index == other._index
 
     @property
     def crystal_system(self):
         """Crystal system, e.g. cubic, hexagonal, etc."""
-        i = self._data["bns_number"][0]
+        i = _load_table(MAGSYMM_GROUPS)["bns_number"][self._index, 0]
         if i <= 2:
             return "triclinic"
         if i <= 15:
@@ -331,7 +349,7 @@ class MagneticSpaceGroup(SymmetryGroup):
     @property
     def sg_symbol(self):
         """Space group symbol."""
-        return self._data["bns_label"]
+        return str(_load_table(MAGSYMM_GROUPS)["bns_label"][self._index])
 
     @property
     def symmetry_ops(self):
@@ -340,27 +358,30 @@ class MagneticSpaceGroup(SymmetryGroup):
         Returns:
             List of pymatgen.core.operations.MagSymmOp.
         """
-        ops = [op_data["op"] for op_data in self._data["bns_operators"]]
-
-        # add lattice centerings
-        centered_ops = []
-        lattice_vectors = [latt["vector"] for latt in self._data["bns_lattice"]]
-
-        for vec in lattice_vectors:
-            if not (np.array_equal(vec, [1, 0, 0]) or np.array_equal(vec, [0, 1, 0]) or np.array_equal(vec, [0, 0, 1])):
-                for op in ops:
-                    new_vec = op.translation_vector + vec
-                    new_op = MagSymmOp.from_rotation_and_translation_and_time_reversal(
-                        op.rotation_matrix,
-                        translation_vec=new_vec,
-                        time_reversal=op.time_reversal,
-                    )
-                    centered_ops.append(new_op)
-
-        ops += centered_ops
-
-        # apply jones faithful transformation
-        return [self.jf.transform_symmop(op) for op in ops]
+        affine_matrices, time_reversals = self._op_arrays
+        return [
+            MagSymmOp(affine_matrix, time_reversal)
+            for affine_matrix, time_reversal in zip(affine_matrices, time_reversals.tolist(), strict=True)
+        ]
+
+    @cached_property
+    def _op_arrays(self) -> tuple[NDArray[np.float64], NDArray[np.int8]]:
+        """Affine matrices and time reversals of the symmetry operations, in the
+        order of symmetry_ops, sliced from the precompiled table of operations.
+        """
+        ops = _load_table(MAGSYMM_OPS)
+        start, stop = np.searchsorted(ops["group"], [self._index, self._index + 1])
+        ops = ops[start:stop]
+
+        # apply jones faithful transformation, as in JonesFaithfulTransformation.transform_symmop
+        P, p = self.jf.P, self.jf.p
+        P_inv = np.linalg.inv(P)
+        rotations = ops["rotation"].astype(float)
+        affine_matrices = np.zeros((len(ops), 4, 4))
+        affine_matrices[:, :3, :3] = P_inv @ rotations @ P
+        affine_matrices[:, :3, 3] = np.mod((ops["translation"] + (rotations - np.identity(3)) @ p) @ P_inv.T, 1.0)
+        affine_matrices[:, 3, 3] = 1
+        return affine_matrices, np.array(ops["time_reversal"])
 
     def get_orbit(self, p, magmom, tol: float = 1e-5):
         """Get the orbit for a point and its associated magnetic moment.
@@ -375,9 +396,22 @@ class MagneticSpaceGroup(SymmetryGroup):
         Returns:
             tuple[list, list]: orbit for point and magnetic moments for orbit.
         """
+        magmom = Magmom(magmom)
+        if tol:
+            affine_matrices, time_reversals = self._op_arrays
+            points = np.mod(np.round(MagSymmOp.operate_stack(affine_matrices, p), decimals=10), 1)
+            unique_indices = find_unique_coords_pbc(points, atol=tol, pbc=(False, False, False))
+
+            # magnetic moments transform as axial vectors, see MagSymmOp.operate_magmom
+            rotations = affine_matrices[unique_indices, :3, :3]
+            factors = np.linalg.det(rotations) * time_reversals[unique_indices]
+            moments = factors[:, None] * (rotations @ magmom.global_moment)
+            return list(points[unique_indices]), [
+                Magmom.from_global_moment_and_saxis(moment, magmom.saxis) for moment in moments
+            ]
+
         orbit: list[np.ndarray] = []
         orbit_magmoms = []
-        magmom = Magmom(magmom)
         for sym_op in self.symmetry_ops:
             pp = sym_op.operate(p)
             pp = np.mod(np.round(pp, decimals=10), 1)
@@ -274,6 +274,90 @@ def is_coord_subset_pbc(
     return coord_cython.is_coord_subset_pbc(c1, c2, np.zeros(3, dtype=np.float64) + atol, mask_arr, pbc)
 
 
+def find_unique_coords_pbc(
+    frac_coords: ArrayLike, atol: float | ArrayLike = 1e-8, pbc: tuple[bool, bool, bool] = (True, True, True)
+) -> np.ndarray:
+    """Get the indices of the unique points in a fractional coord list, taking into
+    account periodic boundary conditions. A point is unique if it does not match
+    any earlier unique point, i.e. the result is the same as appending the points
+    one by one to a list unless in_coord_list_pbc finds them in that list.
+
+    Points are hashed into a grid of cells that are at least 2 * atol wide, so that
+    a point can only match points in its own cell and in the 7 cells next to the
+    corner it is closest to. This takes O(n) rather than O(n^2) time for n points.
+
+    Args:
+        frac_coords: List of fractional coords, of shape (n, 3).
+        atol (float or size 3 array): Absolute tolerance along each axis.
+            Defaults to 1e-8.
+        pbc: a tuple defining the periodic boundary conditions along the three
+            axis of the lattice.
+
+    Returns:
+        np.ndarray: Sorted indices of the unique points.
+    """
+    pbc_arr = np.array(pbc, dtype=bool)
+    frac_coords = np.asarray(frac_coords, dtype=np.float64).reshape(-1, 3)
+    frac_coords = np.where(pbc_arr, np.mod(frac_coords, 1), frac_coords)
+    if len(frac_coords) == 0:
+        return np.array([], dtype=np.int_)
+    atol = np.broadcast_to(np.asarray(atol, dtype=np.float64), 3)
+
+    # Points that coincide to 10 decimals, e.g. images of special positions, always
+    # match each other, so only the first of them is hashed
+    rounded = np.round(frac_coords, 10)
+    _, first_indices = np.unique(np.where(pbc_arr, np.mod(rounded, 1), rounded), axis=0, return_index=True)
+    indices = np.sort(first_indices)
+    points = frac_coords[indices]
+
+    # The grid spans [0, 1) along periodic axes and the range of the points along
+    # the others, with at most 2^20 cells along each axis so that keys fit in 64 bits
+    origin = np.where(pbc_arr, 0, points.min(axis=0))
+    extent = np.where(pbc_arr, 1, np.ptp(points, axis=0))
+    n_cells = np.clip(np.floor(extent / (2 * np.maximum(atol, 1e-300))), 1, 2**20).astype(np.int64)
+    scaled_points = (points - origin) * (n_cells / np.where(extent > 0, extent, 1))
+    cells = np.minimum(np.floor(scaled_points).astype(np.int64), n_cells - 1)
+
+    def get_keys(cells):
+        cells %= n_cells
+        return (cells[..., 0] * n_cells[1] + cells[..., 1]) * n_cells[2] + cells[..., 2]
+
+    keys = get_keys(cells.copy())
+    # Stable sort, so that points within a cell stay in their original order
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    max_occupancy = np.unique(keys, return_counts=True)[1].max()
+
+    # All pairs of a point and an earlier point that it matches
+    directions = np.where(scaled_points - cells < 0.5, -1, 1)
+    later_list, earlier_list = [], []
+    for offset in itertools.product((0, 1), repeat=3):
+        nbr_keys = get_keys(cells + np.array(offset) * directions)
+        starts = np.searchsorted(sorted_keys, nbr_keys, side="left")
+        ends = np.searchsorted(sorted_keys, nbr_keys, side="right")
+        for slot in range(max_occupancy):
+            candidates = order[np.minimum(starts + slot, len(order) - 1)]
+            dist = points - points[candidates]
+            dist[:, pbc_arr] -= np.round(dist)[:, pbc_arr]
+            is_match = (starts + slot < ends) & (candidates < np.arange(len(points)))
+            is_match &= np.all(np.abs(dist) < atol, axis=-1)
+            later_list.append(np.flatnonzero(is_match))
+            earlier_list.append(candidates[is_match])
+    later, earlier = np.concatenate(later_list), np.concatenate(earlier_list)
+
+    # A point is unique if none of the points it matches are, which is resolved
+    # from the first point onwards: 1 for unique, -1 for not unique, 0 for unknown
+    state = np.ones(len(points), dtype=np.int8)
+    state[later] = 0
+    while np.any(state == 0):
+        matches_unique = np.bincount(later, weights=state[earlier] == 1, minlength=len(points)) > 0
+        matches_unknown = np.bincount(later, weights=state[earlier] == 0, minlength=len(points)) > 0
+        unknown = state == 0
+        state[unknown & matches_unique] = -1
+        state[unknown & ~matches_unique & ~matches_unknown] = 1
+    return indices[state == 1]
+
+
 def lattice_points_in_supercell(supercell_matrix):
     """Get the list of points on the original lattice contained in the
     supercell in fractional coordinates (with the supercell basis).
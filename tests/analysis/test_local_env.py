@@ -40,6 +40,7 @@ from pymatgen.analysis.local_env import (
     solid_angle,
 )
 from pymatgen.core import Element, Lattice, Molecule, Structure
+from pymatgen.core.structure import VerletNeighborList
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
 
 TEST_DIR = f"{TEST_FILES_DIR}/analysis/local_env/fragmenter_files"
@@ -1345,6 +1346,16 @@ class TestCutOffDictNN(MatSciTest):
         nn_null = CutOffDictNN()
         assert nn_null.get_cn(self.diamond, 0) == 0
 
+    def test_neighbor_list_cache(self):
+        nn = CutOffDictNN({("C", "C"): 2})
+        expected = [
+            sorted((info["site_index"], info["image"]) for info in infos) for infos in nn.get_all_nn_info(self.diamond)
+        ]
+        self.diamond.neighbor_list_cache = VerletNeighborList(3)
+        infos = nn.get_all_nn_info(self.diamond)
+        assert [sorted((info["site_index"], info["image"]) for info in site_infos) for site_infos in infos] == expected
+        assert self.diamond.neighbor_list_cache.n_full_builds == 1
+
     def test_from_preset(self):
         nn = CutOffDictNN.from_preset("vesta_2019")
         assert nn.get_cn(self.diamond, 0) == 4
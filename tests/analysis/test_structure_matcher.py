@@ -317,6 +317,21 @@ class TestStructureMatcher(MatSciTest):
         out = sm.group_structures(self.struct_list, anonymous=True)
         assert list(map(len, out)) == [4, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1]
 
+    def test_group_structures_ncores(self):
+        sm = StructureMatcher()
+        structures = [*self.struct_list, self.struct_list[0].copy()]
+        structures[-1].make_supercell([1, 1, 2])
+        for anonymous in (False, True):
+            groups = sm.group_structures(structures, anonymous=anonymous)
+            assert sm.group_structures(structures, anonymous=anonymous, ncores=2) == groups
+        assert list(map(len, groups)) == [5, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1]
+
+        # Without primitive cells, the supercell is not compared to the unit cell
+        sm = StructureMatcher(primitive_cell=False)
+        groups = sm.group_structures(structures)
+        assert sm.group_structures(structures, ncores=2) == groups
+        assert [structures[-1]] in groups
+
     def test_mix(self):
         structures = list(map(self.get_structure, ["Li2O", "Li2O2", "LiFePO4"]))
         structures += [Structure.from_file(f"{VASP_IN_DIR}/{fname}") for fname in ["POSCAR_Li2O", "POSCAR_LiFePO4"]]
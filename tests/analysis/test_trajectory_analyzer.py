@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from pymatgen.analysis.trajectory_analyzer import get_msd, get_rdf, get_vacf
+from pymatgen.core import Lattice, Structure
+from pymatgen.core.trajectory import Trajectory, TrajectoryStore
+from pymatgen.util.testing import VASP_OUT_DIR, MatSciTest
+
+
+def get_msd_brute_force(positions: np.ndarray) -> np.ndarray:
+    """MSD of each site by explicitly averaging over all time origins."""
+    n_frames = len(positions)
+    return np.array(
+        [
+            np.mean(np.sum((positions[lag:] - positions[: n_frames - lag]) ** 2, axis=-1), axis=0)
+            for lag in range(n_frames)
+        ]
+    )
+
+
+def get_vacf_brute_force(velocities: np.ndarray) -> np.ndarray:
+    """VACF averaged over all sites, by explicitly averaging over all time origins."""
+    n_frames = len(velocities)
+    return np.array(
+        [np.mean(np.sum(velocities[lag:] * velocities[: n_frames - lag], axis=-1)) for lag in range(n_frames)]
+    )
+
+
+class TestTrajectoryAnalyzer(MatSciTest):
+    def setup_method(self):
+        # Random walk of Li in a rigid O sublattice, crossing periodic boundaries
+        rng = np.random.default_rng(0)
+        n_frames = 50
+        steps = np.concatenate([rng.normal(scale=0.05, size=(n_frames, 2, 3)), np.zeros((n_frames, 2, 3))], axis=1)
+        start = np.array([[0, 0, 0], [0.5, 0.5, 0.5], [0.5, 0, 0], [0, 0.5, 0]])
+        self.frac_coords = start + np.cumsum(steps, axis=0)
+        self.lattice = Lattice.cubic(4).matrix
+        self.traj = Trajectory(
+            species=["Li", "Li", "O", "O"],
+            coords=np.mod(self.frac_coords, 1),
+            lattice=self.lattice,
+            time_step=2,
+        )
+
+    def test_get_msd(self):
+        msd = get_msd(self.traj)
+        assert list(msd) == ["Li", "O"]
+        assert_allclose(msd["Li"], get_msd_brute_force(self.frac_coords @ self.lattice)[:, :2].mean(axis=1), atol=1e-10)
+        assert_allclose(msd["O"], 0, atol=1e-10)
+
+        # Chunks of a single site, and trajectories in displacement mode
+        assert_allclose(get_msd(self.traj, chunk_size=1)["Li"], msd["Li"])
+        self.traj.to_displacements()
+        assert_allclose(get_msd(self.traj)["Li"], msd["Li"])
+
+    def test_get_msd_store(self):
+        traj = Trajectory.from_file(f"{VASP_OUT_DIR}/XDATCAR_traj", store=f"{self.tmp_path}/store")
+        msd = get_msd(traj, chunk_size=len(traj) * 10)
+        self.traj = Trajectory.from_file(f"{VASP_OUT_DIR}/XDATCAR_traj")
+        self.traj.to_displacements()
+        positions = np.cumsum(self.traj.coords, axis=0) @ self.traj.lattice
+        li_sites = [idx for idx, sp in enumerate(self.traj.species) if str(sp) == "Li"]
+        assert_allclose(msd["Li"], get_msd_brute_force(positions)[:, li_sites].mean(axis=1), atol=1e-10)
+
+    def test_get_vacf(self):
+        velocities = np.diff(self.frac_coords @ self.lattice, axis=0) / 2
+        vacf = get_vacf(self.traj)
+        assert len(vacf["Li"]) == 49
+        assert_allclose(vacf["Li"], get_vacf_brute_force(velocities[:, :2]), atol=1e-12)
+        assert_allclose(vacf["O"], 0)
+
+        # Velocities from site properties
+        velocities = np.random.default_rng(0).normal(size=(50, 4, 3))
+        site_props = [{"velocities": vel} for vel in velocities]
+        traj = Trajectory(self.traj.species, self.traj.coords, lattice=self.lattice, site_properties=site_props)
+        assert_allclose(get_vacf(traj)["O"], get_vacf_brute_force(velocities[:, 2:]))
+        assert get_vacf(traj, normalize=True)["Li"][0] == pytest.approx(1)
+        traj = TrajectoryStore.from_trajectory(f"{self.tmp_path}/store", traj).to_trajectory()
+        assert_allclose(get_vacf(traj, chunk_size=1)["O"], get_vacf_brute_force(velocities[:, 2:]))
+
+        self.traj.time_step = None
+        with pytest.raises(ValueError, match="time_step is required"):
+            get_vacf(self.traj)
+
+    def test_get_rdf(self):
+        struct = Structure(Lattice.cubic(3), ["Na", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]]) * 2
+        traj = Trajectory.from_structures([struct] * 3)
+        radii, rdfs = get_rdf(traj, r_max=4, n_bins=40)
+        assert list(rdfs) == [("Na", "Na"), ("Na", "Cl"), ("Cl", "Cl")]
+
+        # Integrating the RDF gives the number of neighbors
+        density = 8 / struct.volume
+        shells = 4 / 3 * np.pi * ((radii + 0.05) ** 3 - (radii - 0.05) ** 3)
+        n_cl_neighbors = np.cumsum(rdfs["Na", "Cl"] * density * shells)
+        assert n_cl_neighbors[radii < 2.7][-1] == pytest.approx(8)
+        n_na_neighbors = np.cumsum(rdfs["Na", "Na"] * (7 / struct.volume) * shells)
+        assert n_na_neighbors[radii < 3.1][-1] == pytest.approx(6)
+        assert n_na_neighbors[radii < 2.9][-1] == pytest.approx(0)
+
+        with pytest.raises(TypeError, match="only available for Structure-based"):
+            get_rdf(Trajectory(["H"], [[[0, 0, 0]]], charge=0))
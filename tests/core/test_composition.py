@@ -12,7 +12,7 @@ from numpy.testing import assert_allclose
 from pytest import approx
 
 from pymatgen.core import Composition, DummySpecies, Element, Species
-from pymatgen.core.composition import ChemicalPotential, CompositionError, reduce_formula
+from pymatgen.core.composition import ChemicalPotential, CompositionError, CompositionMatrix, reduce_formula
 from pymatgen.util.testing import MatSciTest
 
 
@@ -549,6 +549,36 @@ class TestComposition(MatSciTest):
         assert (c1 == c3) == (hash(c1) == hash(c3)), "Hash doesn't match eq when true"
         assert hash(c1) != hash(c2), "Hash equal for different chemical systems"
 
+    def test_formula_cache(self):
+        Composition.cache_clear()
+        comps = [Composition("Li3Fe2(PO4)3") for _ in range(4)]
+        info = Composition.cache_info()
+        assert (info.formula_hits, info.formula_misses, info.formula_size) == (3, 1, 1)
+        assert info.formula_hit_rate == approx(0.75)
+        assert all(comp == self.comps[0] for comp in comps)
+        # cached results must not be shared mutable state
+        Composition._parse_formula("Li3Fe2(PO4)3")["Li"] = 0
+        assert Composition("Li3Fe2(PO4)3")["Li"] == 3
+
+    def test_interned(self):
+        Composition.cache_clear()
+        comp = Composition.interned("Fe2O3")
+        assert comp is Composition.interned({"Fe": 2, "O": 3})
+        assert comp is Composition.interned(Composition("O3Fe2"))
+        assert comp == Composition("Fe2O3")
+        assert hash(comp) == hash(Composition("Fe2O3"))
+        assert "_hash" in comp.__dict__
+        negative_comp = Composition.interned("Fe2O3", allow_negative=True)
+        other_comp = Composition.interned("Fe3O4")
+        assert negative_comp is not comp
+        assert other_comp is not comp
+        info = Composition.cache_info()
+        assert (info.interned_hits, info.interned_misses, info.interned_size) == (2, 3, 3)
+        assert info.interned_hit_rate == approx(0.4)
+
+        # the cached hash is not pickled, as string hashes differ between processes
+        assert "_hash" not in self.serialize_with_pickle(comp)[0].__dict__
+
     def test_comparisons(self):
         c1 = Composition({"S": 1})
         c1_1 = Composition({"S": 1.00000000000001})
@@ -932,3 +962,58 @@ class TestChemicalPotential:
         # test nested brackets with charge
         comp = Composition("[N[Fe]2]2")
         assert str(comp) == "N2 Fe4"
+
+
+class TestCompositionMatrix:
+    def setup_method(self):
+        self.formulas = ["Li3Fe2(PO4)3", "Li4O4", "O4", "Li1.5Si0.5", "ZnOH", "Fe2O3", "NaCl"]
+        self.comps = [Composition(formula) for formula in self.formulas]
+        self.matrix = CompositionMatrix.from_formulas(self.formulas)
+
+    def test_init(self):
+        assert len(self.matrix) == len(self.formulas)
+        assert self.matrix.amounts.shape == (7, 118)
+        assert self.matrix.amounts[1, 2] == 4  # Li
+        assert not self.matrix.amounts.flags.writeable
+        assert self.matrix.elements == [Element(sym) for sym in ("H", "Li", "O", "Na", "Si", "P", "Cl", "Fe", "Zn")]
+        with pytest.raises(ValueError, match="amounts must have shape"):
+            CompositionMatrix(np.ones((2, 3)))
+        with pytest.raises(ValueError, match="Xx in formula='Xx2' is not an element"):
+            CompositionMatrix.from_formulas(["Xx2"])
+        with pytest.raises(CompositionError, match="has no column"):
+            CompositionMatrix.from_compositions([{DummySpecies("X"): 1}])
+
+    def test_conversion(self):
+        assert CompositionMatrix.from_compositions(self.comps) == self.matrix
+        assert self.matrix.to_compositions() == self.comps
+        assert self.matrix.to_formulas() == [comp.formula for comp in self.comps]
+        assert self.matrix.to_formulas(reduced=True) == [comp.reduced_formula for comp in self.comps]
+        assert self.matrix[5] == Composition("Fe2O3")
+        assert self.matrix[[0, 5]].to_formulas() == ["Li3 Fe2 P3 O12", "Fe2 O3"]
+        # oxidation states are dropped
+        assert CompositionMatrix.from_compositions([{Species("Fe", 3): 2, "O": 3}]) == self.matrix[5:6]
+        assert len(CompositionMatrix.from_formulas([])) == 0
+
+    def test_vectorized_properties(self):
+        assert_allclose(self.matrix.num_atoms, [comp.num_atoms for comp in self.comps])
+        assert_allclose(self.matrix.get_atomic_fraction("O"), [comp.get_atomic_fraction("O") for comp in self.comps])
+        assert_allclose(self.matrix.weight, [comp.weight for comp in self.comps])
+        assert_allclose(self.matrix.average_electroneg, [comp.average_electroneg for comp in self.comps])
+        assert self.matrix.fractional_composition.to_compositions() == [
+            comp.fractional_composition for comp in self.comps
+        ]
+        assert np.isnan(CompositionMatrix.from_formulas(["HeH"]).average_electroneg[0])
+
+    def test_reduced_composition(self):
+        reduced, factors = self.matrix.get_reduced_composition_and_factor()
+        expected = [comp.get_reduced_composition_and_factor() for comp in self.comps]
+        assert reduced.to_compositions() == [comp for comp, _ in expected]
+        assert_allclose(factors, [factor for _, factor in expected])
+        assert self.matrix.reduced_composition.to_formulas()[1:3] == ["Li2 O2", "O2"]
+
+    def test_chemical_systems(self):
+        assert self.matrix.chemical_systems == [comp.chemical_system for comp in self.comps]
+        groups = self.matrix.group_by_chemical_system()
+        assert list(groups["Li-O"]) == [1]
+        assert list(groups["Fe-O"]) == [5]
+        assert sum(len(indices) for indices in groups.values()) == len(self.matrix)
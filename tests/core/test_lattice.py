@@ -7,7 +7,7 @@ import pytest
 from numpy.testing import assert_allclose, assert_array_equal
 from pytest import approx
 
-from pymatgen.core.lattice import Lattice, get_points_in_spheres
+from pymatgen.core.lattice import Lattice, _get_niggli_matrix, get_points_in_spheres
 from pymatgen.core.operations import SymmOp
 from pymatgen.util.testing import MatSciTest
 
@@ -274,6 +274,28 @@ class TestLattice(MatSciTest):
         ]
         assert_allclose(lattice.get_niggli_reduced_lattice().matrix, expected, atol=1e-5)
 
+    def test_get_niggli_reduced_lattice_cache(self):
+        _get_niggli_matrix.cache_clear()
+        lattice = Lattice.from_parameters(7.365450, 6.199506, 5.353878, 75.542191, 81.181757, 156.396627)
+        reduced = lattice.get_niggli_reduced_lattice()
+        assert Lattice(lattice.matrix).get_niggli_reduced_lattice() == reduced
+        assert _get_niggli_matrix.cache_info().hits == 1
+        lattice.get_niggli_reduced_lattice(tol=1e-3)
+        assert _get_niggli_matrix.cache_info().misses == 2
+
+    def test_reduction_cache_matches_uncached(self):
+        lattices = [
+            Lattice.from_parameters(3, 3, 3, 60, 60, 60).matrix,
+            [[1, 1, 0], [0, 1, 0], [0, 0, 1]] @ Lattice.from_parameters(3, 3, 3, 60, 60, 60).matrix,
+            [1, 1, 1, -1, 0, 2, 3, 5, 6],
+            self.rhombohedral.matrix,
+            self.monoclinic.matrix,
+        ]
+        for lattice in map(Lattice, lattices):
+            for _ in range(2):
+                assert_array_equal(lattice.get_lll_reduced_lattice().matrix, lattice._calculate_lll()[0])
+                assert_array_equal(lattice.get_niggli_reduced_lattice().matrix, lattice._calculate_niggli().matrix)
+
     def test_find_mapping(self):
         matrix = [[0.1, 0.2, 0.3], [-0.1, 0.2, 0.7], [0.6, 0.9, 0.2]]
         lattice = Lattice(matrix)
@@ -32,6 +32,17 @@ class TestSymmOp(MatSciTest):
         new_coords = self.op.operate_multi([[point, point]] * 2)
         assert_allclose(new_coords, [[[-0.1339746, 2.23205081, 4.0]] * 2] * 2, 2)
 
+    def test_operate_stack(self):
+        points = np.random.default_rng(0).random((5, 3))
+        symm_ops = [self.op, self.op.inverse, SymmOp.from_xyz_str("-y, x-y, z+1/2")]
+        new_coords = SymmOp.operate_stack(symm_ops, points)
+        assert new_coords.shape == (3, 5, 3)
+        for op, op_coords in zip(symm_ops, new_coords, strict=True):
+            assert_allclose(op_coords, op.operate_multi(points))
+        affine_matrices = np.array([op.affine_matrix for op in symm_ops])
+        assert_allclose(SymmOp.operate_stack(affine_matrices, points), new_coords)
+        assert_allclose(SymmOp.operate_stack(symm_ops, points[0]), new_coords[:, 0])
+
     def test_inverse(self):
         point = np.random.default_rng().random(3)
         new_coord = self.op.operate(point)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 import math
 import pickle
 import re
@@ -7,11 +8,23 @@ from copy import deepcopy
 from enum import Enum
 
 import numpy as np
+import orjson
 import pytest
+from numpy.testing import assert_allclose
 from pytest import approx
 
-from pymatgen.core import DummySpecies, Element, Species, get_el_sp
-from pymatgen.core.periodic_table import ElementBase, ElementType
+from pymatgen.core import PKG_DIR, Composition, DummySpecies, Element, Species, get_el_sp
+from pymatgen.core.periodic_table import (
+    _PT_DATA,
+    _PT_UNIT,
+    ElementBase,
+    ElementType,
+    _PeriodicTableData,
+    _write_pt_binary,
+    get_element_properties,
+    get_element_property_table,
+    get_occupancy_matrix,
+)
 from pymatgen.core.units import Ha_to_eV
 from pymatgen.io.core import ParseError
 from pymatgen.util.testing import MatSciTest
@@ -741,3 +754,72 @@ def test_element_type():
     assert isinstance(ElementType.actinoid, Enum)
     assert isinstance(ElementType.metalloid, Enum)
     assert len(ElementType) == 18
+
+
+def test_get_element_property_table():
+    electronegs = get_element_property_table("X")
+    assert len(electronegs) == 119
+    assert electronegs[26] == Element("Fe").X
+    assert np.isnan(electronegs[0])
+    assert np.isnan(electronegs[2])  # no Pauling electronegativity for He
+    assert not electronegs.flags.writeable
+    assert get_element_property_table("atomic_radius")[8] == approx(0.6)
+    assert get_element_property_table("is_metal")[26] == 1
+    assert get_element_property_table("X") is electronegs
+
+    with pytest.raises(ValueError, match="Element has no property 'foo'"):
+        get_element_property_table("foo")
+    with pytest.raises(TypeError, match="'block' is not a numeric Element property"):
+        get_element_property_table("block")
+
+
+def test_get_element_properties():
+    species = [Composition("Fe"), Composition({"Fe2+": 0.5, "Ni": 0.5}), Composition({"He": 1}), {"X": 1}]
+    occupancies = get_occupancy_matrix(species)
+    assert occupancies.shape == (4, 119)
+    assert occupancies[1, 26] == occupancies[1, 28] == 0.5
+    assert occupancies[3, 0] == 1
+
+    props = get_element_properties(species, ["X", "group"])
+    assert_allclose(props["X"], [1.83, 1.87, np.nan, np.nan])
+    assert_allclose(props["group"], [8, 9, 18, np.nan])
+    assert_allclose(get_element_properties(occupancies, "X")["X"], props["X"])
+
+
+class TestPeriodicTableData(MatSciTest):
+    def test_matches_json(self):
+        with gzip.open(f"{PKG_DIR}/core/periodic_table.json.gz", mode="rb") as file:
+            json_data = orjson.loads(file.read())
+        assert _PT_UNIT == json_data.pop("_unit")
+        assert list(_PT_DATA) == list(json_data)
+        for sym, data in json_data.items():
+            assert _PT_DATA[sym].copy() == data
+
+        # named isotopes fall back to the data of their element
+        assert Element("D").data == {**json_data["H"], **json_data["D"]}
+        assert Element("D").electronic_structure == "1s1"
+
+    def test_lazy_columns(self):
+        table = _PeriodicTableData(f"{PKG_DIR}/core/periodic_table.bin")
+        fe_data = table["Fe"]
+        assert table._columns == {}
+        assert fe_data["Atomic no"] == 26
+        assert "X" in fe_data
+        assert fe_data.get("Valence") is None
+        assert set(table._columns) == {"Atomic no", "X"}
+        with pytest.raises(KeyError, match="Xx"):
+            table["Xx"]
+
+    def test_write_pt_binary(self):
+        data = {"_unit": {"Atomic mass": "amu"}, "H": {"Atomic no": 1, "Atomic mass": 1.008}, "He": {"Atomic no": 2}}
+        _write_pt_binary(data, f"{self.tmp_path}/pt.bin")
+        table = _PeriodicTableData(f"{self.tmp_path}/pt.bin")
+        assert table.units == {"Atomic mass": "amu"}
+        assert table.properties == ("Atomic no", "Atomic mass")
+        assert dict(table["He"]) == {"Atomic no": 2}
+        assert table.column("Atomic mass") == {"H": 1.008}
+
+        with open(f"{self.tmp_path}/bad.bin", mode="wb") as file:
+            file.write(b"\0" * 32)
+        with pytest.raises(ValueError, match="is not a binary periodic table"):
+            _PeriodicTableData(f"{self.tmp_path}/bad.bin")
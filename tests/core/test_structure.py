@@ -27,6 +27,9 @@ from pymatgen.core.structure import (
     PeriodicNeighbor,
     Structure,
     StructureError,
+    VerletNeighborList,
+    _filter_pbc_translations,
+    get_neighbor_lists,
 )
 from pymatgen.electronic_structure.core import Magmom
 from pymatgen.io.ase import AseAtomsAdaptor
@@ -587,6 +590,31 @@ class TestIStructure(MatSciTest):
         assert len(fcc_ag_prim) == 1
         assert fcc_ag_prim.volume == approx(17.10448225)
 
+    def test_filter_pbc_translations(self):
+        rng = np.random.default_rng(0)
+        tol = np.array([0.02, 0.03, 0.05])
+        groups = [rng.random((n_sites, 3)) for n_sites in (5, 30)]
+        # Translations mapping the second group onto itself, plus random ones
+        groups[1][15:] = groups[1][:15] + [0.5, 0, 1]
+        translations = np.vstack([[[0, 0, 0], [0.5, 0, 0], [0.5 + 1e-3, 0, -1]], rng.random((50, 3))])
+        for group in groups:
+            # Brute force check of all pairs of sites
+            dist = group[:, None, None, :] + translations[None, :, None, :] - group[None, None, :, :]
+            dist -= np.round(dist)
+            expected = np.all(np.any(np.all(np.abs(dist) < tol, axis=-1), axis=-1), axis=0)
+            assert_allclose(_filter_pbc_translations(translations, [group], tol), translations[expected])
+        filtered = _filter_pbc_translations(translations, groups[1:], tol)
+        assert_allclose(filtered, translations[:3])
+        assert len(_filter_pbc_translations(translations, groups, tol)) == 1
+
+    def test_primitive_on_skewed_supercell(self):
+        struct = self.get_structure("LiFePO4")
+        supercell = struct * [[1, 1, 0], [0, 2, 0], [1, 0, 2]]
+        prim = supercell.get_primitive_structure()
+        assert len(prim) == len(struct)
+        assert prim.volume == approx(struct.volume)
+        assert prim.matches(struct)
+
     def test_primitive_with_constrained_lattice(self):
         struct = Structure.from_file(f"{TEST_FILES_DIR}/core/structure/Fe310.json.gz")
         constraints = {"a": 2.83133, "b": 4.69523, "gamma": 107.54840}
@@ -713,6 +741,62 @@ Direct
             assert_allclose(cy_indices1, py_indices1)
             assert_allclose(cy_indices2, py_indices2)
             assert len(cy_offsets) == len(py_offsets)
+            for threaded, serial in zip(
+                struct.get_neighbor_list(3, n_threads=2),
+                (cy_indices1, cy_indices2, cy_offsets, cy_distances),
+                strict=True,
+            ):
+                assert_array_equal(threaded, serial)
+
+    def test_get_neighbor_lists(self):
+        structures = [self.struct, self.get_structure("LiFePO4"), self.get_structure("Li2O") * 2]
+        center_indices, points_indices, images, distances, indptr = get_neighbor_lists(structures, 3)
+        assert list(indptr) == [0, *np.cumsum([len(struct.get_neighbor_list(3)[0]) for struct in structures])]
+        for idx, struct in enumerate(structures):
+            batch_slice = slice(indptr[idx], indptr[idx + 1])
+            for batched, single in zip(
+                (center_indices, points_indices, images, distances), struct.get_neighbor_list(3), strict=True
+            ):
+                assert_array_equal(batched[batch_slice], single)
+
+    def test_verlet_neighbor_list(self):
+        def sorted_pairs(center_indices, points_indices, images, distances):
+            pairs = np.column_stack([center_indices, points_indices, np.round(images)])
+            order = np.lexsort(pairs.T[::-1])
+            return pairs[order], distances[order]
+
+        rng = np.random.default_rng(0)
+        struct = self.get_structure("Li2O") * 2
+        neighbor_list = VerletNeighborList(4, skin=0.5)
+        frac_coords = struct.frac_coords
+        for step in range(12):
+            frac_coords = frac_coords + rng.normal(scale=0.002, size=frac_coords.shape)
+            if step == 6:
+                # move one atom beyond the skin, which only rebuilds its pairs
+                frac_coords[3] += 0.05
+            struct = Structure(struct.lattice, struct.species, frac_coords, to_unit_cell=True)
+            pairs, distances = sorted_pairs(*neighbor_list.get_neighbor_list(struct.frac_coords, struct.lattice, r=3))
+            expected_pairs, expected_distances = sorted_pairs(*struct.get_neighbor_list(3))
+            assert_array_equal(pairs, expected_pairs)
+            assert_allclose(distances, expected_distances)
+        assert neighbor_list.n_full_builds == 1
+        assert neighbor_list.n_partial_builds >= 1
+        assert neighbor_list.n_reuses >= 5
+
+        expected = [sorted((nn.index, nn.image) for nn in nns) for nns in struct.get_all_neighbors(3)]
+        struct.neighbor_list_cache = neighbor_list
+        assert [sorted((nn.index, nn.image) for nn in nns) for nns in struct.get_all_neighbors(3)] == expected
+        assert (
+            sorted_pairs(*struct.get_neighbor_list(3))[0].tolist()
+            == sorted_pairs(*neighbor_list.get_neighbor_list(struct.frac_coords, struct.lattice, r=3))[0].tolist()
+        )
+        assert [
+            sorted((nn.index, nn.image) for nn in nns)
+            for nns in neighbor_list.get_all_neighbors(struct, 3, indices=[5, 2])
+        ] == [expected[5], expected[2]]
+
+        with pytest.raises(ValueError, match="exceeds the radius of the neighbor list"):
+            neighbor_list.get_neighbor_list(struct.frac_coords, struct.lattice, r=5)
 
     @pytest.mark.skip("TODO: need someone to fix this")
     @pytest.mark.skipif(not os.getenv("CI"), reason="Only run this in CI tests")
@@ -889,6 +973,17 @@ Direct
     def test_get_dist_matrix(self):
         assert_allclose(self.struct.distance_matrix, [[0.0, 2.3516318], [2.3516318, 0.0]])
 
+    def test_get_sparse_distance_matrix(self):
+        struct = self.get_structure("LiFePO4")
+        dist_mat = struct.distance_matrix
+        for r in (0.5, 2.5, 4.0):
+            sparse = struct.get_sparse_distance_matrix(r)
+            expected = np.where(dist_mat <= r, dist_mat, 0)
+            np.fill_diagonal(expected, 0)
+            assert sparse.shape == (len(struct), len(struct))
+            assert sparse.nnz == np.count_nonzero(expected)
+            assert_allclose(sparse.toarray(), expected)
+
     def test_to_from_file_and_string(self):
         for fmt in ("cif", "json", "poscar", "cssr", "pwmat"):
             struct = self.struct.to(fmt=fmt)
@@ -1026,6 +1121,14 @@ Direct
         with pytest.raises(ValueError, match="Invalid backend='42'"):
             self.struct.get_symmetry_dataset(backend="42")
 
+    def test_columnar_sites_read_only(self):
+        struct = IStructure.from_sites(self.struct, columnar=True)
+        with pytest.raises(AttributeError, match="pop"):
+            struct.sites.pop()
+        assert len(struct) == len(struct.sites) == 2
+        assert struct.sites[0] == self.struct[0]
+        assert struct[:1] == (self.struct[0],)
+
 
 class TestStructure(MatSciTest):
     def setup_method(self):
@@ -1095,6 +1198,145 @@ class TestStructure(MatSciTest):
         struct[:2] = "S"
         assert struct.formula == "Li1 S2"
 
+    def test_columnar(self):
+        struct = self.get_structure("LiFePO4")
+        struct.add_site_property("magmom", np.arange(len(struct), dtype=float))
+        columnar = Structure(
+            struct.lattice,
+            struct.species_and_occu,
+            struct.frac_coords,
+            site_properties=struct.site_properties,
+            labels=struct.labels,
+            columnar=True,
+        )
+        assert columnar.is_columnar
+        assert not struct.is_columnar
+        assert not columnar._sites.is_materialized
+        assert columnar.composition == struct.composition
+        assert columnar.species == struct.species
+        assert columnar.site_properties == struct.site_properties
+        assert columnar.labels == struct.labels
+        assert_allclose(columnar.cart_coords, struct.cart_coords)
+        assert not columnar._sites.is_materialized
+
+        # bulk operations stay on the arrays and agree with the site-by-site path
+        for scaling_matrix in (2, [[1, 1, 0], [0, 1, 0], [0, 0, 2]]):
+            supercell = columnar * scaling_matrix
+            assert supercell.is_columnar
+            assert_allclose(supercell.frac_coords, (struct * scaling_matrix).frac_coords)
+            assert supercell.site_properties == (struct * scaling_matrix).site_properties
+        symm_op = SymmOp.from_axis_angle_and_translation([0, 0, 1], 30, translation_vec=[0.1, 0.2, 0.3])
+        for fractional in (False, True):
+            expected = struct.copy().apply_operation(symm_op, fractional=fractional)
+            actual = columnar.copy().apply_operation(symm_op, fractional=fractional)
+            assert actual.lattice == expected.lattice
+            assert_allclose(actual.frac_coords, expected.frac_coords)
+        for frac_coords in (False, True):
+            expected = struct.copy().translate_sites([0, 2, 3], [0.5, 0.5, 0.5], frac_coords=frac_coords)
+            actual = columnar.copy().translate_sites([0, 2, 3], [0.5, 0.5, 0.5], frac_coords=frac_coords)
+            assert_allclose(actual.frac_coords, expected.frac_coords)
+        assert_allclose(
+            columnar.copy().perturb(0.1, seed=42).frac_coords, struct.copy().perturb(0.1, seed=42).frac_coords
+        )
+        assert not columnar._sites.is_materialized
+
+        # changes made through materialized sites are synced back to the arrays
+        for struc in (struct, columnar):
+            struc[0].frac_coords = [0.1, 0.1, 0.1]
+            struc[1].properties["magmom"] = 7
+            struc[2] = "Mn"
+            del struc[3]
+            struc.append("Na", [0.2, 0.2, 0.2])
+            struc.sort()
+            struc.make_supercell([1, 2, 1])
+        assert not columnar._sites.is_materialized
+        assert columnar == struct
+        assert columnar.composition == struct.composition
+        assert columnar.site_properties == struct.site_properties
+        assert columnar.labels == struct.labels
+        assert_allclose(columnar.frac_coords, struct.frac_coords)
+
+    def test_get_element_properties(self):
+        struct = self.get_structure("LiFePO4")
+        struct.replace(0, {"Li": 0.5, "Na": 0.25})
+        props = struct.get_element_properties(["X", "atomic_mass", "row"])
+        for idx, site in enumerate(struct):
+            assert props["atomic_mass"][idx] == approx(
+                sum(el.atomic_mass * occu for el, occu in site.species.items()) / site.species.num_atoms
+            )
+        assert props["X"][0] == approx((0.5 * 0.98 + 0.25 * 0.93) / 0.75)
+        assert list(props["row"][4:8]) == [4] * 4
+
+        columnar = Structure.from_sites(struct, columnar=True)
+        for prop, values in columnar.get_element_properties(["X", "atomic_mass", "row"]).items():
+            assert_allclose(values, props[prop])
+        assert not columnar._sites.is_materialized
+
+        columnar[0].species = "Cu"
+        assert columnar.get_element_properties(["atomic_mass"])["atomic_mass"][0] == approx(Element.Cu.atomic_mass)
+
+    def test_columnar_copy_on_write(self):
+        struct = self.get_structure("LiFePO4")
+        struct.add_site_property("magmom", np.arange(len(struct), dtype=float))
+        orig = Structure.from_sites(struct, columnar=True)
+        expected = orig.copy()
+        copy = orig.copy()
+        assert np.shares_memory(copy._sites._frac_coords, orig._sites._frac_coords)
+        assert np.shares_memory(copy._sites.species_indices, orig._sites.species_indices)
+
+        copy[0].frac_coords = [0.1, 0.1, 0.1]
+        copy[1].properties["magmom"] = 7
+        copy[2] = "Mn"
+        copy.translate_sites([3], [0.5, 0, 0])
+        copy.add_site_property("charge", [1] * len(copy))
+        assert not np.shares_memory(copy._sites._frac_coords, orig._sites._frac_coords)
+        assert orig == expected
+        assert orig.site_properties == expected.site_properties
+        assert_allclose(orig.frac_coords, expected.frac_coords)
+        assert copy[2].species_string == "Mn"
+        assert copy[1].properties["magmom"] == 7
+
+        # materialized sites of the original can still be changed after copying
+        orig[0].frac_coords = [0.3, 0.3, 0.3]
+        copy = orig.copy()
+        orig[0].frac_coords = [0.4, 0.4, 0.4]
+        assert_allclose(copy[0].frac_coords, [0.3, 0.3, 0.3])
+        assert_allclose(orig.frac_coords[0], [0.4, 0.4, 0.4])
+
+    def test_columnar_site_properties(self):
+        for columnar in (False, True):
+            struct = Structure(
+                self.struct.lattice,
+                self.struct.species,
+                self.struct.frac_coords,
+                site_properties={"magmom": [1, 2]},
+                columnar=columnar,
+            )
+            struct.remove_site_property("magmom")
+            assert struct.site_properties == struct.copy().site_properties == {}
+            struct.add_site_property("charge", [1, 2])
+            assert struct[0].properties == {"charge": 1}
+            assert struct.copy().site_properties == {"charge": [1, 2]}
+            for site in struct:
+                del site.properties["charge"]
+            assert struct.site_properties == struct.copy().site_properties == {}
+            with pytest.raises(KeyError, match="charge"):
+                struct.remove_site_property("charge")
+
+    def test_columnar_sync_changed_rows(self):
+        struct = Structure.from_sites(self.get_structure("LiFePO4"), columnar=True)
+        for _site in struct:
+            pass
+        assert struct._sites._get_changed_rows() == []
+        struct[3].frac_coords[0] = 0.5
+        struct[5].properties["magmom"] = 1
+        struct[6].species = "Mn"
+        assert struct._sites._get_changed_rows() == [3, 5, 6]
+        assert struct.frac_coords[3][0] == 0.5
+        assert struct._sites._get_changed_rows() == []
+        assert struct.site_properties["magmom"][5] == 1
+        assert struct[6].species_string == "Mn"
+
     def test_not_hashable(self):
         with pytest.raises(TypeError, match="unhashable type: 'Structure'"):
             _ = {self.struct: 1}
@@ -1552,6 +1794,21 @@ class TestStructure(MatSciTest):
         assert len(self.struct) == orig_len
         assert len(supercell) == 2 * orig_len
 
+    def test_make_supercell_columnar(self):
+        struct = self.struct.copy(site_properties={"magmom": [1, -1]})
+        scaling_matrix = [[1, 1, 0], [0, 2, 0], [0, 0, 3]]
+        expected = struct.make_supercell(scaling_matrix, in_place=False)
+        supercell = struct.make_supercell(scaling_matrix, in_place=False, columnar=True)
+        assert supercell.is_columnar
+        assert not expected.is_columnar
+        assert not supercell._sites.is_materialized
+        assert supercell.lattice == expected.lattice
+        assert_allclose(supercell.frac_coords, expected.frac_coords)
+        assert supercell.site_properties == expected.site_properties == {"magmom": [1] * 6 + [-1] * 6}
+        assert supercell.labels == expected.labels
+        assert list(supercell) == list(expected)
+        assert all(type(site.properties) is dict for site in [*expected, *(struct * 2)])
+
     def test_make_supercell_labeled(self):
         struct = self.labeled_structure.copy()
         struct.make_supercell([1, 1, 2])
@@ -2249,6 +2506,43 @@ Site: H (-0.5134, 0.8892, -0.3630)"""
         nn = self.mol.get_neighbors(self.mol[0], 2)
         assert len(nn) == 4
 
+        # the cached KD-tree follows changes to the sites
+        mol = self.mol.copy()
+        assert len(mol.get_sites_in_sphere([0, 0, 1], 0.2)) == 1
+        mol[1].coords = [0, 0, 3]
+        assert len(mol.get_sites_in_sphere([0, 0, 1], 0.2)) == 0
+        mol.translate_sites([2], [-1.026719, 0, 1.363])
+        assert [nn.index for nn in mol.get_sites_in_sphere([0, 0, 1], 0.2)] == [2]
+        # the tree is reused while the coordinates are unchanged
+        index = mol._spatial_index
+        mol.get_sites_in_sphere([0, 0, 1], 0.2)
+        assert mol._spatial_index is index
+        mol[2].coords[:] = [0, 0, 0.3]
+        assert [nn.index for nn in mol.get_sites_in_sphere([0, 0, 0.3], 0.1)] == [2]
+        mol.append("H", [0, 0, 1.1])
+        assert [nn.index for nn in mol.get_sites_in_sphere([0, 0, 1], 0.2)] == [5]
+
+    def test_get_neighbor_list(self):
+        center_indices, points_indices, offsets, distances = self.mol.get_neighbor_list(1.5)
+        assert len(center_indices) == 8
+        assert_array_equal(offsets, np.zeros((8, 3)))
+        assert_allclose(distances, self.mol.distance_matrix[center_indices, points_indices])
+        assert set(zip(center_indices.tolist(), points_indices.tolist(), strict=True)) == {
+            *((0, idx) for idx in range(1, 5)),
+            *((idx, 0) for idx in range(1, 5)),
+        }
+        center_indices, *_ = self.mol.get_neighbor_list(1.5, sites=[self.mol[1]], exclude_self=False)
+        assert_array_equal(center_indices, [0, 0])
+
+    def test_get_all_neighbors(self):
+        all_nn = self.mol.get_all_neighbors(2)
+        assert len(all_nn) == len(self.mol)
+        for idx, nns in enumerate(all_nn):
+            expected = self.mol.get_neighbors(self.mol[idx], 2)
+            assert [nn.index for nn in nns] == [nn.index for nn in expected]
+            assert [nn.nn_distance for nn in nns] == approx([nn.nn_distance for nn in expected])
+        assert [len(nns) for nns in self.mol.get_all_neighbors(1.5)] == [4, 1, 1, 1, 1]
+
     def test_get_neighbors_in_shell(self):
         nn = self.mol.get_neighbors_in_shell([0, 0, 0], 0, 1)
         assert len(nn) == 1
@@ -2271,6 +2565,13 @@ Site: H (-0.5134, 0.8892, -0.3630)"""
             ],
         )
 
+    def test_get_sparse_distance_matrix(self):
+        sparse = self.mol.get_sparse_distance_matrix(1.5)
+        expected = np.where(self.mol.distance_matrix <= 1.5, self.mol.distance_matrix, 0)
+        assert sparse.nnz == 8
+        assert_allclose(sparse.toarray(), expected)
+        assert_allclose(self.mol.get_sparse_distance_matrix(2).toarray(), self.mol.distance_matrix)
+
     def test_get_zmatrix(self):
         mol = IMolecule(["C", "H", "H", "H", "H"], self.coords)
         z_matrix = """C
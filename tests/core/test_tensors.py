@@ -279,6 +279,18 @@ class TestTensor(MatSciTest):
         reconstructed = sorted(reconstructed, key=np.argmax)
         assert_allclose(list(reconstructed), np.eye(6) * 0.01)
 
+        # Many tensors, with symmetrically equivalent tensors and duplicates
+        rng = np.random.default_rng(0)
+        tbs = [Tensor.from_voigt(row) for row in np.round(rng.random((20, 6)), 1) * 0.01]
+        symm_ops = SpacegroupAnalyzer(self.get_structure("Sn")).get_symmetry_operations(cartesian=True)
+        tbs += [tensor.transform(symm_op) for tensor, symm_op in zip(tbs, symm_ops[1::2], strict=False)]
+        reduced = symmetry_reduce(tbs * 2, self.get_structure("Sn"))
+        assert len(reduced) == 20
+        for unique, symm_ops in reduced.items():
+            for symm_op in symm_ops:
+                assert any(np.allclose(unique.transform(symm_op), tensor, atol=1e-8) for tensor in tbs)
+        assert sum(map(len, reduced.values())) == len(tbs) * 2 - 20
+
     def test_tensor_mapping(self):
         # Test get
         tbs = [Tensor.from_voigt(row) for row in np.eye(6) * 0.01]
@@ -457,6 +469,25 @@ class TestTensorCollection(MatSciTest):
         for t_input, tensor in zip(tc_input, tc, strict=True):
             assert_allclose(Tensor.from_voigt(t_input), tensor)
 
+    def test_stack(self):
+        assert self.seq_tc.stack.shape == (4, 3, 3, 3)
+        assert self.diff_rank.stack is None
+        for idx, tensor in enumerate(self.seq_tc):
+            assert isinstance(tensor, Tensor)
+            assert tensor.rank == 3
+            assert np.shares_memory(tensor, self.seq_tc.stack[idx])
+
+        # Batched operations match those of the individual tensors
+        tc = TensorCollection(np.random.default_rng(0).random((5, 3, 3, 3, 3))).voigt_symmetrized
+        for attribute in ("voigt", "symmetrized", "zeroed"):
+            self.list_based_function_check(attribute, tc)
+        fit = tc.fit_to_structure(self.struct)
+        assert fit.is_fit_to_structure(self.struct)
+        assert not tc.is_fit_to_structure(self.struct)
+        for tensor, tensor_fit in zip(tc, fit, strict=True):
+            assert_allclose(tensor.fit_to_structure(self.struct), tensor_fit)
+        assert_allclose(TensorCollection.from_voigt(tc.voigt).stack, tc.stack)
+
     def test_serialization(self):
         # Test base serialize-deserialize
         dct = self.seq_tc.as_dict()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 import re
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -9,7 +10,7 @@ from numpy.testing import assert_allclose
 
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.structure import Molecule, Structure
-from pymatgen.core.trajectory import Trajectory
+from pymatgen.core.trajectory import SitePropertyColumns, Trajectory, TrajectoryStore
 from pymatgen.io.qchem.outputs import QCOutput
 from pymatgen.io.vasp.outputs import Xdatcar
 from pymatgen.util.testing import TEST_FILES_DIR, VASP_IN_DIR, VASP_OUT_DIR, MatSciTest
@@ -381,6 +382,48 @@ class TestTrajectory(MatSciTest):
         expected_site_props = None
         assert traj_combined.site_properties == expected_site_props
 
+    def test_append_frame(self):
+        lattice, species, coords = self._get_lattice_species_and_coords()
+        props = [{"magmom": [idx, -idx]} for idx in range(3)]
+        traj = Trajectory(lattice=lattice, species=species, coords=coords[:1], site_properties=props[:1])
+        for idx in (1, 2):
+            traj.append_frame(coords[idx], lattice, site_properties=props[idx], frame_properties={"energy": -idx})
+
+        assert len(traj) == 3
+        assert_allclose(traj.coords, coords)
+        assert traj.constant_lattice
+        assert isinstance(traj.site_properties, SitePropertyColumns)
+        assert traj.site_properties == props
+        assert traj.frame_properties == [None, {"energy": -1}, {"energy": -2}]
+        assert traj[2] == Structure(lattice, species, coords[2], site_properties=props[2], properties={"energy": -2})
+
+        # Appending frames doubles the capacity of the buffers rather than copying
+        for _ in range(10):
+            traj.append_frame(coords[0], lattice, site_properties=props[0])
+        assert len(traj) == 13
+        assert len(traj._coords._data) == 16
+
+        # A frame with a different lattice makes the lattice variable
+        traj.append_frame(coords[0], np.multiply(lattice, 2))
+        assert not traj.constant_lattice
+        assert traj.lattice.shape == (14, 3, 3)
+        assert_allclose(traj.lattice[-1], np.multiply(lattice, 2))
+        assert traj.site_properties[-1] is None
+
+        with pytest.raises(ValueError, match="lattice must be given if and only if"):
+            traj.append_frame(coords[0])
+
+    def test_extend_in_place(self):
+        lattice, species, coords = self._get_lattice_species_and_coords()
+        props = [{"magmom": [5, 5], "charge": [None, 1]}] * 3
+        traj = Trajectory(lattice=lattice, species=species, coords=coords, site_properties=props)
+        traj.extend(traj)
+
+        # Object arrays are not stored as columns, and the input list is copied
+        assert isinstance(traj.site_properties, list)
+        assert traj.site_properties == props * 2
+        assert len(props) == 3
+
     def test_extend_frame_props(self):
         lattice, species, coords = self._get_lattice_species_and_coords()
 
@@ -436,6 +479,14 @@ class TestTrajectory(MatSciTest):
 
         assert_allclose(traj.coords, displacements)
 
+    def test_get_neighbor_lists(self):
+        for neighbor_list, struct in zip(self.traj.get_neighbor_lists(3, skin=0.5), self.traj, strict=True):
+            for result, expected in zip(neighbor_list, struct.get_neighbor_list(3), strict=True):
+                assert sorted(np.round(result, 6).tolist()) == sorted(np.round(expected, 6).tolist())
+
+        with pytest.raises(TypeError, match="only available for Structure-based Trajectory"):
+            next(self.traj_mols.get_neighbor_lists(3))
+
     def test_variable_lattice(self):
         structure = self.structures[0]
 
@@ -501,6 +552,81 @@ class TestTrajectory(MatSciTest):
             ):
                 Trajectory.from_file(f"{TEST_DIR}/LiMnO2_chgnet_relax.traj")
 
+    def test_store(self):
+        store_dir = f"{self.tmp_path}/store"
+        traj = Trajectory.from_file(f"{VASP_OUT_DIR}/XDATCAR_traj", store=store_dir)
+        assert len(traj) == len(self.traj) == 100
+        assert not traj.coords.flags.writeable  # read-only memory map
+        assert traj[5] == self.traj[5]
+        assert all(frame1 == frame2 for frame1, frame2 in zip(traj[90:], self.traj[90:], strict=True))
+
+        with pytest.raises(FileExistsError, match="already contains a trajectory store"):
+            TrajectoryStore.from_trajectory(store_dir, self.traj)
+
+        # Appending streams frames into the existing store
+        with TrajectoryStore(store_dir, chunk_size=2) as store:
+            store.extend(self.traj[:3])
+            assert len(store) == 103
+        assert len(TrajectoryStore(store_dir).to_trajectory()) == 103
+
+        # Frames of an interrupted flush are discarded on opening
+        with open(f"{store_dir}/coords.bin", mode="ab") as file:
+            file.write(b"\0" * 100)
+        assert TrajectoryStore(store_dir).coords.shape == (103, 76, 3)
+
+        # Including the frame properties of an interrupted flush
+        prop_dir = f"{self.tmp_path}/prop_store"
+        structures = [self.traj[idx].copy(properties={"energy": -idx}) for idx in range(4)]
+        TrajectoryStore.from_structures(prop_dir, structures[:2])
+        store = TrajectoryStore(prop_dir)
+        store.append_structure(structures[2])
+        with (
+            patch("pymatgen.core.trajectory.dumpfn", side_effect=OSError("interrupted")),
+            pytest.raises(OSError, match="interrupted"),
+        ):
+            store.flush()
+        store = TrajectoryStore(prop_dir)
+        store.append_structure(structures[3])
+        assert store.frame_properties[:] == [{"energy": 0}, {"energy": -1}, {"energy": -3}]
+
+        traj = TrajectoryStore.from_trajectory(f"{self.tmp_path}/mol_store", self.traj_mols).to_trajectory()
+        assert traj.lattice is None
+        assert traj[-1] == self.traj_mols[-1]
+
+    def test_store_properties(self):
+        lattice, species, coords = self._get_lattice_species_and_coords()
+        structures = [
+            Structure(
+                Lattice(np.multiply(lattice, 1 + idx / 10)),
+                species,
+                coords[idx],
+                site_properties={"magmom": [idx, -idx]},
+                properties={"energy": -idx},
+            )
+            for idx in range(len(coords))
+        ]
+        store = TrajectoryStore.from_structures(f"{self.tmp_path}/store", structures, constant_lattice=False)
+        traj = store.to_trajectory()
+
+        assert isinstance(traj.site_properties, SitePropertyColumns)
+        assert_allclose(traj.site_properties[2]["magmom"], [2, -2])
+        assert traj.frame_properties[1:] == [{"energy": -1}, {"energy": -2}]
+        assert traj[2].lattice == structures[2].lattice
+        assert traj[2].properties == {"energy": -2}
+
+        sub_traj = traj[[0, 2]]
+        assert isinstance(sub_traj.site_properties, SitePropertyColumns)
+        assert_allclose(sub_traj.site_properties[1]["magmom"], [2, -2])
+
+        dct = traj.as_dict()
+        assert_allclose(dct["site_properties"][1]["magmom"], [1, -1])
+        assert Trajectory.from_dict(dct)[1] == traj[1]
+
+        with pytest.raises(ValueError, match="do not match those of the trajectory store"):
+            store.append(coords[0], lattice, site_properties={"charge": [0, 0]})
+        with pytest.raises(ValueError, match="lattice must be provided for each frame"):
+            store.append(coords[0])
+
     def test_index_error(self):
         with pytest.raises(IndexError, match="index=100 out of range, trajectory only has 100 frames"):
             self.traj[100]
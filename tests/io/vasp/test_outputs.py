@@ -1874,6 +1874,7 @@ class TestXdatcar:
         filepath = f"{VASP_OUT_DIR}/XDATCAR_6"
         xdatcar = Xdatcar(filepath)
         structures = xdatcar.structures
+        assert list(Xdatcar.iter_structures(filepath, ionicstep_start=2)) == structures[1:]
 
         assert structures[0].lattice != structures[-1].lattice
 
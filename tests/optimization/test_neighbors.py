@@ -3,7 +3,7 @@ from __future__ import annotations
 import numpy as np
 
 from pymatgen.core.lattice import Lattice
-from pymatgen.optimization.neighbors import find_points_in_spheres
+from pymatgen.optimization.neighbors import find_points_in_spheres, find_points_in_spheres_batch
 from pymatgen.util.testing import MatSciTest
 
 
@@ -61,3 +61,43 @@ class TestNeighbors(MatSciTest):
             lattice=np.array(lattice.matrix),
         )
         assert len(nns[0]) == 4
+
+    def test_points_in_spheres_batch(self):
+        rng = np.random.default_rng(0)
+        lattices = list(self.families.values())
+        all_coords = [lattice.get_cartesian_coords(rng.random((n_pts, 3))) for n_pts, lattice in enumerate(lattices, 1)]
+        pbcs = [[1, 1, 1], [1, 0, 1], [0, 0, 0], [1, 1, 1], [0, 1, 1], [1, 1, 1]]
+        indptr = np.cumsum([0, *map(len, all_coords)])
+        coords = np.concatenate(all_coords)
+        for r in (0.5, 6.0):
+            *batch, pair_indptr = find_points_in_spheres_batch(
+                coords,
+                indptr,
+                coords,
+                indptr,
+                r=r,
+                pbc=np.array(pbcs, dtype=np.int64),
+                lattices=np.array([lattice.matrix for lattice in lattices]),
+            )
+            assert len(pair_indptr) == len(lattices) + 1
+            for idx, (lattice, pbc, cart_coords) in enumerate(zip(lattices, pbcs, all_coords, strict=True)):
+                single = find_points_in_spheres(
+                    cart_coords, cart_coords, r=r, pbc=np.array(pbc, dtype=np.int64), lattice=lattice.matrix
+                )
+                for batched, expected in zip(batch, single, strict=True):
+                    np.testing.assert_array_equal(batched[pair_indptr[idx] : pair_indptr[idx + 1]], expected)
+
+    def test_points_in_spheres_n_threads(self):
+        rng = np.random.default_rng(0)
+        lattice = Lattice.from_parameters(12.1, 13.4, 11.2, 85, 97, 110)
+        all_coords = lattice.get_cartesian_coords(rng.random((500, 3)))
+        center_coords = all_coords[::3].copy()
+        for r, pbc in [(0.5, [1, 1, 1]), (4.0, [1, 1, 1]), (4.0, [1, 0, 1])]:
+            pbc = np.array(pbc, dtype=np.int64)
+            serial = find_points_in_spheres(all_coords, center_coords, r=r, pbc=pbc, lattice=lattice.matrix)
+            for n_threads in (2, 4, 0):
+                parallel = find_points_in_spheres(
+                    all_coords, center_coords, r=r, pbc=pbc, lattice=lattice.matrix, n_threads=n_threads
+                )
+                for result, expected in zip(parallel, serial, strict=True):
+                    np.testing.assert_array_equal(result, expected)
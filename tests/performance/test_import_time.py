@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
 import time
 import warnings
 from typing import TYPE_CHECKING
@@ -28,9 +29,6 @@ from pymatgen.util.testing import TEST_FILES_DIR
 if TYPE_CHECKING:
     from typing import Literal
 
-if not os.getenv("CI"):
-    pytest.skip("ref time only comparable in CI runner", allow_module_level=True)
-
 # NOTE: Toggle this to generate reference import time
 GEN_REF_TIME: bool = False
 
@@ -54,17 +52,43 @@ MODULES_TO_TEST: tuple[str, ...] = (
     "from pymatgen.core.xcfunc import XcFunc",
 )
 
+# Heavy modules that must not be loaded as a side effect of each import command,
+# i.e. they should only be imported lazily when the functionality is used
+LAZY_MODULES: dict[str, tuple[str, ...]] = {
+    "from pymatgen.core import Structure": (
+        "matplotlib",
+        "scipy.cluster",
+        "scipy.spatial",
+        "spglib",
+        "pymatgen.symmetry.groups",
+    ),
+    "from pymatgen.io.vasp import Poscar": ("matplotlib", "spglib", "pymatgen.io.vasp.outputs"),
+    "from pymatgen.io.cif import CifParser": ("matplotlib", "spglib"),
+    "import pymatgen.cli.pmg": ("matplotlib", "spglib", "pymatgen.io.vasp.outputs"),
+}
+
 # Get runner OS and reference file
 RUNNER_OS: Literal["linux", "windows", "macos"] = os.getenv("RUNNER_OS", "").lower()  # type: ignore[assignment]
-assert RUNNER_OS in {"linux", "windows", "macos"}
-
-# Skip test on macOS due to inconsistent import time results
-if RUNNER_OS == "macos":
-    pytest.skip("Import time measurements are unstable on macOS", allow_module_level=True)
 
 REF_FILE: str = f"{TEST_FILES_DIR}/performance/import_time_{RUNNER_OS}.json"
 
+# Reference times are only comparable in the CI runners, and are unstable on macOS
+ci_only = pytest.mark.skipif(
+    not os.getenv("CI") or RUNNER_OS not in {"linux", "windows"},
+    reason="ref time only comparable in Linux and Windows CI runners",
+)
+
+
+@pytest.mark.parametrize("module_import_cmd", LAZY_MODULES)
+def test_lazy_imports(module_import_cmd: str) -> None:
+    """Heavy dependencies should not be imported until they are needed."""
+    lazy_modules = LAZY_MODULES[module_import_cmd]
+    code = f"import sys; {module_import_cmd}; print(*[mod for mod in {lazy_modules!r} if mod in sys.modules])"
+    result = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    assert result.stdout.split() == [], f"{module_import_cmd} eagerly imports {result.stdout.strip()}"
+
 
+@ci_only
 @pytest.mark.skipif(not GEN_REF_TIME, reason="Set GEN_REF_TIME to generate reference import time.")
 def test_get_ref_import_time() -> None:
     """A dummy test that would always fail, used to generate copyable reference time."""
@@ -79,6 +103,7 @@ def test_get_ref_import_time() -> None:
     pytest.fail("Reference import times generated. Copy from output to update JSON file.")
 
 
+@ci_only
 @pytest.mark.skipif(GEN_REF_TIME, reason="Generating reference import time.")
 def test_import_time(grace_percent: float = 0.5, hard_percent: float = 1.0) -> None:
     """Test the import time of core modules to avoid performance regression.
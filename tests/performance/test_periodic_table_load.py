@@ -0,0 +1,83 @@
+"""
+Compare loading the binary periodic table used at import time with parsing
+the whole gzipped JSON it is generated from.
+
+The binary table is memory-mapped and only the properties needed to build
+the Element enum are decoded, so it should need less time and far less
+Python heap than the JSON.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+
+from pymatgen.core import PKG_DIR
+from pymatgen.core.periodic_table import _PeriodicTableData
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+JSON_FILE: str = f"{PKG_DIR}/core/periodic_table.json.gz"
+BINARY_FILE: str = f"{PKG_DIR}/core/periodic_table.bin"
+
+# Properties read by Element.__init__ for every element
+ENUM_PROPERTIES: tuple[str, ...] = ("Atomic no", "Atomic mass", "Atomic mass no", "Name", "Atomic radius")
+
+# Timings and heap usage are only comparable in the CI runners, see test_import_time
+ci_only = pytest.mark.skipif(
+    not os.getenv("CI") or os.getenv("RUNNER_OS", "").lower() not in {"linux", "windows"},
+    reason="load time and memory only comparable in Linux and Windows CI runners",
+)
+
+
+def _load_json() -> dict:
+    with gzip.open(JSON_FILE, mode="rb") as file:
+        return orjson.loads(file.read())
+
+
+def _load_binary() -> _PeriodicTableData:
+    table = _PeriodicTableData(BINARY_FILE)
+    for prop in ENUM_PROPERTIES:
+        table.column(prop)
+    return table
+
+
+def _best_time_in_ms(func: Callable, count: int = 20) -> float:
+    best = float("inf")
+    for _ in range(count):
+        start = time.perf_counter_ns()
+        func()
+        best = min(best, time.perf_counter_ns() - start)
+    return best / 1e6
+
+
+def _peak_memory_in_kb(func: Callable) -> float:
+    tracemalloc.start()
+    try:
+        _result = func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+@ci_only
+def test_load_time() -> None:
+    json_time = _best_time_in_ms(_load_json)
+    binary_time = _best_time_in_ms(_load_binary)
+
+    assert binary_time < json_time, f"JSON {json_time:.2f} ms, binary {binary_time:.2f} ms"
+
+
+@ci_only
+def test_load_memory() -> None:
+    json_peak = _peak_memory_in_kb(_load_json)
+    binary_peak = _peak_memory_in_kb(_load_binary)
+
+    assert binary_peak < json_peak / 4, f"JSON {json_peak:.0f} kB, binary {binary_peak:.0f} kB"
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+from pymatgen.symmetry.batch import get_symmetry_results
+from pymatgen.util.testing import MatSciTest
+
+
+class TestGetSymmetryResults(MatSciTest):
+    def setup_method(self):
+        self.structures = [self.get_structure(name) for name in ("Si", "LiFePO4", "Graphite", "CsCl", "TiO2")]
+
+    def test_serial(self):
+        results = list(get_symmetry_results(iter(self.structures), standard_structure="primitive"))
+        assert len(results) == len(self.structures)
+        for struct, result in zip(self.structures, results, strict=True):
+            sga = SpacegroupAnalyzer(struct)
+            dataset = sga.get_symmetry_dataset()
+            assert result.number == sga.get_space_group_number()
+            assert result.international == sga.get_space_group_symbol()
+            assert result.wyckoffs == list(dataset.wyckoffs)
+            assert_allclose(result.equivalent_atoms, dataset.equivalent_atoms)
+            assert_allclose(result.transformation_matrix, dataset.transformation_matrix)
+            assert result.standard_structure == sga.get_primitive_standard_structure()
+
+    def test_ncores(self):
+        structures = self.structures * 3
+        serial = list(get_symmetry_results(structures, symprec=0.1))
+        parallel = list(get_symmetry_results(structures, symprec=0.1, ncores=2, chunksize=2))
+        assert [result.number for result in parallel] == [result.number for result in serial]
+        for result, expected in zip(parallel, serial, strict=True):
+            assert result.wyckoffs == expected.wyckoffs
+            assert_allclose(result.origin_shift, expected.origin_shift)
+            assert result.standard_structure is None
+
+    def test_bounded_submission(self):
+        n_read = 0
+
+        def read_structures():
+            nonlocal n_read
+            for struct in self.structures * 20:
+                n_read += 1
+                yield struct
+
+        results = get_symmetry_results(read_structures(), ncores=2, chunksize=1)
+        assert next(results).number == 227
+        time.sleep(0.5)
+        # 4 * ncores * chunksize structures in flight, and one waiting to be submitted
+        assert n_read <= 10
+        results.close()
+        assert len(list(get_symmetry_results(read_structures(), ncores=2, chunksize=3))) == 100
+
+    @pytest.mark.parametrize("backend", ["spglib", "moyopy"])
+    def test_undetermined(self, backend):
+        if backend == "moyopy":
+            pytest.importorskip("moyopy")
+        struct = self.get_structure("Si").copy()
+        struct.append("Si", struct[0].frac_coords + 1e-6)
+        assert list(get_symmetry_results([struct], backend=backend)) == [None]
+        assert list(get_symmetry_results([struct] * 3, backend=backend, ncores=2)) == [None] * 3
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Invalid backend="):
+            next(get_symmetry_results(self.structures, backend="other"))
+        with pytest.raises(ValueError, match="only available with the spglib backend"):
+            next(get_symmetry_results(self.structures, backend="moyopy", standard_structure="conventional"))
+
+    def test_moyopy(self):
+        pytest.importorskip("moyopy")
+        for result in get_symmetry_results(self.structures, backend="moyopy"):
+            assert np.asarray(result.equivalent_atoms).ndim == 1
+        results = get_symmetry_results(self.structures, backend="moyopy")
+        assert [result.number for result in results] == [
+            SpacegroupAnalyzer(struct).get_space_group_number() for struct in self.structures
+        ]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pickle
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer, _get_symmetry_dataset
+from pymatgen.symmetry.cache import SymmetryDatasetCache, get_symmetry_cache, set_symmetry_cache
+from pymatgen.util.testing import MatSciTest
+
+
+class TestSymmetryDatasetCache(MatSciTest):
+    def test_get_key(self):
+        cache = SymmetryDatasetCache(self.tmp_path, max_size=2)
+        lattice, positions, numbers = np.eye(3), [[0, 0, 0], [0.5, 0.5, 0.5]], [1, 2]
+        key = cache.get_key(lattice, positions, numbers, symprec=0.01)
+        assert key == cache.get_key(lattice.tolist(), np.array(positions), (1, 2), symprec=0.01)
+        assert key != cache.get_key(lattice, positions, numbers, symprec=0.1)
+        assert key != cache.get_key(lattice, positions, [2, 1], symprec=0.01)
+        assert key != cache.get_key(lattice, positions, numbers, [1, -1], symprec=0.01)
+        assert key != cache.get_key(lattice, positions, numbers, [[0, 0, 1], [0, 0, -1]], symprec=0.01)
+
+    def test_get_set(self):
+        cache = SymmetryDatasetCache(self.tmp_path, max_size=2)
+        assert cache.get("a") is None
+        cache.set("a", {"number": 225})
+        assert cache.get("a") == {"number": 225}
+        assert len(cache) == 1
+
+        # Another instance and an unpickled instance share the database
+        assert SymmetryDatasetCache(self.tmp_path).get("a") == {"number": 225}
+        assert pickle.loads(pickle.dumps(cache)).get("a") == {"number": 225}  # noqa: S301
+
+        # Datasets that cannot be pickled are not cached
+        cache.set("b", lambda: None)
+        assert cache.get("b") is None
+
+        cache.clear()
+        assert len(cache) == 0
+
+    @mock.patch("pymatgen.symmetry.cache.LAST_USED_REFRESH_NS", 0)
+    def test_evict(self):
+        cache = SymmetryDatasetCache(self.tmp_path, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+    def test_get_read_only(self):
+        cache = SymmetryDatasetCache(self.tmp_path)
+        cache.set("a", 1)
+        db = cache._connect()
+        n_changes = db.total_changes
+        assert cache.get("a") == 1
+        # A dataset used recently is not marked as used again
+        assert db.total_changes == n_changes
+        with mock.patch("pymatgen.symmetry.cache.LAST_USED_REFRESH_NS", 0):
+            assert cache.get("a") == 1
+        assert db.total_changes == n_changes + 1
+
+    @mock.patch.dict("pymatgen.symmetry.cache._SYMMETRY_CACHE")
+    def test_read_through(self):
+        set_symmetry_cache(self.tmp_path)
+        assert get_symmetry_cache().path == f"{self.tmp_path}/symmetry_datasets.sqlite"
+        struct = self.get_structure("Si")
+        _get_symmetry_dataset.cache_clear()
+        assert struct.get_space_group_info() == ("Fd-3m", 227)
+        assert len(get_symmetry_cache()) == 1
+
+        # A new process would skip spglib
+        _get_symmetry_dataset.cache_clear()
+        with mock.patch("spglib.get_symmetry_dataset", side_effect=RuntimeError):
+            assert SpacegroupAnalyzer(struct).get_space_group_number() == 227
+            assert struct.get_symmetry_dataset()["international"] == "Fd-3m"
+            with pytest.raises(RuntimeError):
+                struct.get_space_group_info(symprec=0.1)
+
+        set_symmetry_cache(None)
+        assert get_symmetry_cache() is None
@@ -9,7 +9,7 @@ from pytest import approx
 
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.operations import SymmOp
-from pymatgen.symmetry.groups import SYMM_DATA, PointGroup, SpaceGroup
+from pymatgen.symmetry.groups import SYMM_DATA, SYMM_OPS_TABLE, PointGroup, SpaceGroup, _load_table
 
 __author__ = "Shyue Ping Ong"
 __copyright__ = "Copyright 2012, The Materials Virtual Lab"
@@ -225,6 +225,16 @@ class TestSpaceGroup:
         op = SymmOp.from_rotation_and_translation([[1, 0, 0], [0, -1, 0], [0, 0, -1]], [0.5, 0.5, 0.5])
         assert op in sg.symmetry_ops
 
+    def test_symm_ops_table(self):
+        # the precompiled table has the operations of symm_ops.json, in the same order
+        for symbol in ("P1", "Pnma", "Fm-3m", "R-3c:R"):
+            sg = SpaceGroup(symbol)
+            spg = SpaceGroup.SYMM_OPS[sg._symm_ops_index]
+            assert symbol in (spg["hermann_mauguin"], spg["universal_h_m"], spg["hermann_mauguin_u"])
+            assert sg.symmetry_ops == {SymmOp.from_xyz_str(xyz_str) for xyz_str in spg["symops"]}
+            assert len(sg._get_affine_matrices()) == sg.order
+        assert isinstance(_load_table(SYMM_OPS_TABLE), np.memmap)
+
     def test_other_settings(self):
         sg = SpaceGroup("Pbnm")
         assert sg.int_number == 62
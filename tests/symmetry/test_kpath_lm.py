@@ -7,7 +7,7 @@ from pymatgen.analysis.magnetism.analyzer import CollinearMagneticStructureAnaly
 from pymatgen.core.lattice import Lattice
 from pymatgen.core.structure import Structure
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
-from pymatgen.symmetry.kpath import KPathLatimerMunro
+from pymatgen.symmetry.kpath import _KPATH_CACHE, KPathLatimerMunro
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
 
 
@@ -126,3 +126,27 @@ class TestKPathLatimerMunro(MatSciTest):
         assert kpoints["Γ"] == approx([0, 0, 0])
 
         assert kpoints["d_{1}"] == approx([-0.5, -0.5, 0.0]) or kpoints["d"] == approx([-0.5, -0.5, 0.0])
+
+    def test_kpath_cache(self):
+        KPathLatimerMunro.cache_clear()
+        struct = SpacegroupAnalyzer(self.get_structure("Si")).get_primitive_standard_structure()
+        kpath = KPathLatimerMunro(struct)
+        assert len(_KPATH_CACHE) == 1
+
+        # Same reciprocal lattice and point group, so the k-path is reused
+        struct.replace_species({"Si": "Ge"})
+        kpath_ge = KPathLatimerMunro(struct)
+        assert len(_KPATH_CACHE) == 1
+        assert kpath_ge.kpath["path"] == kpath.kpath["path"]
+        assert kpath_ge.kpath["kpoints"].keys() == kpath.kpath["kpoints"].keys()
+
+        # k-paths are copied out of the cache
+        kpath_ge.kpath["kpoints"]["Γ"] += 1
+        assert list(KPathLatimerMunro(struct).kpath["kpoints"]["Γ"]) == [0, 0, 0]
+
+        struct.scale_lattice(1.1 * struct.volume)
+        KPathLatimerMunro(struct)
+        assert len(_KPATH_CACHE) == 2
+
+        KPathLatimerMunro.cache_clear()
+        assert len(_KPATH_CACHE) == 0
@@ -48,6 +48,18 @@ class TestBandStructureSC(MatSciTest):
         hkp = KPathSetyawanCurtarolo(struct)
         assert hkp.name == "MCLC5"
 
+    def test_get_kpoints(self):
+        kpath = KPathSetyawanCurtarolo(self.get_structure("Si"))
+        kpoints, labels = kpath.get_kpoints(line_density=20)
+        assert len(kpoints) == len(labels)
+        assert labels[0] == kpath.kpath["path"][0][0]
+        assert kpoints[0] == approx(kpath.rec_lattice.get_cartesian_coords(kpath.kpath["kpoints"][labels[0]]))
+
+        kpoints_arr, labels_arr = kpath.get_kpoints(line_density=20, coords_are_cartesian=False, as_array=True)
+        assert labels_arr == labels
+        assert kpoints_arr.shape == (len(labels), 3)
+        assert kpoints_arr == approx(kpath.rec_lattice.get_fractional_coords(kpoints))
+
     def test_kpath_acentered(self):
         species = ["K", "La", "Ti"]
         coords = [[0.345, 5, 0.77298], [0.1345, 5.1, 0.77298], [0.7, 0.8, 0.9]]
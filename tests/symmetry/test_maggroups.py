@@ -3,6 +3,7 @@ from __future__ import annotations
 import warnings
 
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose
 
 from pymatgen.core.lattice import Lattice
@@ -38,6 +39,13 @@ class TestMagneticSpaceGroup(MatSciTest):
         assert msg_from_og_1 == msg_from_og_2
         assert msg_from_bns_1 == msg_from_og_1
 
+        assert MagneticSpaceGroup(1651).sg_symbol == "Ia'-3'd'"
+        for label in ("Fm-3x", [71, 1], 0, 1652):
+            with pytest.raises(ValueError, match="Unknown magnetic space group"):
+                MagneticSpaceGroup(label)
+        with pytest.raises(ValueError, match="Unknown magnetic space group"):
+            MagneticSpaceGroup.from_og([65, 10, 1])
+
     def test_crystal_system(self):
         assert self.msg_1.crystal_system == "orthorhombic"
         assert self.msg_2.crystal_system == "orthorhombic"
@@ -152,6 +160,15 @@ x+1/2, y, z, -1
 -x+1/2, -y, -z, -1"""
         assert msg_4_symmops == msg_4_symmops_ref
 
+    def test_get_orbit(self):
+        for msg in (self.msg_2, self.msg_4):
+            orbit, magmoms = msg.get_orbit([0.1, 0.2, 0.3], [1, 2, 3])
+            ref_orbit, ref_magmoms = msg.get_orbit([0.1, 0.2, 0.3], [1, 2, 3], tol=0)
+            assert_allclose(orbit, ref_orbit)
+            assert_allclose([magmom.moment for magmom in magmoms], [magmom.moment for magmom in ref_magmoms])
+            for op, magmom in zip(msg.symmetry_ops, magmoms, strict=True):
+                assert_allclose(magmom.moment, op.operate_magmom([1, 2, 3]).moment)
+
     def test_equivalence_to_spacegroup(self):
         # first 230 magnetic space groups have same symmetry operations
         # as normal space groups, so should give same orbits
@@ -135,6 +135,24 @@ class TestCoordUtils:
         test_coord = [-0.5, -0.5, 0.5]
         assert coord.find_in_coord_list_pbc(coords, test_coord, pbc=pbc)[0] == 1
 
+    def test_find_unique_coords_pbc(self):
+        coords = [[0, 0, 0], [0.5, 0.5, 0.5], [0.99, 1, -1e-9], [0.5, 0.5, 0.5 + 1e-9], [0.2, 0.3, 0.4]]
+        assert_array_equal(coord.find_unique_coords_pbc(coords), [0, 1, 2, 4])
+        assert_array_equal(coord.find_unique_coords_pbc(coords, atol=0.02), [0, 1, 4])
+        assert_array_equal(coord.find_unique_coords_pbc(coords, atol=0.02, pbc=(True, False, True)), [0, 1, 2, 4])
+        assert coord.find_unique_coords_pbc([]).size == 0
+
+        # Same result as adding points one by one unless they are already in the list
+        rng = np.random.default_rng(0)
+        coords = rng.random((50, 3))[rng.integers(50, size=300)] + rng.normal(scale=0.01, size=(300, 3))
+        coords += rng.integers(-1, 2, size=(300, 3))
+        for pbc in [(True, True, True), (True, False, True)]:
+            unique = []
+            for idx, frac_coord in enumerate(coords):
+                if not coord.in_coord_list_pbc(coords[unique], frac_coord, atol=0.02, pbc=pbc):
+                    unique.append(idx)
+            assert_array_equal(coord.find_unique_coords_pbc(coords, atol=0.02, pbc=pbc), unique)
+
     def test_is_coord_subset_pbc(self):
         c1 = [0, 0, 0]
         c2 = [0, 1.2, -1]